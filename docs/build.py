@@ -68,6 +68,24 @@ def get_parser() -> argparse.ArgumentParser:
         help="suppress rST files generation text",
     )
 
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        dest="jobs",
+        type=int,
+        default=None,
+        help="number of processes generating rST files, defaults to the number of CPUs",
+    )
+
+    parser.add_argument(
+        "-F",
+        "--full",
+        action="store_true",
+        dest="full",
+        help="regenerate all rST files, even those whose sources have not changed",
+    )
+
     parser.add_argument(
         "-R",
         "--rst-only",
@@ -96,7 +114,7 @@ def get_parser() -> argparse.ArgumentParser:
 
 
 def process_generated_files(generated_dir: str) -> None:
-    for file_path in Path(generated_dir).iterdir():
+    for file_path in Path(generated_dir).glob("*.rst"):
         with open(file_path, "r+", encoding="utf-8", newline=None) as file:
             doc = file.read()
 
@@ -119,7 +137,12 @@ def main(argv: Sequence[str]) -> None:
             shutil.rmtree(args.generated_dir, ignore_errors=True)
 
         # Generate Symplyphysics rst files
-        generate_laws_docs(args.laws_source_dir, args.generated_dir, args.exclude_dirs, args.quiet)
+        generate_laws_docs(args.laws_source_dir,
+            args.generated_dir,
+            args.exclude_dirs,
+            args.quiet,
+            jobs=args.jobs,
+            incremental=not args.full)
 
         # Copy index.rst to 'generated' folder
         index_file = Path(args.conf_dir) / "index.rst"
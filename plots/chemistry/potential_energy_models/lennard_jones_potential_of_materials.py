@@ -1,8 +1,7 @@
 from dataclasses import dataclass
 from sympy import symbols
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.condensed_matter.interaction_potentials import lennard_jones_potential
 
 print(f"Formula of Lennard-Jones potential:\n{print_expression(lennard_jones_potential.law)}\n")
@@ -27,30 +26,23 @@ datas_ = [
 distance = symbols("distance", positive=True)
 law = lennard_jones_potential.law.rhs.subs(lennard_jones_potential.distance, distance)
 
-potentials_plot = plot(
+potentials_plot = GridPlot(
     ylim=(-1.0, 2.0),
-    axis_center=(0.0, 0.0),
-    line_color="red",
     title="Lennard-Jones potential of different materials",
     xlabel="r, nm",
     ylabel="U, eV",
-    backend=MatplotlibBackend,
-    show=False,
     legend=True,
 )
 
-for data_ in datas_:
-    applied_law = law.subs({
-        lennard_jones_potential.dispersion_energy: data_.dispersion_energy,
-        lennard_jones_potential.particle_size: data_.particle_size,
-    })
-    subplot = plot(
-        applied_law,
-        (distance, 0.0, 0.8),
-        label=data_.label,
-        line_color=data_.line_color,
-        show=False,
-    )
-    potentials_plot.append(subplot[0])
+potentials_plot.family(
+    law,
+    (distance, 0.0, 0.8),
+    {
+    lennard_jones_potential.dispersion_energy: [d.dispersion_energy for d in datas_],
+    lennard_jones_potential.particle_size: [d.particle_size for d in datas_],
+    },
+    labels=[d.label for d in datas_],
+    colors=[d.line_color for d in datas_],
+)
 
 potentials_plot.show()
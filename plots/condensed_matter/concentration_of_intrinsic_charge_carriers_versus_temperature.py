@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 from sympy import sqrt, symbols, Eq, solve, limit, oo
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units
+from symplyphysics.plotting import GridPlot
 from symplyphysics.condensed_matter.semiconductors import concentration_of_intrinsic_charge_carriers as carriers_law
 
 reduced_concentration = symbols("reduced_concentration")
@@ -39,29 +38,23 @@ print(print_expression(reduced_temperature_eqn))
 print("\nThe formula for reduced concentration of charge carriers:\n")
 print(print_expression(reduced_concentration_expr))
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Reduced concentration of intrinsic charge carriers versus reduced temperature",
     xlabel=r"reduced temperature $T^* = \frac{k_\text{B} T}{E_g}$",
     ylabel=r"reduced concentration $n^* = \frac{n}{\sqrt{N_c N_v}}$",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False,
 )
 
-main_plot = plot(
+base_plot.line(
     reduced_concentration_expr,
     (reduced_temperature, 0, 5),
     label=r"$n^*(T^*)$",
-    show=False,
 )
-base_plot.extend(main_plot)
 
-limit_plot = plot(
+base_plot.line(
     reduced_concentration_limit,
     (reduced_temperature, 0, 5),
     label=r"$n^*$ as $T^* \to \infty$",
-    show=False,
 )
-base_plot.extend(limit_plot)
 
 base_plot.show()
@@ -1,8 +1,7 @@
 #!/usr/bin/env python3
 from sympy import sin
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.classical_mechanics.kinematics.translational_motion import acceleration_is_speed_derivative as acceleration
 
 print(f"Formula is:\n{print_expression(acceleration.law)}")
@@ -14,21 +13,14 @@ dsolved = applied_law.doit()
 print(f"Velocity function is:\n{print_expression(VelocityFunction(acceleration.time))}")
 print(f"Acceleration function is:\n{print_expression(dsolved)}")
 
-p1 = plot(VelocityFunction(acceleration.time), (acceleration.time, 0, 10),
-    line_color="blue",
+p1 = GridPlot(
     title="Acceleration(time), Velocity(time)",
-    label="Velocity(time)",
     xlabel="time",
     ylabel="f(time)",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False)
-
-p2 = plot(dsolved.rhs, (acceleration.time, 0, 10),
-    line_color="red",
-    label="Acceleration(time)",
-    backend=MatplotlibBackend,
-    show=False)
-
-p1.append(p2[0])
+)
+p1.line(VelocityFunction(acceleration.time), (acceleration.time, 0, 10),
+    color="blue",
+    label="Velocity(time)")
+p1.line(dsolved.rhs, (acceleration.time, 0, 10), color="red", label="Acceleration(time)")
 p1.show()
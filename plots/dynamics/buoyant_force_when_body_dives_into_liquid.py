@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 from sympy import solve, symbols, pi
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, quantities
 from symplyphysics.core.convert import evaluate_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.continuum_mechanics.fluid_mechanics.hydrostatics import buoyant_force_from_density_and_volume as archimedes_law
 from symplyphysics.classical_mechanics.dynamics.force import acceleration_is_force_over_mass as gravity_law
 
@@ -48,29 +47,15 @@ print(
     f"Buoyant force below liquid function is:\n{print_expression(result_buoyant_force_below_liquid)}"
 )
 
-p1 = plot(result_buoyant_force_above_liquid, (height, 0, CYLINDER_HEIGHT),
-    line_color="blue",
+p1 = GridPlot(
     title="Floating body",
     xlabel="Height below water",
     ylabel="Force",
-    label="Buoyant",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False)
-
-p2 = plot(result_gravity_force, (height, 0, 8),
-    line_color="red",
-    label="Gravity",
-    backend=MatplotlibBackend,
-    show=False)
-
-p3 = plot(result_buoyant_force_below_liquid, (height, CYLINDER_HEIGHT, 8),
-    line_color="blue",
-    label="",
-    backend=MatplotlibBackend,
-    show=False)
-
-p1.append(p2[0])
-p1.append(p3[0])
-p1[2].label = ""
+)
+p1.line(result_buoyant_force_above_liquid, (height, 0, CYLINDER_HEIGHT),
+    color="blue",
+    label="Buoyant")
+p1.line(result_gravity_force, (height, 0, 8), color="red", label="Gravity")
+p1.line(result_buoyant_force_below_liquid, (height, CYLINDER_HEIGHT, 8), color="blue")
 p1.show()
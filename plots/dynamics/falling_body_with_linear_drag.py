@@ -5,9 +5,8 @@ proportional to its speed. Plot the body's speed as a function of time.
 """
 
 from sympy import solve, Symbol, Idx, Eq, dsolve, S
-from sympy.plotting import plot
 from symplyphysics import quantities, global_index
-from symplyphysics.core.convert import evaluate_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.classical_mechanics.kinematics.translational_motion import acceleration_is_speed_derivative as acceleration_def
 from symplyphysics.classical_mechanics.dynamics.force import net_force_is_sum_of_individual_forces as force_superposition_law
 from symplyphysics.classical_mechanics.dynamics.force import acceleration_is_force_over_mass as newtons_second_law
@@ -56,10 +55,9 @@ speed_expr = dsolve(deqn, speed(time), ics={speed(0): 0}).rhs
 asymptote_expr = speed_expr.limit(time, S.Infinity)
 print(asymptote_expr.subs(tau, tau_eqn.rhs))
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Speed of a body falling in a medium with linear resistance",
     legend=True,
-    show=False,
     xlabel="time, s",
     ylabel="speed, m/s",
 )
@@ -67,33 +65,20 @@ base_plot = plot(
 taus = 0.1, 0.5, 1.0, 1.5
 colors = "blue", "orange", "green", "red"
 
-has_asymptote_label = False  # pylint: disable=invalid-name
-
-for tau_, color in zip(taus, colors, strict=True):
-    speed_expr_ = evaluate_expression(speed_expr.subs(tau, tau_))
-    asymptote_expr_ = speed_expr_.limit(time, S.Infinity)
-
-    asymptote_label = ""  # pylint: disable=invalid-name
-    if not has_asymptote_label:
-        has_asymptote_label = True  # pylint: disable=invalid-name
-        asymptote_label = "asymptote"  # pylint: disable=invalid-name
-
-    subplot = plot(
-        asymptote_expr_,
-        (time, 0, 4),
-        label=asymptote_label,
-        line_color="gray",
-        show=False,
-    )
-    base_plot.extend(subplot)
+base_plot.family(
+    asymptote_expr,
+    (time, 0, 4),
+    {tau: taus},
+    labels=["asymptote"] + [""] * (len(taus) - 1),
+    colors=["gray"] * len(taus),
+)
 
-    subplot = plot(
-        speed_expr_,
-        (time, 0, 4),
-        label=rf"$m/b = {tau_} \, \text{{s}}$",
-        line_color=color,
-        show=False,
-    )
-    base_plot.extend(subplot)
+base_plot.family(
+    speed_expr,
+    (time, 0, 4),
+    {tau: taus},
+    labels=[rf"$m/b = {tau_} \, \text{{s}}$" for tau_ in taus],
+    colors=colors,
+)
 
 base_plot.show()
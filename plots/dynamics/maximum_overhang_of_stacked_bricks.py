@@ -8,7 +8,6 @@ stack?
 
 # "Gorbunov, E.D. & Panaiotti E.D., Sbornik zadach po fizike dlya postupayushchikh v VUZ: Uchebnoe posobie, 3rd ed., rev. and enl. Moscow: Izdatel'stvo MGTU im. N. E. Baumana, 2005, 240 p., ill." — page 50, exercise 4.
 
-import matplotlib.pyplot as plt
 from sympy import Idx, solve, Eq, IndexedBase, Indexed, Sum, Wild, Expr, rot_axis3
 from sympy.matrices.dense import DenseMatrix
 from symplyphysics import symbols, print_expression, global_index, clone_as_symbol
@@ -17,6 +16,7 @@ from symplyphysics.core.coordinate_systems import (CARTESIAN, CoordinateVector,
     as_coordinate_vector)
 from symplyphysics.core.vectors import VectorDot, VectorCross
 from symplyphysics.core.solvers import vector_equals
+from symplyphysics.plotting import GridPlot
 from symplyphysics.classical_mechanics.dynamics.gravity import potential_energy_from_mass_and_height as potential_energy_law
 from symplyphysics.classical_mechanics.kinematics.centers import center_of_mass_for_system_of_particles as center_of_mass_def
 
@@ -290,9 +290,12 @@ maximum_overhangs = [
     }).evalf() for block_count_ in block_counts
 ]
 
-plt.semilogx(block_counts, maximum_overhangs, "b.-")
-plt.title("Maximum overhang as a function of block count")
-plt.xlabel("number of blocks")
-plt.ylabel("maximum overhang per unit block length")
-plt.grid(which="both")
-plt.show()
+overhang_plot = GridPlot(
+    title="Maximum overhang as a function of block count",
+    xlabel="number of blocks",
+    ylabel="maximum overhang per unit block length",
+    xscale="log",
+    grid=True,
+)
+overhang_plot.data(block_counts, maximum_overhangs, style="b.-")
+overhang_plot.show()
@@ -1,8 +1,8 @@
 #!/usr/bin/env python3
 
-from sympy import symbols, plot
-from sympy.plotting.plot import MatplotlibBackend
+from sympy import symbols
 from symplyphysics import print_expression, quantities, convert_to_si
+from symplyphysics.plotting import GridPlot
 from symplyphysics.electromagnetism.electrostatics.point_charge import electric_field_due_to_point_charge as electric_field
 
 # Description
@@ -33,18 +33,13 @@ net_field = net_field.subs(quantities.vacuum_permittivity, VACUUM_PERMITTIVITY)
 
 print(f"Net field expression:\n{print_expression(net_field)}")
 
-plot_of_total_field = plot(
-    net_field,
-    (position, -0.5, 1),
+plot_of_total_field = GridPlot(
     title="Net field of two point charges",
-    label="total field",
-    line_color="blue",
     xlabel="x, m",
     ylabel="E, N/C",
     ylim=(-3e6, 3e6),
     legend=True,
-    backend=MatplotlibBackend,
-    show=False,
 )
+plot_of_total_field.line(net_field, (position, -0.5, 1), label="total field", color="blue")
 
 plot_of_total_field.show()
@@ -8,9 +8,8 @@
 ## Also we have here a real LC with some resistive leakage. Resonant frequency stays the same as ideal LC, but resonant peak is not so sharp. The sharpness of resonant peak shows quality factor of LC circuit.
 
 from sympy import Abs, Idx, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import global_index, symbols
+from symplyphysics.plotting import GridPlot
 from symplyphysics.electromagnetism.circuits.alternating_current.admittance import admittance_in_parallel_connection as parallel_admittance_law
 from symplyphysics.electromagnetism.circuits.alternating_current.admittance import admittance_is_inverse_impedance as admittance_def
 from symplyphysics.electromagnetism.circuits.components.capacitors import capacitor_impedance_from_capacitance_and_frequency as capacitor_impedance
@@ -70,27 +69,21 @@ frequency_from_period = solve(period_definition.law, period_definition.angular_f
     dict=True)[0][period_definition.angular_frequency]
 thomsons_frequency = frequency_from_period.subs({period_definition.period: thomsons_period})
 
-PLOT = plot(impedance_ideal_to_plot,
+PLOT = GridPlot(title="LC impedance", legend=True)
+
+PLOT.line(impedance_ideal_to_plot,
     (frequency_arg, thomsons_frequency - 1.2, thomsons_frequency + 1.2),
-    line_color="blue",
-    title="LC impedance",
-    label="LC impedance",
-    legend=True,
-    backend=MatplotlibBackend,
-    show=False)
-
-real_impedance = plot(impedance_real_to_plot,
+    color="blue",
+    label="LC impedance")
+
+PLOT.line(impedance_real_to_plot,
     (frequency_arg, thomsons_frequency - 1.2, thomsons_frequency + 1.2),
     label="RLC impedance",
-    line_color="green",
-    show=False)
-PLOT.append(real_impedance[0])
+    color="green")
 
-freq_line = plot((frequency_arg - thomsons_frequency) * 1000000000,
+PLOT.line((frequency_arg - thomsons_frequency) * 1000000000,
     (frequency_arg, thomsons_frequency - 0.001, thomsons_frequency + 0.001),
     label="frequency = 1 / sqrt(LC)",
-    line_color="red",
-    show=False)
-PLOT.append(freq_line[0])
+    color="red")
 
 PLOT.show()
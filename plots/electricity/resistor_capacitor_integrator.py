@@ -18,9 +18,8 @@ its maximum value. The circuit current, on the other hand, will simply decrease
 """
 
 from sympy import symbols as sym_symbols, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import units, convert_to_si
+from symplyphysics.plotting import GridPlot
 from symplyphysics.electromagnetism.circuits.transient_analysis.serial_resistor_capacitor_circuit import voltage_across_charging_capacitor_in_serial_resistor_capacitor_circuit as rc_node
 from symplyphysics.electromagnetism.circuits.transient_analysis.serial_resistor_capacitor_circuit import time_constant_of_resistor_capacitor_circuit as time_constant_law
 
@@ -50,61 +49,41 @@ capacitor_voltage_function = solve(applied_law, rc_node.capacitor_voltage,
 # see symplyphysics.electricity.current_is_proportional_to_voltage for a proof that current through resistor = resistor voltage / resistor impedance
 capacitor_current_function = (INITIAL_VOLTAGE - capacitor_voltage_function) / EXAMPLE_RESISTANCE
 
-UC = plot(capacitor_voltage_function, (time, 0, 8 * RC_TIME_CONSTANT),
-    line_color="blue",
+UC = GridPlot(
     title="Charging capacitor in a serial $RC$ circuit",
-    label="Capacitor voltage",
     xlabel="time $t$",
     ylabel="reduced quantities",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False)
+)
 
-IC = plot(capacitor_current_function, (time, 0, 8 * RC_TIME_CONSTANT),
-    line_color="orange",
-    label="Circuit current",
-    legend=True,
-    backend=MatplotlibBackend,
-    show=False)
-UC.append(IC[0])
-
-voltage063 = plot(0.63 * INITIAL_VOLTAGE, (time, 0, RC_TIME_CONSTANT),
-    line_color="yellow",
-    label="$U = 0.63 U_0$",
-    backend=MatplotlibBackend,
-    show=False)
-UC.append(voltage063[0])
-
-tau_line = plot(
+UC.line(capacitor_voltage_function, (time, 0, 8 * RC_TIME_CONSTANT),
+    color="blue",
+    label="Capacitor voltage")
+
+UC.line(capacitor_current_function, (time, 0, 8 * RC_TIME_CONSTANT),
+    color="orange",
+    label="Circuit current")
+
+UC.line(0.63 * INITIAL_VOLTAGE, (time, 0, RC_TIME_CONSTANT), color="yellow", label="$U = 0.63 U_0$")
+
+UC.line(
     1000 * (time - RC_TIME_CONSTANT) * 0.63 * INITIAL_VOLTAGE,
     (time, RC_TIME_CONSTANT, RC_TIME_CONSTANT + 0.001),
     label="$t = \\tau$",
-    line_color="yellow",
-    show=False,
+    color="yellow",
 )
-UC.append(tau_line[0])
 
-voltage095 = plot(0.95 * INITIAL_VOLTAGE, (time, 0, 3 * RC_TIME_CONSTANT),
-    line_color="green",
-    label="$U = 0.95 U_0$",
-    backend=MatplotlibBackend,
-    show=False)
-UC.append(voltage095[0])
+UC.line(0.95 * INITIAL_VOLTAGE, (time, 0, 3 * RC_TIME_CONSTANT),
+    color="green",
+    label="$U = 0.95 U_0$")
 
-tau3_line = plot(
+UC.line(
     1000 * (time - 3 * RC_TIME_CONSTANT) * 0.95 * INITIAL_VOLTAGE,
     (time, 3 * RC_TIME_CONSTANT, 3 * RC_TIME_CONSTANT + 0.001),
     label="$t = 3 \\tau$",
-    line_color="green",
-    show=False,
+    color="green",
 )
-UC.append(tau3_line[0])
-
-voltageFull = plot(INITIAL_VOLTAGE, (time, 0, 8 * RC_TIME_CONSTANT),
-    line_color="red",
-    label="$U_0$",
-    backend=MatplotlibBackend,
-    show=False)
-UC.append(voltageFull[0])
+
+UC.line(INITIAL_VOLTAGE, (time, 0, 8 * RC_TIME_CONSTANT), color="red", label="$U_0$")
 
 UC.show()
@@ -4,10 +4,9 @@ Plot the free fall acceleration on Earth as a function of elevation (i.e. perpen
 to Earth's surface).
 """
 
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, quantities, units
 from symplyphysics.core.convert import evaluate_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.classical_mechanics.dynamics.gravity import free_fall_acceleration_from_height as acceleration_law
 
 print(
@@ -30,16 +29,15 @@ free_fall_acceleration_expr = acceleration_law.law.rhs.subs({
 })
 free_fall_acceleration_expr = evaluate_expression(free_fall_acceleration_expr)
 
-p1 = plot(
-    free_fall_acceleration_expr,
-    (elevation, 0, 10e3),  # meters
+p1 = GridPlot(
     ylim=(9.74, 9.85),
-    axis_center=(0.0, 9.75),
-    line_color="red",
     title="Free fall acceleration $g$ versus elevation $h$",
     xlabel=r"$h, \text{m}$",
     ylabel=r"$g, \text{m}/\text{s}^2$",
-    backend=MatplotlibBackend,
-    show=False,
+)
+p1.line(
+    free_fall_acceleration_expr,
+    (elevation, 0, 10e3),  # meters
+    color="red",
 )
 p1.show()
@@ -4,10 +4,9 @@
 ## You throw the grenade to enemies. Which angle of throwing should you choose to hit the farthest enemy?
 
 from sympy import diff, symbols, Eq, solve, simplify, pi
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics.classical_mechanics.kinematics.translational_motion import position_via_constant_acceleration_and_time as movement_law
 from symplyphysics.mathematics.geometry import scalar_projection_is_vector_length_times_cosine_of_angle as projector
+from symplyphysics.plotting import GridPlot
 
 flight_time = symbols("flight_time")
 throwing_velocity = symbols("throwing_velocity")
@@ -79,22 +78,17 @@ max_law = Eq(0, distance_diff)
 max_angle = solve(max_law, throwing_angle, dict=True)[0][throwing_angle]
 print(f"Angle to achieve maximum distance: {max_angle}")
 
-p0 = plot(flight_distance_plotted, (throwing_angle, 0, pi / 2),
-    line_color="blue",
+p0 = GridPlot(
     title="Throwing distance depending on angle",
-    label="distance",
     xlabel="throwing angle, radians",
     ylabel="distance",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False)
-
-peak_line = plot(
+)
+p0.line(flight_distance_plotted, (throwing_angle, 0, pi / 2), label="distance", color="blue")
+p0.line(
     1000 * (throwing_angle - max_angle),
     (throwing_angle, max_angle, max_angle + 0.001),
     label="angle = 45°",
-    line_color="green",
-    show=False,
+    color="green",
 )
-p0.append(peak_line[0])
 p0.show()
@@ -6,9 +6,8 @@ Plot the displacement during damped oscillations for different values of the dam
 
 from collections import namedtuple
 from sympy import dsolve, Expr, symbols, Function as SymFunction
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import units, convert_to_si
+from symplyphysics.plotting import GridPlot
 from symplyphysics.oscillations.mechanical_oscillations.damped_oscillations import damped_harmonic_oscillator_equation as damped_eqn
 
 displacement = symbols("q", cls=SymFunction, real=True)
@@ -48,18 +47,15 @@ def get_solution(zeta: float) -> Expr:
     return dsolved
 
 
-p = plot(
+p = GridPlot(
     title="Damped oscillations for various values of damping ratio",
     xlabel="time, s",
     ylabel="displacement, m",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 for datum in DATA:
     sol = get_solution(datum.zeta)
-    sub_p = plot(sol, (time, 0, 10), label=datum.label, line_color=datum.color, show=False)
-    p.append(sub_p[0])
+    p.line(sol, (time, 0, 10), label=datum.label, color=datum.color)
 
 p.show()
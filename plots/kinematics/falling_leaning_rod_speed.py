@@ -7,8 +7,8 @@ floor with constant speed :math:`v` in the positive direction of the :math:`x`-a
 """
 
 from sympy import Eq, solve, ask, Q
-from sympy.plotting import plot
 from symplyphysics import symbols, clone_as_symbol, print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.classical_mechanics.kinematics.translational_motion import position_via_constant_speed_and_time as position_law
 
 a_initial_position = clone_as_symbol(symbols.position, subscript="0")
@@ -69,21 +69,21 @@ t_max_ = t_max_expr.subs(subs)
 b_position_ = b_position_expr.subs(subs)
 b_speed_ = b_speed_expr.subs(subs)
 
-plot(
-    b_position_,
-    (time, 0, t_max_),
+position_plot = GridPlot(
     title="Position of end B as a function of time",
     xlabel="time, s",
     ylabel="position, m",
 )
+position_plot.line(b_position_, (time, 0, t_max_))
+position_plot.show()
 
 # NOTE that the speed of end B explodes the closer it gets to the ground. In real life there would
 # be friction that prevents this behaviour from occurring. This corresponds to end A abruptly
 # stopping (and its speed changing to 0) when the rod fully lies on the floor.
-plot(
-    b_speed_,
-    (time, 0, t_max_),
+speed_plot = GridPlot(
     title="Speed of end B as a function of time",
     xlabel="time, s",
     ylabel="speed, m/s",
 )
+speed_plot.line(b_speed_, (time, 0, t_max_))
+speed_plot.show()
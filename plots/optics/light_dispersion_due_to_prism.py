@@ -4,10 +4,11 @@ Light enters a prism whose cross section is an equilateral triangle. The prism i
 silica. Plot the dispersion of light after it passes the prism.
 """
 
-from sympy import symbols as sym_symbols, Eq, solve, pi, plot, sin, cos, tan, Rational, sqrt
+from sympy import symbols as sym_symbols, Eq, solve, pi, sin, cos, tan, Rational, sqrt
 from symplyphysics import symbols, clone_as_symbol
 from symplyphysics.core.geometry.line import two_point_function, Point2D
 from symplyphysics.optics.geometrical_optics.refraction import refraction_angle_from_environments as snells_law
+from symplyphysics.plotting import GridPlot
 
 air_refractive_index = clone_as_symbol(
     symbols.relative_refractive_index,
@@ -176,20 +177,16 @@ values = {
     incoming_incidence_angle: pi / 6,
 }
 
-baseplot = plot(
+baseplot = GridPlot(
     title="Refraction of light by triangular prism",
-    xlabel="",
-    ylabel="",
     xlim=(0, 1),
     ylim=(0, 1),
     size=(8, 8),
     legend=True,
-    show=False,
 )
 
 triangle_edge = two_point_function(Point2D(0, sqrt(3) / 2), Point2D(Rational(1, 2), 0), x)
-subplot = plot(triangle_edge, (x, 0, Rational(1, 2)), line_color="black", label="", show=False)
-baseplot.extend(subplot)
+baseplot.line(triangle_edge, (x, 0, Rational(1, 2)), color="black")
 
 for wavelength_in_um_, color in zip(mid_wavelengths_in_nm, colors):
     air_refractive_index_ = air_refractive_index_subs.subs(wavelength_in_um,
@@ -208,13 +205,11 @@ for wavelength_in_um_, color in zip(mid_wavelengths_in_nm, colors):
     od_ = od_expr.subs(values_).n()
 
     ray = two_point_function(Point2D(oh_, ch_), Point2D(od_, 0), x)
-    subplot = plot(
+    baseplot.line(
         ray,
         (x, oh_, 1),
-        line_color=color,
+        color=color,
         label=rf"$\lambda \approx {round(wavelength_in_um_, 3)} \, \mu\text{{m}}$",
-        show=False,
     )
-    baseplot.extend(subplot)
 
 baseplot.show()
@@ -9,12 +9,13 @@ from math import isnan, isinf
 from argparse import ArgumentParser
 import sys
 from sympy import (ImmutableMatrix, symbols as sym_symbols, Eq, solve, Expr, sqrt, rot_axis3, sin,
-    pi, asin, Point2D, sign, im, plot, plot_parametric)
+    pi, asin, Point2D, sign, im)
 from symplyphysics.core.coordinate_systems import CoordinateVector, CARTESIAN
 from symplyphysics.core.coordinate_systems.vector import as_coordinate_vector, component
 from symplyphysics.core.vectors import VectorNorm, VectorCross, VectorDot
 from symplyphysics.optics.geometrical_optics.refraction import refraction_angle_from_environments as snells_law
 from symplyphysics.core.geometry.line import two_point_function
+from symplyphysics.plotting import GridPlot
 
 # PART 1. Parsing command line arguments
 
@@ -298,14 +299,11 @@ def display() -> None:
 
     maxval = max(max((component(t[2], 0) for t in data), default=1), 1) * 1.1
 
-    base_plot = plot(
+    base_plot = GridPlot(
         title="Parallel rays passing through a thick convex lens",
-        xlabel="",
-        ylabel="",
         ylim=(-maxval, maxval),
         xlim=(-maxval, maxval),
         size=(8, 8),
-        show=False,
     )
 
     phi = sym_symbols("phi", real=True)
@@ -319,55 +317,38 @@ def display() -> None:
     # Rotate the radius-vector relative to the circle center and then shift the circle center.
     eqn1_parametric = as_coordinate_vector(
         rotate(phi, make_point(left_side_radius, 0)) + left_side_center)
-    subplot = plot_parametric(
+    base_plot.parametric(
         eqn1_parametric.components[:-1],
         (phi, pi - left_max_angle, pi + left_max_angle),
-        line_color="blue",
-        label="",
-        show=False,
+        color="blue",
     )
-    base_plot.extend(subplot)
 
     # Rotate the radius-vector relative to the circle center and then shift the circle center.
     eqn2_parametric = as_coordinate_vector(
         rotate(phi, make_point(right_side_radius, 0)) + right_side_center)
-    subplot = plot_parametric(
+    base_plot.parametric(
         eqn2_parametric.components[:-1],
         (phi, -right_max_angle, right_max_angle),
-        line_color="blue",
-        label="",
-        show=False,
+        color="blue",
     )
-    base_plot.extend(subplot)
 
     for p_in, p_out, p_f in data:
         p_left = make_point(-maxval, p_in.components[1])
-        subplot = plot(
+        base_plot.line(
             make_line_eqn(p_left, p_in),
             (x, -maxval, p_in.components[0]),
-            line_color="green",
-            label="",
-            show=False,
+            color="green",
         )
-        base_plot.extend(subplot)
-
-        subplot = plot(
+        base_plot.line(
             make_line_eqn(p_in, p_out),
             (x, p_in.components[0], p_out.components[0]),
-            line_color="green",
-            label="",
-            show=False,
+            color="green",
         )
-        base_plot.extend(subplot)
-
-        subplot = plot(
+        base_plot.line(
             make_line_eqn(p_out, p_f),
             (x, p_out.components[0], p_f.components[0]),
-            line_color="green",
-            label="",
-            show=False,
+            color="green",
         )
-        base_plot.extend(subplot)
 
     base_plot.show()
 
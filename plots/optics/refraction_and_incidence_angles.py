@@ -3,9 +3,8 @@
 from dataclasses import dataclass
 from pytest import approx
 from sympy import symbols, solve, pi, sin
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend, Plot
 from symplyphysics.optics.geometrical_optics.refraction import refraction_angle_from_environments as refraction_law
+from symplyphysics.plotting import GridPlot
 
 # Description
 ## Plot the dependency of refraction angle on incidence angle for different environments
@@ -59,7 +58,7 @@ class SubplotData:
     color: str
 
 
-def make_subplot(data_: SubplotData) -> Plot:
+def add_subplot(plot_: GridPlot, data_: SubplotData) -> None:
     maximum_angle = maximum_angle_of_incidence(data_.incident_index, data_.refracted_index)
     angle_of_refraction_value = solved_angle_of_refraction.subs({
         incident_index: data_.incident_index,
@@ -67,14 +66,13 @@ def make_subplot(data_: SubplotData) -> Plot:
         # convert back, from degrees to radians
         angle_of_incidence: angle_of_incidence * pi / 180
     })
-    return plot(
+    plot_.line(
         # convert Y result to degrees
         angle_of_refraction_value * 180 / pi,
         # convert X values to degrees (requires to convert back to degrees in the formula)
         (angle_of_incidence, 0, maximum_angle * 180 / pi),
         label=data_.label,
-        line_color=data.color,
-        show=False,
+        color=data_.color,
     )
 
 
@@ -105,15 +103,12 @@ datas = [
     ),
 ]
 
-p = plot(
+p = GridPlot(
     title="Angle of refraction against angle of incidence",
     xlabel="Angle of incidence, deg",
     ylabel="Angle of refraction, deg",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 for data in datas:
-    sub_p = make_subplot(data)
-    p.append(sub_p[0])
+    add_subplot(p, data)
 p.show()
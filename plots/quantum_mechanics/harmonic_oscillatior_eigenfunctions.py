@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 
 from sympy import pi
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import units, convert_to, quantities
+from symplyphysics.plotting import GridPlot
 from symplyphysics.quantum_physics.quantum_harmonic_oscillator import quantum_oscillator_wave_eigenfunctions as law
 
 values = {
@@ -13,13 +12,11 @@ values = {
 
 mode_numbers_ = 0, 1, 2, 3
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Quantum harmonic oscillator eigenfunctions",
     xlabel=r"position, $\text{m}$",
     ylabel=r"wave function, $\text{m}^{-1/2}$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 law_rhs = law.law.rhs.subs({
@@ -30,12 +27,10 @@ law_rhs = law.law.rhs.subs({
 for mode_number_ in mode_numbers_:
     expr = law_rhs.subs(values).subs(law.mode_number, mode_number_)
 
-    sub_plot = plot(
+    base_plot.line(
         expr,
         (law.position, -3e-18, 3e-18),  # m
         label=f"$n = {mode_number_}$",
-        show=False,
     )
-    base_plot.extend(sub_plot)
 
 base_plot.show()
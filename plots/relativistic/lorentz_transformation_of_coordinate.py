@@ -2,9 +2,8 @@
 
 from collections import namedtuple
 from sympy import solve, symbols, Eq
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.quantities import speed_of_light
 from symplyphysics.special_relativity.relativistic_kinematics.lorentz_transformation import lorentz_transformation_of_coordinate as transform_law
 
@@ -30,27 +29,21 @@ proper_coordinate_expr = solve(
 
 print(print_expression(proper_coordinate_expr))
 
-base_plot = plot(
+base_plot = GridPlot(
     title=r"Proper coordinate $x'$ as a function of frame speed",
     xlabel=r"$\beta = \frac{v}{c}$",
     ylabel=r"$x'$",
-    backend=MatplotlibBackend,
     legend=True,
-    annotation=False,
-    show=False,
 )
 
-for datum_ in data_:
-    expr = proper_coordinate_expr.subs({
-        transform_law.position_in_lab_frame: datum_.x,
-        transform_law.time_in_lab_frame: datum_.t,
-    })
-    sub_plot = plot(
-        expr,
-        (reduced_speed, 0, 0.98),
-        label=datum_.label,
-        show=False,
-    )
-    base_plot.extend(sub_plot)
+base_plot.family(
+    proper_coordinate_expr,
+    (reduced_speed, 0, 0.98),
+    {
+    transform_law.position_in_lab_frame: [d.x for d in data_],
+    transform_law.time_in_lab_frame: [d.t for d in data_],
+    },
+    labels=[d.label for d in data_],
+)
 
 base_plot.show()
@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
-from sympy import Symbol, Eq, solve, oo, plot
+from sympy import Symbol, Eq, solve, oo
 from symplyphysics import print_expression
 from symplyphysics.core.convert import evaluate_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.quantities import speed_of_light
 from symplyphysics.classical_mechanics.conservation_laws import initial_mechanical_energy_equals_final_mechanical_energy as energy_conservation_law
 from symplyphysics.classical_mechanics.conservation_laws import initial_momentum_equals_final_momentum as momentum_conservation_law
@@ -144,41 +145,34 @@ print(print_expression(reduced_reflected_wave_energy_upper_limit))
 ## - `beta` - reduced speed of mirror after interaction
 ## - `c` - speed of light
 
-base_plot = plot(
+base_plot = GridPlot(
     title=r"Mirror speed and reflected wave energy as functions of incident wave energy",
     xlabel=r"reduced incident wave energy $w_0 = \frac{W_0}{m_0 c^2}$",
     ylabel="reduced quantities",
     legend=True,
-    show=False,
 )
 
 plot_range = (reduced_incident_wave_energy, 0, 10)
 
-speed_plot = plot(
+base_plot.line(
     reduced_mirror_speed_expr,
     plot_range,
     label=r"reduced mirror speed $\beta = \frac{v}{c}$",
-    line_color="blue",
-    show=False,
+    color="blue",
 )
-base_plot.extend(speed_plot)
 
-energy_plot = plot(
+base_plot.line(
     reduced_reflected_wave_energy_expr,
     plot_range,
     label=r"reduced reflected wave energy $w_1 = \frac{W_1}{m_0 c^2}$",
-    line_color="red",
-    show=False,
+    color="red",
 )
-base_plot.extend(energy_plot)
 
-energy_asymptote_plot = plot(
+base_plot.line(
     reduced_reflected_wave_energy_upper_limit,
     plot_range,
     label=r"$w_1$ in the limit $w_0 \to \infty$",
-    line_color="pink",
-    show=False,
+    color="pink",
 )
-base_plot.extend(energy_asymptote_plot)
 
 base_plot.show()
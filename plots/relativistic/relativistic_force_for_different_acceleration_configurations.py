@@ -1,9 +1,10 @@
 #!/usr/bin/env python3
 
 from collections import namedtuple
-from sympy import Symbol, plot, sqrt
+from sympy import Symbol, sqrt
 from symplyphysics.quantities import speed_of_light
 from symplyphysics.core.convert import evaluate_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.special_relativity.relativistic_dynamics.force_and_acceleration import relativistic_force_acceleration_relation as force_law
 from symplyphysics.special_relativity.fundamentals import lorentz_factor_via_speed as lorentz_factor_def
 
@@ -31,12 +32,11 @@ data_ = [
 reduced_speed = Symbol("reduced_speed", nonnegative=True)
 velocity = CoordinateVector([reduced_speed * speed_of_light, 0, 0], CARTESIAN)
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Force as a function of velocity for different acceleration configurations",
     xlabel=r"$\beta = \frac{v}{c}$",
     ylabel=r"$\frac{F}{m_0}, \left(\frac{\text{m}}{\text{s}}\right)^2$",
     legend=True,
-    show=False,
 )
 
 lorentz_factor = lorentz_factor_def.law.rhs.subs(
@@ -58,12 +58,10 @@ for datum_ in data_:
 
     expr = VectorNorm(vector)
     expr_value = evaluate_expression(expr)
-    sub_plot = plot(
+    base_plot.line(
         expr_value,
         (reduced_speed, 0, 0.97),
         label=datum_.label,
-        show=False,
     )
-    base_plot.extend(sub_plot)
 
 base_plot.show()
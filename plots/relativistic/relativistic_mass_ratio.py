@@ -1,9 +1,8 @@
 #!/usr/bin/env python3
 
 from sympy import solve, symbols, Eq
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.quantities import speed_of_light
 from symplyphysics.special_relativity.relativistic_dynamics.obsolete_concepts import relativistic_mass_via_rest_mass_and_speed
 
@@ -32,17 +31,12 @@ solved_law = Eq(mass_ratio, result_mass_ratio)
 
 print(f"Formula is:\n{print_expression(solved_law)}")
 
-p1 = plot(
-    result_mass_ratio,
-    (speed_ratio, 0, 0.99999),
+p1 = GridPlot(
     ylim=(0, 100),
-    axis_center=(0.0, 0.0),
-    line_color="red",
     title="Relativistic to rest mass ratio depending on speed ratio",
     xlabel=r"$\frac{v}{c}$",
     ylabel=r"$\frac{m_{rel}}{m_{rest}}$",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False,
 )
+p1.line(result_mass_ratio, (speed_ratio, 0, 0.99999), color="red")
 p1.show()
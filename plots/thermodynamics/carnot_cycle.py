@@ -9,13 +9,12 @@ Plot the pressure-volume diagram of the carnot cycle, which consists of 4 stages
 """
 
 from sympy import Eq, solve, symbols
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import units
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.thermodynamics.equations_of_state.ideal_gas import pressure_and_volume_in_isothermal_process as isothermal_law
 from symplyphysics.thermodynamics.equations_of_state.ideal_gas import pressure_and_volume_in_adiabatic_process as adiabatic_law
 from symplyphysics.thermodynamics.equations_of_state.ideal_gas import ideal_gas_equation
+from symplyphysics.plotting import GridPlot
 
 _temperature_start = symbols("temperature_start")
 _temperature_end = symbols("temperature_end")
@@ -116,42 +115,25 @@ result_pressure_adiabatic_compression = adiabatic_pressure.subs({
     adiabatic_law.final_volume: carnot_cycle_volume
 })
 
-p1 = plot(result_pressure_isothermal_expansion,
-    (carnot_cycle_volume, GAS_VOLUME_START, GAS_VOLUME_ADIABATIC_START),
-    line_color="blue",
+p1 = GridPlot(
     title="Carnot Cycle",
     xlabel="Volume",
     ylabel="Pressure",
-    label="Isothermal",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False)
-
-p2 = plot(result_pressure_adiabatic_expansion,
+)
+p1.line(result_pressure_isothermal_expansion,
+    (carnot_cycle_volume, GAS_VOLUME_START, GAS_VOLUME_ADIABATIC_START),
+    color="blue",
+    label="Isothermal")
+p1.line(result_pressure_adiabatic_expansion,
     (carnot_cycle_volume, GAS_VOLUME_ADIABATIC_START, gas_volume_adiabatic_end),
-    line_color="red",
-    label="Adiabatic",
-    backend=MatplotlibBackend,
-    show=False)
-
-p3 = plot(result_pressure_isothermal_compression,
+    color="red",
+    label="Adiabatic")
+p1.line(result_pressure_isothermal_compression,
     (carnot_cycle_volume, gas_volume_isothermal_end, gas_volume_adiabatic_end),
-    line_color="blue",
-    backend=MatplotlibBackend,
-    label="",
-    show=False)
-
-p4 = plot(result_pressure_adiabatic_compression,
+    color="blue")
+p1.line(result_pressure_adiabatic_compression,
     (carnot_cycle_volume, GAS_VOLUME_START, gas_volume_isothermal_end),
-    line_color="red",
-    backend=MatplotlibBackend,
-    label="",
-    show=False)
-
-p1.append(p2[0])
-p1.append(p3[0])
-p1.append(p4[0])
-p1[2].label = ""
-p1[3].label = ""
+    color="red")
 
 p1.show()
@@ -5,11 +5,10 @@ Plot the radiation power of an ideal black body as a function of temperature. Se
 """
 
 from sympy import solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.electromagnetic_waves.blackbody_radiation import radiance_of_black_body_from_temperature as stefan_boltzmann_law
+from symplyphysics.plotting import GridPlot
 
 print(f"Formula is:\n{print_expression(stefan_boltzmann_law.law)}")
 
@@ -19,13 +18,13 @@ solved = solve(stefan_boltzmann_law.law, stefan_boltzmann_law.radiance,
 radiance_temperature = evaluate_expression(solved)
 print(f"Radiance function is:\n{print_expression(radiance_temperature)}")
 
-p1 = plot(radiance_temperature, (stefan_boltzmann_law.temperature, 0, 400),
-    line_color="black",
+p1 = GridPlot(
     title="Stefan - Boltzmann Law",
     xlabel="T, K",
     ylabel=r"P, $\text{W}/\text{m}^2$",
-    label="completely black body",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False)
+)
+p1.line(radiance_temperature, (stefan_boltzmann_law.temperature, 0, 400),
+    color="black",
+    label="completely black body")
 p1.show()
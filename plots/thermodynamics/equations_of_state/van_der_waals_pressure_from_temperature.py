@@ -5,12 +5,11 @@ gas volume.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.thermodynamics.equations_of_state.van_der_waals import van_der_vaals_equation as van_der_waals_law
 from symplyphysics.quantity_relations import quantity_is_molar_quantity_times_amount_of_substance as molar_qty_law
+from symplyphysics.plotting import GridPlot
 
 volume_values = [0.1, 0.15, 0.2, 0.25, 0.3, 0.35, 0.4, 0.45]  # liters
 
@@ -45,21 +44,19 @@ pressure_to_plots = pressure_value.subs({
 })
 pressure_to_plots = evaluate_expression(pressure_to_plots)
 
-base_plot = plot(title="The Van der Waals state equation",
+base_plot = GridPlot(
+    title="The Van der Waals state equation",
     xlabel=r"$T, K$",
     ylabel=r"$P, Pa$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False)
+)
 
-for volume_value in volume_values:
+base_plot.family(
+    pressure_to_plots,
+    (temperature, 100, 500),  # [K]
     # Convert from liters to m^3
-    pressure_to_subplot = pressure_to_plots.subs({volume: volume_value * 1E-3})
-    subplot = plot(
-        pressure_to_subplot,
-        (temperature, 100, 500),  # [K]
-        label=f"Volume is {volume_value}",
-        show=False)
-    base_plot.append(subplot[0])
+    {volume: [volume_value * 1E-3 for volume_value in volume_values]},
+    labels=[f"Volume is {volume_value}" for volume_value in volume_values],
+)
 
 base_plot.show()
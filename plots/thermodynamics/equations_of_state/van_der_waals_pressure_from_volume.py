@@ -5,12 +5,11 @@ temperature.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.thermodynamics.equations_of_state.van_der_waals import van_der_vaals_equation as van_der_waals_law
 from symplyphysics.quantity_relations import quantity_is_molar_quantity_times_amount_of_substance as molar_qty_law
+from symplyphysics.plotting import GridPlot
 
 temperature_values = [130, 140, 150, 160, 170]  # K
 
@@ -45,20 +44,18 @@ pressure_to_plots = pressure_value.subs({
 })
 pressure_to_plots = evaluate_expression(pressure_to_plots)
 
-base_plot = plot(title="The Van der Waals state equation: P(V)",
+base_plot = GridPlot(
+    title="The Van der Waals state equation: P(V)",
     xlabel=r"$V, m^3$",
     ylabel=r"$P, Pa$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False)
-
-for temperature_value in temperature_values:
-    pressure_to_subplot = pressure_to_plots.subs({temperature: temperature_value})
-    subplot = plot(
-        pressure_to_subplot,
-        (volume, 0.00008, 0.0003),  # [m^3]
-        label=f"Temperature is {temperature_value} K",
-        show=False)
-    base_plot.append(subplot[0])
+)
+
+base_plot.family(
+    pressure_to_plots,
+    (volume, 0.00008, 0.0003),  # [m^3]
+    {temperature: temperature_values},
+    labels=[f"Temperature is {temperature_value} K" for temperature_value in temperature_values],
+)
 
 base_plot.show()
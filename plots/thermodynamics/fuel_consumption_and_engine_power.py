@@ -7,8 +7,6 @@ of the engine's efficiency factor.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units, Quantity
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.classical_mechanics.fundamentals import density_from_mass_volume as density_law
@@ -16,6 +14,7 @@ from symplyphysics.classical_mechanics.kinematics.translational_motion import po
 from symplyphysics.electromagnetism.circuits.alternating_current import power_factor_is_real_power_over_apparent_power as efficiency_law
 from symplyphysics.classical_mechanics.fundamentals import energy_via_constant_power_and_time as energy_law
 from symplyphysics.thermodynamics.phase_transitions.latent_heat import heat_of_combustion_via_mass as combustion_energy_law
+from symplyphysics.plotting import GridPlot
 
 efficiency_factor_values = [0.15, 0.3, 0.45, 0.6, 0.75]
 
@@ -84,24 +83,22 @@ print(
     sep="\n",
 )
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Gasoline consumption and engine power",
     xlabel="power, kW",
     ylabel="fuel consumption, L/km",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
-# Create plots for every efficient factor in sequence and add plot to base plot
-for efficiency_factor_value in efficiency_factor_values:
-    consumption_expr_subs = consumption_expr.subs(efficiency_factor, efficiency_factor_value)
-    subplot = plot(
-        consumption_expr_subs,
-        (power_in_kw, 1, 100),
-        label=rf"$\eta_\text{{engine}} = {efficiency_factor_value}$",
-        show=False,
-    )
-    base_plot.extend(subplot)
+# Create plots for all efficient factors at once
+base_plot.family(
+    consumption_expr,
+    (power_in_kw, 1, 100),
+    {efficiency_factor: efficiency_factor_values},
+    labels=[
+    rf"$\eta_\text{{engine}} = {efficiency_factor_value}$"
+    for efficiency_factor_value in efficiency_factor_values
+    ],
+)
 
 base_plot.show()
@@ -9,11 +9,10 @@ Plot the fundamental processes involving the ideal gas on the pressure-volume di
 """
 
 from sympy import symbols, solve, Rational
-from sympy.plotting import plot, plot_parametric
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.thermodynamics.equations_of_state.ideal_gas import pressure_and_volume_in_adiabatic_process as adiabatic_law
 from symplyphysics.thermodynamics.equations_of_state.ideal_gas import ideal_gas_equation as ideal_gas_law
+from symplyphysics.plotting import GridPlot
 
 pressure, volume, temperature = symbols("pressure volume temperature", positive=True)
 
@@ -27,29 +26,25 @@ ideal_gas_eqn = evaluate_expression(ideal_gas_eqn)
 
 pressure_expr = solve(ideal_gas_eqn, pressure)[0]
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Fundamental thermodynamic processes of an ideal monatomic gas",
     xlabel=r"volume, $\text{m}^3$",
     ylabel=r"pressure, $\text{Pa}$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 # Plot guiding isotherms
 
 for temperature_, label in zip((400, 800, 1200), "lower middle upper".split()):
     pressure_expr_ = pressure_expr.subs(temperature, temperature_)
-    isotherm_plot = plot(
+    base_plot.line(
         pressure_expr_,
         (volume, 1, 5),
         # ideally the label should go to the right end of the corresponding line
         # although I reckon this is only possible to do via matplotlib
         label=f"$T = {temperature_} \\, \\text{{K}}$ ({label})",
-        line_color="yellow",
-        show=False,
+        color="yellow",
     )
-    base_plot.extend(isotherm_plot)
 
 # Let the processes start at V = 1.5 m**3 and T = 800 K
 
@@ -87,36 +82,30 @@ final_volume = solve(
 
 adiabate_pressure_expr = solve(adiabate_eqn, pressure)[0]
 
-adiabate_plot = plot(
+base_plot.line(
     adiabate_pressure_expr,
     (volume, INITIAL_VOLUME, final_volume),
     label=r"adiabate, $Q = 0$",
-    line_color="blue",
-    show=False,
+    color="blue",
 )
-base_plot.extend(adiabate_plot)
 
 # Plot isobar
 
-isobar_plot = plot(
+base_plot.line(
     initial_pressure,
     (volume, INITIAL_VOLUME, final_volume),
     label=r"isobar, $p = \text{const}$",
-    line_color="green",
-    show=False,
+    color="green",
 )
-base_plot.extend(isobar_plot)
 
 # Plot isotherm
 
-isotherm_plot = plot(
+base_plot.line(
     pressure_expr.subs(temperature, INITIAL_TEMPERATURE),
     (volume, INITIAL_VOLUME, final_volume),
     label=r"isotherm, $T = \text{const}$",
-    line_color="red",
-    show=False,
+    color="red",
 )
-base_plot.extend(isotherm_plot)
 
 # Plot isochore
 
@@ -125,13 +114,11 @@ isochore_final_pressure = pressure_expr.subs({
     temperature: FINAL_TEMPERATURE,
 })
 
-isochore_plot = plot_parametric(
+base_plot.parametric(
     (INITIAL_VOLUME, pressure),
     (pressure, initial_pressure, isochore_final_pressure),
     label=r"isochore, $V = \text{const}$",
-    line_color="violet",
-    show=False,
+    color="violet",
 )
-base_plot.extend(isochore_plot)
 
 base_plot.show()
@@ -6,8 +6,6 @@ function of the equilibrium temperature of the mixture.
 """
 
 from sympy import Idx, symbols, Eq, solve, simplify
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, global_index
 from symplyphysics.core.symbols.celsius import to_kelvin, Celsius
 from symplyphysics.thermodynamics.response_functions.heat_capacity import heat_is_heat_capacity_times_temperature_change as thermal_energy_law
@@ -15,6 +13,7 @@ from symplyphysics.thermodynamics.phase_transitions.latent_heat import latent_he
 from symplyphysics.classical_mechanics.fundamentals import density_from_mass_volume as density_law
 from symplyphysics.quantity_relations import quantity_is_specific_quantity_times_mass as specific_qty_law
 from symplyphysics.thermodynamics.conservation_laws import total_energy_transfer_is_zero_in_isolated_system as thermodinamics_law_1
+from symplyphysics.plotting import GridPlot
 
 temperature_of_hot_water_values = [5, 20, 35, 50, 65, 80]
 
@@ -99,12 +98,10 @@ mass_ratio_to_plot = mass_ratio_value.subs({
     temperature_melt_ice: to_kelvin(Celsius(0))
 })
 
-base_plot = plot(title="The mass of ice required to cool the hot water to a set temperature",
+base_plot = GridPlot(title="The mass of ice required to cool the hot water to a set temperature",
     xlabel=r"$T_\text{balance}, K$",
     ylabel=r"$m_\text{ice} / m_\text{water}$",
-    backend=MatplotlibBackend,
-    legend=True,
-    show=False)
+    legend=True)
 
 for temperature_of_hot_water_value in temperature_of_hot_water_values:
     mass_ratio_to_subplot = mass_ratio_to_plot.subs(
@@ -116,11 +113,9 @@ for temperature_of_hot_water_value in temperature_of_hot_water_values:
         temperature_balance,
         dict=True)[0][temperature_balance]
 
-    subplot = plot(mass_ratio_to_subplot,
+    base_plot.line(mass_ratio_to_subplot,
         (temperature_balance, to_kelvin(Celsius(0)), temperature_supremum),
         label=r"$T_\text{water}=" + f"{to_kelvin(Celsius(temperature_of_hot_water_value))}" +
-        r"\, K$",
-        show=False)
-    base_plot.append(subplot[0])
+        r"\, K$")
 
 base_plot.show()
@@ -5,11 +5,10 @@ particle mass.
 """
 
 from collections import namedtuple
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, Quantity, units, quantities, convert_to_si
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.statistical_physics.classical_statistics.maxwell_boltzmann import maxwell_boltzmann_speed_distribution as speed_distribution
+from symplyphysics.plotting import GridPlot
 
 MassDatum = namedtuple("MassDatum", "mass label")
 
@@ -26,27 +25,29 @@ mass_data_ = [
 print(
     f"Maxwell-Boltzmann speed distribution function:\n{print_expression(speed_distribution.law)}\n")
 
-mass_plot = plot(
+mass_plot = GridPlot(
     title="Maxwell—Boltzmann speed distribution for particles of different masses, $T$ = const",
     xlabel=r"speed $v, \frac{m}{s}$",
     ylabel=r"probability density, $(\frac{m}{s})^{-1}$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 distribution = speed_distribution.law.rhs.subs(speed_distribution.equilibrium_temperature,
     quantities.standard_conditions_temperature)
 distribution = evaluate_expression(distribution)
 
-for mass_datum_ in mass_data_:
-    mass_ = convert_to_si(Quantity(mass_datum_.mass * units.amu))
-    mass_subplot = plot(
-        distribution.subs(speed_distribution.particle_mass, mass_),
-        (speed_distribution.particle_speed, 0, 2000),
-        label=f"$m_{{{mass_datum_.label}}} = {mass_datum_.mass} \\, \\text{{amu}}$",
-        show=False,
-    )
-    mass_plot.append(mass_subplot[0])
+mass_plot.family(
+    distribution,
+    (speed_distribution.particle_speed, 0, 2000),
+    {
+    speed_distribution.particle_mass: [
+    convert_to_si(Quantity(mass_datum_.mass * units.amu)) for mass_datum_ in mass_data_
+    ]
+    },
+    labels=[
+    f"$m_{{{mass_datum_.label}}} = {mass_datum_.mass} \\, \\text{{amu}}$"
+    for mass_datum_ in mass_data_
+    ],
+)
 
 mass_plot.show()
@@ -4,10 +4,9 @@ Plot the speed distribution of a gas in Maxwell—Boltzmann statistics for diffe
 temperature.
 """
 
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, convert_to, Quantity, units, quantities
 from symplyphysics.statistical_physics.classical_statistics.maxwell_boltzmann import maxwell_boltzmann_speed_distribution as speed_distribution
+from symplyphysics.plotting import GridPlot
 
 argon_mass_ = convert_to(Quantity(39.948 * units.amu), units.kilogram)
 temperatures_ = [100, 200, 300, 400, 500]  # K
@@ -16,13 +15,11 @@ print(
     f"Maxwell-Boltzmann speed distribution function of Argon:\n{print_expression(speed_distribution.law)}\n"
 )
 
-temperature_plot = plot(
+temperature_plot = GridPlot(
     title="Maxwell—Boltzmann speed distribution of Argon at different temperatures",
     xlabel=r"speed $v, \frac{m}{s}$",
     ylabel=r"probability density, $(\frac{m}{s})^{-1}$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 distribution = speed_distribution.law.rhs.subs({
@@ -30,13 +27,11 @@ distribution = speed_distribution.law.rhs.subs({
     quantities.boltzmann_constant: convert_to(units.boltzmann_constant, units.joule / units.kelvin),
 })
 
-for temperature_ in temperatures_:
-    temperature_subplot = plot(
-        distribution.subs(speed_distribution.equilibrium_temperature, temperature_),
-        (speed_distribution.particle_speed, 0, 1000),
-        label=f"$T = {temperature_} K$",
-        show=False,
-    )
-    temperature_plot.append(temperature_subplot[0])
+temperature_plot.family(
+    distribution,
+    (speed_distribution.particle_speed, 0, 1000),
+    {speed_distribution.equilibrium_temperature: temperatures_},
+    labels=[f"$T = {temperature_} K$" for temperature_ in temperatures_],
+)
 
 temperature_plot.show()
@@ -4,12 +4,11 @@ Plot the distribution function of the Lorentz factor for the Maxwell—Jüttner
 """
 
 from sympy import solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units
 from symplyphysics.core.convert import evaluate_expression
 from symplyphysics.statistical_physics.relativistic_statistics.maxwell_juttner import maxwell_juettner_distribution as distribution_law
 from symplyphysics.statistical_physics.relativistic_statistics.maxwell_juttner import reduced_temperature_in_maxwell_juettner_statistics as reduced_law
+from symplyphysics.plotting import GridPlot
 
 print("Maxwell-Juettner distribution formula:\n")
 print(print_expression(distribution_law.law))
@@ -31,26 +30,23 @@ rhs = evaluate_expression(rhs)
 
 temperatures_ = [1e10, 2e10, 5e10]  # K
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Maxwell—Jüttner distribution of Lorentz factor at different temperatures",
     xlabel=r"Lorentz factor $\gamma$",
     ylabel=r"Probability $f(\gamma)$",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False,
 )
 
 for temperature_ in temperatures_:
+    # the Bessel function depends only on temperature, and is evaluated here since NumPy lacks it
     expr = rhs.subs(
         reduced_law.temperature,
         temperature_,
-    )
-    sub_plot = plot(
+    ).evalf()
+    base_plot.line(
         expr,
         (distribution_law.lorentz_factor, 1, 100),
         label=f"T = {temperature_:.2e} K",
-        show=False,
     )
-    base_plot.extend(sub_plot)
 
 base_plot.show()
@@ -6,8 +6,6 @@ entry speed for different types of materials composing it.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
 from symplyphysics.core.symbols.celsius import to_kelvin, Celsius
 from symplyphysics.thermodynamics.response_functions.heat_capacity import heat_is_heat_capacity_times_temperature_change as thermal_energy_law
@@ -15,6 +13,7 @@ from symplyphysics.quantity_relations import quantity_is_specific_quantity_times
 from symplyphysics.thermodynamics.phase_transitions.latent_heat import latent_heat_of_fusion_via_mass as energy_melting_law
 from symplyphysics.classical_mechanics.conservation_laws import initial_mechanical_energy_equals_final_mechanical_energy as energy_conservation_law
 from symplyphysics.classical_mechanics.dynamics.translational_motion import kinetic_energy_from_mass_and_speed as kinetic_energy_law
+from symplyphysics.plotting import GridPlot
 
 matter_parameters: dict[str, dict[str, float]] = {
     "Fe": {
@@ -104,12 +103,10 @@ coefficient_of_melting_meteorite_to_plots = answer.subs({
     temperature_of_meteorite: 300  # kelvins
 })
 
-base_plot = plot(title="The proportion of a molten meteorite depending on its velocity",
+base_plot = GridPlot(title="The proportion of a molten meteorite depending on its velocity",
     xlabel="$v$, m/s",
     ylabel="molten ratio",
-    backend=MatplotlibBackend,
-    legend=True,
-    show=False)
+    legend=True)
 
 MASSES_RATIO_MAXIMUM = 1
 MASSES_RATIO_MINIMUM = 0
@@ -128,12 +125,10 @@ for matter, parameters in matter_parameters.items():
         {coefficient_of_melting_meteorite: MASSES_RATIO_MINIMUM})
     velocity_minimum = solve(masses_ratio_minimum_equation, velocity_of_meteorite)[-1]
 
-    subplot = plot(
+    base_plot.line(
         masses_ratio_to_subplot.rhs,
         (velocity_of_meteorite, velocity_minimum, velocity_maximum),
         label=matter,
-        show=False,
     )
-    base_plot.append(subplot[0])
 
 base_plot.show()
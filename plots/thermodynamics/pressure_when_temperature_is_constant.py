@@ -4,10 +4,9 @@ Plot the pressure of an ideal gas as a function of its volume during an isotherm
 """
 
 from sympy import solve, symbols
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
 from symplyphysics.thermodynamics.equations_of_state.ideal_gas import pressure_and_volume_in_isothermal_process as boyles_law
+from symplyphysics.plotting import GridPlot
 
 print(f"Formula is:\n{print_expression(boyles_law.law)}")
 
@@ -27,11 +26,7 @@ result_pressure = solved.subs({
 
 print(f"Pressure function is:\n{print_expression(result_pressure)}")
 
-p1 = plot(result_pressure, (volume, 0.01, 1),
-    title="Pressure(Volume)",
-    xlabel="Volume",
-    ylabel="Pressure",
-    backend=MatplotlibBackend,
-    show=False)
+p1 = GridPlot(title="Pressure(Volume)", xlabel="Volume", ylabel="Pressure")
+p1.line(result_pressure, (volume, 0.01, 1))
 
 p1.show()
@@ -5,10 +5,9 @@ Bosé—Einstein distribution.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units
 from symplyphysics.statistical_physics.quantum_statistics.bose_einstein import single_particle_state_distribution as distribution_law
+from symplyphysics.plotting import GridPlot
 
 occupancy = distribution_law.occupancy_of_state
 energy = distribution_law.energy_of_state
@@ -32,27 +31,23 @@ print(
     f"Occupancy as a function of reduced energy and chemical potential:\n\n{print_expression(distribution_expr)}\n"
 )
 
-base_plot = plot(
+base_plot = GridPlot(
     title=
     "Occupancy as a function of reduced energy and chemical potential for Bose—Einstein distribution",
     xlabel=r"$-\varepsilon / k_\text{B} T$",
     ylabel=r"$\bar n$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 values_ = -0.5, -1, -2, -5
 
-for value_ in values_:
-    expr_ = distribution_expr.subs(reduced_chemical_potential, value_)
-    LABEL = r"$\mu = " + (str(value_) if value_ != -1 else "-") + r" k_\text{B} T$" # pylint: disable=invalid-name
-    sub_plot = plot(
-        expr_,
-        (reduced_energy, 0, 5),
-        label=LABEL,
-        show=False,
-    )
-    base_plot.extend(sub_plot)
+base_plot.family(
+    distribution_expr,
+    (reduced_energy, 0, 5),
+    {reduced_chemical_potential: values_},
+    labels=[
+    r"$\mu = " + (str(value_) if value_ != -1 else "-") + r" k_\text{B} T$" for value_ in values_
+    ],
+)
 
 base_plot.show()
@@ -5,10 +5,9 @@ Bosé—Einstein distribution.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units
 from symplyphysics.statistical_physics.quantum_statistics.bose_einstein import single_particle_state_distribution as distribution_law
+from symplyphysics.plotting import GridPlot
 
 occupancy = distribution_law.occupancy_of_state
 energy = distribution_law.energy_of_state
@@ -35,26 +34,22 @@ distribution_expr = solve(
 
 print(f"Occupancy as a function of reduced energy:\n\n{print_expression(distribution_expr)}\n")
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Occupancy as a function of reduced energy for Bose—Einstein distribution",
     xlabel=r"$-\varepsilon/\mu$",
     ylabel=r"$\bar n$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 factors_ = 1, 2, 10, 15
 
-for factor_ in factors_:
-    expr_ = distribution_expr.subs(reduced_temperature, factor_)
-    LABEL = r"$k_\text{B} T = -" + (f"{factor_}" if factor_ != 1 else "") + r"\mu$" # pylint: disable=invalid-name
-    sub_plot = plot(
-        expr_,
-        (reduced_energy, 0, 5),
-        label=LABEL,
-        show=False,
-    )
-    base_plot.extend(sub_plot)
+base_plot.family(
+    distribution_expr,
+    (reduced_energy, 0, 5),
+    {reduced_temperature: factors_},
+    labels=[
+    r"$k_\text{B} T = -" + (f"{factor_}" if factor_ != 1 else "") + r"\mu$" for factor_ in factors_
+    ],
+)
 
 base_plot.show()
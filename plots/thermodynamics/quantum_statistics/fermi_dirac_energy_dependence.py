@@ -5,10 +5,9 @@ Fermi—Dirak distribution.
 """
 
 from sympy import symbols, Eq, solve, S
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units
 from symplyphysics.statistical_physics.quantum_statistics.fermi_dirac import single_particle_state_fermi_distribution as distribution_law
+from symplyphysics.plotting import GridPlot
 
 occupancy = distribution_law.occupancy_of_state
 energy = distribution_law.energy_of_state
@@ -34,26 +33,22 @@ distribution_expr = solve(
 
 print(f"Occupancy as a function of reduced energy:\n\n{print_expression(distribution_expr)}\n")
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Occupancy as a function of reduced energy for Fermi—Dirac distribution",
     xlabel=r"$\varepsilon/\mu$",
     ylabel=r"$\bar n$",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
 factors_ = 1, 2, 10, 100
 
-for factor_ in factors_:
-    expr_ = distribution_expr.subs(reduced_temperature, S.One / factor_)
-    LABEL = r"$k_\text{B} T = \mu" + (f"/{factor_}$" if factor_ != 1 else "$") # pylint: disable=invalid-name
-    sub_plot = plot(
-        expr_,
-        (reduced_energy, 0, 5),
-        label=LABEL,
-        show=False,
-    )
-    base_plot.extend(sub_plot)
+base_plot.family(
+    distribution_expr,
+    (reduced_energy, 0, 5),
+    {reduced_temperature: [S.One / factor_ for factor_ in factors_]},
+    labels=[
+    r"$k_\text{B} T = \mu" + (f"/{factor_}$" if factor_ != 1 else "$") for factor_ in factors_
+    ],
+)
 
 base_plot.show()
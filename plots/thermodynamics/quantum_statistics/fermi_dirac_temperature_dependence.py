@@ -4,10 +4,9 @@ Plot occupancy as a function of reduced temperature for the Fermi—Dirak distri
 """
 
 from sympy import symbols, Eq, solve, S
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression, units
 from symplyphysics.statistical_physics.quantum_statistics.fermi_dirac import single_particle_state_fermi_distribution as distribution_law
+from symplyphysics.plotting import GridPlot
 
 occupancy = distribution_law.occupancy_of_state
 energy = distribution_law.energy_of_state
@@ -26,31 +25,25 @@ distribution_expr = solve([distribution_law.law, reduced_temperature_eqn], (occu
 
 print(f"Occupancy as a function of reduced temperature:\n{print_expression(distribution_expr)}\n")
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Occupancy as a function of reduced temperature for Fermi—Dirac distribution",
     xlabel=r"reduced temperature $T^* = \frac{k_\text{B} T}{\varepsilon - \mu}$",
     ylabel=r"occupancy $\bar n$",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False,
 )
 
-occupancy_plot = plot(
+base_plot.line(
     distribution_expr,
     (reduced_temperature, 0, 15),
     label=r"$\bar n (T^*)$",
-    show=False,
 )
-base_plot.extend(occupancy_plot)
 
 asymptote_expr = distribution_expr.limit(reduced_temperature, S.Infinity)
 
-asymptote_plot = plot(
+base_plot.line(
     asymptote_expr,
     (reduced_temperature, 0, 15),
     label=r"$T^* \to \infty$ asymptote",
-    show=False,
 )
-base_plot.extend(asymptote_plot)
 
 base_plot.show()
@@ -5,9 +5,8 @@ wave speed) for different values of the observer speed.
 """
 
 from sympy import symbols, Eq, solve
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.waves.doppler_effect import frequency_shift_from_speed_in_collinear_motion as shift_law
 
 reduced_frequency = symbols("reduced_frequency")
@@ -62,23 +61,20 @@ print(print_expression(Eq(reduced_frequency, reduced_frequency_expr)))
 # `v` is wave speed, `v_S` is source speed, and `v_O` is observer speed
 # `f_O` is observed frequency, and `f_S` is source frequency
 
-base_plot = plot(
+base_plot = GridPlot(
     title="Reduced observed frequency as a function of reduced source speed",
     xlabel=r"reduced source speed $\frac{v_S}{v}$",
     ylabel=r"reduced observed frequency $\frac{f_O}{f_S}$",
     legend=True,
-    backend=MatplotlibBackend,
-    show=False,
 )
 
-for reduced_observer_speed_ in (-2, -1, -0.5, 0, 0.5, 1):
-    expr = reduced_frequency_expr.subs(reduced_observer_speed, reduced_observer_speed_)
-    sub_plot = plot(
-        expr,
-        (reduced_source_speed, -0.8, 1),
-        label=rf"$\frac{{v_O}}{{v}} = {reduced_observer_speed_}$",
-        show=False,
-    )
-    base_plot.extend(sub_plot)
+reduced_observer_speed_values = (-2, -1, -0.5, 0, 0.5, 1)
+
+base_plot.family(
+    reduced_frequency_expr,
+    (reduced_source_speed, -0.8, 1),
+    {reduced_observer_speed: reduced_observer_speed_values},
+    labels=[rf"$\frac{{v_O}}{{v}} = {v_}$" for v_ in reduced_observer_speed_values],
+)
 
 base_plot.show()
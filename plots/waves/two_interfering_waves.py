@@ -2,9 +2,8 @@
 
 from collections import namedtuple
 from sympy import pi
-from sympy.plotting import plot
-from sympy.plotting.plot import MatplotlibBackend
 from symplyphysics import print_expression
+from symplyphysics.plotting import GridPlot
 from symplyphysics.waves.wave_interference import displacement_in_interfering_waves as interference_law
 
 # Description
@@ -29,23 +28,18 @@ plot_data_ = (
     Data(phi=pi, label=r"\pi"),
 )
 
-p = plot(
+p = GridPlot(
     title="Interference of waves",
     xlabel="position, m",
     ylabel="displacement, m",
-    backend=MatplotlibBackend,
     legend=True,
-    show=False,
 )
 
-for plot_datum in plot_data_:
-    wave_subs = wave.subs(interference_law.phase_shift, plot_datum.phi)
-    sub_p = plot(
-        wave_subs,
-        (interference_law.position, -5, 5),
-        label=f"$\\phi = {plot_datum.label}$",
-        show=False,
-    )
-    p.append(sub_p[0])
+p.family(
+    wave,
+    (interference_law.position, -5, 5),
+    {interference_law.phase_shift: [d.phi for d in plot_data_]},
+    labels=[f"$\\phi = {d.label}$" for d in plot_data_],
+)
 
 p.show()
@@ -12,6 +12,7 @@ from .core.symbols.symbols import (print_expression, clone_as_symbol, global_ind
 from .core.symbols.prefixes import prefixes
 from .core.quantity_decorator import validate_input, validate_output
 from .core.approx import assert_equal
+from .core.preload import preload
 from . import symbols
 from . import quantities
 
@@ -47,6 +48,8 @@ __all__ = [
     "validate_output",
     # approx
     "assert_equal",
+    # preload
+    "preload",
     # physical symbols
     "symbols",
     # physical quantities
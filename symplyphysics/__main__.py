@@ -0,0 +1,30 @@
+"""
+Command line interface of Symplyphysics.
+
+* ``python -m symplyphysics eval`` evaluates a law over the rows of a CSV file, see
+  `symplyphysics.batch`.
+"""
+
+import argparse
+import sys
+from typing import Sequence
+
+from . import batch
+
+_PROG = "python -m symplyphysics"
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=_PROG, description="Symplyphysics command line tools.")
+    parser.add_argument("command", choices=["eval"], help="command to run")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help="arguments of the command")
+    return parser
+
+
+def main(argv: Sequence[str]) -> int:
+    args = get_parser().parse_args(argv)
+    return batch.main(args.arguments, prog=f"{_PROG} {args.command}")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -14,8 +14,9 @@ planets of the Solar System and the Sun (the average radii of the orbits).
 #. `Wikipedia, third formula <https://en.wikipedia.org/wiki/Titius%E2%80%93Bode_law#Original_formulation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
 from sympy.core.numbers import NegativeInfinity
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -14,7 +14,8 @@ Absolute magnitude can be calculated using apparent magnitude and distance to th
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Absolute_magnitude#Apparent_magnitude>`__.
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
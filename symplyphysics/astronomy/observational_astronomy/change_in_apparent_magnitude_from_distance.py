@@ -15,7 +15,8 @@ the ratio of their illuminances, up to a multiplier.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Apparent_magnitude#Calculations>`__.
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ The luminosity of a star can be calculated from the absolute magnitude of the st
 #. `Wikipedia, last formula in paragraph <https://en.wikipedia.org/wiki/Luminosity#Relationship_to_magnitude>`__.
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     validate_input,
     validate_output,
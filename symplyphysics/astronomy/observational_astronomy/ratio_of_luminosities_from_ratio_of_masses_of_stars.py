@@ -15,7 +15,8 @@ luminosity is approximately proportional to the fourth power of mass.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Mass%E2%80%93luminosity_relation>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
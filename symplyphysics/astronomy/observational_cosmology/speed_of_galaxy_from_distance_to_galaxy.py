@@ -15,7 +15,8 @@ the observer.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Hubble%27s_law#>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
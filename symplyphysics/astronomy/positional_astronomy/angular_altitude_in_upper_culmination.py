@@ -15,7 +15,8 @@ local meridian. **Upper culmination** refers to the time when the object reaches
 #. `Wikipedia <https://en.wikipedia.org/wiki/Culmination#>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import units, Quantity, validate_input, validate_output, symbols
 
 altitude = symbols.altitude
@@ -18,7 +18,8 @@ to determine the latitude of the observation site.
     TODO: check possible link <https://cseligman.com/laboratory/navcalc.htm>
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
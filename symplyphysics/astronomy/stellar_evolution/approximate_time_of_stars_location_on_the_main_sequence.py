@@ -17,7 +17,8 @@ well as the masses and luminosities of the Sun and the star.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Main_sequence#Lifetime>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, units, Quantity, validate_input, validate_output, quantities
 
 star_lifetime = symbols.time
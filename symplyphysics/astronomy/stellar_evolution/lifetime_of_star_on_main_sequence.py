@@ -22,7 +22,8 @@ can be approximated from the mass of the star.
    current law with a fixed indicator value.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     units,
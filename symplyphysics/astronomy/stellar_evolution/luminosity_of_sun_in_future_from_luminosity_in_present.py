@@ -17,7 +17,8 @@ The luminosity of the Sun in the future can be calculated from the luminosity of
     TODO find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
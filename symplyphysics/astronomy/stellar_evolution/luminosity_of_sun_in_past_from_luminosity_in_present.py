@@ -13,7 +13,8 @@ The luminosity of the Sun in the past can be calculated from the luminosity of t
     TODO find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
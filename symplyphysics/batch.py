@@ -0,0 +1,317 @@
+"""
+This module evaluates laws over CSV files of any size. Rows are streamed through a pipeline of
+generators in chunks of a fixed number of rows, each chunk is parsed with NumPy and evaluated by a
+single call of the compiled law kernel (see `symplyphysics.core.kernels`), and the results are
+written out as soon as they are ready. The memory use is bounded by the size of the chunks, and the
+chunks can be parsed and evaluated by several worker processes.
+
+* `evaluate_csv` appends the values of a law target to the rows of a CSV file.
+
+Evaluate a law from the command line with::
+
+    python -m symplyphysics eval electromagnetism.circuits.direct_current.current_is_voltage_over_resistance \\
+        --target current --input data.csv --output result.csv --units "voltage=milli*volt" --workers 4
+
+**Notes:**
+
+#. The first row of the input is the header. Columns are matched with the law symbols by their
+   names, other columns are copied to the output as they are. The target is appended as the last
+   column.
+
+#. Values are SI magnitudes unless the units of their columns are given, see
+   `symplyphysics.core.convert.parse_unit`. The unit of the target column can be given as well.
+   Rows that cannot be evaluated, e.g. with missing values, a zero divisor or a complex result,
+   get ``nan``.
+
+#. If the law has several solutions for the target, the principal one is used, e.g. the positive
+   square root, see `symplyphysics.core.kernels.principal_solution`.
+
+#. Quoted fields are supported as long as they do not span several lines.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import itertools
+import sys
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Mapping, Optional, Sequence
+
+import numpy as np
+
+from .core.convert import parse_unit
+from .core.dimensions import assert_equivalent_dimension
+from .core.kernels import LawKernel, compile_law, load_law, real_si_magnitude
+from .core.symbols.quantities import Quantity
+from .core.symbols.symbols import DimensionSymbol
+
+_DEFAULT_CHUNK_SIZE = 65536
+
+
+def _compile(law: str, target: str) -> LawKernel:
+    return compile_law(load_law(law), target, solution=None)
+
+
+@dataclass(frozen=True)
+class _ChunkEvaluator:
+    """
+    Evaluates chunks of CSV lines. Holds only picklable data, so that it can be sent to worker
+    processes, which compile the kernel themselves.
+    """
+
+    law: str
+
+    target: str
+
+    columns: tuple[int, ...]
+    """Indices of the input columns, in the order of the kernel inputs."""
+
+    scales: tuple[float, ...]
+    """Factors converting the input columns to SI magnitudes."""
+
+    output_scale: float
+    """Factor converting the SI magnitudes of the target to the unit of the output column."""
+
+    delimiter: str
+
+    def kernel(self) -> LawKernel:
+        return _compile(self.law, self.target)
+
+    def _parse(self, lines: Sequence[str]) -> np.ndarray:
+        try:
+            return np.loadtxt(lines,
+                delimiter=self.delimiter,
+                usecols=self.columns,
+                quotechar='"',
+                comments=None,
+                ndmin=2,
+                dtype=float)
+        except ValueError:
+            pass
+        # values that are not numbers, e.g. empty cells, are only found by parsing row by row
+        values = np.full((len(lines), len(self.columns)), np.nan)
+        for i, row in enumerate(csv.reader(lines, delimiter=self.delimiter)):
+            for j, column in enumerate(self.columns):
+                try:
+                    values[i, j] = float(row[column])
+                except (IndexError, ValueError):
+                    pass
+        return values
+
+    def __call__(self, lines: Sequence[str]) -> str:
+        values = self._parse(lines) * np.asarray(self.scales)
+        with np.errstate(all="ignore"):
+            result: np.ndarray = self.kernel()(*values.T) * self.output_scale
+        result = np.real_if_close(np.broadcast_to(result, (len(lines),)))
+        if np.iscomplexobj(result):
+            result = np.where(result.imag == 0, result.real, np.nan)
+        result = np.where(np.isfinite(result), result, np.nan)
+        # formatting dominates the evaluation, so it is done with as few Python calls as possible
+        rows = map(self.delimiter.join, zip(lines, map(repr, result.tolist())))
+        return "\n".join(rows) + "\n"
+
+
+_worker_evaluator: Optional[_ChunkEvaluator] = None
+
+
+def _initialize_worker(evaluator: _ChunkEvaluator) -> None:
+    global _worker_evaluator  # pylint: disable=global-statement
+    _worker_evaluator = evaluator
+    evaluator.kernel()
+
+
+def _evaluate_in_worker(lines: Sequence[str]) -> str:
+    assert _worker_evaluator is not None
+    return _worker_evaluator(lines)
+
+
+def _read_chunks(lines: Iterable[str], size: int) -> Iterator[list[str]]:
+    """Yields lists of at most ``size`` non-empty lines without their line breaks."""
+
+    stripped = (line.rstrip("\r\n") for line in lines)
+    rows = (line for line in stripped if line.strip())
+    while chunk := list(itertools.islice(rows, size)):
+        yield chunk
+
+
+def _evaluate_chunks(chunks: Iterable[list[str]], evaluator: _ChunkEvaluator,
+    workers: Optional[int]) -> Iterator[str]:
+    """Yields the evaluated chunks in order, keeping at most two chunks per worker in flight."""
+
+    if not workers or workers <= 1:
+        yield from map(evaluator, chunks)
+        return
+
+    with ProcessPoolExecutor(workers,
+        initializer=_initialize_worker,
+        initargs=(evaluator,)) as executor:
+        pending: deque[Future[str]] = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_evaluate_in_worker, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _scale(unit: Any, name: str, symbol: DimensionSymbol) -> float:
+    unit = parse_unit(unit) if isinstance(unit, str) else unit
+    assert_equivalent_dimension(unit, name, "evaluate_csv", symbol.dimension)
+    return real_si_magnitude(Quantity(unit), symbol)
+
+
+def _open(file: str | Path | IO[str], mode: str) -> tuple[IO[str], bool]:
+    if not isinstance(file, (str, Path)):
+        return file, False
+    if str(file) == "-":
+        return (sys.stdin if mode == "r" else sys.stdout), False
+    # the csv module expects newline translation to be disabled
+    return open(file, mode, encoding="utf-8", newline=""), True  # pylint: disable=consider-using-with
+
+
+def evaluate_csv(law: str,
+    target: str,
+    input_file: str | Path | IO[str],
+    output_file: str | Path | IO[str],
+    *,
+    units: Optional[Mapping[str, Any]] = None,
+    chunk_size: int = _DEFAULT_CHUNK_SIZE,
+    workers: Optional[int] = None,
+    delimiter: str = ",") -> int:
+    """
+    Evaluates the law ``target`` for each row of ``input_file`` and writes the rows along with the
+    values of ``target`` to ``output_file``.
+
+    Args:
+        law: Dotted path of the law module.
+        target: Name of the symbol to evaluate.
+        input_file: Path of the CSV file, ``"-"`` for the standard input, or a text stream.
+        output_file: Path of the CSV file, ``"-"`` for the standard output, or a text stream.
+        units: Units of the columns keyed by the column names, as unit expressions or strings.
+        chunk_size: Number of rows evaluated at once.
+        workers: Number of worker processes, the rows are evaluated in this process by default.
+        delimiter: Delimiter of the CSV fields.
+
+    Returns:
+        The number of evaluated rows.
+
+    Raises:
+        ValueError: If the input has no header or lacks the columns of the law inputs, units are
+            given for unknown columns, or the solution of the law for ``target`` cannot be chosen.
+        UnitsError: If the units of columns do not match the law symbols.
+    """
+
+    if chunk_size < 1:
+        raise ValueError(f"Chunk size should be positive, got {chunk_size}.")
+    kernel = _compile(law, target)
+    units = units or {}
+
+    source, close_source = _open(input_file, "r")
+    try:
+        header_line = source.readline().rstrip("\r\n")
+        if not header_line:
+            raise ValueError("Input should start with a header.")
+        header = next(csv.reader([header_line], delimiter=delimiter))
+        missing = [n for n in kernel.inputs if n not in header]
+        if missing:
+            raise ValueError(f"Input lacks the columns {missing} of the law inputs.")
+        unknown = set(units) - set(header) - {kernel.target}
+        if unknown:
+            raise ValueError(f"Units are given for unknown columns {sorted(unknown)}.")
+
+        evaluator = _ChunkEvaluator(law,
+            kernel.target,
+            tuple(header.index(n) for n in kernel.inputs),
+            tuple(
+            _scale(units[n], n, s) if n in units else 1.0
+            for n, s in zip(kernel.inputs, kernel.input_symbols)),
+            (1 / _scale(units[kernel.target], kernel.target, kernel.target_symbol)
+            if kernel.target in units else 1.0),
+            delimiter,
+        )
+
+        sink, close_sink = _open(output_file, "w")
+        try:
+            sink.write(f"{header_line}{delimiter}{kernel.target}\n")
+            rows = 0
+            for block in _evaluate_chunks(_read_chunks(source, chunk_size), evaluator, workers):
+                sink.write(block)
+                rows += block.count("\n")
+            sink.flush()
+        finally:
+            if close_sink:
+                sink.close()
+    finally:
+        if close_source:
+            source.close()
+    return rows
+
+
+def _unit_option(option: str) -> tuple[str, str]:
+    column, separator, unit = option.partition("=")
+    if not separator or not column or not unit:
+        raise argparse.ArgumentTypeError(f"Expected COLUMN=UNIT, got '{option}'.")
+    return column, unit
+
+
+def get_parser(prog: str = "python -m symplyphysics.batch") -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog=prog,
+        description="Evaluate a Symplyphysics law over the rows of a CSV file.")
+    parser.add_argument("law", help="dotted path of the law module")
+    parser.add_argument("-t", "--target", required=True, help="name of the symbol to evaluate")
+    parser.add_argument("-i",
+        "--input",
+        default="-",
+        help="input CSV file, standard input by default")
+    parser.add_argument("-o",
+        "--output",
+        default="-",
+        help="output CSV file, standard output by default")
+    parser.add_argument("-u",
+        "--units",
+        nargs="+",
+        type=_unit_option,
+        action="extend",
+        default=[],
+        metavar="COLUMN=UNIT",
+        help="units of columns, SI units by default")
+    parser.add_argument("--chunk-size",
+        type=int,
+        default=_DEFAULT_CHUNK_SIZE,
+        help="number of rows evaluated at once")
+    parser.add_argument("-j",
+        "--workers",
+        type=int,
+        default=None,
+        help="number of worker processes")
+    parser.add_argument("-d", "--delimiter", default=",", help="delimiter of the CSV fields")
+    return parser
+
+
+def main(argv: Sequence[str], prog: str = "python -m symplyphysics.batch") -> int:
+    parser = get_parser(prog)
+    args = parser.parse_args(argv)
+    try:
+        evaluate_csv(args.law,
+            args.target,
+            args.input,
+            args.output,
+            units=dict(args.units),
+            chunk_size=args.chunk_size,
+            workers=args.workers,
+            delimiter=args.delimiter)
+    except (ValueError, ImportError) as e:
+        parser.error(str(e))
+    return 0
+
+
+__all__ = ["evaluate_csv"]
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
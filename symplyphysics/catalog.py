@@ -0,0 +1,565 @@
+"""
+This module provides a static catalog of laws. The catalog is built from the syntax trees of the law
+modules without importing them, and can be saved to a JSON file and queried without importing any
+law.
+
+Every law module contributes a `LawEntry` holding its dotted path, title, documented symbols with
+their dimensions, the output symbol of its ``law`` and the signatures of its ``calculate_*``
+functions.
+
+* `build_index` parses the law modules and returns a `LawIndex`.
+* `load_index` loads a previously saved index.
+* `find_laws` looks up laws by the dimensions or the names of their output and input symbols.
+
+Example::
+
+    laws = find_laws(outputs=units.force, inputs=[units.mass, units.acceleration])
+    print([law.module for law in laws])
+
+Build the index file with ``python -m symplyphysics.catalog -o laws.json``.
+
+**Notes:**
+
+#. Symbols are resolved statically, i.e. module members defined as ``symbols.*``, clones of other
+   symbols, or via the ``Symbol``, ``Function`` and ``VectorSymbol`` constructors are recognized.
+   Symbols defined otherwise are omitted from the catalog.
+
+#. Without the index file `find_laws` builds the index from the sources on first use, which takes
+   about a second. Subsequent queries use the cached index.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import functools
+import json
+import sys
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Literal, Mapping, Optional, Sequence
+
+from sympy import Rational, S, sqrt, sympify
+from sympy.physics import units
+from sympy.physics.units import Quantity as SymQuantity
+from sympy.physics.units.definitions.dimension_definitions import angle as angle_type
+from sympy.physics.units.systems.si import SI, dimsys_SI
+
+from .core.dimensions import any_dimension, print_dimension
+from .docs.parse import find_title_and_description
+
+SymbolKind = Literal["symbol", "function", "vector", "vector_function", "indexed"]
+
+_INDEX_VERSION = 1
+_PACKAGE_DIR = Path(__file__).parent
+_EXCLUDED_DIRS = ("core", "docs", "symbols")
+
+_SYMBOL_KINDS: dict[str, SymbolKind] = {
+    "Symbol": "symbol",
+    "Function": "function",
+    "VectorSymbol": "vector",
+    "VectorFunction": "vector_function",
+    "IndexedSymbol": "indexed",
+    "clone_as_symbol": "symbol",
+    "clone_as_function": "function",
+    "clone_as_vector_symbol": "vector",
+    "clone_as_vector_function": "vector_function",
+    "clone_as_indexed": "indexed",
+    "clone_as_indexed_vector": "indexed",
+    "ExactDifferential": "symbol",
+    "InexactDifferential": "symbol",
+}
+
+# position of the dimension argument of the symbol constructors
+_DIMENSION_ARGUMENTS = {
+    "Symbol": 1,
+    "Function": 2,
+    "VectorSymbol": 1,
+    "VectorFunction": 2,
+    "IndexedSymbol": 2,
+}
+
+_DIMENSION_NAMES: dict[str, Any] = {
+    "units": units,
+    "angle_type": angle_type,
+    "dimensionless": S.One,
+    "any_dimension": any_dimension,
+}
+
+_DIMENSION_FUNCTIONS: dict[str, Any] = {
+    "Rational": Rational,
+    "sqrt": sqrt,
+}
+
+
+@dataclass(frozen=True)
+class LawSymbolEntry:
+    """Symbol or function defined in a law module."""
+
+    name: str
+    """Name of the module member."""
+
+    display: str
+    """Code-printed representation of the symbol."""
+
+    kind: SymbolKind
+    """Kind of the symbol."""
+
+    dimension: str
+    """Prettified name of the dimension."""
+
+    base_dimensions: Optional[dict[str, str]] = field(default_factory=dict)
+    """
+    Dependencies of the dimension on the SI base dimensions, with exponents as strings. `None` if
+    the symbol accepts any dimension.
+    """
+
+    origin: Optional[str] = None
+    """Name of the symbol in `symplyphysics.symbols` this symbol is derived from, if any."""
+
+
+@dataclass(frozen=True)
+class LawFunctionEntry:
+    """Signature of a ``calculate_*`` function."""
+
+    name: str
+    """Name of the function."""
+
+    parameters: list[str]
+    """Parameter names of the function."""
+
+    inputs: dict[str, Optional[str]]
+    """Names of the law symbols the parameters are validated against, `None` if unknown."""
+
+    output: Optional[str]
+    """Name of the law symbol the result is validated against, `None` if unknown."""
+
+
+@dataclass(frozen=True)
+class LawEntry:
+    """Catalog entry of a law module."""
+
+    module: str
+    """Dotted path of the module."""
+
+    path: str
+    """Path of the source file relative to the package root."""
+
+    title: str
+    """Title of the law."""
+
+    symbols: list[LawSymbolEntry]
+    """Documented symbols of the module in definition order."""
+
+    output: Optional[str] = None
+    """Name of the symbol on the left-hand side of ``law``, `None` if there is no explicit law."""
+
+    functions: list[LawFunctionEntry] = field(default_factory=list)
+    """The ``calculate_*`` functions of the module."""
+
+    def symbol(self, name: str) -> LawSymbolEntry:
+        for symbol in self.symbols:
+            if symbol.name == name:
+                return symbol
+        raise KeyError(name)
+
+    @property
+    def outputs(self) -> list[LawSymbolEntry]:
+        """Symbols that the law or its functions are solved for."""
+
+        names = [self.output] + [f.output for f in self.functions]
+        return [s for s in self.symbols if s.name in names]
+
+    @staticmethod
+    def from_dict(data: Mapping[str, Any]) -> LawEntry:
+        symbols = [LawSymbolEntry(**s) for s in data["symbols"]]
+        functions = [LawFunctionEntry(**f) for f in data["functions"]]
+        return LawEntry(data["module"], data["path"], data["title"], symbols, data["output"],
+            functions)
+
+
+def _dimension_name(node: ast.expr) -> Any:
+    """Evaluates the dimension expression ``node`` composed of `sympy.physics.units` members."""
+
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return sympify(node.value)
+    if isinstance(node, ast.Name) and node.id in _DIMENSION_NAMES:
+        return _DIMENSION_NAMES[node.id]
+    if isinstance(node, ast.Attribute):
+        value = _dimension_name(node.value)
+        if value is units:
+            return getattr(units, node.attr)
+    if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name) and
+            node.func.id in _DIMENSION_FUNCTIONS and not node.keywords):
+        return _DIMENSION_FUNCTIONS[node.func.id](*(_dimension_name(a) for a in node.args))
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub):
+        return -_dimension_name(node.operand)
+    if isinstance(node, ast.BinOp):
+        left = _dimension_name(node.left)
+        right = _dimension_name(node.right)
+        if isinstance(node.op, ast.Mult):
+            return left * right
+        if isinstance(node.op, ast.Div):
+            return left / right
+        if isinstance(node.op, ast.Pow):
+            return left**right
+    raise ValueError(f"Cannot evaluate dimension '{ast.unparse(node)}'.")
+
+
+def _dimension_of(value: Any) -> Any:
+    if isinstance(value, SymQuantity):
+        return SI.get_quantity_dimension(value)
+    if value.is_number:
+        return units.Dimension(1)
+    return value
+
+
+def base_dimensions(dimension: Any) -> dict[str, str]:
+    """
+    Returns the dependencies of ``dimension`` (or the dimension of a unit) on the SI base
+    dimensions, as stored in the catalog.
+    """
+
+    dependencies = dimsys_SI.get_dimensional_dependencies(_dimension_of(dimension))
+    return {str(k.name): str(v) for k, v in sorted(dependencies.items(), key=lambda i: str(i[0]))}
+
+
+def _dimension_entry(node: ast.expr) -> tuple[str, Optional[dict[str, str]]]:
+    dimension = _dimension_of(_dimension_name(node))
+    if dimension == any_dimension:
+        return "any", None
+    return print_dimension(dimension), base_dimensions(dimension)
+
+
+def _keyword(call: ast.Call, name: str) -> Optional[ast.expr]:
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return keyword.value
+    return None
+
+
+def _string(node: Optional[ast.expr]) -> Optional[str]:
+    if isinstance(node, ast.Constant) and isinstance(node.value, str):
+        return node.value
+    return None
+
+
+class _SymbolResolver:
+    """Resolves module members to symbols without executing the module."""
+
+    def __init__(self, known: Mapping[str, LawSymbolEntry], globals_: Mapping[str, LawSymbolEntry]):
+        self._known = known
+        self._globals = globals_
+
+    def reference(self, node: ast.expr) -> Optional[LawSymbolEntry]:
+        """Resolves ``symbols.name`` or the name of a previously defined member."""
+
+        if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and
+                node.value.id == "symbols"):
+            return self._globals.get(node.attr)
+        if isinstance(node, ast.Name):
+            return self._known.get(node.id)
+        return None
+
+    def resolve(self, name: str, node: ast.expr) -> Optional[LawSymbolEntry]:
+        reference = self.reference(node)
+        if reference is not None:
+            return LawSymbolEntry(name, reference.display, reference.kind, reference.dimension,
+                reference.base_dimensions, reference.origin)
+
+        if not isinstance(node, ast.Call) or not isinstance(node.func, ast.Name):
+            return None
+        constructor = node.func.id
+        kind = _SYMBOL_KINDS.get(constructor)
+        if kind is None:
+            return None
+
+        display = _string(_keyword(node, "display_symbol"))
+        if constructor in _DIMENSION_ARGUMENTS:
+            position = _DIMENSION_ARGUMENTS[constructor]
+            dimension_node = _keyword(node, "dimension")
+            if dimension_node is None and len(node.args) > position:
+                dimension_node = node.args[position]
+            try:
+                dimension, base = (_dimension_entry(dimension_node)
+                    if dimension_node is not None else ("dimensionless", {}))
+            except (ValueError, AttributeError):
+                return None
+            display = display or (_string(node.args[0]) if node.args else None) or name
+            return LawSymbolEntry(name, display, kind, dimension, base)
+
+        source = self.reference(node.args[0]) if node.args else None
+        if source is None:
+            return None
+        display = display or source.display
+        subscript = _string(_keyword(node, "subscript"))
+        if subscript:
+            display = f"{display}_{subscript}"
+        return LawSymbolEntry(name, display, kind, source.dimension, source.base_dimensions,
+            source.origin)
+
+
+def _assignments(module: ast.Module) -> Iterable[tuple[str, ast.expr, Optional[str]]]:
+    """Yields the names, values and docstrings of the module-level assignments."""
+
+    body = module.body
+    for i, stmt in enumerate(body):
+        if not isinstance(stmt, ast.Assign) or len(stmt.targets) != 1:
+            continue
+        target = stmt.targets[0]
+        if not isinstance(target, ast.Name):
+            continue
+        next_stmt = body[i + 1] if i + 1 < len(body) else None
+        doc = _string(next_stmt.value) if isinstance(next_stmt, ast.Expr) else None
+        yield target.id, stmt.value, doc
+
+
+def _parse_global_symbols(directory: Path) -> dict[str, LawSymbolEntry]:
+    """Parses the symbols of `symplyphysics.symbols`."""
+
+    symbols: dict[str, LawSymbolEntry] = {}
+    resolver = _SymbolResolver(symbols, {})
+    for path in sorted(directory.glob("*.py")):
+        module = ast.parse(path.read_text(encoding="utf-8"))
+        for name, value, _ in _assignments(module):
+            symbol = resolver.resolve(name, value)
+            if symbol is not None:
+                symbols[name] = LawSymbolEntry(name, symbol.display, symbol.kind, symbol.dimension,
+                    symbol.base_dimensions, symbol.origin or name)
+    return symbols
+
+
+def _decorator_arguments(function: ast.FunctionDef,
+    symbols: Mapping[str, LawSymbolEntry]) -> tuple[dict[str, Optional[str]], Optional[str]]:
+    inputs: dict[str, Optional[str]] = {}
+    output: Optional[str] = None
+
+    def symbol_name(node: ast.expr) -> Optional[str]:
+        return node.id if isinstance(node, ast.Name) and node.id in symbols else None
+
+    for decorator in function.decorator_list:
+        if not isinstance(decorator, ast.Call) or not isinstance(decorator.func, ast.Name):
+            continue
+        if decorator.func.id == "validate_input":
+            for keyword in decorator.keywords:
+                if keyword.arg is not None:
+                    inputs[keyword.arg] = symbol_name(keyword.value)
+        elif decorator.func.id == "validate_output" and decorator.args:
+            output = symbol_name(decorator.args[0])
+    return inputs, output
+
+
+def _law_output(module: ast.Module, symbols: Mapping[str, LawSymbolEntry]) -> Optional[str]:
+    for name, value, _ in _assignments(module):
+        if name != "law":
+            continue
+        if not (isinstance(value, ast.Call) and isinstance(value.func, ast.Name) and
+                value.func.id == "Eq" and value.args):
+            return None
+        lhs = value.args[0]
+        if isinstance(lhs, ast.Call):
+            lhs = lhs.func
+        return lhs.id if isinstance(lhs, ast.Name) and lhs.id in symbols else None
+    return None
+
+
+def parse_law(source: str, module: str, path: str,
+    global_symbols: Mapping[str, LawSymbolEntry]) -> Optional[LawEntry]:
+    """
+    Parses the ``source`` code of the law ``module``. Returns `None` if the module has no title,
+    i.e. it is not a documented law.
+    """
+
+    tree = ast.parse(source)
+    docstring = ast.get_docstring(tree)
+    parsed_doc = find_title_and_description(docstring) if docstring else None
+    if parsed_doc is None:
+        return None
+    title = parsed_doc[0].strip()
+
+    known: dict[str, LawSymbolEntry] = {}
+    resolver = _SymbolResolver(known, global_symbols)
+    symbols: list[LawSymbolEntry] = []
+    for name, value, doc in _assignments(tree):
+        symbol = resolver.resolve(name, value)
+        if symbol is None:
+            continue
+        known[name] = symbol
+        if doc is not None and not name.startswith("_"):
+            symbols.append(symbol)
+    documented = {s.name: s for s in symbols}
+
+    functions: list[LawFunctionEntry] = []
+    for stmt in tree.body:
+        if isinstance(stmt, ast.FunctionDef) and stmt.name.startswith("calculate_"):
+            inputs, output = _decorator_arguments(stmt, documented)
+            parameters = [arg.arg for arg in stmt.args.args]
+            functions.append(LawFunctionEntry(stmt.name, parameters, inputs, output))
+
+    return LawEntry(module, path, title, symbols, _law_output(tree, documented), functions)
+
+
+class LawIndex:
+    """Collection of catalog entries supporting queries."""
+
+    def __init__(self, laws: Iterable[LawEntry]) -> None:
+        self.laws = list(laws)
+        self._modules = {law.module: law for law in self.laws}
+
+    def __len__(self) -> int:
+        return len(self.laws)
+
+    def __getitem__(self, module: str) -> LawEntry:
+        """Returns the entry of ``module``. The ``symplyphysics.`` prefix may be omitted."""
+
+        if module in self._modules:
+            return self._modules[module]
+        return self._modules[f"symplyphysics.{module}"]
+
+    def find_laws(self, outputs: Any = None, inputs: Iterable[Any] = ()) -> list[LawEntry]:
+        """See `find_laws`."""
+
+        output_matchers = ([_matcher(o) for o in _as_iterable(outputs)]
+            if outputs is not None else [])
+        input_matchers = [_matcher(i) for i in inputs]
+
+        found: list[LawEntry] = []
+        for law in self.laws:
+            candidates = law.outputs if output_matchers else [None]
+            for output in candidates:
+                if output is not None and not any(m(output) for m in output_matchers):
+                    continue
+                rest = [s for s in law.symbols if s is not output]
+                if _assign(input_matchers, rest):
+                    found.append(law)
+                    break
+        return found
+
+    def save(self, path: str | Path) -> None:
+        data = {
+            "version": _INDEX_VERSION,
+            "laws": [asdict(law) for law in self.laws],
+        }
+        Path(path).write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+
+def _as_iterable(value: Any) -> Iterable[Any]:
+    return value if isinstance(value, (list, tuple, set)) else [value]
+
+
+def _matcher(spec: Any) -> Any:
+    if isinstance(spec, str):
+        return lambda symbol: spec in (symbol.origin, symbol.name)
+    dimension = base_dimensions(spec)
+    # symbols of any dimension are only matched by name
+    return lambda symbol: symbol.base_dimensions == dimension
+
+
+def _assign(matchers: Sequence[Any], symbols: Sequence[LawSymbolEntry]) -> bool:
+    """Checks if every matcher can be assigned a distinct symbol."""
+
+    if not matchers:
+        return True
+    first, rest = matchers[0], matchers[1:]
+    for i, symbol in enumerate(symbols):
+        if first(symbol) and _assign(rest, [*symbols[:i], *symbols[i + 1:]]):
+            return True
+    return False
+
+
+def build_index(directory: Optional[str | Path] = None) -> LawIndex:
+    """
+    Builds the index of the laws located in ``directory``, which defaults to the whole package.
+    No law module is imported. Laws outside of the package are named relative to the parent of
+    ``directory``.
+    """
+
+    root = Path(directory).resolve() if directory is not None else _PACKAGE_DIR.resolve()
+    global_symbols = _parse_global_symbols(_PACKAGE_DIR / "symbols")
+    # modules outside of the package are named relative to the parent of ``directory``
+    base = (_PACKAGE_DIR.resolve().parent
+        if root.is_relative_to(_PACKAGE_DIR.resolve()) else root.parent)
+
+    laws: list[LawEntry] = []
+    for path in sorted(root.rglob("*.py")):
+        relative = path.resolve().relative_to(base)
+        parts = relative.with_suffix("").parts
+        if len(parts) > 1 and parts[1] in _EXCLUDED_DIRS:
+            continue
+        if any(p.startswith(("_", ".")) for p in parts):
+            continue
+        module = ".".join(parts)
+        law = parse_law(path.read_text(encoding="utf-8"), module, relative.as_posix(),
+            global_symbols)
+        if law is not None:
+            laws.append(law)
+    return LawIndex(laws)
+
+
+def load_index(path: str | Path) -> LawIndex:
+    """Loads the index saved with `LawIndex.save`."""
+
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("version") != _INDEX_VERSION:
+        raise ValueError(f"Unsupported version of the law index '{path}'.")
+    return LawIndex(LawEntry.from_dict(law) for law in data["laws"])
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_index(path: Optional[str]) -> LawIndex:
+    return load_index(path) if path is not None else build_index()
+
+
+def find_laws(outputs: Any = None,
+    inputs: Iterable[Any] = (),
+    *,
+    index: Optional[LawIndex | str | Path] = None) -> list[LawEntry]:
+    """
+    Returns the laws that can be solved for any of ``outputs`` and that also involve every one of
+    ``inputs``, each input being matched to a distinct symbol.
+
+    Outputs and inputs are either dimensions, units (e.g. ``units.force`` or ``units.newton``) that
+    are matched by their SI base dimensions, or strings that are matched against the names of the
+    symbols in `symplyphysics.symbols` (e.g. ``"mass"``) and the names of the module members.
+
+    ``index`` is either an index or a path to an index file. By default, the index is built from the
+    package sources once per process.
+    """
+
+    if not isinstance(index, LawIndex):
+        index = _cached_index(str(index) if index is not None else None)
+    return index.find_laws(outputs, inputs)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m symplyphysics.catalog",
+        description="Build the static catalog of Symplyphysics laws.")
+    parser.add_argument("-o", "--output", default="laws.json", help="path of the index file")
+    parser.add_argument("--source",
+        default=None,
+        help="directory to index, defaults to the whole package")
+    return parser
+
+
+def main(argv: Sequence[str]) -> None:
+    args = get_parser().parse_args(argv)
+    index = build_index(args.source)
+    index.save(args.output)
+    print(f"Indexed {len(index)} laws into {args.output}.")
+
+
+__all__ = [
+    "SymbolKind",
+    "LawSymbolEntry",
+    "LawFunctionEntry",
+    "LawEntry",
+    "LawIndex",
+    "base_dimensions",
+    "parse_law",
+    "build_index",
+    "load_index",
+    "find_laws",
+]
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
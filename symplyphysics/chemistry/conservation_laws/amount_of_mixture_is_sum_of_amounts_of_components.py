@@ -19,7 +19,8 @@ The total amount of the mixture is equal to the sum of the amounts of each of th
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ The total mass of a closed system is conserved. For more information, see
 #. `Wikipedia <https://en.wikipedia.org/wiki/Conservation_of_mass>`__.
 """
 
-from sympy import Eq, solve, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -20,7 +20,8 @@ The mass is constant in a system that is closed, and mass is not transformed to
 #. `Wikipedia <https://en.wikipedia.org/wiki/Conservation_of_mass>`__.
 """
 
-from sympy import (Eq, dsolve, Derivative)
+from sympy import (Eq, Derivative)
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_function)
 
 time = symbols.time
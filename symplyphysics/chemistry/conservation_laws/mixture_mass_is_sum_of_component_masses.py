@@ -20,7 +20,8 @@ the mixture.
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -17,7 +17,8 @@ proportional to their chemical equivalents.
 #. `BYJU'S <https://byjus.com/chemistry/laws-of-electrolysis/>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities
 
 electrochemical_equivalent = symbols.electrochemical_equivalent
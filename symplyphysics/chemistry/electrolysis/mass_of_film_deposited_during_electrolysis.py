@@ -16,7 +16,8 @@ through a solution or melt of an electrolyte.
 #. `Wikipedia, derivable from here <https://en.wikipedia.org/wiki/Faraday%27s_laws_of_electrolysis#Derivation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, Symbol, dimensionless
 from symplyphysics.quantities import faraday_constant
 
@@ -13,7 +13,8 @@ at an electrode is directly proportional to the charge.
     TODO: replace `I * t` with charge `q`?
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 mass = symbols.mass
@@ -14,7 +14,8 @@ molecular mass.
 #. `Wikipedia, formula in the second paragraph <https://en.wikipedia.org/wiki/Avogadro_constant#>`__.
 """
 
-from sympy import Eq, solve, Idx
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     Quantity,
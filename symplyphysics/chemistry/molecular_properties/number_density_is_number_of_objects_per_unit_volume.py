@@ -10,7 +10,8 @@ See :ref:`Quantity is volumetric density times volume` for a more general law.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Number_density#Definition>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
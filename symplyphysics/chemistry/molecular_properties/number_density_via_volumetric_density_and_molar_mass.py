@@ -15,7 +15,8 @@ amount of substance.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Number_density#Mass_density>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, quantities, symbols
 from symplyphysics.chemistry.molecular_properties import number_density_is_number_of_objects_per_unit_volume
 from symplyphysics.classical_mechanics.fundamentals import density_from_mass_volume
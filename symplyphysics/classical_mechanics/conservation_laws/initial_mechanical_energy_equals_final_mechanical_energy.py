@@ -18,7 +18,8 @@ to another if the forces doing work on the system are conservative in nature.
     TODO: rename file
 """
 
-from sympy import Eq, solve, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
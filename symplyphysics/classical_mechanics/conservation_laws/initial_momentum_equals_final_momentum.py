@@ -18,7 +18,8 @@ system remains constant during and after any interactions between objects. See
     TODO: rename file
 """
 
-from sympy import Eq, solve, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
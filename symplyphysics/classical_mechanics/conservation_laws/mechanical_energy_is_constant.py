@@ -16,7 +16,8 @@ and air resistance, or when such forces can be reasonably neglected.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Conservation_of_energy>`__.
 """
 
-from sympy import (Eq, dsolve, Derivative)
+from sympy import (Eq, Derivative)
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_function)
 
 time = symbols.time
@@ -19,7 +19,8 @@ momentum of the system is the sum of momenta of every object in this system.
     TODO: vector counterpart of this law
 """
 
-from sympy import (Derivative, Eq, dsolve)
+from sympy import (Derivative, Eq)
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_function)
 
 time = symbols.time
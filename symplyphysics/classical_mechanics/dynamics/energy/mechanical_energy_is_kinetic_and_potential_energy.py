@@ -14,7 +14,8 @@ potential energy.
 #. `Wikipedia - Mechanical energy <https://en.wikipedia.org/wiki/Mechanical_energy#General>`__
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
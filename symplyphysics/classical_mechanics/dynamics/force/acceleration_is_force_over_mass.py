@@ -12,7 +12,8 @@ to the net force exerted on the body.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Newton's_laws_of_motion#Second_law>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.classical_mechanics.dynamics.force import acceleration_from_force_vector as acceleration_law
 
@@ -14,7 +14,8 @@ and friction force.
     TODO: reformulate in terms of the coefficient of friction?
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
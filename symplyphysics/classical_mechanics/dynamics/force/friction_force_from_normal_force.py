@@ -11,7 +11,8 @@ friction force is proportional to the normal force between the two objects.
 #. `Physics LibreTexts <https://phys.libretexts.org/Courses/Tuskegee_University/Algebra_Based_Physics_I/04%3A_Dynamics-_Force_and_Newton%27s_Laws_of_Motion/4.07%3A_Friction>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (clone_as_symbol, symbols, Quantity, validate_input, validate_output)
 
 friction_force = clone_as_symbol(symbols.force, display_symbol="F_fr", display_latex="F_\\text{fr}")
@@ -14,7 +14,8 @@ The net force is the arithmetic sum of forces.
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (symbols, Quantity, validate_input, validate_output, global_index,
     IndexedSum)
 from symplyphysics.core.expr_comparisons import expr_equals
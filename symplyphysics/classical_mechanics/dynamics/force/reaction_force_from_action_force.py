@@ -14,7 +14,8 @@ directions.
     TODO: make vector version of this law
 """
 
-from sympy import (Eq, solve, Idx)
+from sympy import (Eq, Idx)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (clone_as_symbol, symbols, Quantity, validate_input, validate_output,
     global_index)
 from symplyphysics.core.expr_comparisons import expr_equals
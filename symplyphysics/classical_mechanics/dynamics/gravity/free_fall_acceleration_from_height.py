@@ -10,7 +10,8 @@ Free fall acceleration from height
 #. :quantity_notation:`gravitational_constant`.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.dynamics.gravity import gravity_force_from_mass_and_distance as gravity_law
@@ -15,7 +15,8 @@ bodies and inversely proportional to the distance squared between the bodies.
 #. `Physics LibreTexts. Newton's Law of Universal Gravitation (5.1.1.1) <https://phys.libretexts.org/Workbench/PH_245_Textbook_V2/13%3A_Gravitation/13.02%3A_Newton's_Law_of_Universal_Gravitation>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, clone_as_symbol, symbols,
     quantities)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -17,7 +17,8 @@ other objects.
     TODO: add note that it is specifically gravitational potential energy => move to `gravity`?
 """
 
-from sympy import Eq, solve, symbols as sym_symbols
+from sympy import Eq, symbols as sym_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
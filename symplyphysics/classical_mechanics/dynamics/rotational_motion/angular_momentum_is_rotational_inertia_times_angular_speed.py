@@ -17,7 +17,8 @@ of its angular velocity.
 #. `Wikipedia, vector counterpart of this law <https://en.wikipedia.org/wiki/Angular_momentum#Orbital_angular_momentum_in_three_dimensions>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 from symplyphysics.core.expr_comparisons import expr_equals
 
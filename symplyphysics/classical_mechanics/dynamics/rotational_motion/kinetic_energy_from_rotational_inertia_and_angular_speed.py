@@ -10,7 +10,8 @@ and its angular speed.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Kinetic_energy#Rotating_bodies>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -11,7 +11,8 @@ and the angular displacement during the movement of the body.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Work_(physics)#Torque_and_rotation>`__.
 """
 
-from sympy import Eq, integrate, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import integrate, solve
 from symplyphysics import (
     symbols,
     Quantity,
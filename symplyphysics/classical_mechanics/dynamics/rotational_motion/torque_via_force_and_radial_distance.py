@@ -14,7 +14,8 @@ Torque via force and radial distance
 #. `Wikipedia <https://en.wikipedia.org/wiki/Torque#Definition_and_relation_to_other_physical_quantities>`__.
 """
 
-from sympy import Eq, solve, sin, symbols as sympy_symbols
+from sympy import Eq, sin, symbols as sympy_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.core.symbols.quantities import scale_factor
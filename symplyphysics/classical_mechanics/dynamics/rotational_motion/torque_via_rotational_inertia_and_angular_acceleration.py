@@ -10,7 +10,8 @@ on a mechanical object causing its rotational motion.
 #. `Wikipedia, last formula in paragraph <https://en.wikipedia.org/wiki/Torque#Relationship_with_the_angular_momentum>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
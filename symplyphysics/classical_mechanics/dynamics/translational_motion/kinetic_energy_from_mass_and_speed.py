@@ -9,7 +9,8 @@ The *kinetic energy* of a body is the form of energy that it possesses due to it
 #. `Wikipedia <https://en.wikipedia.org/wiki/Kinetic_energy#>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
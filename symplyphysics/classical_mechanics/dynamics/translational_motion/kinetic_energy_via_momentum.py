@@ -13,7 +13,8 @@ Kinetic energy can be expressed as a function of momentum and mass.
 #. `Wikipedia, fourth formula <https://en.wikipedia.org/wiki/Kinetic_energy#Kinetic_energy_of_rigid_bodies>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
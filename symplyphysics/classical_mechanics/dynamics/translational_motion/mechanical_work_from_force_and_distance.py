@@ -33,7 +33,8 @@ Work is scalar value equal to force multiplied by distance.
     NOTE: include angle in the formula?
 """
 
-from sympy import Eq, solve, Q, refine
+from sympy import Eq, Q, refine
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output
 from symplyphysics.core.expr_comparisons import expr_equals
 
@@ -10,7 +10,8 @@ not only in the case of variable mass, but also in the relativistic case.
 #. `Wikipedia, derivable from here <https://en.wikipedia.org/wiki/Kinetic_energy#With_vector_calculus>`__.
 """
 
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_function
 from symplyphysics.core.expr_comparisons import expr_equals
 
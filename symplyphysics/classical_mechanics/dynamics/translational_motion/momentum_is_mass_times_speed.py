@@ -13,7 +13,8 @@ The *momentum* of an object equals the product of its mass and speed.
 #. `Wikipedia - Momentum <https://en.wikipedia.org/wiki/Momentum#Single_particle>`__
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 momentum = symbols.momentum
@@ -14,7 +14,8 @@ Volumetric mass *density* is the mass of substance contained in a unit volume of
 #. `Wikipedia — Density <https://en.wikipedia.org/wiki/Density>`__
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
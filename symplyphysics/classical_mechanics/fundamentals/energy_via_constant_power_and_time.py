@@ -16,7 +16,8 @@ When power is constant, energy can be expressed as a product of power and time.
     TODO Move to another folder? this law is not exclusive to electrodynamics
 """
 
-from sympy import Eq, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     Quantity,
     validate_input,
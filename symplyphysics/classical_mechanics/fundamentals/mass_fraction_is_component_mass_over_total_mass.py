@@ -14,7 +14,8 @@ mass to the total mass of the mixture.
 #. `Wikipedia - Mass fraction <https://en.wikipedia.org/wiki/Mass_fraction_(chemistry)>`__
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -9,7 +9,8 @@ Centripetal acceleration via linear speed and radius
 #. `Physics LibreTexts, first part of equation 6.2.5 <https://phys.libretexts.org/Bookshelves/College_Physics/College_Physics_1e_(OpenStax)/06%3A_Uniform_Circular_Motion_and_Gravitation/6.02%3A_Centripetal_Acceleration>`__.
 """
 
-from sympy import Eq, solve, sin, cos, Derivative, pi
+from sympy import Eq, sin, cos, Derivative, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (clone_as_symbol, symbols, Quantity, validate_input, validate_output,
     clone_as_function)
 from symplyphysics.core.expr_comparisons import expr_equals, expr_equals_abs
@@ -14,7 +14,8 @@ of the velocity vector, and its vector is tangent to the path of the body.
 #. Equation 10-22 on p. 269 of "Fundamentals of Physics" by David Halladay et al., 10th Ed.
 """
 
-from sympy import Eq, solve, Derivative
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
@@ -23,7 +23,8 @@ The maximum height that a body thrown vertically will rise to depends on the ini
     TODO: move to kinetimatics
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -24,7 +24,8 @@ velocity and the horizon, and the magnitude of the free fall acceleration.
 #. `Physics LibreTexts. Projectile Motion, Maximum Height (3.3.14) <https://phys.libretexts.org/Bookshelves/University_Physics/Physics_(Boundless)/3%3A_Two-Dimensional_Kinematics/3.3%3A_Projectile_Motion>`__.
 """
 
-from sympy import Eq, solve, sin, pi
+from sympy import Eq, sin, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -22,7 +22,8 @@ of free fall.
     TODO rename file
 """
 
-from sympy import Eq, solve, sin, pi
+from sympy import Eq, sin, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities, clone_as_symbol
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.kinematics.translational_motion import position_via_constant_acceleration_and_time as distance_law
@@ -22,7 +22,8 @@ of free fall.
     TODO rename file
 """
 
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ length of a circular path and its radius (distance to the axis).
 #. `openstax, table 6.2, first line <https://openstax.org/books/physics/pages/6-3-rotational-motion>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 from symplyphysics.core.expr_comparisons import expr_equals
 
@@ -13,7 +13,8 @@ position is a linear function of time.
 #. `Wikipedia, second out of the last four equations in the paragraph <https://en.wikipedia.org/wiki/Kinematics#Acceleration_2>`__.
 """
 
-from sympy import Eq, solve, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
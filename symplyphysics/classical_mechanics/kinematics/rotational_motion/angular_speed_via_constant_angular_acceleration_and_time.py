@@ -15,7 +15,8 @@ speed is a linear function of time.
 #. `Wikipedia, first out of the last four equations in the paragraph <https://en.wikipedia.org/wiki/Kinematics#Acceleration_2>`__.
 """
 
-from sympy import Eq, dsolve, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
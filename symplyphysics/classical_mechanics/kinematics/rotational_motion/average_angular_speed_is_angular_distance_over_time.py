@@ -10,7 +10,8 @@ the rate of change in angle of rotation over time.
 #. `BYJU's <https://byjus.com/physics/angular-velocity/#average-angular-velocity>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.core.symbols.quantities import scale_factor
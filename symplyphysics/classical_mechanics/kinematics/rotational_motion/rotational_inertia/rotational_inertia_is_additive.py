@@ -15,7 +15,8 @@ inertia of each part of the system.
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, IndexedSum, symbols
 from symplyphysics.core.symbols.symbols import clone_as_indexed
 
@@ -16,7 +16,8 @@ If a body is moving with a constant acceleration, its position in space is a qua
     TODO: make a vector counterpart of this law
 """
 
-from sympy import Eq, solve, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output, clone_as_symbol
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.kinematics.translational_motion import speed_is_distance_derivative as _velocity_definition
@@ -14,7 +14,8 @@ of time.
 #. `Wikipedia, derivable from the vector counterpart of this law <https://en.wikipedia.org/wiki/Kinematics#Relative_acceleration>`__.
 """
 
-from sympy import (Eq, solve, dsolve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.kinematics.translational_motion import speed_is_distance_derivative as velocity_definition
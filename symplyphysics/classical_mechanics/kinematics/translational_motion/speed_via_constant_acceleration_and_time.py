@@ -17,7 +17,8 @@ of time.
     TODO: make a vector counterpart of this law
 """
 
-from sympy import (Eq, solve, dsolve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (symbols, Quantity, validate_input, validate_output, clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
 
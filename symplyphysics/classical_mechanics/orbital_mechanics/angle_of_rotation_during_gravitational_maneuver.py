@@ -18,7 +18,8 @@ and the velocity of the rocket relative to the planet.
     TODO find link to law
 """
 
-from sympy import Eq, solve, atan
+from sympy import Eq, atan
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output, quantities
 
 angle = symbols.angle
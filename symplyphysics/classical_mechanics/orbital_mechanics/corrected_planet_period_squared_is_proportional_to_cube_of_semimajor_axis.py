@@ -17,7 +17,8 @@ on the attracting mass, but also on the mass of the planet itself.
 #. Sivukhin D.V. (1979), *Obshchiy kurs fiziki* [General course of Physics], vol. 1, p. 321, (59.3).
 """
 
-from sympy import Eq, pi, solve
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
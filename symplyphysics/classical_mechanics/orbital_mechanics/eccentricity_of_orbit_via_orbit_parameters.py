@@ -11,7 +11,8 @@ used to judge the elongation of the elliptical orbit.
 #. `Wikipedia, ellipse <https://en.wikipedia.org/wiki/Eccentricity_(mathematics)#Standard_form>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ First escape velocity
 #. `Wikipedia <https://en.wikipedia.org/wiki/Escape_velocity#From_an_orbiting_body>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.dynamics.gravity import gravity_force_from_mass_and_distance as gravity_force_law
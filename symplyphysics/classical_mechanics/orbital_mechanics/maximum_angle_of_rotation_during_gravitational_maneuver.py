@@ -17,7 +17,8 @@ when aiming range is at planet radius.
     TODO find link
 """
 
-from sympy import (Eq, solve, atan)
+from sympy import (Eq, atan)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
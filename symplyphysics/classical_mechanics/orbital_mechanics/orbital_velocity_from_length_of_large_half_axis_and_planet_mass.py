@@ -20,7 +20,8 @@ planet and the orbit configuration parameters.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Orbital_speed#Instantaneous_orbital_speed>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities
 
 orbital_speed = symbols.speed
@@ -10,7 +10,8 @@ the period of rotation of any planet to the semi-major axis of its orbit.
 #. `Physics LibreTexts. Kepler's Third Law, Derivation of Kepler's Third Law (5.6.23) <https://phys.libretexts.org/Bookshelves/University_Physics/Physics_(Boundless)/5%3A_Uniform_Circular_Motion_and_Gravitation/5.6%3A_Keplers_Laws>`__.
 """
 
-from sympy import Eq, solve, pi, Symbol as SymSymbol
+from sympy import Eq, pi, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
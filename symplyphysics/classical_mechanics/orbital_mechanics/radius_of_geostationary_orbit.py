@@ -18,7 +18,8 @@ angular speed of the Earth's rotation around its axis.
     TODO: find link with exact formula
 """
 
-from sympy import (Eq, Rational, solve, Symbol as SymSymbol)
+from sympy import (Eq, Rational, Symbol as SymSymbol)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
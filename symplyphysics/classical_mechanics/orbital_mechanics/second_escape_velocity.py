@@ -15,7 +15,8 @@ the gravitational attraction of this celestial body and leave a closed orbit aro
 #. `Physics LibreTexts. Conservation of Energy, Escape velocity (13.4.10) <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/Book%3A_University_Physics_I_-_Mechanics_Sound_Oscillations_and_Waves_(OpenStax)/13%3A_Gravitation/13.04%3A_Gravitational_Potential_Energy_and_Total_Energy>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output, quantities
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.dynamics.gravity import gravitational_potential_energy as potential_energy_law
@@ -13,7 +13,8 @@ rotates and the orbital velocity.
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -13,7 +13,8 @@ that it can overcome the gravitational attraction of the Earth and the Sun and l
     TODO: find English link
 """
 
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
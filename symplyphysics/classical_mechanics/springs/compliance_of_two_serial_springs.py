@@ -14,7 +14,8 @@ total compliance of the system of springs is the sum of the compliances of each
 #. `Wikipedia <https://en.wikipedia.org/wiki/Series_and_parallel_springs#Formulas>`__.
 """
 
-from sympy import Eq, solve, Symbol as SymSymbol
+from sympy import Eq, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
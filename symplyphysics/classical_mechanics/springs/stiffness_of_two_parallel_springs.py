@@ -15,7 +15,8 @@ spring.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Series_and_parallel_springs#Formulas>`__.
 """
 
-from sympy import Eq, solve, Idx
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, global_index, symbols,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
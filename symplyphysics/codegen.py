@@ -0,0 +1,305 @@
+"""
+This module generates standalone Python modules evaluating laws with NumPy, so that laws can be
+evaluated without importing SymPy or Symplyphysics. A generated module holds a vectorized
+``calculate_<target>`` function for each target symbol of the law. The functions take and return
+SI magnitudes, and document the SI units of their arguments and results.
+
+* `generate_law_module` returns the source code of the module generated from a law.
+* `generate_package` generates the modules of all laws of a package, mirroring its structure.
+
+Example::
+
+    source = generate_law_module(
+        "electromagnetism.circuits.direct_current.current_is_voltage_over_resistance")
+
+Generate a whole domain with
+``python -m symplyphysics.codegen electromagnetism.circuits -o generated --check-dimensions``.
+
+**Notes:**
+
+#. If the module is generated with ``check_dimensions=True``, each argument can also be given as a
+   ``(magnitude, dimension)`` pair, where ``dimension`` maps the SI base dimensions to their
+   exponents, e.g. ``(3.0, {"length": 1, "time": -1})``. Such arguments are checked against the
+   dimensions of the law symbols on entry.
+
+#. Laws are solved for their targets with the same rules as numeric kernels (see
+   `symplyphysics.core.kernels`). If a law has several solutions for a target, its principal
+   solution is generated, see `symplyphysics.core.kernels.principal_solution`. Targets that cannot
+   be solved or compiled are skipped.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``. Generated
+   modules only require NumPy.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Optional, Sequence
+
+from sympy import Expr, Symbol as SymSymbol, cse, numbered_symbols
+from sympy.core.function import AppliedUndef
+from sympy.printing.numpy import NumPyPrinter
+
+from .catalog import base_dimensions, build_index
+from .core.dimensions import dimension_to_si_unit
+from .core.kernels import LawKernel, compile_law, law_symbols, load_law
+from .core.symbols.symbols import DimensionSymbol
+
+_PACKAGE_PREFIX = "symplyphysics."
+_PACKAGE_DIR = Path(__file__).parent
+
+_CHECK_HELPER = '''
+def _magnitude(name: str, value: ArrayLike) -> numpy.ndarray:
+    """
+    Returns the magnitude of ``value`` given either in SI units or as a ``(magnitude, dimension)``
+    pair, in which case the dimension is checked.
+    """
+
+    if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], dict):
+        magnitude, dimension = value
+        actual = {k: Fraction(str(v)) for k, v in dimension.items() if v}
+        if actual != _DIMENSIONS[name]:
+            raise ValueError(f"Argument '{name}' should have dimension {_DIMENSIONS[name]}, "
+                f"got {actual}.")
+        value = magnitude
+    return numpy.asarray(value)
+'''
+
+
+@dataclass
+class CodegenReport:
+    """Summary of a `generate_package` run."""
+
+    generated: list[str] = field(default_factory=list)
+    """Paths of the generated files."""
+
+    failed: dict[str, str] = field(default_factory=dict)
+    """Error messages of the law modules that could not be generated, keyed by their dotted paths."""
+
+
+def _law_title(module: ModuleType) -> str:
+    lines = (module.__doc__ or "").strip().splitlines()
+    return lines[0].strip() if lines else module.__name__
+
+
+def _unit(symbol: DimensionSymbol) -> str:
+    unit = str(dimension_to_si_unit(symbol.dimension))
+    return "dimensionless" if unit == "1" else unit
+
+
+def _dimension(symbol: DimensionSymbol) -> str:
+    exponents = (f"{k!r}: Fraction({v!r})"
+        for k, v in base_dimensions(symbol.dimension).items()
+        if v != "0")
+    return "{" + ", ".join(exponents) + "}"
+
+
+def _explicit_target(module: ModuleType) -> Optional[str]:
+    lhs = module.law.lhs
+    if isinstance(lhs, AppliedUndef):
+        lhs = lhs.func
+    for name, symbol in law_symbols(module).items():
+        if symbol == lhs:
+            return name
+    return None
+
+
+def _printed_body(kernel: LawKernel) -> list[str]:
+    # applied functions are evaluated at the point, hence they are plain arguments
+    arguments: dict[Expr, Expr] = {}
+    applications = {a.func: a for a in kernel.expr.atoms(AppliedUndef)}
+    for name, symbol in zip(kernel.inputs, kernel.input_symbols):
+        arguments[applications.get(symbol, symbol)] = SymSymbol(name)
+    expr = kernel.expr.xreplace(arguments)
+
+    printer = NumPyPrinter()
+    replacements, (reduced,) = cse(expr, symbols=numbered_symbols("_x"))
+    lines = [f"{s} = {printer.doprint(e)}" for s, e in replacements]
+    result = printer.doprint(reduced)
+    # constant laws still return arrays
+    lines.append(f"return {result}" if kernel.inputs else f"return numpy.asarray({result})")
+    return lines
+
+
+def _function_source(kernel: LawKernel, check_dimensions: bool) -> str:
+    arguments = ", ".join(f"{n}: ArrayLike" for n in kernel.inputs)
+    lines = [
+        f"def calculate_{kernel.target}({arguments}) -> numpy.ndarray:",
+        '    """',
+        f"    Calculates ``{kernel.target}`` in {_unit(kernel.target_symbol)}.",
+    ]
+    if kernel.inputs:
+        lines.extend(["", "    Args:"])
+        lines.extend(f"        {n}: {s.display_name} in {_unit(s)}."
+            for n, s in zip(kernel.inputs, kernel.input_symbols))
+    lines.extend(['    """', ""])
+
+    convert = "_magnitude({0!r}, {0})" if check_dimensions else "numpy.asarray({0})"
+    lines.extend(f"    {n} = {convert.format(n)}" for n in kernel.inputs)
+    lines.extend(f"    {line}" for line in _printed_body(kernel))
+    return "\n".join(lines) + "\n"
+
+
+def generate_law_module(law: ModuleType | str,
+    targets: Optional[Sequence[str]] = None,
+    *,
+    check_dimensions: bool = False) -> str:
+    """
+    Returns the source code of the module evaluating the ``law`` module, or the law at the dotted
+    path, for each of the ``targets``. ``targets`` are names of the law symbols and default to the
+    left-hand side of the law. If ``check_dimensions`` is `True`, the dimensions of arguments given
+    along with their dimensions are checked.
+
+    Raises:
+        ValueError: If none of the ``targets`` can be solved and compiled.
+    """
+
+    module = load_law(law) if isinstance(law, str) else law
+    if targets is None:
+        explicit = _explicit_target(module)
+        if explicit is None:
+            raise ValueError("Law is not written in the explicit form, specify the targets.")
+        targets = [explicit]
+
+    kernels: list[LawKernel] = []
+    errors: list[str] = []
+    for target in targets:
+        try:
+            kernels.append(compile_law(module, target, solution=None))
+        except (ValueError, TypeError, NotImplementedError) as e:
+            errors.append(str(e))
+    if not kernels:
+        raise ValueError(f"Law cannot be generated: {' '.join(errors)}")
+
+    header = [
+        '"""',
+        _law_title(module),
+        "",
+        f"Generated from ``{module.__name__}`` by ``python -m symplyphysics.codegen``, do not edit.",
+        "All values are SI magnitudes.",
+        "",
+        f"Law: ``{module.law}``",
+        '"""',
+        "",
+    ]
+    if check_dimensions:
+        header.append("from fractions import Fraction")
+    header.extend(["import numpy", "from numpy.typing import ArrayLike", ""])
+
+    parts = ["\n".join(header)]
+    if check_dimensions:
+        dimensions: dict[str, DimensionSymbol] = {}
+        for kernel in kernels:
+            dimensions.update(zip(kernel.inputs, kernel.input_symbols))
+        parts.append("_DIMENSIONS = {\n" + "".join(f"    {n!r}: {_dimension(s)},\n"
+            for n, s in dimensions.items()) + "}\n")
+        parts.append(_CHECK_HELPER)
+    parts.extend(_function_source(k, check_dimensions) for k in kernels)
+    parts.append(f"__all__ = [{', '.join(repr('calculate_' + k.target) for k in kernels)}]\n")
+
+    source = "\n\n".join(p.strip("\n") + "\n" for p in parts)
+    # the generated source is always valid, this guards against printing errors
+    ast.parse(source)
+    return source
+
+
+def _package_docstring(package: str) -> str:
+    return f'"""\nLaws of ``{package}`` generated by ``python -m symplyphysics.codegen``.\n"""\n'
+
+
+def generate_package(package: str,
+    output_dir: str | Path,
+    *,
+    all_targets: bool = False,
+    check_dimensions: bool = False) -> CodegenReport:
+    """
+    Generates the modules of all laws within the dotted ``package`` path in ``output_dir``, which
+    becomes a package mirroring the structure of ``package``. If ``all_targets`` is `True`, the laws
+    are generated for all of their symbols rather than for their left-hand sides.
+    """
+
+    if not package.startswith(_PACKAGE_PREFIX):
+        package = _PACKAGE_PREFIX + package
+    relative = package.removeprefix(_PACKAGE_PREFIX).split(".")
+    index = build_index(_PACKAGE_DIR.joinpath(*relative))
+
+    output = Path(output_dir)
+    report = CodegenReport()
+    for entry in index.laws:
+        try:
+            module = load_law(entry.module)
+            targets = list(law_symbols(module)) if all_targets else None
+            source = generate_law_module(module, targets, check_dimensions=check_dimensions)
+        except ValueError as e:
+            report.failed[entry.module] = str(e)
+            continue
+
+        parts = entry.module.removeprefix(package).lstrip(".").split(".")
+        path = output.joinpath(*parts).with_suffix(".py")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # every directory becomes a package
+        directory = path.parent
+        while True:
+            init = directory / "__init__.py"
+            if not init.exists():
+                name = ".".join([package, *directory.relative_to(output).parts])
+                init.write_text(_package_docstring(name), encoding="utf-8")
+            if directory == output:
+                break
+            directory = directory.parent
+        path.write_text(source, encoding="utf-8")
+        report.generated.append(str(path))
+    return report
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m symplyphysics.codegen",
+        description="Generate standalone NumPy modules from Symplyphysics laws.")
+    parser.add_argument("source", help="dotted path of a law module or a package of laws")
+    parser.add_argument("-o", "--output", required=True, help="output file or directory")
+    parser.add_argument("-t",
+        "--target",
+        action="append",
+        default=None,
+        help="target symbol of a law module, can be repeated")
+    parser.add_argument("--all-targets",
+        action="store_true",
+        help="generate packages for all symbols of the laws")
+    parser.add_argument("--check-dimensions",
+        action="store_true",
+        help="check the dimensions of arguments on entry")
+    return parser
+
+
+def main(argv: Sequence[str]) -> int:
+    args = get_parser().parse_args(argv)
+    source = args.source.removeprefix(_PACKAGE_PREFIX)
+    if _PACKAGE_DIR.joinpath(*source.split(".")).is_dir():
+        report = generate_package(source,
+            args.output,
+            all_targets=args.all_targets,
+            check_dimensions=args.check_dimensions)
+        print(f"Generated {len(report.generated)} modules in {args.output}.")
+        for module, message in report.failed.items():
+            print(f"  skipped {module}: {message}")
+        return 0
+
+    code = generate_law_module(source, args.target, check_dimensions=args.check_dimensions)
+    Path(args.output).write_text(code, encoding="utf-8")
+    print(f"Generated {args.output}.")
+    return 0
+
+
+__all__ = [
+    "CodegenReport",
+    "generate_law_module",
+    "generate_package",
+]
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -16,7 +16,8 @@ diffraction is a consequence of interference between waves reflected from crysta
 #. `Wikipedia <https://en.wikipedia.org/wiki/Bragg%27s_law#Bragg_condition>`__.
 """
 
-from sympy import Eq, solve, sin
+from sympy import Eq, sin
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -16,7 +16,8 @@ of the positive charges at this point.
 #. `Wikipedia, first formula with adjustments <https://en.wikipedia.org/wiki/Electron_mobility#Relation_to_current_density>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ this is the drift.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Drift_velocity#>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 drift_velocity = symbols.drift_velocity
@@ -14,7 +14,8 @@ temperature coefficient and resistance at zero degrees celsius may differ.
 #. `BYJU's, similar formula for resistivity <https://byjus.com/physics/resistivity-temperature-dependence/>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     units,
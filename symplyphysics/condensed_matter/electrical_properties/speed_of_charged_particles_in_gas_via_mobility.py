@@ -16,7 +16,8 @@ on the local value of the electric intensity.
     TODO: create usual law `v = mu * E`
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, Symbol, validate_input, validate_output, symbols)
 
 speed = symbols.speed
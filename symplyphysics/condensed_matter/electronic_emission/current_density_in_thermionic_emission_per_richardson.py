@@ -16,7 +16,8 @@ the material. This formula for emission current density was proposed by Owen Wil
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Thermionic_emission#Richardson's_law>`__.
 """
 
-from sympy import (Eq, solve, exp)
+from sympy import (Eq, exp)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     quantities,
@@ -14,7 +14,8 @@ the time spent by the electron near the atom decreases.
     TODO: move to `ionization` folder?
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -18,7 +18,8 @@ Lotz-Drewin approximation for the ionization cross section is considered.
     TODO: move to `ionization` folder?
 """
 
-from sympy import Eq, solve, pi, log
+from sympy import Eq, pi, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, Symbol, validate_input, validate_output, dimensionless,
     symbols, clone_as_symbol)
 from symplyphysics.quantities import bohr_radius, hydrogen_ionization_energy
@@ -15,7 +15,8 @@ the energy distribution of electrons and can be approximated by the expression b
     TODO: move to `ionization` folder?
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
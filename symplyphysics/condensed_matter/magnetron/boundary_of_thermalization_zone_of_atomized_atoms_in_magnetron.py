@@ -17,7 +17,8 @@ which its energy will be equal to the energy of thermal motion in a gas-discharg
     TODO: move to `magnetron` folder?
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 boundary_of_thermalization_zone = symbols.length
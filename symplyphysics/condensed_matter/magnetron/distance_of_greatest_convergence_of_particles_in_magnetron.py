@@ -14,7 +14,8 @@ anode in the magnetron at which plasma occurs.
     TODO: move to `magnetron` folder?
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
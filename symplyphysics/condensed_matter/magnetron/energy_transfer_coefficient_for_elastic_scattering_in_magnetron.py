@@ -10,7 +10,8 @@ the mass of the traveling atom and the mass of the gas atom.
     TODO: find link and check file
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, Symbol, validate_input, validate_output, dimensionless,
     convert_to_float, clone_as_symbol, symbols)
 
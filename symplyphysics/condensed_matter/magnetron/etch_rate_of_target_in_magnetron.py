@@ -16,7 +16,8 @@ In other words, this is how much thinner a target becomes per unit of time.
     TODO: move to `magnetron` folder?
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
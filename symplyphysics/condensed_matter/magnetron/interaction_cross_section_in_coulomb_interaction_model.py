@@ -15,7 +15,8 @@ ionization energy of gas atoms. See :ref:`Effective cross section <effective_cro
     TODO: move to `magnetron` folder?
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -20,7 +20,8 @@ taking into account their pairwise interactions. See :ref:`Effective cross secti
     NOTE: a more proper law would replace `particle_diameter` with `test_radius + target_radius`
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 cross_sectional_area_of_interaction = symbols.cross_section
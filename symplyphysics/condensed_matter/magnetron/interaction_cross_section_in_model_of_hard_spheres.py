@@ -15,7 +15,8 @@ distance of greatest convergence between the atoms.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Cross_section_(physics)#Collision_among_gas_particles>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ traveling atom and the energy transfer coefficient between the atom and the gas
     TODO: move to `magnetron` folder?
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
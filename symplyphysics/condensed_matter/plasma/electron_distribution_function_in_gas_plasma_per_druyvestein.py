@@ -24,7 +24,8 @@ passes into the Druyvestein distribution function.
     TODO: find a more suitable link
 """
 
-from sympy import Eq, Rational, solve, exp
+from sympy import Eq, Rational, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -22,7 +22,8 @@ conditions, the Maxwell distribution is most common.
     TODO: find a more suitable link
 """
 
-from sympy import Eq, Rational, solve, exp
+from sympy import Eq, Rational, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -22,7 +22,8 @@ value of this potential is removed.
     TODO: find link and check file
 """
 
-from sympy import Eq, solve, pi, exp, sqrt
+from sympy import Eq, pi, exp, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 from symplyphysics.quantities import elementary_charge, electron_rest_mass, boltzmann_constant
 
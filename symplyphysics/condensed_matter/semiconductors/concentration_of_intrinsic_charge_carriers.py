@@ -18,7 +18,8 @@ nonzero concentration of free charge carriers in the semiconductor.
 #. `University Wafer, Intrinsic carrier concentration <https://www.universitywafer.com/intrinsic-carrier-concentration.html>`_.
 """
 
-from sympy import Eq, solve, exp, sqrt
+from sympy import Eq, exp, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     quantities,
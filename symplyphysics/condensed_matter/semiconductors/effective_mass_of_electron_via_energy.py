@@ -20,8 +20,8 @@ from sympy import (
     Derivative,
     Expr,
     Eq,
-    solve,
 )
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     clone_as_symbol,
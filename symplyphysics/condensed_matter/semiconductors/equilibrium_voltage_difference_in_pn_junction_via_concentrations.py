@@ -20,7 +20,8 @@ The p-n junction has a potential barrier preventing the movement of charge carri
 #. `Wikipedia <https://en.wikipedia.org/wiki/P%E2%80%93n_junction#Size_of_depletion_region>`_.
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
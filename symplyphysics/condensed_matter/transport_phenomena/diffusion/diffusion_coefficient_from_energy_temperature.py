@@ -19,7 +19,8 @@ result of the thermal motion of molecules.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Mass_diffusivity#Solids>`__.
 """
 
-from sympy import (Eq, solve, exp)
+from sympy import (Eq, exp)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
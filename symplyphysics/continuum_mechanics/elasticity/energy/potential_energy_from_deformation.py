@@ -16,7 +16,8 @@ Spring accumulates energy while being deformed. This law is known as the **Hooke
     TODO Move law to ./deformations/
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ per unit area over which the force is distributed.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Pressure#Formula>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -32,7 +32,8 @@ of the plate and the ratio :math:`\\frac{u}{d}` where :math:`d` is the distance
 #. `Wikipedia <https://en.wikipedia.org/wiki/Viscosity#Dynamic_viscosity>`__.
 """
 
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
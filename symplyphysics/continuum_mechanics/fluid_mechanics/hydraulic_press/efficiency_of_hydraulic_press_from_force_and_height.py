@@ -11,7 +11,8 @@ input force and the height of the input side).
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
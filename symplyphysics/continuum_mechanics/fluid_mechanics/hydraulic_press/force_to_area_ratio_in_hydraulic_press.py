@@ -23,7 +23,8 @@ applied to the pistons to keep the system in balance.
     TODO: rename file
 """
 
-from sympy import Eq, solve, dsolve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
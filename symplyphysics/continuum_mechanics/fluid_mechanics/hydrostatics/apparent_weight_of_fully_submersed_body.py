@@ -24,7 +24,8 @@ density.
     TODO: rename law
 """
 
-from sympy import Eq, solve, pi, Idx
+from sympy import Eq, pi, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (clone_as_symbol, symbols, Quantity, validate_input, validate_output,
     quantities, global_index)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -11,7 +11,8 @@ vector is directed opposite to the gravity vector.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Archimedes%27_principle#Formula>`__.
 """
 
-from sympy import Eq, solve, Idx
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (clone_as_symbol, symbols, quantities, Quantity, validate_input,
     validate_output, global_index)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -20,7 +20,8 @@ due to the force of gravity.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Pressure#Liquid_pressure>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.continuum_mechanics.fluid_mechanics.hydrostatics import hydrostatic_pressure_via_density_height_and_acceleration as pressure_law
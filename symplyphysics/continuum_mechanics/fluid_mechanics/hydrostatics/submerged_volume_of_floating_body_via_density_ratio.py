@@ -20,7 +20,8 @@ depends on the ratio of the densities of the body and the fluid.
 #. `Physics LibreTexts, formula 10.3.17 <https://phys.libretexts.org/Bookshelves/University_Physics/Physics_(Boundless)/10%3A_Fluids/10.3%3A_Archimedes_Principle>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -15,7 +15,8 @@ pressure caused by a flowing fluid.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Dynamic_pressure>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 dynamic_pressure = symbols.dynamic_pressure
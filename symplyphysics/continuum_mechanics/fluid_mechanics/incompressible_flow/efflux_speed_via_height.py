@@ -20,7 +20,8 @@ the height of the fluid column. It is also known as the **Torricelli's law**.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Torricelli%27s_law#>`__.
 """
 
-from sympy import Eq, solve, sqrt, dsolve, Symbol as SymSymbol
+from sympy import Eq, sqrt, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -15,7 +15,8 @@ and density.
     TODO find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.continuum_mechanics.fluid_mechanics.hydrostatics import hydrostatic_pressure_via_density_and_height as pressure_law
@@ -14,7 +14,8 @@ fluid is constant at all points along a streamline.
 #. `Wikipedia, derivable from here <https://en.wikipedia.org/wiki/Bernoulli%27s_principle#Simplified_form>`__.
 """
 
-from sympy import Eq, dsolve, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_function,
     clone_as_symbol, quantities)
 from symplyphysics.core.expr_comparisons import expr_equals
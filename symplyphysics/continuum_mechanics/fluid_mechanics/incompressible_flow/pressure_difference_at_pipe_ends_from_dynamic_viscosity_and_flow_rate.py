@@ -22,7 +22,8 @@ applied to air flow in lung alveoli, or the flow through a drinking straw.
     TODO: rename file to use descriptive name
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
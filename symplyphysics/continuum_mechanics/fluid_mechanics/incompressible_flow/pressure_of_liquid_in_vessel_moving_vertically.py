@@ -14,7 +14,8 @@ fall, the vertical acceleration of the vessel and the height of liquid.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output, quantities
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.continuum_mechanics.fluid_mechanics.hydrostatics import hydrostatic_pressure_via_density_height_and_acceleration as pressure_law
@@ -21,7 +21,8 @@ to the tendency of the fluid to make `gravity waves <https://en.wikipedia.org/wi
     TODO: rename file
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
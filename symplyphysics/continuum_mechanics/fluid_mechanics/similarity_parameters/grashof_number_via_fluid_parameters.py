@@ -15,7 +15,8 @@ and is analogous to the Reynolds number.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Grashof_number#Definition>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
@@ -14,7 +14,8 @@ flow, characteristic length of the system, and thermal conductivity of the fluid
     TODO: rename file
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, convert_to_float, symbols)
 
 heat_transfer_coefficient = symbols.heat_transfer_coefficient
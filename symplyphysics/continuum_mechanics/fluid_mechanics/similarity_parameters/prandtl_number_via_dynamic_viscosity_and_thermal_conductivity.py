@@ -11,7 +11,8 @@ and thermal conductivity.
 #. `Wikipedia, last formula within the box <https://en.wikipedia.org/wiki/Prandtl_number>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
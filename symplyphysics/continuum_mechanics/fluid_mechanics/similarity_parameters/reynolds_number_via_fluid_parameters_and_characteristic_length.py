@@ -12,7 +12,8 @@ while high Reynolds numbers tend to correspond to turbulent flows.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Reynolds_number#Definition>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
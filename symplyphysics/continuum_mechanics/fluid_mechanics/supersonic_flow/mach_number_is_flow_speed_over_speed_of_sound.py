@@ -10,7 +10,8 @@ the ratio of flow speed divided by the speed of sound in the medium.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Mach_number>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
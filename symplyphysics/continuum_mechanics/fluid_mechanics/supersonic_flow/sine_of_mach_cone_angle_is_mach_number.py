@@ -18,7 +18,8 @@ phenomenon.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Mach_wave#Mach_angle>`__.
 """
 
-from sympy import Eq, sin, solve
+from sympy import Eq, sin
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -24,7 +24,8 @@ to the tube's diameter.
     TODO: rename file to use descriptive name
 """
 
-from sympy import Eq, solve, cos, dsolve
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -14,7 +14,8 @@ created by two surfaces: the outer and the inner.
     TODO: fix file name
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.continuum_mechanics.fluid_mechanics.surface_effects import laplace_pressure_of_spherical_shapes as laplace_law
@@ -11,7 +11,8 @@ the fluid is called *Laplace pressure*.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Laplace_pressure>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
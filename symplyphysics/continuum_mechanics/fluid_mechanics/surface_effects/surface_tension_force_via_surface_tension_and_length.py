@@ -15,7 +15,8 @@ Also see `figure <https://www.researchgate.net/publication/312093145/figure/fig7
 #. `Wikipedia <https://en.wikipedia.org/wiki/Surface_tension#Physics>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Quantity, validate_input, validate_output
 
 surface_tension_force = symbols.force
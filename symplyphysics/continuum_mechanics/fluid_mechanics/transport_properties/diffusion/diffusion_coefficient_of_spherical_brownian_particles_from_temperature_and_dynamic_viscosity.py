@@ -28,7 +28,8 @@ the type of diffusing particles. This law is also known as the *Stokes—Einstei
 #. `Wikipedia <https://en.wikipedia.org/wiki/Einstein_relation_(kinetic_theory)>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -16,7 +16,8 @@ with increasing temperature, whereas for liquids it decreases with increasing te
 #. `Sutherland model <https://en.wikipedia.org/wiki/Temperature_dependence_of_viscosity#Sutherland_model>`__.
 """
 
-from sympy import Eq, solve, Rational
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
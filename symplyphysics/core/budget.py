@@ -0,0 +1,405 @@
+"""
+This module provides the bounded-latency evaluation mode for law functions. Within a latency budget,
+the symbolic work of a law function decorated with `validate_input`, e.g. calls to ``solve``,
+``simplify`` or ``integrate``, is interrupted once the budget is exceeded. The result is then
+computed numerically from the law of the module the function is defined in: the SI magnitudes of
+the arguments are substituted into the law, which is then evaluated numerically, integrals being
+computed via quadrature, or solved for the output with a root finder.
+
+* `latency_budget` is a context manager capping every law function called within its scope.
+* `bounded_latency` is a decorator capping a single law function.
+* `LatencyReport` collects the evaluation path (``"symbolic"`` or ``"numeric"``) and the time of
+  every capped call.
+
+Example::
+
+    with latency_budget(0.05) as report:
+        result = law.calculate_force(...)
+    print(report.paths)
+
+**Notes:**
+
+#. The numeric fallback is possible when the law function validates its parameters and result
+   against the symbols of the module's ``law``, and these symbols cover the whole law. Otherwise
+   `TimeoutError` is raised when the budget is exceeded. The numeric fallback is capped by the same
+   budget, `TimeoutError` is raised when it is exceeded as well, so a call takes at most twice the
+   budget.
+
+#. The symbolic work is interrupted by raising an asynchronous exception in the calling thread,
+   which requires CPython. A single watchdog thread serves all capped calls. The work is not moved
+   to another process, since law functions are closures over their modules and rely on caches of
+   the calling process, e.g. of solved laws.
+
+#. The exception is raised only once, at the next bytecode boundary of the interrupted thread, so
+   it can land within a ``finally`` block or the exit of a context manager. The evaluation
+   parameters of SymPy, which its context managers such as ``evaluate(False)`` restore on exit,
+   are therefore restored by the budget itself after an interruption. The caches of SymPy are
+   updated atomically and stay consistent. Other state that the interrupted code restores on exit
+   is not guarded. If the exception is swallowed by the symbolic work, the call completes
+   symbolically after the budget.
+
+#. Results of the numeric fallback are approximations, so they are never stored in the result
+   cache, see `symplyphysics.core.memo`.
+
+#. Only the outermost law function call is capped, law functions called from it share its budget.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import ctypes
+import functools
+import inspect
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator, Literal, Mapping, Optional
+
+import mpmath
+from sympy import Dummy, Eq, Expr, lambdify, sympify
+from sympy.core.function import AppliedUndef
+from sympy.core.parameters import global_parameters
+from sympy.physics.units import Quantity as SymQuantity
+
+from .convert import convert_to_si, evaluate_expression
+from .dimensions import dimension_to_si_unit
+from .symbols.quantities import Quantity
+from .symbols.symbols import Function, Symbol
+
+EvaluationPath = Literal["symbolic", "numeric"]
+
+
+class _BudgetExceeded(BaseException):
+    """
+    Interrupts the symbolic work. Derived from `BaseException` so that it is not swallowed by the
+    ``except Exception`` clauses within SymPy.
+    """
+
+
+@dataclass(frozen=True)
+class EvaluationRecord:
+    """Describes a single capped call."""
+
+    function: str
+    """Qualified name of the law function."""
+
+    path: EvaluationPath
+    """How the result was obtained."""
+
+    elapsed: float
+    """Total time of the call in seconds."""
+
+
+@dataclass
+class LatencyReport:
+    """Collects the records of capped calls."""
+
+    records: list[EvaluationRecord] = field(default_factory=list)
+
+    @property
+    def paths(self) -> list[EvaluationPath]:
+        return [r.path for r in self.records]
+
+    @property
+    def path(self) -> Optional[EvaluationPath]:
+        """Path of the last call, `None` if there were no calls."""
+
+        return self.records[-1].path if self.records else None
+
+    @property
+    def fallbacks(self) -> int:
+        """Number of calls that fell back to the numeric evaluation."""
+
+        return sum(1 for r in self.records if r.path == "numeric")
+
+
+def _set_async_exc(thread_id: int, exception: Optional[type[BaseException]]) -> None:
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id),
+        ctypes.py_object(exception) if exception else None)
+
+
+class _Watchdog:
+    """
+    Raises `_BudgetExceeded` once in threads whose deadlines have passed. A single daemon thread
+    serves the deadlines of all threads.
+    """
+
+    def __init__(self) -> None:
+        self._condition = threading.Condition()
+        self._deadlines: dict[int, float] = {}
+        self._fired: set[int] = set()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        with self._condition:
+            while True:
+                now = time.monotonic()
+                for thread_id, deadline in self._deadlines.items():
+                    if deadline <= now and thread_id not in self._fired:
+                        self._fired.add(thread_id)
+                        _set_async_exc(thread_id, _BudgetExceeded)
+
+                waits = [d - now for d in self._deadlines.values() if d > now]
+                self._condition.wait(min(waits) if waits else None)
+
+    @contextmanager
+    def deadline(self, seconds: float) -> Iterator[None]:
+        """Interrupts the current thread with `_BudgetExceeded` after ``seconds``."""
+
+        thread_id = threading.get_ident()
+        with self._condition:
+            self._deadlines[thread_id] = time.monotonic() + seconds
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                    name="symplyphysics-latency-budget",
+                    daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+        try:
+            yield
+        finally:
+            while True:
+                try:
+                    with self._condition:
+                        self._deadlines.pop(thread_id, None)
+                        if thread_id in self._fired:
+                            self._fired.discard(thread_id)
+                            # drop the exception if it was not raised yet
+                            _set_async_exc(thread_id, None)
+                    break
+                except _BudgetExceeded:
+                    # raised before the deadline was removed, the work is done by now
+                    continue
+
+
+_watchdog = _Watchdog()
+
+
+@dataclass(frozen=True)
+class _NumericPlan:
+    law: Eq
+    target: Expr
+    target_symbol: Symbol | Function
+    parameters: Mapping[str, Expr]
+
+    def evaluate(self, bound_arguments: Mapping[str, Any]) -> Quantity:
+        values: dict[Expr, Expr] = {}
+        for name, symbol in self.parameters.items():
+            value = bound_arguments[name]
+            values[symbol] = convert_to_si(value) if isinstance(value, SymQuantity) else sympify(
+                value, strict=True)
+
+        law = self.law.xreplace(values)
+        lhs = evaluate_expression(law.lhs)
+        rhs = evaluate_expression(law.rhs)
+
+        if lhs == self.target and not rhs.has(self.target):
+            result = complex(rhs.evalf())
+        else:
+            result = _find_root(lhs - rhs, self.target)
+
+        value = result.real if result.imag == 0 else result
+        return Quantity(value * dimension_to_si_unit(self.target_symbol.dimension))
+
+
+_ROOT_GUESSES = (1.0, 0.0, -1.0, 1e-6, 1e3, 1e-12, 1e6, 1e12, 1e-3, 10j)
+
+
+def _find_root(residual: Expr, target: Expr) -> complex:
+    x = Dummy("x")
+    residual = residual.xreplace({target: x})
+    if residual.free_symbols - {x}:
+        raise ValueError(f"Residual '{residual}' should only depend on the unknown.")
+
+    f = lambdify(x, residual, modules="mpmath")
+    for guess in _ROOT_GUESSES:
+        try:
+            # the root is verified by `findroot` itself
+            root = complex(mpmath.findroot(f, guess))
+        except (ValueError, ZeroDivisionError, TypeError):
+            continue
+        # roots of real equations come out with spurious imaginary parts
+        if abs(root.imag) <= 1e-10 * abs(root):
+            root = complex(root.real)
+        return root
+
+    raise ValueError(f"Cannot find the root of '{residual}'.")
+
+
+def _applied(law: Eq, symbol: Any) -> Optional[Expr]:
+    if not isinstance(symbol, Function):
+        return symbol if isinstance(symbol, Symbol) and law.has(symbol) else None
+
+    applications = [a for a in law.atoms(AppliedUndef) if a.func == symbol]
+    return applications[0] if len(applications) == 1 else None
+
+
+@functools.lru_cache(maxsize=None)
+def _numeric_plan(func: Callable[..., Any], inputs: tuple[tuple[str, Any], ...],
+    output: Any) -> Optional[_NumericPlan]:
+    law = getattr(sys.modules.get(func.__module__), "law", None)
+    if not isinstance(law, Eq):
+        return None
+
+    target = _applied(law, output)
+    if target is None:
+        return None
+
+    parameters: dict[str, Expr] = {}
+    for name, unit in inputs:
+        symbol = _applied(law, unit)
+        if symbol is None or symbol == target:
+            continue
+        # a function depending on an integration variable cannot be replaced by a single value
+        if symbol in parameters.values() or not symbol.free_symbols <= law.free_symbols:
+            return None
+        parameters[name] = symbol
+
+    covered = set(parameters.values()) | {target}
+    unknowns = (law.free_symbols | law.atoms(AppliedUndef)) - covered
+    # arguments of applied functions are substituted along with the functions themselves
+    unknowns -= {s for a in covered if isinstance(a, AppliedUndef) for s in a.free_symbols}
+    if any(not isinstance(u, SymQuantity) for u in unknowns):
+        return None
+
+    return _NumericPlan(law, target, output, parameters)
+
+
+class _State(threading.local):
+    depth = 0
+
+
+_state = _State()
+
+
+class LatencyBudget:
+    """Caps the symbolic work of law function calls at ``seconds`` and records them in ``report``."""
+
+    def __init__(self, seconds: float, report: Optional[LatencyReport] = None) -> None:
+        if seconds <= 0:
+            raise ValueError(f"Latency budget should be positive, got {seconds}.")
+
+        self.seconds = seconds
+        self.report = report if report is not None else LatencyReport()
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        units: tuple[Mapping[str, Any], Any],
+        args: tuple[Any, ...],
+        kwargs: dict[str, Any],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """
+        Runs ``compute``, which performs the call of the law function ``func`` with the given
+        arguments, within the budget. ``units`` are the expected units of the parameters and the
+        result of ``func``.
+
+        Raises:
+            TimeoutError: If the budget is exceeded and no numeric fallback is possible, or the
+                numeric fallback exceeds the budget as well.
+        """
+
+        if _state.depth:
+            return compute()
+
+        start = time.perf_counter()
+        path: EvaluationPath = "symbolic"
+        parameters = dict(vars(global_parameters))
+        _state.depth += 1
+        try:
+            try:
+                with _watchdog.deadline(self.seconds):
+                    result = compute()
+            except _BudgetExceeded:
+                path = "numeric"
+                # the interruption could skip the restoring of SymPy parameters on exit
+                for name, value in parameters.items():
+                    setattr(global_parameters, name, value)
+                try:
+                    with _watchdog.deadline(self.seconds):
+                        result = self._fallback(func, units, args, kwargs)
+                except _BudgetExceeded as e:
+                    raise TimeoutError(f"Numeric evaluation of '{func.__qualname__}' exceeded "
+                        f"the latency budget of {self.seconds} s as well.") from e
+        finally:
+            _state.depth -= 1
+
+        self.report.records.append(
+            EvaluationRecord(func.__qualname__, path,
+            time.perf_counter() - start))
+        return result
+
+    def _fallback(self, func: Callable[..., Any], units: tuple[Mapping[str, Any], Any],
+        args: tuple[Any, ...], kwargs: dict[str, Any]) -> Quantity:
+        inputs, output = units
+        try:
+            plan = _numeric_plan(func, tuple(inputs.items()), output)
+        except TypeError:
+            # unhashable units
+            plan = None
+        if plan is None:
+            raise TimeoutError(f"Function '{func.__qualname__}' exceeded the latency budget of "
+                f"{self.seconds} s and cannot be evaluated numerically.")
+
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        return plan.evaluate(bound.arguments)
+
+
+_active_budget: contextvars.ContextVar[Optional[LatencyBudget]] = contextvars.ContextVar(
+    "active_latency_budget", default=None)
+
+
+def active_latency_budget() -> Optional[LatencyBudget]:
+    """Returns the latency budget of the current context, or `None` if there is none."""
+
+    return _active_budget.get()
+
+
+@contextmanager
+def latency_budget(seconds: float,
+    report: Optional[LatencyReport] = None) -> Iterator[LatencyReport]:
+    """
+    Caps the symbolic work of every law function called within the scope at ``seconds``. Yields
+    the report of the calls.
+    """
+
+    budget = LatencyBudget(seconds, report)
+    token = _active_budget.set(budget)
+    try:
+        yield budget.report
+    finally:
+        _active_budget.reset(token)
+
+
+def bounded_latency(
+    seconds: float,
+    report: Optional[LatencyReport] = None,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator capping the symbolic work of a law function at ``seconds``."""
+
+    def decorator(law_function: Callable[..., Any]) -> Callable[..., Any]:
+
+        @functools.wraps(law_function)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with latency_budget(seconds, report):
+                return law_function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+__all__ = [
+    "EvaluationPath",
+    "EvaluationRecord",
+    "LatencyReport",
+    "LatencyBudget",
+    "active_latency_budget",
+    "latency_budget",
+    "bounded_latency",
+]
@@ -1,6 +1,10 @@
-from typing import Any, SupportsFloat
-from sympy import Expr, S
+import ast
+import operator
+from typing import Any, Callable, SupportsFloat
+from sympy import Expr, S, sympify
+from sympy.physics import units
 from sympy.physics.units import Quantity as SymQuantity
+from sympy.physics.units.prefixes import Prefix
 
 from .dimensions import assert_equivalent_dimension, dimension_to_si_unit
 from .symbols.quantities import Quantity
@@ -50,10 +54,73 @@ def evaluate_expression(expr: Expr, evaluate: bool = False, **kwargs: Any) -> Ex
     return expr
 
 
+# Exponents are limited so that strings like ``"10**10**10"`` cannot exhaust the memory
+_MAX_UNIT_EXPONENT = 64
+
+_UNIT_OPERATORS: dict[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.Pow: operator.pow,
+}
+
+
+def _parse_unit_node(node: ast.AST, unit: str) -> Any:
+    if isinstance(node, ast.BinOp) and type(node.op) in _UNIT_OPERATORS:
+        lhs = _parse_unit_node(node.left, unit)
+        rhs = _parse_unit_node(node.right, unit)
+        if isinstance(node.op, ast.Pow) and not (rhs.is_Number and abs(rhs) <= _MAX_UNIT_EXPONENT):
+            raise ValueError(f"Cannot parse unit '{unit}'.")
+        return _UNIT_OPERATORS[type(node.op)](lhs, rhs)
+    if isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.USub, ast.UAdd)):
+        # signed numbers are only allowed, e.g. in exponents like ``s**-2``
+        value = _parse_unit_node(node.operand, unit)
+        if not value.is_Number:
+            raise ValueError(f"Cannot parse unit '{unit}'.")
+        return -value if isinstance(node.op, ast.USub) else value
+    if (isinstance(node, ast.Constant) and isinstance(node.value, (int, float)) and
+            not isinstance(node.value, bool)):
+        return sympify(node.value)
+    if isinstance(node, ast.Name):
+        value = vars(units).get(node.id)
+        if not isinstance(value, (SymQuantity, Prefix)):
+            raise ValueError(f"Unknown unit '{node.id}' in '{unit}'.")
+        return value
+    raise ValueError(f"Cannot parse unit '{unit}'.")
+
+
+def parse_unit(unit: str) -> Expr:
+    """
+    Parses ``unit`` written in terms of the `sympy.physics.units` names, e.g. ``"kilometer/hour"``,
+    ``"kilo*ohm"`` or ``"kg*m/s**2"``.
+
+    Raises:
+        ValueError: If ``unit`` is not an expression made of numbers and units.
+    """
+
+    # The string is never evaluated: only unit names, numbers, and multiplication, division and
+    # power are accepted from its syntax tree
+    try:
+        tree = ast.parse(unit.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Cannot parse unit '{unit}'.") from e
+
+    try:
+        expr = _parse_unit_node(tree.body, unit)
+    except (TypeError, ZeroDivisionError) as e:
+        raise ValueError(f"Cannot parse unit '{unit}'.") from e
+
+    expr = sympify(expr)
+    if expr.has(S.ComplexInfinity, S.NaN, S.Infinity, S.NegativeInfinity):
+        raise ValueError(f"Cannot parse unit '{unit}'.")
+
+    return expr
+
+
 __all__ = [
     "convert_to",
     "convert_to_float",
     "convert_to_si",
     "evaluate_quantity",
     "evaluate_expression",
+    "parse_unit",
 ]
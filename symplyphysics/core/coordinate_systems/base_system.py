@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Optional, Sequence, Iterable
+from typing import Any, Callable, Optional, Sequence, Iterable, TypeVar, cast
 
 from sympy import Expr, sqrt, Matrix, true, simplify, Symbol as SymSymbol, ImmutableMatrix, Basic
 from sympy.logic.boolalg import Boolean
@@ -9,26 +9,29 @@ from symplyphysics.core.symbols.symbols import Symbol, clone_as_function, Functi
 
 from ..miscellaneous import const
 
+_T = TypeVar("_T")
+
 _base_coordinate_system_cache: dict[tuple[type[BaseCoordinateSystem], Optional[tuple[Symbol, Symbol,
     Symbol]], Optional[tuple[Function, Function, Function]]], BaseCoordinateSystem] = {}
 
+# Metric data shared by the systems of the same class and base scalars, see
+# `BaseCoordinateSystem._metric_data`
+_metric_data_cache: dict[tuple[type[BaseCoordinateSystem], tuple[Symbol, Symbol, Symbol]], dict[str,
+    Any]] = {}
 
-class BaseCoordinateSystem(Basic):
-    _base_scalars: tuple[Symbol, Symbol, Symbol]
-
-    _cartesian_derivative_matrix: ImmutableMatrix
-    """See `BaseCoordinateSystem.cartesian_derivative_matrix`."""
 
-    _lame_coefficients: tuple[Expr, Expr, Expr]
-    """See `BaseCoordinateSystem.lame_coefficients`."""
-
-    _base_vector_matrix: ImmutableMatrix
-    """See `BaseCoordinateSystem.base_vector_matrix`."""
+class BaseCoordinateSystem(Basic):
+    """
+    Base class of coordinate systems. The metric data of a system, i.e. the Cartesian derivative
+    matrix, the Lamé coefficients and the matrices of base vectors, is computed on first use and
+    memoized per class and base scalars. Subclasses can ship precomputed forms of the data by
+    overriding the ``generate_*`` methods.
+    """
 
+    _base_scalars: tuple[Symbol, Symbol, Symbol]
     _wrt: Symbol
     _base_scalar_functions: tuple[Function, Function, Function]
-    _diff_base_vector_matrix: ImmutableMatrix
-    """See `BaseCoordinateSystem.diff_base_vector_matrix`."""
+    _diff_base_vector_matrix_cache: Optional[ImmutableMatrix]
 
     @property
     def base_scalars(self) -> tuple[Symbol, Symbol, Symbol]:
@@ -38,6 +41,43 @@ class BaseCoordinateSystem(Basic):
     def base_scalar_functions(self) -> tuple[Function, Function, Function]:
         return self._base_scalar_functions
 
+    @property
+    def _cartesian_derivative_matrix(self) -> ImmutableMatrix:
+        """See `BaseCoordinateSystem.cartesian_derivative_matrix`."""
+
+        return self._metric_data("cartesian_derivative_matrix",
+            self.generate_cartesian_derivative_matrix)
+
+    @property
+    def _lame_coefficients(self) -> tuple[Expr, Expr, Expr]:
+        """See `BaseCoordinateSystem.lame_coefficients`."""
+
+        return self._metric_data("lame_coefficients", self.generate_lame_coefficients)
+
+    @property
+    def _base_vector_matrix(self) -> ImmutableMatrix:
+        """See `BaseCoordinateSystem.base_vector_matrix`."""
+
+        return self._metric_data("base_vector_matrix", self.generate_base_vector_matrix)
+
+    @property
+    def _diff_base_vector_matrix(self) -> ImmutableMatrix:
+        """See `BaseCoordinateSystem.diff_base_vector_matrix`."""
+
+        # depends on the base scalar functions, hence it is memoized per system
+        if self._diff_base_vector_matrix_cache is None:
+            self._diff_base_vector_matrix_cache = self.generate_diff_base_vector_matrix()
+
+        return self._diff_base_vector_matrix_cache
+
+    def _metric_data(self, name: str, generate: Callable[[], _T]) -> _T:
+        data = _metric_data_cache.setdefault((type(self), self._base_scalars), {})
+
+        if name not in data:
+            data[name] = generate()
+
+        return cast(_T, data[name])
+
     def __repr__(self) -> str:
         return type(self).__qualname__
 
@@ -72,21 +112,6 @@ class BaseCoordinateSystem(Basic):
         a, b, c = base_scalars_
         obj._base_scalars = a, b, c
 
-        x, y, z = obj.cartesian_transform(base_scalars_)
-
-        obj._cartesian_derivative_matrix = ImmutableMatrix([
-            [x.diff(a), y.diff(a), z.diff(a)],
-            [x.diff(b), y.diff(b), z.diff(b)],
-            [x.diff(c), y.diff(c), z.diff(c)],
-        ])
-
-        obj._lame_coefficients = obj.generate_lame_coefficients()
-
-        obj._base_vector_matrix = ImmutableMatrix([
-            simplify(obj._cartesian_derivative_matrix.row(i_row) / obj._lame_coefficients[i_row])
-            for i_row in range(3)
-        ])
-
         obj._wrt = Symbol("t", real=True)
 
         if not base_scalar_functions_:
@@ -97,13 +122,7 @@ class BaseCoordinateSystem(Basic):
             )
 
         obj._base_scalar_functions = base_scalar_functions_
-
-        applied_base_scalars = [f(obj._wrt) for f in obj._base_scalar_functions]
-
-        diff_matrix = simplify(obj.base_vector_matrix(applied_base_scalars).diff(obj._wrt))
-        inv_matrix = obj.inverse_base_vector_matrix(applied_base_scalars)
-
-        obj._diff_base_vector_matrix = ImmutableMatrix(simplify(diff_matrix * inv_matrix))
+        obj._diff_base_vector_matrix_cache = None
 
         return obj
 
@@ -158,6 +177,16 @@ class BaseCoordinateSystem(Basic):
 
         return simplify(matrix)
 
+    def generate_cartesian_derivative_matrix(self) -> ImmutableMatrix:
+        a, b, c = self.base_scalars
+        x, y, z = self.cartesian_transform(self.base_scalars)
+
+        return ImmutableMatrix([
+            [x.diff(a), y.diff(a), z.diff(a)],
+            [x.diff(b), y.diff(b), z.diff(b)],
+            [x.diff(c), y.diff(c), z.diff(c)],
+        ])
+
     def generate_lame_coefficients(self) -> tuple[Expr, Expr, Expr]:
         assumption = self.assumption(self.base_scalars)
 
@@ -172,6 +201,25 @@ class BaseCoordinateSystem(Basic):
 
         return h1, h2, h3
 
+    def generate_base_vector_matrix(self) -> ImmutableMatrix:
+        return ImmutableMatrix([
+            simplify(self._cartesian_derivative_matrix.row(i_row) / self._lame_coefficients[i_row])
+            for i_row in range(3)
+        ])
+
+    def generate_diff_base_vector_matrix(self) -> ImmutableMatrix:
+        """
+        Generates the matrix of `BaseCoordinateSystem.diff_base_vector_matrix` with respect to
+        ``t``, in which the base scalars are replaced with the base scalar functions of ``t``.
+        """
+
+        applied_base_scalars = [f(self._wrt) for f in self._base_scalar_functions]
+
+        diff_matrix = simplify(self.base_vector_matrix(applied_base_scalars).diff(self._wrt))
+        inv_matrix = self.inverse_base_vector_matrix(applied_base_scalars)
+
+        return ImmutableMatrix(simplify(diff_matrix * inv_matrix))
+
     def lame_coefficients(self, base_scalars: Optional[Sequence[Expr]] = None) -> Sequence[Expr]:
         """
         An `i`-th Lamé coefficient is the length of the derivative of the position vector `r` with
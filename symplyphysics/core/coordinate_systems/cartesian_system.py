@@ -1,6 +1,6 @@
 from typing import Optional, Sequence, Iterable
 
-from sympy import Expr, Matrix, Symbol as SymSymbol, S
+from sympy import Expr, Matrix, Symbol as SymSymbol, S, ImmutableMatrix
 from sympy.physics import units
 
 from symplyphysics.core.symbols.symbols import Symbol
@@ -26,6 +26,15 @@ class CartesianCoordinateSystem(BaseCoordinateSystem):
     def generate_lame_coefficients(self) -> tuple[Expr, Expr, Expr]:
         return S.One, S.One, S.One
 
+    def generate_cartesian_derivative_matrix(self) -> ImmutableMatrix:
+        return ImmutableMatrix.eye(3)
+
+    def generate_base_vector_matrix(self) -> ImmutableMatrix:
+        return ImmutableMatrix.eye(3)
+
+    def generate_diff_base_vector_matrix(self) -> ImmutableMatrix:
+        return ImmutableMatrix.zeros(3)
+
     def cartesian_derivative_matrix(
         self,
         _base_scalars: Optional[Sequence[Expr]] = None,
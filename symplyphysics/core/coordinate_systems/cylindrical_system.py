@@ -1,6 +1,6 @@
 from typing import Optional, Sequence, Iterable
 
-from sympy import Expr, S, cos, sin, sqrt, atan2, Q
+from sympy import Expr, S, cos, sin, sqrt, atan2, Q, ImmutableMatrix
 from sympy.logic.boolalg import Boolean
 from sympy.physics import units
 from sympy.physics.units.definitions.dimension_definitions import angle as angle_type
@@ -49,6 +49,27 @@ class CylindricalCoordinateSystem(BaseCoordinateSystem):
 
         return h_rho, h_phi, h_z
 
+    # Precomputed forms of the metric data, see `BaseCoordinateSystem`
+
+    def generate_base_vector_matrix(self) -> ImmutableMatrix:
+        _, phi, _ = self.base_scalars
+
+        return ImmutableMatrix([
+            [cos(phi), sin(phi), 0],
+            [-sin(phi), cos(phi), 0],
+            [0, 0, 1],
+        ])
+
+    def generate_diff_base_vector_matrix(self) -> ImmutableMatrix:
+        _, phi, _ = self.base_scalar_functions
+        dphi = phi(self._wrt).diff(self._wrt)
+
+        return ImmutableMatrix([
+            [0, dphi, 0],
+            [-dphi, 0, 0],
+            [0, 0, 0],
+        ])
+
     def extract_position_vector_components(self, coordinates: Iterable[Expr]) -> Sequence[Expr]:
         rho, _, z = coordinates
 
@@ -1,6 +1,6 @@
 from typing import Optional, Sequence, Iterable
 
-from sympy import Expr, S, cos, sin, sqrt, atan2, Q, tan
+from sympy import Expr, S, cos, sin, sqrt, atan2, Q, tan, ImmutableMatrix
 from sympy.logic.boolalg import Boolean
 from sympy.physics import units
 from sympy.physics.units.definitions.dimension_definitions import angle as angle_type
@@ -52,6 +52,29 @@ class SphericalCoordinateSystem(BaseCoordinateSystem):
 
         return h_r, h_theta, h_phi
 
+    # Precomputed forms of the metric data, see `BaseCoordinateSystem`
+
+    def generate_base_vector_matrix(self) -> ImmutableMatrix:
+        _, theta, phi = self.base_scalars
+
+        return ImmutableMatrix([
+            [sin(theta) * cos(phi), sin(theta) * sin(phi), cos(theta)],
+            [cos(theta) * cos(phi), cos(theta) * sin(phi), -sin(theta)],
+            [-sin(phi), cos(phi), 0],
+        ])
+
+    def generate_diff_base_vector_matrix(self) -> ImmutableMatrix:
+        _, theta, phi = self.base_scalar_functions
+        theta_t = theta(self._wrt)
+        dtheta = theta_t.diff(self._wrt)
+        dphi = phi(self._wrt).diff(self._wrt)
+
+        return ImmutableMatrix([
+            [0, dtheta, sin(theta_t) * dphi],
+            [-dtheta, 0, cos(theta_t) * dphi],
+            [-sin(theta_t) * dphi, -cos(theta_t) * dphi, 0],
+        ])
+
     def extract_position_vector_components(self, coordinates: Iterable[Expr]) -> Sequence[Expr]:
         r, _, _ = coordinates
 
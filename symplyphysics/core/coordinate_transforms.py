@@ -0,0 +1,181 @@
+"""
+This module converts arrays of points and vector components between coordinate systems, e.g.
+`CartesianCoordinateSystem`, `CylindricalCoordinateSystem` and `SphericalCoordinateSystem`. The
+transforms are built from the symbolic definitions of the systems and compiled into vectorized
+functions once per pair of system classes (see `symplyphysics.core.kernels`), so that millions of
+samples are converted without any SymPy work.
+
+* `transform_points` converts the coordinates of points from one system to another.
+* `transform_vectors` converts the components of vectors applied at points from the base of one
+  system to the base of another.
+* `clear_transform_cache` drops the compiled transforms.
+
+Example::
+
+    points = np.array([[1.0, 0.0, 1.0], [0.0, 2.0, 0.0]])
+    transform_points(points, CARTESIAN, SPHERICAL)  # columns are r, theta, phi
+    transform_vectors((velocities, "kilometer/hour"), points, CARTESIAN, CYLINDRICAL)
+
+**Notes:**
+
+#. Points and vector components are arrays whose last axis has the length 3, e.g. of the shape
+   ``(N, 3)``. They are either arrays of SI magnitudes, or ``(values, unit)`` pairs, where ``unit``
+   is a unit expression or its string, see `symplyphysics.core.convert.parse_unit`. The unit of
+   points applies to their length coordinates, angles are always given in radians. The results are
+   SI magnitudes.
+
+#. The transforms depend only on the classes of the systems, not on their base scalars.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import numpy as np
+from sympy import Dummy, Expr, Matrix
+from sympy.physics import units
+from sympy.physics.units.systems.si import SI
+
+from .convert import parse_unit
+from .coordinate_systems import BaseCoordinateSystem
+from .dimensions import assert_equivalent_dimension
+from .kernels import compile_expression
+from .symbols.quantities import Quantity
+
+
+_SystemTypes = tuple[type[BaseCoordinateSystem], type[BaseCoordinateSystem]]
+
+# Compiled transforms keyed by the classes of the source and the target systems
+_point_transform_cache: dict[_SystemTypes, Callable[..., Any]] = {}
+_vector_transform_cache: dict[_SystemTypes, Callable[..., Any]] = {}
+
+
+def _target_coordinates(source: BaseCoordinateSystem, target: BaseCoordinateSystem) -> list[Expr]:
+    cartesian = source.cartesian_transform(source.base_scalars)
+    return list(target.inverse_cartesian_transform(cartesian))
+
+
+def _point_transform(source_type: type[BaseCoordinateSystem],
+    target_type: type[BaseCoordinateSystem]) -> Callable[..., Any]:
+    key = (source_type, target_type)
+    if key not in _point_transform_cache:
+        source, target = source_type(), target_type()
+        coordinates = _target_coordinates(source, target)
+        _point_transform_cache[key] = compile_expression(coordinates, source.base_scalars,
+            cse=True)
+
+    return _point_transform_cache[key]
+
+
+def _vector_transform(source_type: type[BaseCoordinateSystem],
+    target_type: type[BaseCoordinateSystem]) -> Callable[..., Any]:
+    key = (source_type, target_type)
+    if key not in _vector_transform_cache:
+        _vector_transform_cache[key] = _compile_vector_transform(source_type(), target_type())
+
+    return _vector_transform_cache[key]
+
+
+def _compile_vector_transform(source: BaseCoordinateSystem,
+    target: BaseCoordinateSystem) -> Callable[..., Any]:
+    # Rows of the base vector matrices are the base vectors in terms of the Cartesian ones, hence
+    # the transposed source matrix converts the components into Cartesian ones
+    target_matrix = target.base_vector_matrix().xreplace(
+        dict(zip(target.base_scalars, _target_coordinates(source, target))))
+    matrix = target_matrix * source.base_vector_matrix().T
+
+    components = [Dummy(f"v{i}") for i in range(3)]
+    outputs = matrix * Matrix(components)
+    return compile_expression(list(outputs), [*source.base_scalars, *components], cse=True)
+
+
+def _unit_scale(unit: Expr | str) -> float:
+    unit = parse_unit(unit) if isinstance(unit, str) else unit
+    return float(Quantity(unit).scale_factor)
+
+
+def _split(value: Any) -> tuple[np.ndarray, Any]:
+    if isinstance(value, tuple) and len(value) == 2:
+        values, unit = value
+    else:
+        values, unit = value, None
+
+    array = np.asarray(values, dtype=float)
+    if array.ndim == 0 or array.shape[-1] != 3:
+        raise ValueError(f"Expected an array of the shape (..., 3), got {array.shape}.")
+
+    return array, unit
+
+
+def _points(value: Any, system: BaseCoordinateSystem) -> np.ndarray:
+    array, unit = _split(value)
+    if unit is None:
+        return array
+
+    unit = parse_unit(unit) if isinstance(unit, str) else unit
+    assert_equivalent_dimension(unit, "points", "transform_points", units.length)
+    scale = _unit_scale(unit)
+
+    dimension_system = SI.get_dimension_system()
+    lengths = [
+        dimension_system.equivalent_dims(s.dimension, units.length) for s in system.base_scalars
+    ]
+    return array * np.where(lengths, scale, 1.0)
+
+
+def _columns(function: Callable[..., Any], *arrays: np.ndarray) -> np.ndarray:
+    shape = np.broadcast_shapes(*(a.shape for a in arrays))
+    arguments = [c for a in arrays for c in np.moveaxis(a, -1, 0)]
+    return np.stack([np.broadcast_to(c, shape[:-1]) for c in function(*arguments)], axis=-1)
+
+
+def transform_points(points: Any, source: BaseCoordinateSystem,
+    target: BaseCoordinateSystem) -> np.ndarray:
+    """
+    Converts the coordinates of ``points`` in the ``source`` system into the coordinates in the
+    ``target`` system.
+
+    Raises:
+        ValueError: If ``points`` is not an array of the shape ``(..., 3)``.
+        UnitsError: If the unit of ``points`` is not a unit of length.
+    """
+
+    array = _points(points, source)
+    return _columns(_point_transform(type(source), type(target)), array)
+
+
+def transform_vectors(components: Any, points: Any, source: BaseCoordinateSystem,
+    target: BaseCoordinateSystem) -> np.ndarray:
+    """
+    Converts the ``components`` of vectors in the base of the ``source`` system into the
+    components in the base of the ``target`` system. The vectors are applied at ``points``, given
+    by their coordinates in the ``source`` system, since base vectors of curvilinear systems depend
+    on the point.
+
+    Raises:
+        ValueError: If ``components`` or ``points`` are not arrays of the shape ``(..., 3)``.
+        UnitsError: If the unit of ``points`` is not a unit of length.
+    """
+
+    array, unit = _split(components)
+    if unit is not None:
+        array = array * _unit_scale(unit)
+
+    point_array = _points(points, source)
+    return _columns(_vector_transform(type(source), type(target)), point_array, array)
+
+
+def clear_transform_cache() -> None:
+    """Drops all compiled transforms."""
+
+    _point_transform_cache.clear()
+    _vector_transform_cache.clear()
+
+
+__all__ = [
+    "transform_points",
+    "transform_vectors",
+    "clear_transform_cache",
+]
@@ -0,0 +1,406 @@
+"""
+This module provides a persistent memoization of expensive SymPy calls, such as `sympy.dsolve`,
+shared by all processes using the same cache directory. Laws import the cached versions of
+`dsolve`, `integrate`, `simplify` and `solve` from this module, so that warm runs of the test suite
+or of law workers skip the recomputation of the derivations.
+
+Calls are keyed on the `sympy.srepr` of their arguments, the assumptions of the symbols and
+functions in them, the evaluation mode and the SymPy version. The cache is disabled by default, in
+which case the cached functions call the original ones directly.
+
+* `DiskCache` stores signed pickled results in an SQLite database with size-based LRU eviction.
+* `disk_cacheit` wraps a function so that its results are stored in the active disk cache.
+* `enable_disk_cache` and `disable_disk_cache` switch the disk cache on and off globally.
+
+The cache is also enabled on import if the ``SYMPLYPHYSICS_CACHE_DIR`` environment variable is
+set to the cache directory.
+
+Example::
+
+    enable_disk_cache("~/.cache/symplyphysics", max_bytes=256 * 2**20)
+
+**Notes:**
+
+#. Symbols are created with generated names, which depend on the import order of laws. Hence,
+   calls made by different programs might not share the cache entries.
+
+#. Symbols, functions and quantities are stored as placeholders and replaced with the objects
+   passed to the call on lookup. Quantities are keyed on their scale factors, dimensions and signs,
+   like in `symplyphysics.core.memo`. Calls involving vectors or other non-SymPy objects are never
+   cached, since their values are not captured by their representation.
+
+#. Loading a pickle can run arbitrary code, so entries are signed with HMAC-SHA256 and entries
+   with a wrong signature are ignored. The key is read from the ``SYMPLYPHYSICS_CACHE_KEY``
+   environment variable, or else from the ``cache.key`` file in the cache directory, which is
+   created on first use and readable by its owner only. The key file is rejected if other users
+   can read or replace it. Processes sharing a cache directory between users should share the key
+   via the environment variable instead, and the directory should be writable by trusted users
+   only.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import hmac
+import os
+import pickle
+import secrets
+import sqlite3
+import stat
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+import sympy
+from sympy import Basic, Dummy, Function, Symbol as SymSymbol, preorder_traversal, srepr
+from sympy.core.function import AppliedUndef
+from sympy.core.parameters import global_parameters
+from sympy.logic.boolalg import BooleanAtom
+from sympy.physics.units import Quantity as SymQuantity
+
+from .symbols.symbols import Symbol
+
+_T = TypeVar("_T", bound=Callable[..., Any])
+
+_CACHE_DIR_VARIABLE = "SYMPLYPHYSICS_CACHE_DIR"
+_CACHE_KEY_VARIABLE = "SYMPLYPHYSICS_CACHE_KEY"
+_DATABASE_NAME = "sympy-calls.sqlite3"
+_KEY_NAME = "cache.key"
+_KEY_SIZE = 32
+_SIGNATURE_SIZE = hashlib.sha256().digest_size
+
+_SYMBOL_TYPES = (SymSymbol, Dummy, Symbol)
+_PLACEHOLDER_PREFIX = "_cached"
+
+# assumptions of quantities depend on their scale factors
+_QUANTITY_FACTS = ("commutative", "real", "positive", "negative", "nonzero")
+
+
+def _read_key(directory: Path) -> bytes:
+    """
+    Returns the key of the cache in ``directory``, creating it if needed.
+
+    Raises:
+        ValueError: If the key file can be read or replaced by other users.
+    """
+
+    variable = os.environ.get(_CACHE_KEY_VARIABLE)
+    if variable:
+        return variable.encode()
+
+    path = directory / _KEY_NAME
+    if not path.exists():
+        # the key is written to a private temporary file first, so that other processes never
+        # read a partially written key
+        descriptor, temporary = tempfile.mkstemp(dir=directory, prefix=f".{_KEY_NAME}")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(secrets.token_bytes(_KEY_SIZE))
+            os.link(temporary, path)
+        except FileExistsError:
+            pass
+        finally:
+            os.unlink(temporary)
+
+    info = path.stat()
+    private = not info.st_mode & (stat.S_IRWXG | stat.S_IRWXO)
+    if hasattr(os, "getuid"):
+        private = private and info.st_uid == os.getuid()
+    if not private:
+        raise ValueError(f"Cache key '{path}' should be owned and accessible by the current user "
+            f"only, or the key should be set in '{_CACHE_KEY_VARIABLE}'.")
+    return path.read_bytes()
+
+
+class DiskCache:
+    """
+    Process-safe store of pickled results in the ``directory``. Holds at most ``max_bytes`` of
+    results, evicting the least recently used ones. Values are signed with ``key``, which defaults
+    to the key of the directory, see the notes of the module.
+
+    Raises:
+        ValueError: If the key file of the directory can be read or replaced by other users.
+    """
+
+    def __init__(self,
+        directory: str | Path,
+        max_bytes: int = 256 * 2**20,
+        *,
+        key: Optional[bytes] = None) -> None:
+        if max_bytes <= 0:
+            raise ValueError(f"Cache size should be positive, got {max_bytes}.")
+
+        self.directory = Path(directory).expanduser()
+        self.max_bytes = max_bytes
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._key = key if key is not None else _read_key(self.directory)
+        self._local = threading.local()
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, "
+                "value BLOB NOT NULL, size INTEGER NOT NULL, accessed REAL NOT NULL)")
+            connection.execute("CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)")
+
+    @property
+    def path(self) -> Path:
+        return self.directory / _DATABASE_NAME
+
+    def _connect(self) -> sqlite3.Connection:
+        # connections cannot be shared between threads and forked processes, SQLite locks the
+        # database across processes
+        connection: Optional[sqlite3.Connection] = getattr(self._local, "connection", None)
+        if connection is None or self._local.pid != os.getpid():
+            connection = sqlite3.connect(self.path, timeout=60, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            self._local.connection = connection
+            self._local.pid = os.getpid()
+        return connection
+
+    def _sign(self, key: str, value: bytes) -> bytes:
+        return hmac.new(self._key, key.encode() + b"\0" + value, hashlib.sha256).digest()
+
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Returns the stored value of ``key``, or `None` if there is none or its signature is wrong.
+        """
+
+        connection = self._connect()
+        row = connection.execute("SELECT value FROM entries WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        signature, value = bytes(row[0][:_SIGNATURE_SIZE]), bytes(row[0][_SIGNATURE_SIZE:])
+        if not hmac.compare_digest(signature, self._sign(key, value)):
+            return None
+        connection.execute("UPDATE entries SET accessed = ? WHERE key = ?", (time.time(), key))
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        """Stores ``value`` under ``key`` and evicts the least recently used entries if needed."""
+
+        value = self._sign(key, value) + value
+        if len(value) > self.max_bytes:
+            return
+        connection = self._connect()
+        with connection:
+            connection.execute("BEGIN IMMEDIATE")
+            connection.execute("INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)",
+                (key, value, len(value), time.time()))
+            total = connection.execute("SELECT TOTAL(size) FROM entries").fetchone()[0]
+            if total <= self.max_bytes:
+                return
+            rows = connection.execute("SELECT key, size FROM entries ORDER BY accessed").fetchall()
+            evicted = []
+            for old_key, size in rows:
+                if total <= self.max_bytes:
+                    break
+                evicted.append((old_key,))
+                total -= size
+            connection.executemany("DELETE FROM entries WHERE key = ?", evicted)
+
+    def size(self) -> int:
+        """Returns the total size of the stored values along with their signatures in bytes."""
+
+        return int(self._connect().execute("SELECT TOTAL(size) FROM entries").fetchone()[0])
+
+    def clear(self) -> None:
+        self._connect().execute("DELETE FROM entries")
+
+    def __len__(self) -> int:
+        return int(self._connect().execute("SELECT COUNT(*) FROM entries").fetchone()[0])
+
+
+class _Uncacheable(Exception):
+    pass
+
+
+def _collect_atoms(value: Any, symbols: set[Basic], functions: set[Any],
+    quantities: set[SymQuantity]) -> None:
+    if isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            _collect_atoms(item, symbols, functions, quantities)
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            _collect_atoms(key, symbols, functions, quantities)
+            _collect_atoms(item, symbols, functions, quantities)
+    elif isinstance(value, Basic):
+        traversal = preorder_traversal(value)
+        for node in traversal:
+            if isinstance(node, SymQuantity):
+                quantities.add(node)
+                traversal.skip()
+            elif isinstance(node, AppliedUndef):
+                functions.add(node.func)
+            elif type(node) in _SYMBOL_TYPES:
+                symbols.add(node)
+            elif not type(node).__module__.startswith("sympy."):
+                raise _Uncacheable()
+            elif not node.args and not (node.is_number or isinstance(node, BooleanAtom)):
+                raise _Uncacheable()
+    elif not isinstance(value, (str, int, float, bool, type(None))):
+        raise _Uncacheable()
+
+
+def _replace(value: Any, symbols: dict[Basic, Basic], functions: dict[Any, Any]) -> Any:
+    if isinstance(value, list):
+        return [_replace(item, symbols, functions) for item in value]
+    if isinstance(value, (tuple, set, frozenset)):
+        return type(value)(_replace(item, symbols, functions) for item in value)
+    if isinstance(value, dict):
+        return {
+            _replace(key, symbols, functions): _replace(item, symbols, functions)
+            for key, item in value.items()
+        }
+    if isinstance(value, Basic):
+        value = value.xreplace(symbols)
+        for old, new in functions.items():
+            value = value.replace(old, new)
+    return value
+
+
+def _assumptions(function: Any) -> dict[str, Any]:
+    return getattr(function, "_kwargs", {})
+
+
+def _quantity_facts(quantity: SymQuantity) -> dict[str, bool]:
+    facts = {name: getattr(quantity, f"is_{name}") for name in _QUANTITY_FACTS}
+    return {name: value for name, value in facts.items() if value is not None}
+
+
+def _quantity_key(quantity: SymQuantity) -> str:
+    facts = sorted(_quantity_facts(quantity).items())
+    return srepr((quantity.scale_factor, quantity.dimension, facts))
+
+
+class _Call:
+    """Key of a call along with the mapping between its symbols and the stored placeholders."""
+
+    def __init__(self, name: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        symbols: set[Basic] = set()
+        functions: set[Any] = set()
+        quantities: set[SymQuantity] = set()
+        _collect_atoms((args, kwargs), symbols, functions, quantities)
+
+        # `srepr` omits the assumptions of functions and the dimensions of quantities
+        sorted_functions = sorted(functions, key=lambda f: (f.name, str(_assumptions(f))))
+        sorted_quantities = sorted(quantities, key=lambda q: (srepr(q), _quantity_key(q)))
+        content = "\n".join((
+            sympy.__version__,
+            name,
+            srepr((args, sorted(kwargs.items()))),
+            repr([sorted(_assumptions(f).items()) for f in sorted_functions]),
+            repr([_quantity_key(q) for q in sorted_quantities]),
+            repr((global_parameters.evaluate, global_parameters.distribute)),
+        ))
+        self.key = hashlib.sha256(content.encode()).hexdigest()
+
+        sorted_symbols = sorted(symbols, key=srepr)
+        placeholders: dict[Basic, Basic] = {
+            s: SymSymbol(f"{_PLACEHOLDER_PREFIX}{i}", **s.assumptions0)
+            for i, s in enumerate(sorted_symbols)
+        }
+        placeholders.update({
+            q: SymSymbol(f"{_PLACEHOLDER_PREFIX}_quantity{i}", **_quantity_facts(q))
+            for i, q in enumerate(sorted_quantities)
+        })
+        self.to_placeholders: tuple[dict[Basic, Basic], dict[Any, Any]] = (placeholders, {
+            f: Function(f"{_PLACEHOLDER_PREFIX}_function{i}", **_assumptions(f))
+            for i, f in enumerate(sorted_functions)
+        })
+        self.from_placeholders = (
+            {v: k for k, v in self.to_placeholders[0].items()},
+            {v: k for k, v in self.to_placeholders[1].items()},
+        )
+
+    def dumps(self, result: Any) -> bytes:
+        return pickle.dumps(_replace(result, *self.to_placeholders))
+
+    def loads(self, data: bytes) -> Any:
+        return _replace(pickle.loads(data), *self.from_placeholders)
+
+
+_disk_cache: Optional[DiskCache] = None
+
+
+def active_disk_cache() -> Optional[DiskCache]:
+    """Returns the enabled disk cache, or `None` if it is disabled."""
+
+    return _disk_cache
+
+
+def enable_disk_cache(directory: Optional[str | Path] = None,
+    max_bytes: int = 256 * 2**20) -> DiskCache:
+    """
+    Enables the disk cache in ``directory``, which defaults to ``symplyphysics`` in the user cache
+    directory.
+    """
+
+    if directory is None:
+        directory = Path(os.environ.get("XDG_CACHE_HOME", "~/.cache"), "symplyphysics")
+
+    #pylint: disable-next=global-statement
+    global _disk_cache
+    _disk_cache = DiskCache(directory, max_bytes)
+    return _disk_cache
+
+
+def disable_disk_cache() -> None:
+    #pylint: disable-next=global-statement
+    global _disk_cache
+    _disk_cache = None
+
+
+def disk_cacheit(function: _T) -> _T:
+    """
+    Stores the results of ``function`` in the active disk cache. Results that cannot be pickled
+    are not stored.
+    """
+
+    name = f"{function.__module__}.{function.__qualname__}"
+
+    @functools.wraps(function)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        cache = _disk_cache
+        if cache is None:
+            return function(*args, **kwargs)
+
+        try:
+            call = _Call(name, args, kwargs)
+        except _Uncacheable:
+            return function(*args, **kwargs)
+
+        data = cache.get(call.key)
+        if data is not None:
+            return call.loads(data)
+
+        result = function(*args, **kwargs)
+        try:
+            data = call.dumps(result)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return result
+        cache.put(call.key, data)
+        return result
+
+    return wrapper  # type: ignore[return-value]
+
+
+dsolve = disk_cacheit(sympy.dsolve)
+integrate = disk_cacheit(sympy.integrate)
+simplify = disk_cacheit(sympy.simplify)
+solve = disk_cacheit(sympy.solve)
+
+if _CACHE_DIR_VARIABLE in os.environ:
+    enable_disk_cache(os.environ[_CACHE_DIR_VARIABLE])
+
+__all__ = [
+    "DiskCache",
+    "active_disk_cache",
+    "enable_disk_cache",
+    "disable_disk_cache",
+    "disk_cacheit",
+    "dsolve",
+    "integrate",
+    "simplify",
+    "solve",
+]
@@ -0,0 +1,183 @@
+"""
+This module provides asynchronous variants of law functions, so that the CPU-bound symbolic work
+of ``calculate_*`` functions does not block the asyncio event loop.
+
+* `AsyncLawExecutor` runs law functions in a thread or process pool. Identical calls that are in
+  flight at the same time are coalesced into one call, and a call is cancelled once all of its
+  callers are cancelled.
+* `acalculate` runs a law function with the default thread-backed executor or the given one.
+
+Example::
+
+    async with AsyncLawExecutor("process", max_workers=4) as executor:
+        current = await acalculate(ohm_law.calculate_current, voltage, resistance,
+            executor=executor)
+
+**Notes:**
+
+#. Process pools require the arguments and the results to be picklable, which is the case for
+   quantities and law functions defined at the module level.
+
+#. Threads cannot be interrupted, so a cancelled call that has already started in a thread pool
+   runs to completion but its result is discarded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Literal, Optional
+
+from .symbols.quantities import quantity_key
+
+ExecutorKind = Literal["thread", "process"]
+
+
+class _InFlight:
+
+    def __init__(self, future: asyncio.Future[Any]) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+class AsyncLawExecutor:
+    """
+    Runs law functions in a pool of the given ``kind`` with ``max_workers`` workers. A custom
+    ``executor`` can be passed instead, in which case it is not shut down by this object. If
+    ``coalesce`` is `True`, calls with equal arguments that are in flight at the same time share a
+    single computation.
+    """
+
+    def __init__(
+        self,
+        kind: ExecutorKind = "thread",
+        *,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+        coalesce: bool = True,
+    ) -> None:
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Executor kind should be 'thread' or 'process', got '{kind}'.")
+
+        self.kind = kind
+        self.coalesce = coalesce
+        self._max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+        self._in_flight: dict[Hashable, _InFlight] = {}
+
+    @property
+    def executor(self) -> Executor:
+        """The underlying pool. It is created on first use."""
+
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                    thread_name_prefix="symplyphysics")
+        return self._executor
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct calls that are currently running or queued."""
+
+        return len(self._in_flight)
+
+    async def run(self, law_function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Runs ``law_function`` with the given arguments in the pool and returns its result.
+        Exceptions raised by the law function, e.g. `errors.UnitsError`, are propagated.
+        """
+
+        loop = asyncio.get_running_loop()
+        key = self._key(loop, law_function, args, kwargs)
+
+        entry = self._in_flight.get(key) if key is not None else None
+        if entry is None:
+            call = functools.partial(law_function, *args, **kwargs)
+            entry = _InFlight(asyncio.wrap_future(self.executor.submit(call), loop=loop))
+            if key is not None:
+                self._in_flight[key] = entry
+                entry.future.add_done_callback(functools.partial(self._forget, key, entry))
+
+        entry.waiters += 1
+        try:
+            return await asyncio.shield(entry.future)
+        except asyncio.CancelledError:
+            if entry.waiters == 1:
+                # the last caller is gone, so is the need in the result
+                entry.future.cancel()
+            raise
+        finally:
+            entry.waiters -= 1
+
+    def _key(self, loop: asyncio.AbstractEventLoop, law_function: Callable[..., Any],
+        args: tuple[Any, ...], kwargs: dict[str, Any]) -> Optional[Hashable]:
+        if not self.coalesce:
+            return None
+
+        try:
+            return (loop, law_function, quantity_key(args),
+                quantity_key(tuple(sorted(kwargs.items()))))
+        except TypeError:
+            # unhashable arguments are never coalesced
+            return None
+
+    def _forget(self, key: Hashable, entry: _InFlight, _: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is entry:
+            del self._in_flight[key]
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def __enter__(self) -> AsyncLawExecutor:
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        self.shutdown()
+
+    async def __aenter__(self) -> AsyncLawExecutor:
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        self.shutdown(wait=False)
+
+
+_default_executor: Optional[AsyncLawExecutor] = None
+_default_executor_lock = threading.Lock()
+
+
+def _get_default_executor() -> AsyncLawExecutor:
+    #pylint: disable-next=global-statement
+    global _default_executor
+    with _default_executor_lock:
+        if _default_executor is None:
+            _default_executor = AsyncLawExecutor("thread")
+        return _default_executor
+
+
+async def acalculate(
+    law_function: Callable[..., Any],
+    *args: Any,
+    executor: Optional[AsyncLawExecutor] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Awaitable counterpart of calling ``law_function(*args, **kwargs)``. The call runs in
+    ``executor`` or, if it is not provided, in a shared thread-backed executor.
+    """
+
+    executor = executor or _get_default_executor()
+    return await executor.run(law_function, *args, **kwargs)
+
+
+__all__ = [
+    "ExecutorKind",
+    "AsyncLawExecutor",
+    "acalculate",
+]
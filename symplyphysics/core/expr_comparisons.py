@@ -1,17 +1,223 @@
-from typing import SupportsAbs, Any
-from sympy import simplify
+import cmath
+from dataclasses import dataclass
+from random import Random
+from typing import SupportsAbs, Any, Literal, Optional
+from sympy import (expand, simplify, sympify, Abs, Basic, Derivative, Expr, Float, Heaviside, I,
+    Integral, LambertW, Mod, Piecewise, Pow, Product, Rational, Subs, Sum, SympifyError, arg,
+    ceiling, floor, frac, log, sign)
+from sympy.core.function import AppliedUndef
+from sympy.core.traversal import preorder_traversal
+from sympy.functions.elementary.hyperbolic import InverseHyperbolicFunction
+from sympy.functions.elementary.miscellaneous import MinMaxBase
+from sympy.functions.elementary.trigonometric import InverseTrigonometricFunction
+from sympy.physics.units import Quantity as SymQuantity
+from sympy.tensor.indexed import Indexed
 from sympy.vector import Vector
+from sympy.vector.basisdependent import BasisDependent
+
+from .operations.sum_indexed import IndexedSum
+from .vectors import VectorExpr, VectorNorm, VectorDot, VectorMixedProduct
+
+ComparisonTier = Literal["structural", "numeric", "symbolic"]
+
+# Subexpressions that cannot be evaluated exactly, as well as floating-point numbers, are replaced
+# by independent variables
+_OPAQUE_TYPES = (AppliedUndef, Derivative, Integral, Subs, Sum, Product, Indexed, IndexedSum,
+    SymQuantity, VectorNorm, VectorDot, VectorMixedProduct, Float)
+
+# Expressions with piecewise functions can be equal on some regions of the sampled values only
+_PIECEWISE_TYPES = (Abs, sign, arg, Piecewise, Heaviside, floor, ceiling, frac, Mod, MinMaxBase,
+    InverseTrigonometricFunction, InverseHyperbolicFunction)
+
+_PRECISION = 30
+_TOLERANCE = 1e-12
+_MAX_ATTEMPTS = 4
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Result of `compare_expressions` along with the tier of the check that has decided it."""
+
+    equal: bool
+
+    tier: ComparisonTier
+
+    def __bool__(self) -> bool:
+        return self.equal
+
+
+def _variables(expr: Expr) -> Optional[list[Expr]]:
+    """
+    Returns the free symbols and the maximal opaque subexpressions of ``expr``, or `None` if
+    ``expr`` contains vectors.
+    """
+
+    found: dict[Expr, None] = {}
+    stack: list[Basic] = [expr]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, _OPAQUE_TYPES):
+            found[node] = None
+        elif isinstance(node, (VectorExpr, BasisDependent)):
+            return None
+        elif node.is_Symbol:
+            found[node] = None
+        else:
+            stack.extend(node.args)
+    return list(found)
+
+
+def _is_piecewise(node: Basic) -> bool:
+    if isinstance(node, _PIECEWISE_TYPES):
+        return True
+    # functions with branch cuts are piecewise unless their arguments stay away from the cuts
+    if isinstance(node, Pow):
+        return not node.exp.is_integer and not node.base.is_positive
+    if isinstance(node, (log, LambertW)):
+        return not node.args[0].is_positive
+    return False
+
+
+def _has_piecewise(expr: Expr) -> bool:
+    return any(_is_piecewise(node) for node in preorder_traversal(expr))
+
+
+def _rational(rng: Random) -> Rational:
+    # non-integer values, so that e.g. floor(x) and x differ
+    while True:
+        numerator, denominator = rng.randint(1, 97), rng.randint(2, 37)
+        if numerator % denominator:
+            return Rational(numerator, denominator)
+
+
+def _sample(variable: Expr, rng: Random) -> Expr:
+    negative = rng.random() < 0.5
+    if variable.is_integer:
+        value: Expr = Rational(rng.randint(1, 9))
+        return -value if negative and not variable.is_nonnegative else value
+
+    value = _rational(rng)
+    if variable.is_nonnegative:
+        return value
+    if variable.is_nonpositive:
+        return -value
+    if negative:
+        value = -value
+    if variable.is_real:
+        return value
+    imaginary = _rational(rng)
+    return value + I * (-imaginary if rng.random() < 0.5 else imaginary)
+
+
+def _evaluate(expr: Expr, values: dict[Expr, Expr]) -> Optional[complex]:
+    result = expr.xreplace(values).evalf(_PRECISION)
+    if not result.is_number:
+        return None
+    try:
+        value = complex(result)
+    except (TypeError, ValueError):
+        return None
+    return value if cmath.isfinite(value) else None
+
+
+def _exact_difference(lhs: Expr, rhs: Expr, values: dict[Expr, Expr]) -> Optional[Expr]:
+    difference = expand(lhs.xreplace(values) - rhs.xreplace(values))
+    if not difference.is_number or not difference.is_finite:
+        return None
+    return difference
+
+
+def numeric_equals(lhs: Any, rhs: Any, points: int = 3, seed: int = 0) -> Optional[bool]:
+    """
+    Compares ``lhs`` and ``rhs`` at ``points`` random points, see `compare_expressions`. Returns
+    `True` if their difference is exactly zero at all points, `False` if it is numerically nonzero
+    at some point, and `None` if the expressions cannot be compared this way.
+
+    Since opaque subexpressions are replaced by independent variables, `False` does not prove that
+    the expressions differ. Expressions with piecewise functions are never compared this way.
+    """
+
+    try:
+        lhs = sympify(lhs, strict=True)
+        rhs = sympify(rhs, strict=True)
+    except SympifyError:
+        return None
+    if not isinstance(lhs, Expr) or not isinstance(rhs, Expr):
+        return None
+    if _has_piecewise(lhs) or _has_piecewise(rhs):
+        return None
+
+    lhs_variables = _variables(lhs)
+    rhs_variables = _variables(rhs)
+    if lhs_variables is None or rhs_variables is None:
+        return None
+    variables = list(dict.fromkeys(lhs_variables + rhs_variables))
+
+    rng = Random(seed)
+    evaluated = 0
+    for _ in range(points * _MAX_ATTEMPTS):
+        values = {v: _sample(v, rng) for v in variables}
+        difference = _exact_difference(lhs, rhs, values)
+        # the point might be a singularity of the expressions, try another one
+        if difference is None:
+            continue
+        if difference != 0:
+            lhs_value = _evaluate(lhs, values)
+            rhs_value = _evaluate(rhs, values)
+            if lhs_value is None or rhs_value is None:
+                continue
+            scale = max(abs(lhs_value), abs(rhs_value))
+            if abs(lhs_value - rhs_value) > _TOLERANCE * scale:
+                return False
+            # the difference is too small to tell, e.g. it is sin(x)**2 + cos(x)**2 - 1
+            return None
+        evaluated += 1
+        if evaluated == points:
+            return True
+    return None
 
 
 ## Do not try to limit type of the input parameters. Allow any object to
 ## be compared, if it can.
-def expr_equals(lhs: Any, rhs: Any) -> bool:
-    val = simplify(lhs - rhs)
+def compare_expressions(lhs: Any, rhs: Any, *, points: int = 3, seed: int = 0) -> Comparison:
+    """
+    Checks the equality of ``lhs`` and ``rhs`` in tiers, from the cheapest to the most expensive:
+
+    #. ``structural``: the difference of the expressions is identically zero.
+
+    #. ``numeric``: the difference of the expressions evaluates exactly to zero at ``points``
+       random rational points sampled with respect to the assumptions on their symbols, the signs
+       of the symbols being chosen independently. Undefined functions, derivatives, integrals and
+       other subexpressions that cannot be evaluated exactly, as well as floating-point numbers,
+       are treated as independent variables. Expressions with piecewise functions, e.g. `Abs`,
+       `sign` or `floor`, and with functions whose arguments can cross their branch cuts, e.g.
+       ``sqrt(x**2)`` for a real ``x``, are left to the symbolic tier. The random generator is
+       seeded with ``seed``, so the outcome is reproducible.
+
+    #. ``symbolic``: the difference of the expressions simplifies to zero.
+
+    The numeric tier only ever confirms the equality, i.e. unequal expressions are always
+    confirmed by `sympy.simplify`. Differences that are not exactly zero, e.g. because of rounding
+    of floating-point numbers, are never taken for equality by the numeric tier.
+    """
+
+    diff = lhs - rhs
+    if diff == 0 or diff == Vector.zero:
+        return Comparison(True, "structural")
+
+    if numeric_equals(lhs, rhs, points, seed):
+        return Comparison(True, "numeric")
+
+    val = simplify(diff)
     if val == 0:
-        return True
+        return Comparison(True, "symbolic")
     if val == Vector.zero:
-        return True
-    return False
+        return Comparison(True, "symbolic")
+    return Comparison(False, "symbolic")
+
+
+def expr_equals(lhs: Any, rhs: Any) -> bool:
+    return compare_expressions(lhs, rhs).equal
 
 
 ## SymPy does not allow to compare Abs with non-Abs values so we apply abs() to both sides.
@@ -0,0 +1,240 @@
+"""
+This module fits the constants of a law to measured data. The residual of the law and its Jacobian
+with respect to the free constants are compiled once into a vectorized kernel (see
+`symplyphysics.core.kernels`), and the constants are found with the Levenberg-Marquardt method over
+all measurements at once, which takes milliseconds for ``10**5`` points.
+
+* `fit` fits the free constants of a law to data columns.
+* `FitResult` holds the fitted constants as quantities along with their covariance.
+
+Example::
+
+    result = fit(resistance_law, {
+        "resistance": (measured_resistances, "ohm"),
+        "temperature": (measured_temperatures, "kelvin"),
+    }, free=["resistance_initial", "temperature_coefficient"])
+    result.parameters["temperature_coefficient"], result.standard_errors["temperature_coefficient"]
+
+**Notes:**
+
+#. Data columns are either arrays of SI magnitudes, or ``(values, unit)`` pairs, where ``unit`` is a
+   unit expression or its string, see `symplyphysics.core.convert.parse_unit`. The dimensions of the
+   units are checked against the law symbols. Constant columns can be given as quantities.
+
+#. The residual is the difference between the ``target`` column and the law solved for it, which
+   for explicit laws is the difference between their sides. Laws with several solutions are
+   solved for the principal one, see `symplyphysics.core.kernels.principal_solution`. The
+   covariance of the constants is estimated from the residual variance.
+
+#. Iterations start with undamped Gauss-Newton steps, which solve models linear in the constants
+   at once. Guesses of the right order of magnitude make nonlinear fits converge in a few
+   iterations.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import numpy as np
+from sympy import Expr, diff
+from sympy.physics.units import Quantity as SymQuantity
+
+from .convert import parse_unit
+from .dimensions import assert_equivalent_dimension, dimension_to_si_unit
+from .kernels import (LawSource, TargetType, applied_symbol, as_law, compile_expression,
+    find_target, load_law, real_si_magnitude, solve_law, to_numeric_expression)
+from .symbols.quantities import Quantity
+from .symbols.symbols import DimensionSymbol
+
+_TOLERANCE = 1e-12
+_MAX_ITERATIONS = 200
+_INITIAL_DAMPING = 1e-3
+_MIN_DAMPING = 1e-9
+_MAX_DAMPING = 1e16
+
+
+@dataclass(frozen=True)
+class FitResult:
+    """Constants fitted by `fit`."""
+
+    parameters: dict[str, Quantity]
+    """Fitted constants keyed by their names."""
+
+    standard_errors: dict[str, Quantity]
+    """Standard errors of the fitted constants."""
+
+    covariance: np.ndarray = field(repr=False)
+    """Covariance of the SI magnitudes of the constants, in the order of `parameters`."""
+
+    units: dict[str, Expr]
+    """SI units of the constants, i.e. of the rows and columns of `covariance`."""
+
+    residuals: np.ndarray = field(repr=False)
+    """Residuals of the measurements at the fitted constants, in SI units."""
+
+    iterations: int
+    """Number of Levenberg-Marquardt iterations."""
+
+    converged: bool
+    """Whether the relative change of the constants fell below the tolerance."""
+
+    @property
+    def correlation(self) -> np.ndarray:
+        """Correlation matrix of the constants."""
+
+        deviation = np.sqrt(np.diagonal(self.covariance))
+        return self.covariance / np.outer(deviation, deviation)
+
+
+@dataclass(frozen=True)
+class _FitKernel:
+    parameters: tuple[str, ...]
+
+    parameter_symbols: tuple[DimensionSymbol, ...]
+
+    columns: tuple[str, ...]
+
+    column_symbols: tuple[DimensionSymbol, ...]
+
+    function: Callable[..., Any] = field(repr=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_fit(source: LawSource, target: TargetType, free: tuple[str, ...]) -> _FitKernel:
+    law, names = as_law(source)
+    target_name, target_symbol = find_target(law, names, target)
+
+    unknown = set(free) - set(names)
+    if unknown:
+        raise ValueError(f"Law '{law}' does not have symbols {sorted(unknown)}.")
+    if target_name in free:
+        raise ValueError(f"Target '{target_name}' cannot be a free constant.")
+
+    applied = applied_symbol(law, target_symbol)
+    residual = to_numeric_expression(applied - solve_law(law, applied, None))
+    parameter_symbols = tuple(names[n] for n in free)
+    jacobian = [diff(residual, applied_symbol(law, s)) for s in parameter_symbols]
+
+    columns = tuple(n for n in names if n not in free)
+    column_symbols = tuple(names[n] for n in columns)
+    function = compile_expression([residual, *jacobian],
+        [applied_symbol(law, s) for s in parameter_symbols + column_symbols],
+        cse=True)
+    return _FitKernel(free, parameter_symbols, columns, column_symbols, function)
+
+
+def _column(value: Any, name: str, symbol: DimensionSymbol) -> np.ndarray:
+    if isinstance(value, tuple) and len(value) == 2:
+        values, unit = value
+        unit = parse_unit(unit) if isinstance(unit, str) else unit
+        assert_equivalent_dimension(unit, name, "fit", symbol.dimension)
+        scale = real_si_magnitude(Quantity(unit), symbol)
+        return np.asarray(values, dtype=float) * scale
+    if isinstance(value, SymQuantity):
+        assert_equivalent_dimension(value, name, "fit", symbol.dimension)
+        return np.asarray(real_si_magnitude(value, symbol))
+    return np.asarray(value, dtype=float)
+
+
+def fit(source: LawSource | str,
+    data: Mapping[str, Any],
+    free: Sequence[str],
+    *,
+    target: Optional[TargetType] = None,
+    guess: Optional[Mapping[str, Any]] = None) -> FitResult:
+    """
+    Fits the ``free`` constants of the law ``source`` to ``data``.
+
+    Args:
+        source: Law module, its dotted path, or a law equation.
+        data: Columns of measurements keyed by the names of the other law symbols.
+        free: Names of the law symbols to fit.
+        target: Symbol of the measured dependent variable, defaults to the left-hand side of the
+            law.
+        guess: Starting values of the free constants as quantities or SI magnitudes, default to 1.
+
+    Raises:
+        ValueError: If data columns are missing or unknown, or there are fewer measurements than
+            free constants.
+        UnitsError: If the units of data columns do not match the law symbols.
+    """
+
+    module_or_law = load_law(source) if isinstance(source, str) else source
+    law, _ = as_law(module_or_law)
+    kernel = _compile_fit(module_or_law, law.lhs if target is None else target, tuple(free))
+
+    missing = set(kernel.columns) - set(data)
+    if missing:
+        raise ValueError(f"Missing data columns {sorted(missing)}.")
+    unknown = set(data) - set(kernel.columns)
+    if unknown:
+        raise ValueError(f"Law has no symbols {sorted(unknown)} to match data columns.")
+
+    columns = [_column(data[n], n, s) for n, s in zip(kernel.columns, kernel.column_symbols)]
+    shape = np.broadcast_shapes(*(c.shape for c in columns))
+    size = int(np.prod(shape))
+    if size <= len(free):
+        raise ValueError(f"Fitting {len(free)} constants requires more than {size} measurements.")
+
+    guess = guess or {}
+    x = np.array([real_si_magnitude(guess.get(n, 1.0), s)
+        for n, s in zip(kernel.parameters, kernel.parameter_symbols)])
+
+    def evaluate(x: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        with np.errstate(all="ignore"):
+            results = kernel.function(*x, *columns)
+        results = [np.broadcast_to(np.real_if_close(r), shape).astype(float).reshape(-1)
+            for r in results]
+        return results[0], np.stack(results[1:], axis=-1)
+
+    residuals, jacobian = evaluate(x)
+    cost = float(residuals @ residuals)
+    # start with Gauss-Newton steps, damping them only once they fail
+    damping = 0.0
+    converged = False
+    iterations = 0
+    while iterations < _MAX_ITERATIONS and damping < _MAX_DAMPING and not converged:
+        iterations += 1
+        normal = jacobian.T @ jacobian
+        gradient = jacobian.T @ residuals
+        # Marquardt scaling keeps the damping independent of the units of the constants
+        scale = np.diagonal(normal).copy()
+        scale[scale == 0] = 1
+        step = -np.linalg.lstsq(normal + damping * np.diag(scale), gradient, rcond=None)[0]
+
+        candidate = x + step
+        new_residuals, new_jacobian = evaluate(candidate)
+        new_cost = float(new_residuals @ new_residuals)
+        if not np.isfinite(new_cost) or new_cost > cost:
+            damping = max(10 * damping, _INITIAL_DAMPING)
+            continue
+
+        converged = (new_cost == 0 or
+            bool(np.all(np.abs(step) <= _TOLERANCE * np.abs(candidate) + np.finfo(float).tiny)))
+        x, residuals, jacobian, cost = candidate, new_residuals, new_jacobian, new_cost
+        damping = damping / 10 if damping > _MIN_DAMPING else 0.0
+
+    variance = cost / (size - len(free))
+    covariance = variance * np.linalg.pinv(jacobian.T @ jacobian)
+
+    units = {
+        n: dimension_to_si_unit(s.dimension)
+        for n, s in zip(kernel.parameters, kernel.parameter_symbols)
+    }
+    parameters = {n: Quantity(float(v) * units[n]) for n, v in zip(kernel.parameters, x)}
+    errors = {
+        n: Quantity(float(np.sqrt(v)) * units[n])
+        for n, v in zip(kernel.parameters, np.diagonal(covariance))
+    }
+    return FitResult(parameters, errors, covariance, units, residuals.reshape(shape), iterations,
+        converged)
+
+
+__all__ = [
+    "FitResult",
+    "fit",
+]
@@ -0,0 +1,330 @@
+"""
+This module samples the gradient, divergence, curl and Laplacian of fields on structured 3D grids
+of a coordinate system, e.g. `CartesianCoordinateSystem`, `CylindricalCoordinateSystem` or
+`SphericalCoordinateSystem`.
+
+* `Grid` is a structured grid given by the values of the three base scalars of a system.
+* `evaluate_field` samples a `CoordinateScalar` or a `CoordinateVector` on a grid.
+* `gradient`, `divergence`, `curl` and `laplacian` apply the operators of
+  `symplyphysics.core.operators` to fields, which are either symbolic or given by samples on a grid.
+
+Symbolic fields are differentiated exactly, and the result is compiled once into a vectorized
+function of the base scalars (see `symplyphysics.core.kernels`). Fields defined only by samples are
+differentiated with second-order finite differences, and the Lamé coefficients of the system are
+compiled and sampled on the grid.
+
+Example::
+
+    grid = Grid(SPHERICAL, [np.linspace(1, 2, 50), np.linspace(0.1, 3, 60), np.linspace(0, 6, 70)])
+    field = CoordinateScalar(r**2 * sin(theta), SPHERICAL, point)
+    gradient(field, grid)  # of the shape (50, 60, 70, 3)
+    laplacian(evaluate_field(field, grid), grid, chunk_size=10)
+
+**Notes:**
+
+#. All values are SI magnitudes, i.e. the axes of grids are in meters and radians. Vector fields
+   are sampled as arrays of the shape ``grid.shape + (3,)``, whose last axis holds the components
+   in the base of the system of the grid.
+
+#. ``chunk_size`` limits the number of grid slices along the first axis processed at once, which
+   bounds the memory of temporary arrays. Finite differences of chunks include the neighbouring
+   slices, so the results do not depend on the chunk size up to rounding.
+
+#. Finite differences are of the first order at the edges of the grid. Operators are not defined
+   where a Lamé coefficient vanishes, e.g. on the axis of cylindrical coordinates, and produce
+   ``inf`` or ``nan`` values there.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional, Sequence
+
+import numpy as np
+from sympy import Basic, Expr
+
+from .coordinate_systems import BaseCoordinateSystem, CoordinateScalar, CoordinateVector
+from .kernels import compile_expression, to_numeric_expression
+from .operators import VectorCurl, VectorDivergence, VectorGradient, VectorLaplacian
+
+
+@dataclass(frozen=True, eq=False)
+class Grid:
+    """
+    Structured grid of the coordinate ``system``, which is the Cartesian product of the ``axes``,
+    i.e. of the increasing values of the base scalars of the system.
+    """
+
+    system: BaseCoordinateSystem
+    """Coordinate system of the grid."""
+
+    axes: tuple[np.ndarray, np.ndarray, np.ndarray]
+    """Values of the base scalars of `system` along the axes of the grid."""
+
+    def __init__(self, system: BaseCoordinateSystem, axes: Sequence[Any]) -> None:
+        if len(axes) != 3:
+            raise ValueError(f"Expected 3 axes, got {len(axes)}.")
+
+        arrays = tuple(np.asarray(a, dtype=float) for a in axes)
+        for array in arrays:
+            if array.ndim != 1 or array.size < 2 or np.any(np.diff(array) <= 0):
+                raise ValueError("Axes should be increasing 1D arrays of at least 2 values.")
+
+        object.__setattr__(self, "system", system)
+        object.__setattr__(self, "axes", arrays)
+
+    @property
+    def shape(self) -> tuple[int, int, int]:
+        a, b, c = (len(a) for a in self.axes)
+        return a, b, c
+
+    def mesh(self, sparse: bool = False) -> tuple[np.ndarray, ...]:
+        """Returns the values of the base scalars at the nodes of the grid, see `numpy.meshgrid`."""
+
+        return tuple(np.meshgrid(*self.axes, indexing="ij", sparse=sparse))
+
+    def chunks(self, chunk_size: Optional[int] = None) -> Iterator[slice]:
+        """Splits the first axis of the grid into slices of at most ``chunk_size`` values."""
+
+        size = self.shape[0]
+        step = size if chunk_size is None else chunk_size
+        if step < 1:
+            raise ValueError(f"Chunk size should be positive, got {chunk_size}.")
+
+        for start in range(0, size, step):
+            yield slice(start, min(start + step, size))
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_field(exprs: tuple[Expr, ...],
+    base_scalars: tuple[Expr, Expr, Expr]) -> Callable[..., Any]:
+    numeric = [to_numeric_expression(e) for e in exprs]
+    unknown = set().union(*(e.free_symbols for e in numeric)) - set(base_scalars)
+    if unknown:
+        names = ", ".join(sorted(str(s) for s in unknown))
+        raise ValueError(f"Field depends on symbols other than base scalars: {names}.")
+
+    return compile_expression(numeric, base_scalars)
+
+
+def _field_expressions(field: Any, system: BaseCoordinateSystem) -> tuple[Expr, ...]:
+    if isinstance(field, CoordinateScalar):
+        field_system = field.system
+        exprs: tuple[Expr, ...] = (field.scalar,)
+    elif isinstance(field, CoordinateVector):
+        field_system = field.system
+        exprs = tuple(field.components)
+    else:
+        raise ValueError(f"Expected coordinate scalar or vector, got {field}.")
+
+    if type(field_system) is not type(system):
+        raise ValueError(f"Field is defined in {field_system!r}, the grid is in {system!r}.")
+
+    # the components are functions of the base scalars of the field's own system
+    replacements = dict(zip(field_system.base_scalars, system.base_scalars))
+    return tuple(e.xreplace(replacements) for e in exprs)
+
+
+def _evaluate(exprs: Sequence[Expr], grid: Grid, chunk_size: Optional[int]) -> np.ndarray:
+    function = _compile_field(tuple(exprs), grid.system.base_scalars)
+    shape = grid.shape
+    result = np.empty(shape + (len(exprs),)) if len(exprs) > 1 else np.empty(shape)
+
+    a, b, c = grid.mesh(sparse=True)
+    for chunk in grid.chunks(chunk_size):
+        chunk_shape = (chunk.stop - chunk.start,) + shape[1:]
+        values = function(a[chunk], b, c)
+        columns = [np.broadcast_to(v, chunk_shape) for v in values]
+        result[chunk] = np.stack(columns, axis=-1) if len(exprs) > 1 else columns[0]
+
+    return result
+
+
+def evaluate_field(field: Any, grid: Grid, *, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Samples the ``field``, a `CoordinateScalar` or a `CoordinateVector` of the system of the
+    ``grid``, at the nodes of the grid.
+
+    Raises:
+        ValueError: If the field is not a coordinate scalar or vector of the system of the grid,
+            or depends on symbols other than the base scalars.
+    """
+
+    return _evaluate(_field_expressions(field, grid.system), grid, chunk_size)
+
+
+def _evaluate_result(result: Expr, grid: Grid, vector: bool,
+    chunk_size: Optional[int]) -> np.ndarray:
+    # operators return zero when the result vanishes identically
+    if not isinstance(result, (CoordinateScalar, CoordinateVector)):
+        if result != 0:
+            raise ValueError(f"Cannot evaluate '{result}' on the grid.")
+        return np.zeros(grid.shape + (3,) if vector else grid.shape)
+
+    return evaluate_field(result, grid, chunk_size=chunk_size)
+
+
+# Compiled Lamé coefficients keyed by the classes of coordinate systems
+_lame_coefficients_cache: dict[type[BaseCoordinateSystem], Callable[..., Any]] = {}
+
+
+def _compile_lame_coefficients(system_type: type[BaseCoordinateSystem]) -> Callable[..., Any]:
+    if system_type not in _lame_coefficients_cache:
+        system = system_type()
+        _lame_coefficients_cache[system_type] = compile_expression(
+            list(system.lame_coefficients()), system.base_scalars)
+
+    return _lame_coefficients_cache[system_type]
+
+
+def _samples(field: Any, grid: Grid, vector: bool) -> np.ndarray:
+    array = np.asarray(field, dtype=float)
+    shape = grid.shape + (3,) if vector else grid.shape
+    if array.shape != shape:
+        raise ValueError(f"Expected samples of the shape {shape}, got {array.shape}.")
+    return array
+
+
+# Operators on a chunk of samples given the axes and the Lamé coefficients of the chunk
+
+
+def _derivative(values: np.ndarray, axes: Sequence[np.ndarray], i: int) -> np.ndarray:
+    return np.gradient(values, axes[i], axis=i)
+
+
+def _gradient(f: np.ndarray, axes: Sequence[np.ndarray], h: Sequence[np.ndarray]) -> np.ndarray:
+    return np.stack([_derivative(f, axes, i) / h[i] for i in range(3)], axis=-1)
+
+
+def _divergence(v: np.ndarray, axes: Sequence[np.ndarray], h: Sequence[np.ndarray]) -> np.ndarray:
+    jacobian = h[0] * h[1] * h[2]
+    return sum(_derivative(v[..., i] * jacobian / h[i], axes, i) for i in range(3)) / jacobian
+
+
+def _curl(v: np.ndarray, axes: Sequence[np.ndarray], h: Sequence[np.ndarray]) -> np.ndarray:
+    jacobian = h[0] * h[1] * h[2]
+    components = []
+    for i in range(3):
+        j, k = (i + 1) % 3, (i + 2) % 3
+        circulation = (_derivative(h[k] * v[..., k], axes, j) -
+            _derivative(h[j] * v[..., j], axes, k))
+        components.append(h[i] * circulation / jacobian)
+    return np.stack(components, axis=-1)
+
+
+def _laplacian(f: np.ndarray, axes: Sequence[np.ndarray], h: Sequence[np.ndarray]) -> np.ndarray:
+    jacobian = h[0] * h[1] * h[2]
+    flux = (_derivative(jacobian / h[i]**2 * _derivative(f, axes, i), axes, i) for i in range(3))
+    return sum(flux) / jacobian
+
+
+def _finite_differences(operator: Callable[..., np.ndarray], samples: np.ndarray, grid: Grid,
+    output_shape: tuple[int, ...], halo: int, chunk_size: Optional[int]) -> np.ndarray:
+    lame_coefficients = _compile_lame_coefficients(type(grid.system))
+    size = grid.shape[0]
+    result = np.empty(output_shape)
+
+    for chunk in grid.chunks(chunk_size):
+        # neighbouring slices make the differences at the chunk boundaries match the whole grid
+        start, stop = max(chunk.start - halo, 0), min(chunk.stop + halo, size)
+
+        axes = (grid.axes[0][start:stop],) + grid.axes[1:]
+        chunk_shape = (stop - start,) + grid.shape[1:]
+        mesh = np.meshgrid(*axes, indexing="ij", sparse=True)
+        h = [np.broadcast_to(v, chunk_shape) for v in lame_coefficients(*mesh)]
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            values = operator(samples[start:stop], axes, h)
+        result[chunk] = values[chunk.start - start:chunk.stop - start]
+
+    return result
+
+
+def _is_symbolic(field: Any) -> bool:
+    return isinstance(field, Basic)
+
+
+def gradient(field: Any, grid: Grid, *, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Samples the gradient of the scalar ``field`` on the ``grid``. The field is either a
+    `CoordinateScalar` or its samples on the grid.
+
+    Raises:
+        ValueError: If the field does not match the grid.
+    """
+
+    if _is_symbolic(field):
+        _field_expressions(field, grid.system)
+        result = VectorGradient(field, evaluate=True)
+        return _evaluate_result(result, grid, True, chunk_size)
+
+    samples = _samples(field, grid, vector=False)
+    return _finite_differences(_gradient, samples, grid, grid.shape + (3,), 1, chunk_size)
+
+
+def divergence(field: Any, grid: Grid, *, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Samples the divergence of the vector ``field`` on the ``grid``. The field is either a
+    `CoordinateVector` or its samples on the grid.
+
+    Raises:
+        ValueError: If the field does not match the grid.
+    """
+
+    if _is_symbolic(field):
+        _field_expressions(field, grid.system)
+        result = VectorDivergence(field, evaluate=True)
+        return _evaluate_result(result, grid, False, chunk_size)
+
+    samples = _samples(field, grid, vector=True)
+    return _finite_differences(_divergence, samples, grid, grid.shape, 1, chunk_size)
+
+
+def curl(field: Any, grid: Grid, *, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Samples the curl of the vector ``field`` on the ``grid``. The field is either a
+    `CoordinateVector` or its samples on the grid.
+
+    Raises:
+        ValueError: If the field does not match the grid.
+    """
+
+    if _is_symbolic(field):
+        _field_expressions(field, grid.system)
+        result = VectorCurl(field, evaluate=True)
+        return _evaluate_result(result, grid, True, chunk_size)
+
+    samples = _samples(field, grid, vector=True)
+    return _finite_differences(_curl, samples, grid, grid.shape + (3,), 1, chunk_size)
+
+
+def laplacian(field: Any, grid: Grid, *, chunk_size: Optional[int] = None) -> np.ndarray:
+    """
+    Samples the Laplacian of the scalar ``field`` on the ``grid``. The field is either a
+    `CoordinateScalar` or its samples on the grid.
+
+    Raises:
+        ValueError: If the field does not match the grid.
+    """
+
+    if _is_symbolic(field):
+        _field_expressions(field, grid.system)
+        result = VectorLaplacian(field, evaluate=True)
+        return _evaluate_result(result, grid, False, chunk_size)
+
+    samples = _samples(field, grid, vector=False)
+    # the second derivatives at the chunk boundaries need two neighbouring slices
+    return _finite_differences(_laplacian, samples, grid, grid.shape, 2, chunk_size)
+
+
+__all__ = [
+    "Grid",
+    "evaluate_field",
+    "gradient",
+    "divergence",
+    "curl",
+    "laplacian",
+]
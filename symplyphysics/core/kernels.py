@@ -0,0 +1,778 @@
+"""
+This module provides the functionality for compiling laws into vectorized numeric kernels. A kernel
+is the law solved for one of its symbols and converted into a NumPy function of the remaining
+symbols, so that it can be evaluated over arrays of SI magnitudes without any SymPy work.
+
+* `load_law` imports a law module given its dotted path.
+* `law_symbols` lists the symbols of a law module by their variable names.
+* `LawKernel` holds the solved form of a law and its compiled function.
+* `compile_law` returns the kernel of a law solved for a target symbol. Kernels are cached per law
+  and target, so they are compiled only once per process.
+* `compile_law_function` returns the kernel of the law behind a law function.
+* `compile_law_outputs` returns the kernel of a law solved for several targets, e.g. the entries of
+  a matrix law, which computes all of them in one call.
+* `as_law`, `find_target`, `find_inputs`, `applied_symbol`, `order_arguments` and `si_magnitude`
+  are the building blocks of kernels, which are shared with the numeric solvers of laws.
+
+**Notes:**
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import sys
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Mapping, Optional, Sequence, TypeAlias
+
+import numpy as np
+from sympy import (Derivative, Dummy, Eq, Expr, Indexed, Integral, MatrixBase, Symbol as SymSymbol,
+    count_ops, lambdify, solve, together)
+from sympy.core.function import AppliedUndef
+from sympy.physics.units import Dimension, Quantity as SymQuantity
+from sympy.printing.numpy import NumPyPrinter
+from sympy.printing.precedence import precedence
+
+from .convert import evaluate_expression
+from .dimensions import dimension_to_si_unit, dimsys_SI
+from .quantity_decorator import validated_units
+from .symbols.symbols import DimensionSymbol, Function, Symbol
+from .symbols.quantities import Quantity
+
+LawSource: TypeAlias = ModuleType | Eq
+"""Either a law module that defines the ``law`` variable or the law equation itself."""
+
+TargetType: TypeAlias = str | Expr | Function
+"""Either the name of a symbol within the law module or the symbol itself."""
+
+_PACKAGE_NAME = "symplyphysics"
+
+
+def load_law(path: str) -> ModuleType:
+    """
+    Imports the law module located at the dotted ``path``. The ``symplyphysics.`` prefix may be
+    omitted, e.g. ``electromagnetism.circuits.direct_current.current_is_voltage_over_resistance``.
+
+    Raises:
+        ValueError: If the module does not exist or does not define the ``law`` variable.
+    """
+
+    if path != _PACKAGE_NAME and not path.startswith(_PACKAGE_NAME + "."):
+        path = f"{_PACKAGE_NAME}.{path}"
+
+    try:
+        module = importlib.import_module(path)
+    except ImportError as e:
+        raise ValueError(f"Law module '{path}' cannot be imported.") from e
+
+    if not isinstance(getattr(module, "law", None), Eq):
+        raise ValueError(f"Module '{path}' does not define a law.")
+
+    return module
+
+
+def law_symbols(module: ModuleType) -> dict[str, DimensionSymbol]:
+    """
+    Returns the public symbols and functions of the law ``module`` keyed by their variable names,
+    in the order of their definition.
+    """
+
+    result: dict[str, DimensionSymbol] = {}
+    seen: set[Any] = set()
+    for name, value in vars(module).items():
+        if name.startswith("_") or not isinstance(value, (Symbol, Function)):
+            continue
+        if value in seen:
+            continue
+        seen.add(value)
+        result[name] = value
+    return result
+
+
+def as_law(source: LawSource) -> tuple[Eq, dict[str, DimensionSymbol]]:
+    """
+    Returns the law equation of ``source`` and its symbols keyed by their names, which are the
+    module variable names for a law module and the display names for a law equation.
+
+    Raises:
+        TypeError: If ``source`` is neither a law module nor an equation.
+        ValueError: If several symbols of the law equation have the same display name.
+    """
+
+    if isinstance(source, ModuleType):
+        return source.law, law_symbols(source)
+
+    if not isinstance(source, Eq):
+        raise TypeError(f"Expected '{source}' to be a law module or an equation.")
+
+    atoms = sorted(source.free_symbols | {a.func for a in source.atoms(AppliedUndef)}, key=str)
+    names: dict[str, DimensionSymbol] = {}
+    for atom in atoms:
+        if not isinstance(atom, (Symbol, Function)):
+            continue
+        if atom.display_name in names:
+            raise ValueError(f"Law '{source}' has several symbols named '{atom.display_name}', "
+                "use the law module instead.")
+        names[atom.display_name] = atom
+    return source, names
+
+
+def applied_symbol(law: Eq, symbol: DimensionSymbol) -> Expr:
+    """Returns ``symbol`` itself or its application if it is a function."""
+
+    if not isinstance(symbol, Function):
+        return symbol
+
+    applications = [a for a in law.atoms(AppliedUndef) if a.func == symbol]
+    if len(applications) != 1:
+        raise ValueError(f"Function '{symbol}' should be applied exactly once in '{law}'.")
+    return applications[0]
+
+
+def find_target(law: Eq, names: Mapping[str, DimensionSymbol],
+    target: TargetType) -> tuple[str, DimensionSymbol]:
+    """
+    Returns the name and the symbol of ``target`` among ``names``, see `as_law`.
+
+    Raises:
+        ValueError: If ``target`` is not a symbol of ``law``.
+    """
+
+    if isinstance(target, str):
+        if target not in names:
+            raise ValueError(f"Law '{law}' does not have the symbol '{target}'.")
+        return target, names[target]
+
+    if isinstance(target, AppliedUndef):
+        target = target.func
+
+    for name, symbol in names.items():
+        if symbol == target:
+            return name, symbol
+
+    raise ValueError(f"Symbol '{target}' is not a part of the law '{law}'.")
+
+
+def law_solutions(law: Eq, target: Expr) -> list[Expr]:
+    """
+    Solves ``law`` for ``target`` and returns all of its solutions. The law is not solved if it is
+    already written in the explicit form.
+
+    Raises:
+        ValueError: If SymPy cannot solve the law.
+    """
+
+    if law.lhs == target and not law.rhs.has(target):
+        return [law.rhs]
+    if law.rhs == target and not law.lhs.has(target):
+        return [law.lhs]
+
+    try:
+        return [s[target] for s in solve(law, target, dict=True)]
+    except NotImplementedError as e:
+        raise ValueError(f"Law '{law}' cannot be solved for '{target}'.") from e
+
+
+def solve_law(law: Eq, target: Expr, solution: Optional[int] = 0) -> Expr:
+    """
+    Solves ``law`` for ``target`` and returns the ``solution``-th solution, see `law_solutions`.
+    If ``solution`` is `None`, the solution is chosen by `principal_solution`.
+
+    Raises:
+        ValueError: If the law has no solution for ``target``, or if ``solution`` is `None` and the
+            solution cannot be chosen.
+    """
+
+    solutions = law_solutions(law, target)
+    if solution is None:
+        return solutions[principal_solution(law, target, solutions)]
+    if len(solutions) <= solution:
+        raise ValueError(f"Law '{law}' has no solution #{solution} for '{target}'.")
+    return solutions[solution]
+
+
+# Assumptions of the target symbol that rule out solutions
+_SIGN_ASSUMPTIONS = ("positive", "nonnegative", "negative", "nonpositive", "nonzero")
+
+
+def principal_solution(law: Eq, target: Expr, solutions: Sequence[Expr]) -> int:
+    """
+    Returns the index of the solution of ``law`` for ``target`` among ``solutions``, which is not
+    ruled out by the assumptions of ``target``. Of two solutions differing only in sign, the one
+    without the leading minus sign, i.e. the principal root, is chosen, unless ``target`` is
+    assumed to be nonpositive.
+
+    Raises:
+        ValueError: If no solution or several solutions remain.
+    """
+
+    candidates = [
+        i for i, s in enumerate(solutions)
+        if all(getattr(s, f"is_{a}") is not False for a in _SIGN_ASSUMPTIONS
+        if getattr(target, f"is_{a}"))
+    ]
+
+    if len(candidates) == 2:
+        first, second = (solutions[i] for i in candidates)
+        if (first + second).expand() == 0:
+            negative = bool(target.is_nonpositive)
+            candidates = [
+                i for i in candidates if solutions[i].could_extract_minus_sign() == negative
+            ]
+
+    if not candidates:
+        raise ValueError(f"Law '{law}' has no solution for '{target}' allowed by its assumptions.")
+    if len(candidates) > 1:
+        raise ValueError(f"Law '{law}' has {len(candidates)} solutions for '{target}', choose one "
+            "with `solution`.")
+    return candidates[0]
+
+
+def to_numeric_expression(expr: Expr) -> Expr:
+    """
+    Prepares ``expr`` for compilation: replaces quantities with their SI magnitudes and evaluates
+    integrals and derivatives.
+
+    Raises:
+        ValueError: If ``expr`` cannot be represented in a numeric form.
+    """
+
+    expr = evaluate_expression(expr)
+    if expr.has(Integral, Derivative):
+        expr = expr.doit()
+    if expr.has(Integral, Derivative, Indexed) or expr.atoms(SymQuantity):
+        raise ValueError(f"Expression '{expr}' cannot be compiled into a numeric kernel.")
+    return expr
+
+
+class _KernelPrinter(NumPyPrinter):
+    """Prints reciprocals as divisions, which NumPy evaluates faster than negative powers."""
+
+    def _print_Pow(self, expr: Expr, rational: bool = False) -> str:
+        if expr.exp == -1:
+            return f"1/{self.parenthesize(expr.base, precedence(expr))}"
+        return super()._print_Pow(expr, rational)
+
+
+def compile_expression(
+    expr: Expr | Sequence[Expr],
+    arguments: Sequence[Expr],
+    *,
+    cse: bool = False,
+) -> Callable[..., Any]:
+    """
+    Compiles ``expr`` into a NumPy function of the positional ``arguments``. Applied functions are
+    allowed among the ``arguments``. If ``expr`` is a sequence of expressions, the function returns
+    the list of their values.
+    """
+
+    # Symplyphysics symbols print their display names, which are neither unique nor always valid
+    # identifiers, hence plain dummies are used in the generated code
+    dummies = [Dummy(f"x{i}") for i in range(len(arguments))]
+    replacements = dict(zip(arguments, dummies))
+    if isinstance(expr, Expr):
+        expr = expr.xreplace(replacements)
+    else:
+        expr = [e.xreplace(replacements) for e in expr]
+    return lambdify(dummies, expr, modules="numpy", printer=_KernelPrinter, cse=cse)
+
+
+def order_arguments(kernel: str, inputs: Sequence[str], args: Sequence[Any],
+    kwargs: Mapping[str, Any]) -> list[Any]:
+    """
+    Orders the values passed either positionally or by ``inputs`` names to the ``kernel``, which
+    names it in the errors, in the order of ``inputs``.
+
+    Raises:
+        TypeError: If some of the inputs are missing or unknown.
+    """
+
+    if len(args) > len(inputs):
+        raise TypeError(f"{kernel} takes {len(inputs)} inputs, got {len(args)}.")
+
+    values = dict(zip(inputs, args))
+    for name, value in kwargs.items():
+        if name not in inputs:
+            raise TypeError(f"{kernel} has no input '{name}'.")
+        if name in values:
+            raise TypeError(f"{kernel} got multiple values for '{name}'.")
+        values[name] = value
+
+    missing = [n for n in inputs if n not in values]
+    if missing:
+        raise TypeError(f"{kernel} is missing inputs: {', '.join(missing)}.")
+
+    return [values[n] for n in inputs]
+
+
+@dataclass(frozen=True)
+class LawKernel:
+    """
+    Represents a law solved for the ``target`` symbol and compiled into a vectorized function of
+    the ``inputs`` symbols. All values are SI magnitudes.
+    """
+
+    law: Eq
+    """The original law."""
+
+    target: str
+    """Name of the symbol the law is solved for."""
+
+    target_symbol: DimensionSymbol
+    """The symbol the law is solved for."""
+
+    expr: Expr
+    """The solved form of the law with quantities replaced by their SI magnitudes."""
+
+    inputs: tuple[str, ...]
+    """Names of the input symbols, in the order of the positional arguments of `function`."""
+
+    input_symbols: tuple[DimensionSymbol, ...]
+    """Input symbols in the same order as `inputs`."""
+
+    function: Callable[..., Any] = field(repr=False, compare=False)
+    """The compiled NumPy function."""
+
+    @property
+    def output_dimension(self) -> Dimension:
+        return self.target_symbol.dimension
+
+    @property
+    def input_dimensions(self) -> dict[str, Dimension]:
+        return {n: s.dimension for n, s in zip(self.inputs, self.input_symbols)}
+
+    def arguments(self, *args: Any, **kwargs: Any) -> list[Any]:
+        """
+        Orders the values passed either positionally or by input names into the positional
+        argument list of `function`.
+
+        Raises:
+            TypeError: If some of the inputs are missing or unknown.
+        """
+
+        return order_arguments(f"Kernel for '{self.target}'", self.inputs, args, kwargs)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        """
+        Evaluates the kernel over the SI magnitudes of the inputs, which can be given as scalars or
+        arrays that broadcast together.
+        """
+
+        values = [np.asarray(v) for v in self.arguments(*args, **kwargs)]
+        shape = np.broadcast_shapes(*(v.shape for v in values))
+        result = np.asarray(self.function(*values))
+        return np.broadcast_to(result, shape) if result.shape != shape else result
+
+    def evaluate(self, *args: Any, **kwargs: Any) -> Quantity:
+        """
+        Evaluates the kernel at a single point given by quantities and returns the dimensioned
+        result.
+        """
+
+        values = [si_magnitude(v, s) for v, s in zip(self.arguments(*args, **kwargs),
+            self.input_symbols)]
+        result = complex(self.function(*values))
+        value = result.real if result.imag == 0 else result
+        return Quantity(value * dimension_to_si_unit(self.output_dimension))
+
+    def portable_expr(self) -> Expr:
+        """
+        Returns `expr` with the input symbols replaced by plain SymPy symbols named after the
+        inputs. Unlike `expr`, it can be pickled, e.g. to solve the law in another process, and
+        turned back into the kernel with `compile_solved_law`.
+        """
+
+        return self.expr.xreplace({
+            applied_symbol(self.law, s): SymSymbol(n)
+            for n, s in zip(self.inputs, self.input_symbols)
+        })
+
+
+def si_magnitude(value: Any, symbol: DimensionSymbol | Dimension) -> complex | float:
+    """
+    Returns the magnitude of the quantity ``value`` in the SI units of ``symbol``, or ``value``
+    itself if it is not a quantity. The magnitude is real unless it has an imaginary part.
+    """
+
+    if not isinstance(value, SymQuantity):
+        return value
+
+    unit = dimension_to_si_unit(symbol if isinstance(symbol, Dimension) else symbol.dimension)
+    magnitude = complex(Quantity(value / unit).scale_factor)
+    return magnitude.real if magnitude.imag == 0 else magnitude
+
+
+def real_si_magnitude(value: Any, symbol: DimensionSymbol | Dimension) -> float:
+    """
+    Returns the real magnitude of ``value`` in the SI units of ``symbol``, see `si_magnitude`.
+
+    Raises:
+        ValueError: If the magnitude is complex.
+    """
+
+    magnitude = si_magnitude(value, symbol)
+    if isinstance(magnitude, complex):
+        raise ValueError(f"Magnitude of '{value}' should be real, got {magnitude}.")
+    return float(magnitude)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_law(source: LawSource, target: TargetType, solution: Optional[int]) -> LawKernel:
+    law, names = as_law(source)
+    target_name, target_symbol = find_target(law, names, target)
+
+    expr = solve_law(law, applied_symbol(law, target_symbol), solution)
+    return _law_kernel(law, names, target_name, target_symbol, to_numeric_expression(expr))
+
+
+def _law_kernel(law: Eq, names: Mapping[str, DimensionSymbol], target_name: str,
+    target_symbol: DimensionSymbol, expr: Expr) -> LawKernel:
+    inputs, input_symbols = find_inputs(law, names, [expr], [target_symbol])
+
+    function = compile_expression(expr, [applied_symbol(law, s) for s in input_symbols])
+    return LawKernel(law, target_name, target_symbol, expr, inputs, input_symbols, function)
+
+
+def find_inputs(
+    law: Eq,
+    names: Mapping[str, DimensionSymbol],
+    exprs: Sequence[Expr],
+    targets: Sequence[DimensionSymbol],
+) -> tuple[tuple[str, ...], tuple[DimensionSymbol, ...]]:
+    """Returns the names and the symbols ``exprs`` depend on, in the order of ``names``."""
+
+    used: set[Any] = set()
+    for expr in exprs:
+        used |= expr.free_symbols | {a.func for a in expr.atoms(AppliedUndef)}
+    inputs = tuple(n for n, s in names.items() if s in used and s not in targets)
+    input_symbols = tuple(names[n] for n in inputs)
+
+    unknown = used - set(input_symbols) - set(targets)
+    if unknown:
+        raise ValueError(f"Solved form of law '{law}' depends on unnamed symbols: "
+            f"{', '.join(str(u) for u in unknown)}.")
+    return inputs, input_symbols
+
+
+def compile_law(source: LawSource | str,
+    target: TargetType,
+    *,
+    solution: Optional[int] = 0) -> LawKernel:
+    """
+    Returns the kernel of the law ``source`` solved for ``target``. ``source`` can be a law module,
+    its dotted path, or a law equation. ``target`` can be a symbol of the law or the name of the
+    module variable holding it. If the law has several solutions, ``solution`` selects one of
+    them. If ``solution`` is `None`, the solution is chosen by `principal_solution`.
+
+    Kernels are cached, so the law is solved and compiled only once.
+
+    Raises:
+        ValueError: If the law cannot be solved for ``target`` or compiled, or if ``solution`` is
+            `None` and the solution cannot be chosen.
+    """
+
+    if isinstance(source, str):
+        source = load_law(source)
+    return _compile_law(source, target, solution)
+
+
+def compile_solved_law(source: LawSource | str, target: TargetType, expr: Expr) -> LawKernel:
+    """
+    Returns the kernel of the law ``source`` with the solved form ``expr`` for ``target``, which is
+    returned by `LawKernel.portable_expr`. The law is not solved again, so that it can be solved
+    in another process, and the kernel is not cached.
+
+    Raises:
+        ValueError: If ``expr`` depends on symbols that are not in the law.
+    """
+
+    if isinstance(source, str):
+        source = load_law(source)
+    law, names = as_law(source)
+    target_name, target_symbol = find_target(law, names, target)
+    expr = expr.xreplace({SymSymbol(n): applied_symbol(law, s) for n, s in names.items()})
+    return _law_kernel(law, names, target_name, target_symbol, expr)
+
+
+def _function_parameters(func: Callable[..., Any], kernel: LawKernel,
+    inputs: Mapping[str, Any]) -> dict[str, str]:
+    parameters: dict[str, str] = {}
+    for name, symbol in zip(kernel.inputs, kernel.input_symbols):
+        found = [p for p, u in inputs.items() if u is symbol]
+        found = found or [p for p in (name + "_", name) if p in inputs]
+        if not found:
+            raise ValueError(f"Function '{func.__name__}' has no parameter for '{name}'.")
+        parameters[name] = found[0]
+    return parameters
+
+
+# SI magnitudes of the inputs at which law functions are compared with the solutions of their laws.
+# The inputs of a probe take different values, so that e.g. the roots of their difference vanish.
+_PROBE_VALUES = (2.0, 0.5, 3.0, 1.0, 0.25)
+
+
+def _probe_inputs(kernel: LawKernel, probe: int) -> list[float]:
+    return [
+        _PROBE_VALUES[(probe + i) % len(_PROBE_VALUES)] for i in range(len(kernel.inputs))
+    ]
+
+
+def _probe(func: Callable[..., Any], kernel: LawKernel, parameters: Mapping[str, str],
+    values: Sequence[float]) -> Optional[complex]:
+    arguments: dict[str, Any] = {}
+    for name, symbol, value in zip(kernel.inputs, kernel.input_symbols, values):
+        dimension = symbol.dimension
+        arguments[parameters[name]] = (value if dimsys_SI.is_dimensionless(dimension) else
+            Quantity(value * dimension_to_si_unit(dimension)))
+
+    try:
+        result = func(**arguments)
+        return complex(si_magnitude(result, kernel.target_symbol))
+    # law functions reject inputs in many ways, the next probe is tried then
+    except Exception:  # pylint: disable=broad-exception-caught
+        return None
+
+
+def _matching_solution(func: Callable[..., Any], kernels: Sequence[LawKernel],
+    parameters: Mapping[str, str]) -> LawKernel:
+    ambiguous: Optional[LawKernel] = None
+    for probe in range(len(_PROBE_VALUES)):
+        values = _probe_inputs(kernels[0], probe)
+        expected = _probe(func, kernels[0], parameters, values)
+        if expected is None:
+            continue
+
+        matching = []
+        for kernel in kernels:
+            with np.errstate(all="ignore"):
+                actual = complex(np.asarray(kernel.function(*values)))
+            if np.isclose(actual, expected, rtol=1e-6, atol=0):
+                matching.append(kernel)
+
+        if len(matching) == 1:
+            return matching[0]
+        if matching and ambiguous is None:
+            ambiguous = matching[0]
+
+    if ambiguous is not None:
+        # the solutions agree at all probes
+        return ambiguous
+    raise ValueError(f"Cannot tell which solution of its law the function '{func.__name__}' "
+        "computes.")
+
+
+def compile_law_function(func: Callable[..., Any]) -> tuple[LawKernel, dict[str, str]]:
+    """
+    Returns the kernel of the law of the module ``func`` is defined in, solved for the result of
+    the law function ``func``, along with the parameter names of ``func`` keyed by the kernel
+    inputs. Parameters are related to the law symbols they are validated against, see
+    `symplyphysics.core.quantity_decorator.validated_units`, or by their names for parameters
+    validated against dimensions.
+
+    If the law has several solutions, the one computed by ``func`` is found by comparing them with
+    ``func`` at probe values of the inputs.
+
+    Raises:
+        ValueError: If ``func`` cannot be related to the law.
+    """
+
+    inputs, output = validated_units(func)
+    module = sys.modules.get(func.__module__)
+    if module is None or output is None or not isinstance(output, (Symbol, Function)):
+        raise ValueError(f"Function '{func.__name__}' should validate its result against a law "
+            "symbol.")
+
+    kernel = compile_law(module, output)
+    parameters = _function_parameters(func, kernel, inputs)
+
+    count = len(law_solutions(kernel.law, applied_symbol(kernel.law, output)))
+    if count > 1:
+        kernels = [compile_law(module, output, solution=i) for i in range(count)]
+        kernel = _matching_solution(func, kernels, parameters)
+        parameters = _function_parameters(func, kernel, inputs)
+
+    return kernel, parameters
+
+
+def solve_law_outputs(law: Eq,
+    targets: Sequence[Expr],
+    solution: Optional[int] = 0) -> list[Expr]:
+    """
+    Solves ``law`` for all of the ``targets`` at once and returns the ``solution``-th solution as
+    the list of their values. Matrix laws are not solved if their left-hand side consists of the
+    ``targets``. If ``solution`` is `None`, the solution for a single target is chosen by
+    `principal_solution`, and the solution for several targets should be unique.
+
+    Raises:
+        ValueError: If the law has no solution for ``targets``, or if ``solution`` is `None` and
+            the solution cannot be chosen.
+    """
+
+    if isinstance(law.lhs, MatrixBase) and isinstance(law.rhs, MatrixBase):
+        explicit = dict(zip(law.lhs, law.rhs))
+        if all(t in explicit for t in targets) and not any(law.rhs.has(t) for t in targets):
+            return [explicit[t] for t in targets]
+    elif len(targets) == 1:
+        return [solve_law(law, targets[0], solution)]
+
+    solutions = solve(law, list(targets), dict=True)
+    if solution is None:
+        if len(solutions) > 1:
+            raise ValueError(f"Law '{law}' has {len(solutions)} solutions for "
+                f"{', '.join(str(t) for t in targets)}, choose one with `solution`.")
+        solution = 0
+    if len(solutions) <= solution or any(t not in solutions[solution] for t in targets):
+        raise ValueError(f"Law '{law}' has no solution #{solution} for "
+            f"{', '.join(str(t) for t in targets)}.")
+    return [solutions[solution][t] for t in targets]
+
+
+@dataclass(frozen=True)
+class MultiLawKernel:
+    """
+    Represents a law solved for several ``targets`` at once and compiled into a single vectorized
+    function of the ``inputs`` symbols returning all targets. The subexpressions shared by the
+    targets are computed only once. All values are SI magnitudes.
+    """
+
+    law: Eq
+    """The original law."""
+
+    targets: tuple[str, ...]
+    """Names of the symbols the law is solved for, in the order of the outputs of `function`."""
+
+    target_symbols: tuple[DimensionSymbol, ...]
+    """The symbols the law is solved for in the same order as `targets`."""
+
+    exprs: tuple[Expr, ...]
+    """The solved forms of the law for each of the `targets`."""
+
+    inputs: tuple[str, ...]
+    """Names of the input symbols, in the order of the positional arguments of `function`."""
+
+    input_symbols: tuple[DimensionSymbol, ...]
+    """Input symbols in the same order as `inputs`."""
+
+    function: Callable[..., Any] = field(repr=False, compare=False)
+    """The compiled NumPy function returning the list of the outputs."""
+
+    @property
+    def output_dimensions(self) -> dict[str, Dimension]:
+        return {n: s.dimension for n, s in zip(self.targets, self.target_symbols)}
+
+    @property
+    def input_dimensions(self) -> dict[str, Dimension]:
+        return {n: s.dimension for n, s in zip(self.inputs, self.input_symbols)}
+
+    def arguments(self, *args: Any, **kwargs: Any) -> list[Any]:
+        """See `LawKernel.arguments`."""
+
+        return order_arguments(f"Kernel for '{', '.join(self.targets)}'", self.inputs, args,
+            kwargs)
+
+    def __call__(self, *args: Any, **kwargs: Any) -> tuple[np.ndarray, ...]:
+        """
+        Evaluates all outputs over the SI magnitudes of the inputs, which can be given as scalars
+        or arrays that broadcast together. Returns the outputs in the order of `targets`.
+        """
+
+        values = [np.asarray(v) for v in self.arguments(*args, **kwargs)]
+        shape = np.broadcast_shapes(*(v.shape for v in values))
+        results = [np.asarray(r) for r in self.function(*values)]
+        return tuple(np.broadcast_to(r, shape) if r.shape != shape else r for r in results)
+
+    def evaluate(self, *args: Any, **kwargs: Any) -> tuple[Quantity, ...]:
+        """
+        Evaluates all outputs at a single point given by quantities and returns the dimensioned
+        results in the order of `targets`.
+        """
+
+        values = [si_magnitude(v, s) for v, s in zip(self.arguments(*args, **kwargs),
+            self.input_symbols)]
+        outputs = []
+        for result, symbol in zip(self.function(*values), self.target_symbols):
+            result = complex(result)
+            value = result.real if result.imag == 0 else result
+            outputs.append(Quantity(value * dimension_to_si_unit(symbol.dimension)))
+        return tuple(outputs)
+
+
+def _default_targets(law: Eq) -> tuple[Expr, ...]:
+    if not isinstance(law.lhs, MatrixBase):
+        raise ValueError(f"Targets of law '{law}' should be given explicitly.")
+    return tuple(law.lhs)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_law_outputs(source: LawSource, targets: Optional[tuple[TargetType, ...]],
+    solution: Optional[int]) -> MultiLawKernel:
+    law, names = as_law(source)
+    found = [find_target(law, names, t) for t in targets or _default_targets(law)]
+    target_names = tuple(n for n, _ in found)
+    target_symbols = tuple(s for _, s in found)
+
+    exprs = solve_law_outputs(law, [applied_symbol(law, s) for s in target_symbols], solution)
+    # sums of fractions are cheaper to evaluate over a common denominator
+    exprs = [min((e, together(e)), key=count_ops) for e in map(to_numeric_expression, exprs)]
+    inputs, input_symbols = find_inputs(law, names, exprs, target_symbols)
+
+    function = compile_expression(exprs, [applied_symbol(law, s) for s in input_symbols], cse=True)
+    return MultiLawKernel(law, target_names, target_symbols, tuple(exprs), inputs, input_symbols,
+        function)
+
+
+def compile_law_outputs(source: LawSource | str,
+    targets: Optional[Sequence[TargetType]] = None,
+    *,
+    solution: Optional[int] = 0) -> MultiLawKernel:
+    """
+    Returns the kernel of the law ``source`` solved for all of the ``targets`` at once. ``targets``
+    default to the entries of the left-hand side of a matrix law. Common subexpressions are
+    eliminated across all targets, so the shared terms are computed once per call. ``solution``
+    selects the solution as in `solve_law_outputs`.
+
+    Raises:
+        ValueError: If the law cannot be solved for ``targets`` or compiled.
+    """
+
+    if isinstance(source, str):
+        source = load_law(source)
+    return _compile_law_outputs(source, tuple(targets) if targets is not None else None, solution)
+
+
+def clear_kernel_cache() -> None:
+    """Drops all compiled kernels."""
+
+    _compile_law.cache_clear()
+    _compile_law_outputs.cache_clear()
+
+
+__all__ = [
+    "LawSource",
+    "TargetType",
+    "load_law",
+    "law_symbols",
+    "as_law",
+    "applied_symbol",
+    "find_target",
+    "find_inputs",
+    "order_arguments",
+    "si_magnitude",
+    "real_si_magnitude",
+    "law_solutions",
+    "solve_law",
+    "principal_solution",
+    "to_numeric_expression",
+    "compile_expression",
+    "LawKernel",
+    "compile_law",
+    "compile_law_function",
+    "compile_solved_law",
+    "solve_law_outputs",
+    "MultiLawKernel",
+    "compile_law_outputs",
+    "clear_kernel_cache",
+]
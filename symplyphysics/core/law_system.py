@@ -0,0 +1,294 @@
+"""
+This module solves systems of several laws numerically, instead of stacking their equations into a
+single symbolic `sympy.solve`, which blows up combinatorially as systems grow. The residuals
+``lhs - rhs`` of the laws and their Jacobian with respect to the unknowns are compiled once into a
+vectorized kernel (see `symplyphysics.core.kernels`) and the system is solved with the
+Levenberg-Marquardt method, which becomes the Newton method near the solution.
+
+* `LawSystem` holds the laws along with the identifications of their symbols and solves the system
+  for batches of known values.
+
+Example::
+
+    system = LawSystem([ohm_law, power_law])
+    solution = system.solve(power=Quantity(4 * units.watt), resistance=Quantity(1 * units.ohm))
+    # {'current': 2*A, 'voltage': 2*V}
+
+**Notes:**
+
+#. Variables of the system are named after the law symbols, i.e. after the module variables
+   holding them, or their display names for law equations. Symbols that have the same name but
+   are different are prefixed with the name of their law module, or ``law<index>`` for law
+   equations, e.g. ``"power_via_voltage_and_current.voltage"``. The same symbol shared by several
+   laws is a single variable.
+
+#. Only laws between symbols are supported, i.e. laws with functions are not.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from types import ModuleType
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
+
+import numpy as np
+from sympy import Eq, diff
+from sympy.core.function import AppliedUndef
+from sympy.physics.units import Quantity as SymQuantity
+
+from .dimensions import dimension_to_si_unit, dimsys_SI
+from .errors import UnitsError
+from .kernels import (LawSource, as_law, compile_expression, load_law, si_magnitude,
+    to_numeric_expression)
+from .symbols.quantities import Quantity
+from .symbols.symbols import DimensionSymbol
+
+_TOLERANCE = 1e-12
+_MAX_ITERATIONS = 200
+_INITIAL_DAMPING = 1e-3
+_MAX_DAMPING = 1e16
+
+
+@dataclass(frozen=True)
+class _SystemKernel:
+    """Residuals and their Jacobian with respect to ``unknowns``, compiled for ``knowns``."""
+
+    unknowns: tuple[str, ...]
+
+    knowns: tuple[str, ...]
+
+    function: Callable[..., Any] = field(repr=False)
+
+    def evaluate(self, x: np.ndarray, values: Sequence[np.ndarray],
+        equations: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the residuals of shape ``(..., equations)`` and the Jacobian of shape
+        ``(..., equations, unknowns)`` at the points ``x`` of shape ``(..., unknowns)``.
+        """
+
+        shape = x.shape[:-1]
+        with np.errstate(all="ignore"):
+            results = self.function(*np.moveaxis(x, -1, 0), *values)
+            results = [np.broadcast_to(np.real_if_close(r), shape).astype(float) for r in results]
+        residuals = np.stack(results[:equations], axis=-1)
+        jacobian = np.stack(results[equations:], axis=-1).reshape(shape +
+            (equations, len(self.unknowns)))
+        return residuals, jacobian
+
+
+class LawSystem:
+    """
+    System of ``laws``, which are law modules, their dotted paths, or law equations. Each of the
+    ``identify`` groups holds law symbols that represent the same variable.
+
+    Raises:
+        ValueError: If a law has functions.
+        UnitsError: If identified symbols have different dimensions.
+    """
+
+    def __init__(self,
+        laws: Iterable[LawSource | str],
+        identify: Iterable[Sequence[DimensionSymbol]] = ()) -> None:
+        sources = [load_law(s) if isinstance(s, str) else s for s in laws]
+
+        representatives: dict[DimensionSymbol, DimensionSymbol] = {}
+        for group in identify:
+            first, *rest = group
+            first = representatives.get(first, first)
+            for symbol in rest:
+                if not dimsys_SI.equivalent_dims(first.dimension, symbol.dimension):
+                    raise UnitsError(f"Cannot identify '{symbol}' with '{first}' of a different "
+                        "dimension.")
+                representatives[symbol] = first
+
+        self._variables: dict[str, DimensionSymbol] = {}
+        named: set[DimensionSymbol] = set()
+        equations: list[Eq] = []
+        for index, source in enumerate(sources):
+            law, names = as_law(source)
+            if law.atoms(AppliedUndef):
+                raise ValueError(f"Law '{law}' has functions, which are not supported.")
+            equations.append(law.xreplace(representatives))
+
+            prefix = (source.__name__.rsplit(".", 1)[-1]
+                if isinstance(source, ModuleType) else f"law{index}")
+            for name, symbol in names.items():
+                symbol = representatives.get(symbol, symbol)
+                if symbol in named:
+                    continue
+                named.add(symbol)
+                name = name if name not in self._variables else f"{prefix}.{name}"
+                self._variables[name] = symbol
+
+        self._equations = tuple(equations)
+        self._residuals = tuple(to_numeric_expression(e.lhs - e.rhs) for e in equations)
+        self._kernels: dict[tuple[tuple[str, ...], tuple[str, ...]], _SystemKernel] = {}
+
+    @property
+    def equations(self) -> tuple[Eq, ...]:
+        """Laws of the system with the identified symbols replaced."""
+
+        return self._equations
+
+    @property
+    def variables(self) -> dict[str, DimensionSymbol]:
+        """Symbols of the system keyed by their names."""
+
+        return dict(self._variables)
+
+    def _kernel(self, unknowns: tuple[str, ...], knowns: tuple[str, ...]) -> _SystemKernel:
+        key = (unknowns, knowns)
+        if key not in self._kernels:
+            unknown_symbols = [self._variables[n] for n in unknowns]
+            jacobian = [diff(r, s) for r in self._residuals for s in unknown_symbols]
+            function = compile_expression([*self._residuals, *jacobian],
+                [*unknown_symbols, *(self._variables[n] for n in knowns)],
+                cse=True)
+            self._kernels[key] = _SystemKernel(unknowns, knowns, function)
+        return self._kernels[key]
+
+    def _solve_batch(self, kernel: _SystemKernel, x: np.ndarray,
+        values: Sequence[np.ndarray]) -> np.ndarray:
+        """Runs Levenberg-Marquardt iterations from ``x`` for all points of the batch at once."""
+
+        equations = len(self._residuals)
+        residuals, jacobian = kernel.evaluate(x, values, equations)
+        damping = np.full(x.shape[:-1], _INITIAL_DAMPING)
+        converged = np.all(residuals == 0, axis=-1)
+
+        for _ in range(_MAX_ITERATIONS):
+            # laws are weighted by the inverse of their sensitivity to relative changes of the
+            # unknowns, so that laws of different units are balanced in the cost
+            magnitude = np.maximum(np.abs(x), np.finfo(float).tiny)[..., np.newaxis, :]
+            weights = np.linalg.norm(jacobian * magnitude, axis=-1)
+            weights = np.where(weights > 0, 1 / weights, 1)
+            cost = np.sum((weights * residuals)**2, axis=-1)
+
+            active = ~converged & np.isfinite(cost) & (damping < _MAX_DAMPING)
+            if not np.any(active):
+                break
+
+            weighted = jacobian * weights[..., np.newaxis]
+            normal = np.swapaxes(weighted, -1, -2) @ weighted
+            gradient = np.swapaxes(weighted, -1, -2) @ (weights * residuals)[..., np.newaxis]
+            # Marquardt scaling keeps the damping independent of the units of the unknowns
+            scale = np.diagonal(normal, axis1=-2, axis2=-1).copy()
+            scale[scale == 0] = 1
+            damped = normal + (damping[..., np.newaxis, np.newaxis] *
+                np.eye(x.shape[-1]) * scale[..., np.newaxis, :])
+            damped[~active] = np.eye(x.shape[-1])
+            gradient = np.where(active[..., np.newaxis, np.newaxis], gradient, 0)
+            with np.errstate(all="ignore"):
+                try:
+                    step = -np.linalg.solve(damped, gradient)[..., 0]
+                except np.linalg.LinAlgError:
+                    step = -(np.linalg.pinv(damped) @ gradient)[..., 0]
+
+            candidate = x + step
+            new_residuals, new_jacobian = kernel.evaluate(candidate, values, equations)
+            new_cost = np.sum((weights * new_residuals)**2, axis=-1)
+            accepted = active & np.isfinite(new_cost) & (new_cost <= cost)
+
+            # only undamped, i.e. Gauss-Newton, steps are small because of convergence
+            small = np.all(np.abs(step) <= _TOLERANCE * np.abs(candidate) + np.finfo(float).tiny,
+                axis=-1) & (damping <= _INITIAL_DAMPING)
+            converged |= accepted & (small | np.all(new_residuals == 0, axis=-1))
+
+            x = np.where(accepted[..., np.newaxis], candidate, x)
+            residuals = np.where(accepted[..., np.newaxis], new_residuals, residuals)
+            jacobian = np.where(accepted[..., np.newaxis, np.newaxis], new_jacobian, jacobian)
+            damping = np.where(accepted, damping / 10, damping * 10)
+
+        return np.where(converged[..., np.newaxis], x, np.nan)
+
+    def solve(self,
+        unknowns: Optional[Sequence[str]] = None,
+        *,
+        guess: Optional[Mapping[str, Any]] = None,
+        warm_start: bool = False,
+        **known: Any) -> dict[str, Any]:
+        """
+        Solves the system for the ``unknowns`` given the ``known`` values of the other variables,
+        either as quantities or as SI magnitudes, possibly arrays that broadcast together.
+
+        Args:
+            unknowns: Names of the unknown variables, default to all variables that are not known.
+            guess: Starting values of the unknowns, default to 1 in SI units.
+            warm_start: If `True`, the points of the batch are solved one after another in the
+                flattened order, each starting from the solution of the previous one. This suits
+                sweeps over a parameter, in which neighbouring solutions are close.
+            known: Values of the known variables.
+
+        Returns:
+            Values of the unknowns keyed by their names. The values are quantities if ``known``
+            values are scalars and some of them are quantities, otherwise arrays of SI magnitudes,
+            NaN where the iterations do not converge.
+
+        Raises:
+            ValueError: If variables are unknown, or there are more unknowns than laws.
+        """
+
+        names = set(self._variables)
+        missing = set(known) - names
+        if missing:
+            raise ValueError(f"System has no variables {sorted(missing)}.")
+        if unknowns is None:
+            unknowns = [n for n in self._variables if n not in known]
+        missing = (set(unknowns) | set(guess or {})) - names
+        if missing:
+            raise ValueError(f"System has no variables {sorted(missing)}.")
+        if len(unknowns) > len(self._residuals):
+            raise ValueError(f"System of {len(self._residuals)} laws cannot be solved for "
+                f"{len(unknowns)} unknowns.")
+        rest = names - set(unknowns) - set(known)
+        if rest:
+            raise ValueError(f"Values of {sorted(rest)} should be known.")
+
+        knowns = tuple(n for n in self._variables if n in known)
+        kernel = self._kernel(tuple(unknowns), knowns)
+        values = [np.asarray(si_magnitude(known[n], self._variables[n]), dtype=float)
+            for n in knowns]
+        shape = np.broadcast_shapes(*(v.shape for v in values))
+
+        guess = guess or {}
+        start = np.stack([
+            np.broadcast_to(
+            np.asarray(si_magnitude(guess.get(n, 1.0), self._variables[n]), dtype=float), shape)
+            for n in unknowns
+        ],
+            axis=-1)
+
+        if warm_start:
+            flat_values = [np.broadcast_to(v, shape).reshape(-1) for v in values]
+            flat_start = start.reshape(-1, len(unknowns))
+            result = np.empty_like(flat_start)
+            previous: Optional[np.ndarray] = None
+            for i, point in enumerate(flat_start):
+                x = point if previous is None else previous
+                solved = self._solve_batch(kernel, x, [v[i] for v in flat_values])
+                if not np.all(np.isfinite(solved)) and previous is not None:
+                    solved = self._solve_batch(kernel, point, [v[i] for v in flat_values])
+                result[i] = solved
+                previous = solved if np.all(np.isfinite(solved)) else previous
+            result = result.reshape(shape + (len(unknowns),))
+        else:
+            result = self._solve_batch(kernel, start, values)
+
+        as_quantity = (any(isinstance(v, SymQuantity) for v in known.values()) and
+            all(np.ndim(v) == 0 for v in known.values()))
+        solution: dict[str, Any] = {}
+        for i, name in enumerate(unknowns):
+            value = result[..., i]
+            if not as_quantity:
+                solution[name] = value
+                continue
+            if not np.isfinite(value):
+                raise ValueError(f"Cannot solve the system for '{name}'.")
+            unit = dimension_to_si_unit(self._variables[name].dimension)
+            solution[name] = Quantity(float(value) * unit)
+        return solution
+
+
+__all__ = ["LawSystem"]
@@ -0,0 +1,193 @@
+"""
+This module provides opt-in memoization of the results of law functions. When a result cache is
+enabled, functions decorated with `validate_input` look up their results in it before any
+validation or SymPy work is done.
+
+Calls are keyed on the law function and the values of its arguments, i.e. on the scale factors
+and dimensions of quantities, so equal quantities created separately hit the same entry. Calls
+with unhashable arguments are never cached.
+
+* `ResultCache` stores results with LRU eviction, an optional time-to-live and a size limit.
+* `CacheStats` is a snapshot of the cache statistics, including the hit rate.
+* `enable_result_cache` and `disable_result_cache` switch memoization on and off globally.
+* `memoize_results` is a context manager enabling memoization within its scope.
+
+Example::
+
+    with memoize_results(ResultCache(maxsize=10000, ttl=60)) as cache:
+        ...
+    print(cache.stats().hit_rate)
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Callable, Hashable, Iterator, Optional
+
+from .symbols.quantities import quantity_key
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Snapshot of the `ResultCache` statistics."""
+
+    hits: int
+    """Number of calls served from the cache."""
+
+    misses: int
+    """Number of calls that had to be computed."""
+
+    evictions: int
+    """Number of entries evicted due to the size limit."""
+
+    expirations: int
+    """Number of entries dropped due to the time-to-live."""
+
+    size: int
+    """Current number of entries."""
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+_MISSING = object()
+
+
+class ResultCache:
+    """
+    Thread-safe store of law function results. Holds at most ``maxsize`` entries, evicting the
+    least recently used ones. If ``ttl`` is set, entries expire after ``ttl`` seconds.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: Optional[float] = None) -> None:
+        if maxsize <= 0:
+            raise ValueError(f"Cache size should be positive, got {maxsize}.")
+        if ttl is not None and ttl <= 0:
+            raise ValueError(f"Cache time-to-live should be positive, got {ttl}.")
+
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def make_key(func: Callable[..., Any], args: tuple[Any, ...],
+        kwargs: dict[str, Any]) -> Optional[Hashable]:
+        """Returns the key of the call, or `None` if the arguments cannot be hashed."""
+
+        try:
+            return (func, quantity_key(args), quantity_key(tuple(sorted(kwargs.items()))))
+        except TypeError:
+            return None
+
+    def _get(self, key: Hashable) -> Any:
+        """Returns the cached result or `_MISSING`. Updates the statistics."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires >= time.monotonic():
+                    self._entries.move_to_end(key)
+                    self._hits += 1
+                    return value
+                del self._entries[key]
+                self._expirations += 1
+            self._misses += 1
+            return _MISSING
+
+    def _put(self, key: Hashable, value: Any) -> None:
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def call(self, func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any],
+        compute: Callable[[], Any]) -> Any:
+        """Returns the cached result of the call or stores the result of ``compute``."""
+
+        key = self.make_key(func, args, kwargs)
+        if key is None:
+            return compute()
+
+        value = self._get(key)
+        if value is _MISSING:
+            value = compute()
+            self._put(key, value)
+        return value
+
+    def clear(self) -> None:
+        """Drops all entries and resets the statistics."""
+
+        with self._lock:
+            self._entries.clear()
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(self._hits, self._misses, self._evictions, self._expirations,
+                len(self._entries))
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_result_cache: Optional[ResultCache] = None
+
+
+def active_result_cache() -> Optional[ResultCache]:
+    """Returns the enabled result cache, or `None` if memoization is disabled."""
+
+    return _result_cache
+
+
+def enable_result_cache(cache: Optional[ResultCache] = None) -> ResultCache:
+    """Enables memoization of law function results in ``cache`` or in a new default cache."""
+
+    #pylint: disable-next=global-statement
+    global _result_cache
+    _result_cache = cache if cache is not None else ResultCache()
+    return _result_cache
+
+
+def disable_result_cache() -> None:
+    #pylint: disable-next=global-statement
+    global _result_cache
+    _result_cache = None
+
+
+@contextmanager
+def memoize_results(cache: Optional[ResultCache] = None) -> Iterator[ResultCache]:
+    """Enables memoization within the scope, restoring the previous state on exit."""
+
+    previous = _result_cache
+    try:
+        yield enable_result_cache(cache)
+    finally:
+        if previous is None:
+            disable_result_cache()
+        else:
+            enable_result_cache(previous)
+
+
+__all__ = [
+    "CacheStats",
+    "ResultCache",
+    "active_result_cache",
+    "enable_result_cache",
+    "disable_result_cache",
+    "memoize_results",
+]
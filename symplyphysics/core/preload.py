@@ -0,0 +1,245 @@
+"""
+This module provides the background preloading of law packages, so that workers can start serving
+requests while the rest of the laws are still being imported and compiled.
+
+* `preload` starts importing the given packages in a background thread and, optionally, compiling
+  the kernels of their laws (see `symplyphysics.core.kernels`).
+* `PreloadHandle` reports the readiness of the preloaded modules, the overall progress and the
+  per-module timing.
+
+Example::
+
+    handle = preload(["electromagnetism.circuits", "thermodynamics"], compile=True)
+    ...
+    handle.wait(timeout=30)
+    print(handle.progress, handle.slowest(5))
+
+**Notes:**
+
+#. Modules are loaded in a thread rather than in a process, because the imported modules and the
+   compiled kernels are only useful within the current process. Modules that are being loaded in
+   the background can still be imported from other threads, the import machinery makes them wait
+   until the module is ready.
+
+#. Compiling kernels requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import importlib.util
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType
+from typing import Iterable, Optional
+
+_PACKAGE_NAME = "symplyphysics"
+
+
+@dataclass
+class ModuleTiming:
+    """Timing of a preloaded module."""
+
+    import_time: float = 0.0
+    """Time in seconds spent importing the module."""
+
+    compile_time: float = 0.0
+    """Time in seconds spent compiling the kernels of the module's law."""
+
+    compiled: list[str] = field(default_factory=list)
+    """Names of the symbols the law has been compiled for."""
+
+    @property
+    def total_time(self) -> float:
+        return self.import_time + self.compile_time
+
+
+class PreloadHandle:
+    """Readiness handle of the modules being preloaded in the background."""
+
+    def __init__(self, modules: list[str]) -> None:
+        self.modules = modules
+        self.timings: dict[str, ModuleTiming] = {}
+        self.errors: dict[str, BaseException] = {}
+        self._ready: set[str] = set()
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self._cancelled = threading.Event()
+
+    @property
+    def total(self) -> int:
+        return len(self.modules)
+
+    @property
+    def completed(self) -> int:
+        """Number of modules that are loaded or failed to load."""
+
+        with self._lock:
+            return len(self._ready) + len(self.errors)
+
+    @property
+    def progress(self) -> float:
+        """Fraction of the processed modules, from ``0`` to ``1``."""
+
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def is_ready(self, module: str) -> bool:
+        """Checks if ``module`` has been loaded. The ``symplyphysics.`` prefix may be omitted."""
+
+        with self._lock:
+            return _full_name(module) in self._ready
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Waits for the preloading to finish. Returns `False` on timeout."""
+
+        return self._done.wait(timeout)
+
+    def cancel(self) -> None:
+        """Stops the preloading after the module that is currently being loaded."""
+
+        self._cancelled.set()
+
+    def slowest(self, count: int = 10) -> list[tuple[str, ModuleTiming]]:
+        """Returns the ``count`` slowest modules loaded so far."""
+
+        with self._lock:
+            items = list(self.timings.items())
+        items.sort(key=lambda item: item[1].total_time, reverse=True)
+        return items[:count]
+
+    def start(self, compile_laws: bool = False, all_targets: bool = False) -> None:
+        """Starts loading the modules in a daemon thread, see `run`."""
+
+        threading.Thread(target=self.run,
+            args=(compile_laws, all_targets),
+            name="symplyphysics-preload",
+            daemon=True).start()
+
+    def run(self, compile_laws: bool = False, all_targets: bool = False) -> None:
+        """
+        Loads the modules in the current thread. If ``compile_laws`` is `True`, the laws are
+        compiled for their left-hand side symbols, or for all of their symbols if ``all_targets``
+        is `True`.
+        """
+
+        try:
+            kernels = importlib.import_module(".kernels", __package__) if compile_laws else None
+            for name in self.modules:
+                if self._cancelled.is_set():
+                    break
+                timing = ModuleTiming()
+                try:
+                    start = time.perf_counter()
+                    module = importlib.import_module(name)
+                    timing.import_time = time.perf_counter() - start
+                    if kernels is not None:
+                        start = time.perf_counter()
+                        timing.compiled = _compile_module(kernels, module, all_targets)
+                        timing.compile_time = time.perf_counter() - start
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    with self._lock:
+                        self.errors[name] = e
+                    continue
+                with self._lock:
+                    self.timings[name] = timing
+                    self._ready.add(name)
+        finally:
+            self._done.set()
+
+    def __repr__(self) -> str:
+        return f"PreloadHandle({self.completed}/{self.total} modules, done={self.done})"
+
+
+def _full_name(name: str) -> str:
+    if name == _PACKAGE_NAME or name.startswith(_PACKAGE_NAME + "."):
+        return name
+    return f"{_PACKAGE_NAME}.{name}"
+
+
+def _discover(name: str) -> list[str]:
+    """Lists ``name`` and all of its submodules in the import order, without importing them."""
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ValueError(f"Module '{name}' does not exist.")
+    if spec.submodule_search_locations is None:
+        return [name]
+
+    modules: list[str] = []
+    for location in spec.submodule_search_locations:
+        root = Path(location)
+        packages = sorted(p.parent for p in root.rglob("__init__.py"))
+        for package in packages:
+            if any(part.startswith(("_", ".")) for part in package.relative_to(root).parts):
+                continue
+            package_name = ".".join([name, *package.relative_to(root).parts])
+            modules.append(package_name)
+            modules.extend(f"{package_name}.{p.stem}" for p in sorted(package.glob("*.py"))
+                if not p.stem.startswith("_"))
+    return modules
+
+
+def _compile_module(kernels: ModuleType, module: ModuleType, all_targets: bool) -> list[str]:
+    law = getattr(module, "law", None)
+    if law is None or not hasattr(law, "lhs"):
+        return []
+
+    compiled: list[str] = []
+    for name, symbol in kernels.law_symbols(module).items():
+        if not all_targets and not (law.lhs == symbol or getattr(law.lhs, "func", None) == symbol):
+            continue
+        try:
+            # the principal solutions are the ones evaluated by the planner, the server etc
+            kernels.compile_law(module, name, solution=None)
+        except (ValueError, TypeError, NotImplementedError):
+            # laws with derivatives, sums etc cannot be compiled
+            continue
+        compiled.append(name)
+    return compiled
+
+
+def preload(
+    packages: Iterable[str],
+    *,
+    compile: bool = False,  # pylint: disable=redefined-builtin
+    all_targets: bool = False,
+    background: bool = True,
+) -> PreloadHandle:
+    """
+    Imports ``packages`` (dotted paths, the ``symplyphysics.`` prefix may be omitted) and all of
+    their submodules. If ``compile`` is `True`, the principal solutions of the laws (see
+    `symplyphysics.core.kernels.principal_solution`) are compiled for their left-hand side symbols,
+    or for all of their symbols if ``all_targets`` is `True`.
+
+    The work is done in a daemon thread unless ``background`` is `False`. Returns the handle
+    reporting the progress.
+
+    Raises:
+        ValueError: If any of ``packages`` does not exist.
+    """
+
+    modules: list[str] = []
+    for package in packages:
+        for module in _discover(_full_name(package)):
+            if module not in modules:
+                modules.append(module)
+
+    handle = PreloadHandle(modules)
+    if background:
+        handle.start(compile, all_targets)
+    else:
+        handle.run(compile, all_targets)
+    return handle
+
+
+__all__ = [
+    "ModuleTiming",
+    "PreloadHandle",
+    "preload",
+]
@@ -1,11 +1,13 @@
 import functools
 import inspect
-from typing import Any, Callable, Sequence, TypeAlias, SupportsFloat
+from typing import Any, Callable, Optional, Sequence, TypeAlias, SupportsFloat
 from sympy.physics.units import Quantity as SymQuantity, Dimension
 
 from .symbols.symbols import DimensionSymbol, Function, Symbol, IndexedSymbol
 from .operations.symbolic import Symbolic
 from .dimensions import assert_equivalent_dimension
+from .budget import active_latency_budget
+from .memo import active_result_cache
 
 _ValueType: TypeAlias = SupportsFloat | DimensionSymbol | Symbolic
 
@@ -49,19 +51,38 @@ def _assert_expected_unit(
         assert_equivalent_dimension(c, param_name_indexed, function_name, expected_dimension)
 
 
+# Decorated functions keep the expected units in these attributes, so that law functions can be
+# related to the symbols of the law, see `validated_units`.
+VALIDATED_INPUTS_ATTRIBUTE = "validated_inputs"
+VALIDATED_OUTPUT_ATTRIBUTE = "validated_output"
+
+
+def validated_units(func: Callable[..., Any]) -> tuple[dict[str, Any], Optional[Any]]:
+    """
+    Returns the expected units of the parameters and of the return value of ``func`` decorated
+    with `validate_input` and `validate_output`. The return unit is `None` if it is not validated.
+    """
+
+    inputs = getattr(func, VALIDATED_INPUTS_ATTRIBUTE, {})
+    output = getattr(func, VALIDATED_OUTPUT_ATTRIBUTE, None)
+    return dict(inputs), output
+
+
 # Validates the input quantities. Input parameters should be sympy.physics.units.Quantity, list of Quantity or
 # Vector of Quantity type.
 # Unit should be should be Symbol with dimension property, or Dimension.
+# If memoization is enabled (see `symplyphysics.core.memo`), results of repeated calls are returned from
+# the cache without validation and computation. If a latency budget is active (see
+# `symplyphysics.core.budget`), the symbolic work of the call is capped.
 # Example:
 # @validate_input(param1_=units.length, param2_=(1 / units.length))
 # @validate_input(param1_=body_mass, param2_=body_volume)
 def validate_input(**decorator_kwargs: Any) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
 
     def validate_func(func: Callable[..., Any]) -> Callable[..., Any]:
+        wrapped_signature = inspect.signature(func)
 
-        @functools.wraps(func)
-        def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
-            wrapped_signature = inspect.signature(func)
+        def validate_and_call(*args: Any, **kwargs: Any) -> Any:
             bound_args = wrapped_signature.bind(*args, **kwargs)
             for param in wrapped_signature.parameters.values():
                 if param.name in decorator_kwargs:
@@ -70,6 +91,20 @@ def validate_input(**decorator_kwargs: Any) -> Callable[[Callable[..., Any]], Ca
                         func.__name__)
             return func(*args, **kwargs)
 
+        @functools.wraps(func)
+        def wrapper_validate(*args: Any, **kwargs: Any) -> Any:
+            call = functools.partial(validate_and_call, *args, **kwargs)
+            cache = active_result_cache()
+            if cache is not None:
+                call = functools.partial(cache.call, wrapper_validate, args, kwargs, call)
+            budget = active_latency_budget()
+            if budget is not None:
+                # the numeric fallback bypasses the cache, so approximations are not cached
+                return budget.call(wrapper_validate, validated_units(wrapper_validate), args,
+                    kwargs, call)
+            return call()
+
+        setattr(wrapper_validate, VALIDATED_INPUTS_ATTRIBUTE, dict(decorator_kwargs))
         return wrapper_validate
 
     return validate_func
@@ -93,6 +128,7 @@ def validate_output(
             _assert_expected_unit(ret, expected_unit, "return", func.__name__)
             return ret
 
+        setattr(wrapper_validate, VALIDATED_OUTPUT_ATTRIBUTE, expected_unit)
         return wrapper_validate
 
     return validate_func
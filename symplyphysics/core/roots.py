@@ -0,0 +1,301 @@
+"""
+This module solves laws numerically for any of their symbols. The residual ``lhs - rhs`` of a law
+and its derivative with respect to the unknown are compiled once into a vectorized kernel (see
+`symplyphysics.core.kernels`). Roots are then bracketed by scanning the magnitudes that the unknown
+can take and refined with a safeguarded Newton method, for whole batches of known values at once.
+Unlike `sympy.solve`, this also works for transcendental laws.
+
+* `compile_residual` returns the `ResidualKernel` of a law for an unknown.
+* `solve_numeric` finds the value of the unknown given the values of the other symbols.
+
+Example::
+
+    solve_numeric(refraction_law, "incidence_angle",
+        incidence_refractive_index=1.0,
+        resulting_refractive_index=1.5,
+        refraction_angle=Quantity(0.3 * units.radian))
+
+**Notes:**
+
+#. The magnitudes are scanned in SI units from ``1e-30`` to ``1e30`` at one point per decade, only
+   positive ones being scanned for positive symbols. The root with the smallest magnitude is found
+   if there are several of them, unless a bracket or a guess is given. Roots that are closer to
+   each other than a decade might be missed by the scan.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+import numpy as np
+from sympy import Expr, diff
+from sympy.physics.units import Quantity as SymQuantity
+
+from .dimensions import dimension_to_si_unit
+from .kernels import (LawSource, TargetType, applied_symbol, as_law, compile_expression,
+    find_inputs, find_target, load_law, order_arguments, real_si_magnitude, si_magnitude,
+    to_numeric_expression)
+from .symbols.quantities import Quantity
+from .symbols.symbols import DimensionSymbol
+
+_SCAN_DECADES = (-30, 30)
+_SCAN_POINTS_PER_DECADE = 1
+_SCAN_CHUNK = 2**14
+_TOLERANCE = 1e-12
+_MAX_ITERATIONS = 100
+
+
+@dataclass(frozen=True)
+class ResidualKernel:  # pylint: disable=too-many-instance-attributes
+    """
+    Holds the residual ``lhs - rhs`` of a law and its derivative with respect to the ``target``,
+    along with their compiled kernel.
+    """
+
+    target: str
+    """Name of the unknown symbol."""
+
+    target_symbol: DimensionSymbol
+    """The unknown symbol."""
+
+    unknown: Expr
+    """The unknown symbol, or its application if it is a function."""
+
+    residual: Expr
+    """Residual of the law with quantities replaced by their SI magnitudes."""
+
+    derivative: Expr
+    """Derivative of `residual` with respect to the unknown."""
+
+    inputs: tuple[str, ...]
+    """Names of the known symbols, the unknown is the first argument of `function`."""
+
+    input_symbols: tuple[DimensionSymbol, ...]
+    """Known symbols in the same order as `inputs`."""
+
+    function: Callable[..., Any] = field(repr=False, compare=False)
+    """The compiled NumPy function returning the residual and its derivative."""
+
+    residual_function: Callable[..., Any] = field(repr=False, compare=False)
+    """The compiled NumPy function returning the residual alone, used to scan for roots."""
+
+    def arguments(self, *args: Any, **kwargs: Any) -> list[Any]:
+        """Orders the known values, see `symplyphysics.core.kernels.LawKernel.arguments`."""
+
+        return order_arguments(f"Residual for '{self.target}'", self.inputs, args, kwargs)
+
+    def evaluate(self, x: np.ndarray, values: list[np.ndarray]) -> tuple[np.ndarray, np.ndarray]:
+        """Returns the real residual and its derivative at the SI magnitudes ``x`` of the unknown."""
+
+        with np.errstate(all="ignore"):
+            residual, derivative = self.function(x, *values)
+        return _real(residual, x.shape), _real(derivative, x.shape)
+
+    def evaluate_residual(self, x: np.ndarray, values: list[np.ndarray]) -> np.ndarray:
+        """Returns the real residual at the SI magnitudes ``x`` of the unknown."""
+
+        with np.errstate(all="ignore"):
+            return _real(self.residual_function(x, *values), x.shape)
+
+
+def _real(value: Any, shape: tuple[int, ...]) -> np.ndarray:
+    value = np.broadcast_to(value, shape)
+    # complex values mean that the point lies outside of the domain of the law
+    if np.iscomplexobj(value):
+        value = np.where(value.imag == 0, value.real, np.nan)
+    return value.astype(float)
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_residual(source: LawSource, target: TargetType) -> ResidualKernel:
+    law, names = as_law(source)
+    target_name, target_symbol = find_target(law, names, target)
+
+    residual = to_numeric_expression(law.lhs - law.rhs)
+    unknown = applied_symbol(law, target_symbol)
+    if not residual.has(unknown):
+        raise ValueError(f"Law '{law}' does not depend on '{target_name}'.")
+    derivative = diff(residual, unknown)
+
+    inputs, input_symbols = find_inputs(law, names, [residual], [target_symbol])
+    arguments = [unknown, *(applied_symbol(law, s) for s in input_symbols)]
+    function = compile_expression([residual, derivative], arguments, cse=True)
+    residual_function = compile_expression(residual, arguments)
+    return ResidualKernel(target_name, target_symbol, unknown, residual, derivative, inputs,
+        input_symbols, function, residual_function)
+
+
+def compile_residual(source: LawSource | str, target: TargetType) -> ResidualKernel:
+    """
+    Returns the residual kernel of the law ``source`` for the unknown ``target``, see
+    `symplyphysics.core.kernels.compile_law` for the meaning of the parameters.
+
+    Residuals are cached, so the law is differentiated and compiled only once.
+
+    Raises:
+        ValueError: If the law does not depend on ``target`` or cannot be compiled.
+    """
+
+    if isinstance(source, str):
+        source = load_law(source)
+    return _compile_residual(source, target)
+
+
+def _scan_grid(unknown: Expr) -> np.ndarray:
+    decades = _SCAN_DECADES[1] - _SCAN_DECADES[0]
+    magnitudes = np.logspace(*_SCAN_DECADES, decades * _SCAN_POINTS_PER_DECADE + 1)
+    if unknown.is_positive:
+        return magnitudes
+    if unknown.is_nonnegative:
+        return np.concatenate(([0.0], magnitudes))
+    return np.concatenate((-magnitudes[::-1], [0.0], magnitudes))
+
+
+def _bracket(kernel: ResidualKernel, values: list[np.ndarray],
+    shape: tuple[int, ...]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the brackets of the smallest roots by magnitude. Points without a sign change get an
+    arbitrary bracket, which is rejected by the caller.
+    """
+
+    grid = _scan_grid(kernel.unknown)
+    distance = np.minimum(np.abs(grid[:-1]), np.abs(grid[1:]))
+    flat = [np.broadcast_to(v, shape).reshape(-1, 1) for v in values]
+    size = int(np.prod(shape))
+    index = np.empty(size, dtype=int)
+    # the scan is chunked so that the memory stays bounded for large batches
+    for start in range(0, size, _SCAN_CHUNK):
+        stop = min(start + _SCAN_CHUNK, size)
+        points = np.broadcast_to(grid, (stop - start, grid.size))
+        residual = kernel.evaluate_residual(points, [v[start:stop] for v in flat])
+        finite = np.isfinite(residual)
+        changes = ((np.sign(residual[:, :-1]) * np.sign(residual[:, 1:]) <= 0) & finite[:, :-1] &
+            finite[:, 1:])
+        # brackets without a sign change are never selected
+        index[start:stop] = np.argmin(np.where(changes, distance, np.inf), axis=-1)
+    index = index.reshape(shape)
+    return grid[index], grid[index + 1]
+
+
+def _refine(kernel: ResidualKernel, values: list[np.ndarray], low: np.ndarray, high: np.ndarray,
+    x: np.ndarray) -> np.ndarray:
+    """Refines the bracketed roots with Newton steps, falling back to bisection."""
+
+    f_low = kernel.evaluate_residual(low, values)
+    for _ in range(_MAX_ITERATIONS):
+        f, df = kernel.evaluate(x, values)
+        # shrink the brackets around the current point
+        same = np.sign(f) == np.sign(f_low)
+        low = np.where(same, x, low)
+        f_low = np.where(same, f, f_low)
+        high = np.where(same, high, x)
+
+        with np.errstate(all="ignore"):
+            step = x - f / df
+        inside = np.isfinite(step) & (step > np.minimum(low, high)) & (step < np.maximum(low, high))
+        updated = np.where(inside, step, (low + high) / 2)
+        updated = np.where(f == 0, x, updated)
+
+        converged = np.isfinite(updated) & (np.abs(updated - x)
+            <= _TOLERANCE * np.abs(updated) + np.finfo(float).tiny)
+        x = updated
+        if np.all(converged | ~np.isfinite(x)):
+            break
+    return x
+
+
+def _newton(kernel: ResidualKernel, values: list[np.ndarray], x: np.ndarray) -> np.ndarray:
+    """Runs plain Newton iterations from ``x``, points that do not converge become NaN."""
+
+    for _ in range(_MAX_ITERATIONS):
+        f, df = kernel.evaluate(x, values)
+        with np.errstate(all="ignore"):
+            updated = np.where(f == 0, x, x - f / df)
+        converged = np.isfinite(updated) & (np.abs(updated - x)
+            <= _TOLERANCE * np.abs(updated) + np.finfo(float).tiny)
+        x = updated
+        if np.all(converged | ~np.isfinite(x)):
+            return np.where(converged, x, np.nan)
+    return np.full_like(x, np.nan)
+
+
+def solve_numeric(source: LawSource | str,
+    target: TargetType,
+    *,
+    bracket: Optional[tuple[Any, Any]] = None,
+    guess: Optional[Any] = None,
+    **known: Any) -> Any:
+    """
+    Solves the law ``source`` for ``target`` numerically. ``known`` are the values of the other
+    symbols of the law keyed by their names, given either as quantities or as SI magnitudes,
+    possibly arrays that broadcast together.
+
+    Args:
+        source: Law module, its dotted path, or a law equation.
+        target: Symbol of the law or the name of the module variable holding it.
+        bracket: Values of ``target`` that enclose the root, the search grid is not scanned then.
+        guess: Starting value of ``target`` for Newton iterations, used if no root is bracketed.
+        known: Values of the other symbols of the law.
+
+    Returns:
+        The quantity of ``target`` if ``known`` values are scalars and some of them are quantities,
+        otherwise the array of SI magnitudes, NaN where no root is found.
+
+    Raises:
+        ValueError: If the law cannot be compiled, or no root is found for a quantity result.
+        TypeError: If some of the ``known`` values are missing or unknown.
+    """
+
+    kernel = compile_residual(source, target)
+    ordered = kernel.arguments(**known)
+    as_quantity = (any(isinstance(v, SymQuantity) for v in ordered) and
+        all(np.ndim(v) == 0 for v in ordered))
+    values = [np.asarray(si_magnitude(v, s), dtype=float)
+        for v, s in zip(ordered, kernel.input_symbols)]
+    shape = np.broadcast_shapes(*(v.shape for v in values))
+
+    if bracket is not None:
+        low, high = (np.broadcast_to(np.asarray(si_magnitude(b, kernel.target_symbol),
+            dtype=float), shape) for b in bracket)
+    else:
+        low, high = _bracket(kernel, values, shape)
+    f_low = kernel.evaluate_residual(low, values)
+    f_high = kernel.evaluate_residual(high, values)
+    found = np.sign(f_low) * np.sign(f_high) <= 0
+
+    result = np.full(shape, np.nan)
+    if np.any(found):
+        start = np.where(found, (low + high) / 2, np.nan)
+        result = _refine(kernel, values, low, high, start)
+        # the sign also changes across poles, where the residual grows instead
+        residual = np.abs(kernel.evaluate_residual(result, values))
+        found &= residual <= np.minimum(np.abs(f_low), np.abs(f_high))
+        result = np.where(found, result, np.nan)
+    if not np.all(found):
+        start_value = 1.0 if guess is None else real_si_magnitude(guess, kernel.target_symbol)
+        start = np.where(found, np.nan, np.broadcast_to(start_value, shape))
+        result = np.where(found, result, _newton(kernel, values, start))
+
+    if not as_quantity:
+        return result
+    if not np.isfinite(result).all():
+        raise ValueError(f"Cannot find the root of '{kernel.residual}' for '{kernel.target}'.")
+    return Quantity(float(result) * dimension_to_si_unit(kernel.target_symbol.dimension))
+
+
+def clear_residual_cache() -> None:
+    """Drops all compiled residuals."""
+
+    _compile_residual.cache_clear()
+
+
+__all__ = [
+    "ResidualKernel",
+    "compile_residual",
+    "solve_numeric",
+    "clear_residual_cache",
+]
@@ -0,0 +1,210 @@
+"""
+This module provides the sensitivities of laws, i.e. the partial derivatives of the solved form of a
+law with respect to its inputs. The solved form is differentiated once, and the derivatives are
+compiled along with the solved form into a single vectorized kernel (see
+`symplyphysics.core.kernels`), so that sensitivities are evaluated over batches of operating points
+without any SymPy work.
+
+* `law_sensitivity` returns the `LawSensitivity` of a law solved for one or several targets.
+* `LawSensitivity` evaluates gradients and Jacobians, either absolute, in SI units, or relative,
+  i.e. the log-log derivatives ``d(ln y) / d(ln x)``.
+
+Example::
+
+    sensitivity = law_sensitivity(ohm_law, "current")
+    sensitivity.gradient(voltage=[1.0, 2.0], resistance=2.0)
+    # {'voltage': array([0.5, 0.5]), 'resistance': array([-0.25, -0.5])}
+
+**Notes:**
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional, Sequence
+
+import numpy as np
+from sympy import Expr, MatrixBase, diff
+from sympy.physics.units import Dimension
+
+from .dimensions import dimension_to_si_unit
+from .kernels import (LawSource, TargetType, applied_symbol, as_law, compile_expression,
+    compile_law, compile_law_outputs, load_law, si_magnitude)
+from .symbols.quantities import Quantity
+from .symbols.symbols import DimensionSymbol
+
+
+@dataclass(frozen=True)
+class LawSensitivity:
+    """
+    Holds the partial derivatives of the ``targets`` of a law with respect to its ``inputs`` and
+    their compiled kernel. All values are SI magnitudes.
+    """
+
+    targets: tuple[str, ...]
+    """Names of the symbols the law is solved for."""
+
+    target_symbols: tuple[DimensionSymbol, ...]
+    """The symbols the law is solved for in the same order as `targets`."""
+
+    inputs: tuple[str, ...]
+    """Names of the input symbols, in the order of the positional arguments."""
+
+    input_symbols: tuple[DimensionSymbol, ...]
+    """Input symbols in the same order as `inputs`."""
+
+    derivatives: tuple[tuple[Expr, ...], ...]
+    """Partial derivatives of each of the `targets` with respect to each of the `inputs`."""
+
+    function: Callable[..., Any] = field(repr=False, compare=False)
+    """
+    The compiled NumPy function returning the values of the targets followed by the partial
+    derivatives in the row-major order.
+    """
+
+    arguments: Callable[..., list[Any]] = field(repr=False, compare=False)
+    """Orders the values passed either positionally or by input names, see `LawKernel.arguments`."""
+
+    @property
+    def partial_dimensions(self) -> dict[tuple[str, str], Dimension]:
+        """Dimensions of the partial derivatives keyed by the target and input names."""
+
+        return {(t, i): ts.dimension / s.dimension
+            for t, ts in zip(self.targets, self.target_symbols)
+            for i, s in zip(self.inputs, self.input_symbols)}
+
+    def _evaluate(self, args: Sequence[Any], kwargs: dict[str, Any]) -> tuple[list[np.ndarray],
+        np.ndarray, list[np.ndarray]]:
+        values = [np.asarray(v) for v in self.arguments(*args, **kwargs)]
+        shape = np.broadcast_shapes(*(v.shape for v in values))
+        results = [np.broadcast_to(np.asarray(r), shape) for r in self.function(*values)]
+        outputs = results[:len(self.targets)]
+        jacobian = np.stack(results[len(self.targets):], axis=-1).reshape(shape +
+            (len(self.targets), len(self.inputs)))
+        return outputs, jacobian, [np.broadcast_to(v, shape) for v in values]
+
+    def jacobian(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        """
+        Evaluates the Jacobian over the SI magnitudes of the inputs, which can be given as scalars
+        or arrays that broadcast together. The last two axes of the result correspond to `targets`
+        and `inputs` respectively.
+        """
+
+        return self._evaluate(args, kwargs)[1]
+
+    def relative_jacobian(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        """
+        Evaluates the log-log derivatives ``d(ln y) / d(ln x) = (x / y) * dy / dx``, see
+        `jacobian`. Entries are infinite or NaN where the targets vanish.
+        """
+
+        outputs, jacobian, values = self._evaluate(args, kwargs)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return (jacobian * np.stack(values, axis=-1)[..., np.newaxis, :] /
+                np.stack(outputs, axis=-1)[..., :, np.newaxis])
+
+    def _single_target(self) -> None:
+        if len(self.targets) != 1:
+            raise ValueError(f"Gradient is defined for a single target, got {len(self.targets)}, "
+                "use the Jacobian instead.")
+
+    def gradient(self, *args: Any, **kwargs: Any) -> dict[str, np.ndarray]:
+        """
+        Evaluates the partial derivatives of the single target with respect to each of the inputs,
+        see `jacobian`.
+        """
+
+        self._single_target()
+        jacobian = self.jacobian(*args, **kwargs)
+        return {n: jacobian[..., 0, i] for i, n in enumerate(self.inputs)}
+
+    def relative_gradient(self, *args: Any, **kwargs: Any) -> dict[str, np.ndarray]:
+        """Evaluates the log-log derivatives of the single target, see `relative_jacobian`."""
+
+        self._single_target()
+        jacobian = self.relative_jacobian(*args, **kwargs)
+        return {n: jacobian[..., 0, i] for i, n in enumerate(self.inputs)}
+
+    def evaluate(self, *args: Any, **kwargs: Any) -> dict[str, Quantity]:
+        """
+        Evaluates the partial derivatives of the single target at a single point given by
+        quantities and returns the dimensioned results keyed by the input names.
+        """
+
+        self._single_target()
+        values = [si_magnitude(v, s) for v, s in zip(self.arguments(*args, **kwargs),
+            self.input_symbols)]
+        results = list(self.function(*values))[len(self.targets):]
+        unit = dimension_to_si_unit(self.target_symbols[0].dimension)
+        gradient = {}
+        for name, symbol, result in zip(self.inputs, self.input_symbols, results):
+            result = complex(result)
+            value = result.real if result.imag == 0 else result
+            gradient[name] = Quantity(value * unit / dimension_to_si_unit(symbol.dimension))
+        return gradient
+
+
+@functools.lru_cache(maxsize=None)
+def _law_sensitivity(source: LawSource, targets: Optional[tuple[TargetType, ...]],
+    solution: Optional[int]) -> LawSensitivity:
+    if targets is None:
+        law, _ = as_law(source)
+        if not isinstance(law.lhs, MatrixBase):
+            targets = (law.lhs,)
+
+    if targets is not None and len(targets) == 1:
+        kernel: Any = compile_law(source, targets[0], solution=solution)
+        names, symbols, exprs = (kernel.target,), (kernel.target_symbol,), (kernel.expr,)
+    else:
+        kernel = compile_law_outputs(source, targets, solution=solution)
+        names, symbols, exprs = kernel.targets, kernel.target_symbols, kernel.exprs
+
+    # functions of the law are differentiated with respect to their applications
+    arguments = [applied_symbol(kernel.law, s) for s in kernel.input_symbols]
+    derivatives = tuple(tuple(diff(e, a) for a in arguments) for e in exprs)
+
+    flat = [d for row in derivatives for d in row]
+    function = compile_expression([*exprs, *flat], arguments, cse=True)
+    return LawSensitivity(names, symbols, kernel.inputs, kernel.input_symbols, derivatives,
+        function, kernel.arguments)
+
+
+def law_sensitivity(source: LawSource | str,
+    targets: Optional[TargetType | Sequence[TargetType]] = None,
+    *,
+    solution: Optional[int] = None) -> LawSensitivity:
+    """
+    Returns the sensitivity of the law ``source`` solved for ``targets``, which is either a single
+    target or a sequence of them. ``targets`` default to the left-hand side of the law, or to its
+    entries for a matrix law. ``solution`` defaults to the principal solution, see
+    `symplyphysics.core.kernels.compile_law` and `symplyphysics.core.kernels.solve_law_outputs`.
+
+    Sensitivities are cached, so the law is differentiated and compiled only once.
+
+    Raises:
+        ValueError: If the law cannot be solved for ``targets`` or compiled.
+    """
+
+    if isinstance(source, str):
+        source = load_law(source)
+    if targets is None:
+        return _law_sensitivity(source, None, solution)
+    if isinstance(targets, (str, Expr)) or not isinstance(targets, Sequence):
+        targets = [targets]
+    return _law_sensitivity(source, tuple(targets), solution)
+
+
+def clear_sensitivity_cache() -> None:
+    """Drops all compiled sensitivities."""
+
+    _law_sensitivity.cache_clear()
+
+
+__all__ = [
+    "LawSensitivity",
+    "law_sensitivity",
+    "clear_sensitivity_cache",
+]
@@ -1,4 +1,5 @@
-from typing import Callable
+from collections import defaultdict
+from typing import Callable, Optional
 from sympy import Basic, S, Eq, sympify, Add, Expr
 
 from ..vectors import (
@@ -8,6 +9,7 @@ from ..vectors import (
     into_terms,
     split_factor,
 )
+from ..expr_comparisons import Comparison, numeric_equals
 
 
 def apply(eqn: Basic, f: Callable[[Basic], Basic]) -> Eq:
@@ -29,11 +31,43 @@ def apply(eqn: Basic, f: Callable[[Basic], Basic]) -> Eq:
     return Eq(f(lhs), f(rhs), evaluate=False)
 
 
+def _vector_factors(expr: Expr) -> Optional[dict[Expr, Expr]]:
+    """Returns the scalar factors of the vectors in ``expr``, `None` if it cannot be split."""
+
+    factors: defaultdict[Expr, Expr] = defaultdict(lambda: S.Zero)
+    try:
+        for term in into_terms(expr):
+            vector, factor = split_factor(term)
+            factors[vector] += factor
+    except ValueError:
+        return None
+    return factors
+
+
+def compare_vectors(lhs: Expr, rhs: Expr, *, points: int = 3, seed: int = 0) -> Comparison:
+    """
+    Checks the equality of two vector expressions in the same tiers as `compare_expressions`. In
+    the ``numeric`` tier, the difference of the vectors is viewed as a linear combination of
+    vectors, and the scalar factor of each vector is compared with zero at random points.
+    """
+
+    diff = lhs - rhs
+    if diff == 0 or norm(diff) == 0:
+        return Comparison(True, "structural")
+
+    factors = _vector_factors(diff)
+    if factors is not None and all(
+            numeric_equals(f, S.Zero, points, seed) for f in factors.values()):
+        return Comparison(True, "numeric")
+
+    diff = diff.simplify()
+    return Comparison(bool(norm(diff) == 0), "symbolic")
+
+
 def vector_equals(lhs: Expr, rhs: Expr) -> bool:
     """Checks the equality of two vector expressions."""
 
-    diff = (lhs - rhs).simplify()
-    return bool(norm(diff) == 0)
+    return compare_vectors(lhs, rhs).equal
 
 
 def solve_for_vector(
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from functools import partial
-from typing import Any, Optional, Sequence, SupportsFloat
+from typing import Any, Hashable, Optional, Sequence, SupportsFloat
 from sympy import S, Expr, sympify, Abs
 from sympy.physics.units import Dimension, Quantity as SymQuantity
 from sympy.physics.units.systems.si import SI
@@ -60,6 +60,12 @@ class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancest
     def identity(self, *_args: Any) -> Quantity:
         return self
 
+    # Quantities are registered in the global unit system when constructed, so they are rebuilt
+    # from their scale factor and dimension instead of SymPy arguments when unpickled
+    def __reduce_ex__(self, _protocol: Any) -> tuple[Any, ...]:
+        return (_rebuild_quantity, (self.scale_factor, self.dimension, self.display_name,
+            self.display_latex))
+
     def _eval_is_positive(self) -> bool:
         # NOTE: returns False for complex values, see https://github.com/blackyblack/symplyphysics/blob/3e7e05b9837c70bb23d36202b9e958b739cd36bc/test/electricity/circuits/transmission_lines/transmission_matrix_lossy_transmission_line_test.py#L23
         try:
@@ -105,6 +111,18 @@ class Quantity(DimensionSymbol, SymQuantity):  # pylint: disable=too-many-ancest
         return str(printer.doprint(si_value * si_unit))
 
 
+def _rebuild_quantity(
+    scale_factor_: Expr,
+    dimension: Dimension,
+    display_symbol: str,
+    display_latex: str,
+) -> Quantity:
+    return Quantity(scale_factor_,
+        dimension=dimension,
+        display_symbol=display_symbol,
+        display_latex=display_latex)
+
+
 # Allows for some SymPy comparisons, eg Piecewise function
 @dispatch(Quantity, Quantity)
 def _eval_is_ge(lhs: Quantity, rhs: Quantity) -> bool:
@@ -128,3 +146,23 @@ def scale_factor(quantity_: SupportsFloat) -> float:
         return float(quantity_.scale_factor)
 
     return float(quantity_)
+
+
+def quantity_key(value: Any) -> Hashable:
+    """
+    Returns a hashable key that identifies ``value`` by its contents. Quantities are identified by
+    their scale factors and dimensions rather than by their generated names, so equal quantities
+    created separately share the same key. Sequences are converted into tuples of keys.
+
+    Raises:
+        TypeError: If ``value`` cannot be hashed.
+    """
+
+    if isinstance(value, SymQuantity):
+        return (SymQuantity, value.scale_factor, value.dimension)
+
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(quantity_key(v) for v in value))
+
+    hash(value)
+    return value
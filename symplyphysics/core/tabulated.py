@@ -0,0 +1,330 @@
+"""
+This module provides tabulated surrogates of expensive laws. The law behind a law function is
+compiled (see `symplyphysics.core.kernels`) and sampled over a grid covering the declared ranges of
+its inputs. The grid is refined adaptively, interval by interval, until linear interpolation meets
+the error tolerance. The surrogate is then evaluated by vectorized multilinear interpolation.
+
+* `TabulatedLaw.build` samples a law function over the ranges of its parameters.
+* `TabulatedLaw` is called like the law function it replaces, and also evaluates arrays of SI
+  magnitudes.
+* `TabulatedLaw.save` and `TabulatedLaw.load` store the table as NumPy arrays, which can be loaded
+  memory-mapped.
+
+Example::
+
+    table = TabulatedLaw.build(cross_section_law.calculate_cross_sectional_area_of_ionization, {
+        "energy_of_electron_": (Quantity(20 * units.electronvolt), Quantity(1 * units.kiloelectronvolt)),
+    }, fixed={
+        "ionization_energy_": Quantity(15.76 * units.electronvolt),
+        ...
+    }, tolerance=1e-4)
+    table(ionization_energy_, Quantity(100 * units.electronvolt), ...)
+
+**Notes:**
+
+#. Parameters of the law function that are not tabulated are fixed when the table is built. Calls
+   with other values of fixed parameters, or with values outside of the tabulated ranges, raise
+   `ValueError`.
+
+#. The tolerance is relative to the largest magnitude of the law over the table. The error is
+   estimated at the midpoints of the intervals of the grid, so narrow features between the nodes
+   of the initial grid might be missed.
+
+#. Ranges of positive inputs spanning two decades or more are sampled on the logarithmic scale.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import importlib
+import inspect
+import itertools
+import json
+from pathlib import Path
+from typing import Any, Callable, Mapping, Optional, Sequence
+
+import numpy as np
+from sympy import Expr
+
+from .dimensions import assert_equivalent_dimension, dimension_to_si_unit, dimsys_SI
+from .kernels import compile_law_function, real_si_magnitude
+from .quantity_decorator import validated_units
+from .symbols.quantities import Quantity
+
+_INITIAL_POINTS = 5
+_LOG_SCALE_RATIO = 100
+_MAX_REFINEMENTS = 50
+_FIXED_TOLERANCE = 1e-9
+_CHECK_TOLERANCE = 1e-6
+_METADATA_FILE = "metadata.json"
+_VALUES_FILE = "values.npy"
+
+
+def _real(values: Any) -> np.ndarray:
+    values = np.asarray(values)
+    if np.iscomplexobj(values):
+        if np.any(values.imag != 0):
+            raise ValueError("Tabulated laws should have real values.")
+        values = values.real
+    return values.astype(float)
+
+
+class TabulatedLaw:
+    """
+    Tabulated surrogate of the law function ``function``. ``parameters`` are the names of the
+    tabulated parameters and ``axes`` are their grids in SI units, ``values`` being the SI
+    magnitudes of the law at the nodes of the grid. ``fixed`` are the SI magnitudes of the other
+    parameters. Use `build` or `load` to create tables.
+    """
+
+    def __init__(self,
+        function: Callable[..., Any],
+        parameters: Sequence[str],
+        axes: Sequence[np.ndarray],
+        values: np.ndarray,
+        fixed: Mapping[str, float],
+        log_scale: Sequence[bool],
+        tolerance: float) -> None:
+        self.function = function
+        self.parameters = tuple(parameters)
+        self.axes = tuple(axes)
+        self.values = values
+        self.fixed = dict(fixed)
+        self.log_scale = tuple(log_scale)
+        self.tolerance = tolerance
+        self._inputs, output = validated_units(function)
+        if output is None:
+            raise ValueError(f"Function '{function.__name__}' should validate its result.")
+        self._signature = inspect.signature(function)
+        self.unit: Expr = dimension_to_si_unit(getattr(output, "dimension", output))
+
+    @property
+    def size(self) -> int:
+        """Number of nodes of the table."""
+
+        return int(self.values.size)
+
+    @classmethod
+    def build(cls,
+        function: Callable[..., Any],
+        ranges: Mapping[str, tuple[Any, Any]],
+        *,
+        fixed: Optional[Mapping[str, Any]] = None,
+        tolerance: float = 1e-4,
+        max_points: int = 10**6) -> TabulatedLaw:
+        """
+        Tabulates the law function ``function`` over the ``ranges`` of its parameters, given as
+        ``(low, high)`` pairs of quantities or numbers for dimensionless parameters. The other
+        parameters are set to their ``fixed`` values.
+
+        Raises:
+            ValueError: If the parameters do not match the law, the tolerance is not met within
+                ``max_points`` nodes, or the table does not match ``function``.
+            UnitsError: If the dimensions of the ranges or fixed values do not match the law.
+        """
+
+        if tolerance <= 0:
+            raise ValueError(f"Tolerance should be positive, got {tolerance}.")
+
+        kernel, names = compile_law_function(function)
+        symbols = dict(zip(names.values(), kernel.input_symbols))
+        fixed = fixed or {}
+        unknown = (set(ranges) | set(fixed)) - set(symbols)
+        if unknown:
+            raise ValueError(f"Function '{function.__name__}' has no law parameters "
+                f"{sorted(unknown)}.")
+        missing = set(symbols) - set(ranges) - set(fixed)
+        if missing:
+            raise ValueError(f"Parameters {sorted(missing)} should be either tabulated or fixed.")
+
+        fixed_values: dict[str, float] = {}
+        for name, value in fixed.items():
+            assert_equivalent_dimension(value, name, function.__name__, symbols[name].dimension)
+            fixed_values[name] = real_si_magnitude(value, symbols[name])
+
+        parameters = [p for p in names.values() if p in ranges]
+        axes: list[np.ndarray] = []
+        log_scale: list[bool] = []
+        for name in parameters:
+            bounds = []
+            for bound in ranges[name]:
+                assert_equivalent_dimension(bound, name, function.__name__,
+                    symbols[name].dimension)
+                bounds.append(real_si_magnitude(bound, symbols[name]))
+            low, high = bounds
+            if not low < high:
+                raise ValueError(f"Range of '{name}' should be increasing, got {low} and {high}.")
+            log = low > 0 and high / low >= _LOG_SCALE_RATIO
+            axes.append(
+                np.geomspace(low, high, _INITIAL_POINTS) if log else np.linspace(
+                low, high, _INITIAL_POINTS))
+            log_scale.append(log)
+
+        inputs = {p: n for n, p in names.items()}
+
+        def evaluate(grid: Sequence[np.ndarray]) -> np.ndarray:
+            arguments = dict(zip(parameters, np.meshgrid(*grid, indexing="ij", sparse=True)))
+            arguments.update(fixed_values)
+            shape = tuple(len(a) for a in grid)
+            with np.errstate(all="ignore"):
+                result = kernel(**{inputs[p]: v for p, v in arguments.items()})
+            return np.broadcast_to(_real(result), shape)
+
+        for _ in range(_MAX_REFINEMENTS):
+            values = evaluate(axes)
+            scale = float(np.max(np.abs(values))) or 1.0
+            refined = False
+            for k, axis in enumerate(axes):
+                midpoints = np.sqrt(axis[:-1] * axis[1:]) if log_scale[k] else (axis[:-1] +
+                    axis[1:]) / 2
+                grid = list(axes)
+                grid[k] = midpoints
+                exact = evaluate(grid)
+                # midpoints are in the middle of intervals on the interpolation scale
+                interpolated = (np.take(values, range(len(axis) - 1), axis=k) +
+                    np.take(values, range(1, len(axis)), axis=k)) / 2
+                error = np.abs(exact - interpolated)
+                error = np.where(np.isfinite(error), error, np.inf)
+                error = np.max(np.moveaxis(error, k, 0).reshape(len(midpoints), -1), axis=1)
+                bad = error > tolerance * scale
+                if np.any(bad):
+                    axes[k] = np.sort(np.concatenate((axis, midpoints[bad])))
+                    refined = True
+            if not refined:
+                break
+            if np.prod([len(a) for a in axes]) > max_points:
+                raise ValueError(f"Tolerance {tolerance} cannot be met within {max_points} points.")
+        else:
+            raise ValueError(f"Tolerance {tolerance} is not met after {_MAX_REFINEMENTS} "
+                "refinements.")
+
+        # the law is compared with the law function at the middle node of the table, so that a
+        # table of another solution of the law is never returned
+        node = tuple(len(a) // 2 for a in axes)
+        arguments = dict(fixed)
+        for name, axis, index in zip(parameters, axes, node):
+            dimension = symbols[name].dimension
+            arguments[name] = (axis[index] if dimsys_SI.is_dimensionless(dimension) else Quantity(
+                axis[index] * dimension_to_si_unit(dimension)))
+        expected = real_si_magnitude(function(**arguments), kernel.target_symbol)
+        if not np.isclose(values[node], expected, rtol=_CHECK_TOLERANCE, atol=0):
+            raise ValueError(f"Table of '{function.__name__}' does not match the function: "
+                f"{values[node]} instead of {expected} at {arguments}.")
+
+        return cls(function, parameters, axes, np.ascontiguousarray(values), fixed_values,
+            log_scale, tolerance)
+
+    def magnitudes(self, *args: Any, **kwargs: Any) -> np.ndarray:
+        """
+        Interpolates the table at the SI magnitudes of the tabulated parameters, which can be given
+        as scalars or arrays that broadcast together, positionally or by the parameter names.
+
+        Raises:
+            ValueError: If values are outside of the tabulated ranges.
+        """
+
+        if len(args) > len(self.parameters):
+            raise TypeError(f"Table takes {len(self.parameters)} arguments, got {len(args)}.")
+        given = dict(zip(self.parameters, args))
+        given.update(kwargs)
+        if set(given) != set(self.parameters):
+            raise TypeError(f"Table takes arguments {list(self.parameters)}, got {list(given)}.")
+
+        points = np.broadcast_arrays(*(np.asarray(given[p], dtype=float) for p in self.parameters))
+        indices = []
+        weights = []
+        for name, axis, log, x in zip(self.parameters, self.axes, self.log_scale, points):
+            if np.any(x < axis[0]) or np.any(x > axis[-1]) or np.any(np.isnan(x)):
+                raise ValueError(f"Values of '{name}' should be within [{axis[0]}, {axis[-1]}].")
+            index = np.clip(np.searchsorted(axis, x, side="right") - 1, 0, len(axis) - 2)
+            left, right = axis[index], axis[index + 1]
+            if log:
+                left, right, x = np.log(left), np.log(right), np.log(x)
+            indices.append(index)
+            weights.append((x - left) / (right - left))
+
+        result = np.zeros(points[0].shape if points else ())
+        for corner in itertools.product((0, 1), repeat=len(self.parameters)):
+            weight = np.ones_like(result)
+            for c, w in zip(corner, weights):
+                weight = weight * (w if c else 1 - w)
+            result = result + weight * self.values[tuple(i + c for i, c in zip(indices, corner))]
+        return result
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Quantity:
+        """
+        Evaluates the table with the arguments of the law function, which are validated in the
+        same way.
+
+        Raises:
+            ValueError: If values are outside of the tabulated ranges, or fixed parameters have
+                other values.
+            UnitsError: If the dimensions of the arguments do not match the law.
+        """
+
+        bound = self._signature.bind(*args, **kwargs)
+        name = self.function.__name__
+        magnitudes = {}
+        for parameter, value in bound.arguments.items():
+            unit = self._inputs.get(parameter)
+            if unit is None:
+                continue
+            dimension = getattr(unit, "dimension", unit)
+            assert_equivalent_dimension(value, parameter, name, dimension)
+            magnitudes[parameter] = real_si_magnitude(value, dimension)
+
+        for parameter, value in self.fixed.items():
+            if not np.isclose(magnitudes[parameter], value, rtol=_FIXED_TOLERANCE, atol=0):
+                raise ValueError(f"Argument '{parameter}' to function '{name}' is fixed to "
+                    f"{value} in the table, got {magnitudes[parameter]}.")
+
+        result = self.magnitudes(**{p: magnitudes[p] for p in self.parameters})
+        return Quantity(float(result) * self.unit)
+
+    def save(self, directory: str | Path) -> None:
+        """Stores the table as NumPy arrays along with its metadata in ``directory``."""
+
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        np.save(path / _VALUES_FILE, self.values)
+        for i, axis in enumerate(self.axes):
+            np.save(path / f"axis{i}.npy", axis)
+        metadata = {
+            "function": f"{self.function.__module__}:{self.function.__qualname__}",
+            "parameters": self.parameters,
+            "fixed": self.fixed,
+            "log_scale": self.log_scale,
+            "tolerance": self.tolerance,
+        }
+        (path / _METADATA_FILE).write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+
+    @classmethod
+    def load(cls,
+        directory: str | Path,
+        function: Optional[Callable[..., Any]] = None,
+        *,
+        mmap: bool = True) -> TabulatedLaw:
+        """
+        Loads the table stored by `save` in ``directory``. The law function is imported unless
+        ``function`` is given. If ``mmap`` is `True`, the values are memory-mapped rather than read
+        into memory.
+        """
+
+        path = Path(directory)
+        metadata = json.loads((path / _METADATA_FILE).read_text(encoding="utf-8"))
+        if function is None:
+            module, qualname = metadata["function"].split(":")
+            attribute: Any = importlib.import_module(module)
+            for part in qualname.split("."):
+                attribute = getattr(attribute, part)
+            function = attribute
+
+        parameters = metadata["parameters"]
+        values = np.load(path / _VALUES_FILE, mmap_mode="r" if mmap else None)
+        axes = [np.load(path / f"axis{i}.npy") for i in range(len(parameters))]
+        return cls(function, parameters, axes, values, metadata["fixed"], metadata["log_scale"],
+            metadata["tolerance"])
+
+
+__all__ = ["TabulatedLaw"]
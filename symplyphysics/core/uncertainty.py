@@ -0,0 +1,284 @@
+"""
+This module propagates the uncertainty of measurements through law functions with the Monte Carlo
+method. The inputs are sampled as arrays and the law is evaluated once over the whole sample by its
+compiled kernel (see `symplyphysics.core.kernels`), so that millions of samples take a fraction of
+a second.
+
+* `Normal`, `Uniform` and `Triangular` describe the distributions of inputs, their parameters are
+  quantities of the same dimension as the input.
+* `propagate` samples the inputs of a law function and evaluates the law over the sample.
+* `PropagationResult` holds the sample of the result and provides its summary statistics and
+  percentiles as quantities.
+
+Example::
+
+    result = propagate(ohm_law.calculate_current, {
+        "voltage_": Normal(Quantity(3 * units.volt), Quantity(0.1 * units.volt)),
+        "resistance_": Uniform(Quantity(1.9 * units.ohm), Quantity(2.1 * units.ohm)),
+    }, samples=10**6, method="latin_hypercube")
+    low, high = result.interval(0.95)
+
+**Notes:**
+
+#. The law function should validate its parameters and result against the symbols of the module's
+   ``law``, see `symplyphysics.core.quantity_decorator.validated_units`. Parameters validated
+   against dimensions are matched with the law symbols by their names.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+from abc import abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Mapping, Optional
+
+import numpy as np
+from sympy import Expr
+
+from .dimensions import assert_equivalent_dimension, dimension_to_si_unit
+from .kernels import compile_law_function, real_si_magnitude, si_magnitude
+from .symbols.quantities import Quantity
+
+SamplingMethod = Literal["random", "latin_hypercube"]
+
+# Coefficients of the rational approximation of the inverse of the standard normal distribution
+# function by P. J. Acklam, the relative error is below 1.2e-9
+_NORMAL_A = (-3.969683028665376e+01, 2.209460984245205e+02, -2.759285104469687e+02,
+    1.383577518672690e+02, -3.066479806614716e+01, 2.506628277459239e+00)
+_NORMAL_B = (-5.447609879822406e+01, 1.615858368580409e+02, -1.556989798598866e+02,
+    6.680131188771972e+01, -1.328068155288572e+01)
+_NORMAL_C = (-7.784894002430293e-03, -3.223964580411365e-01, -2.400758277161838e+00,
+    -2.549732539343734e+00, 4.374664141464968e+00, 2.938163982698783e+00)
+_NORMAL_D = (7.784695709041462e-03, 3.224671290700398e-01, 2.445134137142996e+00,
+    3.754408661907416e+00)
+_NORMAL_TAIL = 0.02425
+
+
+def _polynomial(coefficients: tuple[float, ...], x: np.ndarray) -> np.ndarray:
+    result = np.full_like(x, coefficients[0])
+    for c in coefficients[1:]:
+        result = result * x + c
+    return result
+
+
+def _standard_normal_ppf(u: np.ndarray) -> np.ndarray:
+    result = np.empty_like(u)
+
+    lower = u < _NORMAL_TAIL
+    upper = u > 1 - _NORMAL_TAIL
+    central = ~(lower | upper)
+
+    q = u[central] - 0.5
+    r = q * q
+    result[central] = (_polynomial(_NORMAL_A, r) * q / (_polynomial(_NORMAL_B, r) * r + 1))
+
+    for mask, sign, tail in ((lower, 1, u[lower]), (upper, -1, 1 - u[upper])):
+        q = np.sqrt(-2 * np.log(tail))
+        result[mask] = sign * _polynomial(_NORMAL_C, q) / (_polynomial(_NORMAL_D, q) * q + 1)
+    return result
+
+
+class Distribution:
+    """
+    Base class of input distributions. Parameters of distributions are quantities, or numbers for
+    dimensionless inputs.
+    """
+
+    @abstractmethod
+    def parameters(self) -> dict[str, Any]:
+        """Returns the parameters of the distribution keyed by their names."""
+
+    @abstractmethod
+    def ppf(self, u: np.ndarray, parameters: Mapping[str, float]) -> np.ndarray:
+        """
+        Returns the quantiles of the distribution at probabilities ``u``, given the SI magnitudes
+        of the ``parameters``.
+        """
+
+    def sample(self, rng: np.random.Generator, size: int,
+        parameters: Mapping[str, float]) -> np.ndarray:
+        """Draws ``size`` independent values, see `ppf`."""
+
+        return self.ppf(rng.random(size), parameters)
+
+
+@dataclass(frozen=True)
+class Normal(Distribution):
+    """Normal distribution with the ``mean`` and the standard deviation ``std``."""
+
+    mean: Any
+
+    std: Any
+
+    def parameters(self) -> dict[str, Any]:
+        return {"mean": self.mean, "std": self.std}
+
+    def ppf(self, u: np.ndarray, parameters: Mapping[str, float]) -> np.ndarray:
+        return parameters["mean"] + parameters["std"] * _standard_normal_ppf(u)
+
+    def sample(self, rng: np.random.Generator, size: int,
+        parameters: Mapping[str, float]) -> np.ndarray:
+        return rng.normal(parameters["mean"], parameters["std"], size)
+
+
+@dataclass(frozen=True)
+class Uniform(Distribution):
+    """Uniform distribution between ``low`` and ``high``."""
+
+    low: Any
+
+    high: Any
+
+    def parameters(self) -> dict[str, Any]:
+        return {"low": self.low, "high": self.high}
+
+    def ppf(self, u: np.ndarray, parameters: Mapping[str, float]) -> np.ndarray:
+        return parameters["low"] + (parameters["high"] - parameters["low"]) * u
+
+
+@dataclass(frozen=True)
+class Triangular(Distribution):
+    """
+    Triangular distribution between ``low`` and ``high`` peaking at ``mode``, which is the only
+    value if ``low`` equals ``high``.
+    """
+
+    low: Any
+
+    mode: Any
+
+    high: Any
+
+    def parameters(self) -> dict[str, Any]:
+        return {"low": self.low, "mode": self.mode, "high": self.high}
+
+    def ppf(self, u: np.ndarray, parameters: Mapping[str, float]) -> np.ndarray:
+        low, mode, high = parameters["low"], parameters["mode"], parameters["high"]
+        if not low <= mode <= high:
+            raise ValueError(f"Mode {mode} should be between {low} and {high}.")
+        width = high - low
+        if width == 0:
+            return np.full(np.shape(u), float(mode))
+        split = (mode - low) / width
+        return np.where(u < split, low + np.sqrt(u * width * (mode - low)),
+            high - np.sqrt((1 - u) * width * (high - mode)))
+
+
+@dataclass(frozen=True)
+class PropagationResult:
+    """Sample of the result of a law function, see `propagate`."""
+
+    samples: np.ndarray = field(repr=False)
+    """SI magnitudes of the result."""
+
+    unit: Expr
+    """SI unit of the result."""
+
+    def _quantity(self, value: float) -> Quantity:
+        return Quantity(float(value) * self.unit)
+
+    @property
+    def mean(self) -> Quantity:
+        return self._quantity(np.mean(self.samples))
+
+    @property
+    def std(self) -> Quantity:
+        """Sample standard deviation."""
+
+        return self._quantity(np.std(self.samples, ddof=1))
+
+    @property
+    def median(self) -> Quantity:
+        return self._quantity(np.median(self.samples))
+
+    def percentile(self, q: float) -> Quantity:
+        """Returns the ``q``-th percentile of the result, ``q`` being between 0 and 100."""
+
+        return self._quantity(np.percentile(self.samples, q))
+
+    def interval(self, level: float = 0.95) -> tuple[Quantity, Quantity]:
+        """Returns the central interval containing the ``level`` fraction of the result."""
+
+        if not 0 < level < 1:
+            raise ValueError(f"Level should be between 0 and 1, got {level}.")
+        tail = 50 * (1 - level)
+        return self.percentile(tail), self.percentile(100 - tail)
+
+
+def propagate(func: Callable[..., Any],
+    inputs: Mapping[str, Any],
+    *,
+    samples: int = 100_000,
+    seed: Optional[int] = 0,
+    method: SamplingMethod = "random") -> PropagationResult:
+    """
+    Propagates the distributions of the ``inputs`` of the law function ``func`` to its result.
+
+    Args:
+        func: Law function decorated with `validate_input` and `validate_output`.
+        inputs: Values of all parameters of ``func`` keyed by the parameter names. Values are
+            either `Distribution` instances or fixed quantities.
+        samples: Size of the sample.
+        seed: Seed of the random generator, so that the result is reproducible.
+        method: ``"random"`` draws independent values, ``"latin_hypercube"`` draws a single value
+            from each of the ``samples`` equiprobable strata of each input, which makes statistics
+            converge faster.
+
+    Raises:
+        ValueError: If ``func`` cannot be related to the law or the inputs are missing.
+        UnitsError: If the dimensions of the inputs do not match the law.
+    """
+
+    if samples < 2:
+        raise ValueError(f"Sample should have at least 2 values, got {samples}.")
+    if method not in ("random", "latin_hypercube"):
+        raise ValueError(f"Unknown sampling method '{method}'.")
+
+    kernel, parameters = compile_law_function(func)
+    unknown = set(inputs) - set(parameters.values())
+    if unknown:
+        raise ValueError(f"Function '{func.__name__}' has no parameters {sorted(unknown)} "
+            "in the law.")
+
+    rng = np.random.default_rng(seed)
+    values: dict[str, Any] = {}
+    for name, symbol in zip(kernel.inputs, kernel.input_symbols):
+        parameter = parameters[name]
+        if parameter not in inputs:
+            raise ValueError(f"Missing input '{parameter}' of '{func.__name__}'.")
+        value = inputs[parameter]
+
+        if not isinstance(value, Distribution):
+            assert_equivalent_dimension(value, parameter, func.__name__, symbol.dimension)
+            values[name] = si_magnitude(value, symbol)
+            continue
+
+        magnitudes: dict[str, float] = {}
+        for key, item in value.parameters().items():
+            assert_equivalent_dimension(item, f"{parameter}.{key}", func.__name__,
+                symbol.dimension)
+            magnitudes[key] = real_si_magnitude(item, symbol)
+        if method == "latin_hypercube":
+            strata = (rng.permutation(samples) + rng.random(samples)) / samples
+            values[name] = value.ppf(strata, magnitudes)
+        else:
+            values[name] = value.sample(rng, samples, magnitudes)
+
+    result = np.broadcast_to(kernel(**values), (samples,))
+    if np.iscomplexobj(result):
+        if np.any(result.imag != 0):
+            raise ValueError(f"Result of '{func.__name__}' should be real.")
+        result = result.real
+    return PropagationResult(np.asarray(result, dtype=float),
+        dimension_to_si_unit(kernel.output_dimension))
+
+
+__all__ = [
+    "Distribution",
+    "Normal",
+    "Uniform",
+    "Triangular",
+    "PropagationResult",
+    "propagate",
+]
@@ -1,21 +1,55 @@
 """
 This module provides the function `generate_laws_docs` that generates rST files for laws and
 packages in a given directory.
+
+Modules are processed in a pool of processes. A manifest of the content hashes of the processed
+sources is kept in the output directory, so that modules which have not changed since the previous
+run are skipped. The hash of a module covers the modules it imports, directly or transitively, from
+the packages next to the source directory and from `symplyphysics`, since the documentation is
+generated by executing the module.
 """
 
 import ast
+import hashlib
+import json
 import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import Any, Callable, Optional, Sequence
 from .parse import find_members_and_functions, find_title_and_description
 from .view import print_law, print_package
 from .patch import patch_sympy_evaluate
 
+_MANIFEST_NAME = ".manifest.json"
+
+# the generated files also depend on the generator itself
+_GENERATOR_DIR = Path(__file__).parent
+_PACKAGE_ROOT = Path(__file__).parent.parent.parent
+
+
+@dataclass
+class DocsBuildReport:
+    """Summary of a `generate_laws_docs` run."""
+
+    generated: dict[str, float] = field(default_factory=dict)
+    """Time in seconds spent on each processed source file."""
+
+    skipped: list[str] = field(default_factory=list)
+    """Source files that have not changed since the previous run."""
+
+    removed: list[str] = field(default_factory=list)
+    """Generated files removed because their sources no longer exist."""
+
+    def slowest(self, count: int = 10) -> list[tuple[str, float]]:
+        return sorted(self.generated.items(), key=lambda item: item[1], reverse=True)[:count]
+
 
 def _parse_documentation(source: ast.Module) -> Optional[tuple[str, str]]:
     """
     Returns\\:
-     
+
     * the title and description parsed from the ``source`` docstring.
 
     * `None` if there is no docstring or title.
@@ -35,15 +69,13 @@ def _is_private(s: str) -> bool:
 
 
 def _process_law_package(directory: str, laws: Sequence[str], packages: Sequence[str],
-    output_dir: str, quiet: bool) -> Optional[str]:
+    output_dir: str) -> Optional[str]:
     """
     Processes the `__init__.py` file of the law package ``directory`` containing ``laws`` and
     sub-``packages``.
 
     Writes the resulting rST file in ``output_dir``.
 
-    Suppresses generating messages if ``quiet`` is `True`.
-
     Returns\\:
 
     * the stem of the path to the written package documentation file.
@@ -53,9 +85,6 @@ def _process_law_package(directory: str, laws: Sequence[str], packages: Sequence
 
     source_dirpath = Path(directory)
 
-    if not quiet:
-        print(f"Generating rST for package {source_dirpath}.")
-
     source_init_path = source_dirpath / "__init__.py"
     with open(source_init_path, "r", encoding="utf-8", newline=None) as file:
         source_content = file.read()
@@ -90,14 +119,12 @@ def _process_law_package(directory: str, laws: Sequence[str], packages: Sequence
     return doc_file_stem
 
 
-def _process_law(directory: str, filename: str, output_dir: str, quiet: bool) -> Optional[str]:
+def _process_law(directory: str, filename: str, output_dir: str) -> Optional[str]:
     """
     Processes the law in the given ``directory`` under the ``filename``.
 
     Writes the resulting rST file in ``output_dir``.
 
-    Suppresses generating messages if ``quiet`` is `True`.
-
     Returns\\:
 
     * the stem of the path to the law documentation file.
@@ -105,14 +132,8 @@ def _process_law(directory: str, filename: str, output_dir: str, quiet: bool) ->
     * `None` if the source file doesn't have any documentation.
     """
 
-    if filename.startswith("__") or not filename.endswith(".py"):
-        return None
-
     source_filepath = Path(directory, filename)
 
-    if not quiet:
-        print(f"Generating rST for {source_filepath}.")
-
     with open(source_filepath, "r", encoding="utf-8", newline=None) as file:
         source_content = file.read()
 
@@ -144,17 +165,227 @@ def _process_law(directory: str, filename: str, output_dir: str, quiet: bool) ->
     return doc_short_stem
 
 
-def generate_laws_docs(source_dir: str, output_dir: str, exclude_dirs: Sequence[str],
-    quiet: bool) -> None:
+def _timed(function: Callable[..., Optional[str]], *args: Any) -> tuple[Optional[str], float]:
+    """Calls ``function`` and returns its result along with the elapsed time in seconds."""
+
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def _generator_hash() -> str:
+    digest = hashlib.sha256()
+    for path in sorted(_GENERATOR_DIR.glob("*.py")):
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+class _DependencyHasher:
+    """
+    Hashes source files along with the modules they import. Modules are looked up in the ``roots``
+    directories, other imports, e.g. of SymPy, are not followed.
+    """
+
+    def __init__(self, roots: Sequence[Path]) -> None:
+        self.roots = list(dict.fromkeys(r.resolve() for r in roots))
+        self._hashes: dict[Path, str] = {}
+        self._imports: dict[Path, list[Path]] = {}
+
+    def _file_hash(self, path: Path) -> str:
+        digest = self._hashes.get(path)
+        if digest is None:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            self._hashes[path] = digest
+        return digest
+
+    def _find(self, name: str) -> list[Path]:
+        """Returns the files of the module ``name`` and of its parent packages."""
+
+        parts = name.split(".")
+        for root in self.roots:
+            found = []
+            for i in range(1, len(parts) + 1):
+                directory = root.joinpath(*parts[:i])
+                if (directory / "__init__.py").is_file():
+                    found.append(directory / "__init__.py")
+                elif i == len(parts) and directory.with_suffix(".py").is_file():
+                    found.append(directory.with_suffix(".py"))
+                else:
+                    break
+            if found:
+                return found
+        return []
+
+    def _module_name(self, path: Path) -> Optional[str]:
+        for root in self.roots:
+            if path.is_relative_to(root):
+                parts = path.relative_to(root).with_suffix("").parts
+                return ".".join(parts[:-1] if parts[-1] == "__init__" else parts)
+        return None
+
+    def _direct_imports(self, path: Path) -> list[Path]:
+        imports = self._imports.get(path)
+        if imports is not None:
+            return imports
+
+        module = self._module_name(path)
+        package = (module if path.name == "__init__.py" else module.rpartition(".")[0]) if (
+            module is not None) else None
+        names: list[str] = []
+        try:
+            tree = ast.parse(path.read_bytes())
+        except SyntaxError:
+            tree = ast.Module(body=[], type_ignores=[])
+        for node in ast.walk(tree):
+            if isinstance(node, ast.Import):
+                names.extend(a.name for a in node.names)
+            elif isinstance(node, ast.ImportFrom):
+                base = node.module or ""
+                if node.level:
+                    if package is None:
+                        continue
+                    parent = package.split(".")[:len(package.split(".")) - node.level + 1]
+                    base = ".".join(parent + ([base] if base else []))
+                # imported names might be modules as well
+                names.append(base)
+                names.extend(f"{base}.{a.name}" for a in node.names)
+
+        imports = list(dict.fromkeys(f for n in names if n for f in self._find(n)))
+        self._imports[path] = imports
+        return imports
+
+    def hash(self, path: Path, extra: bytes = b"") -> str:
+        """Returns the hash of ``path`` and ``extra`` along with the modules ``path`` imports."""
+
+        path = path.resolve()
+        digest = hashlib.sha256(path.read_bytes() + extra)
+        seen = {path}
+        stack = [path]
+        while stack:
+            for dependency in self._direct_imports(stack.pop()):
+                if dependency not in seen:
+                    seen.add(dependency)
+                    stack.append(dependency)
+
+        for dependency in sorted(seen - {path}):
+            digest.update(str(dependency).encode())
+            digest.update(self._file_hash(dependency).encode())
+        return digest.hexdigest()
+
+
+def _load_manifest(output_dir: str) -> dict[str, Any]:
+    """
+    Returns\\:
+
+    * the entries of the manifest in ``output_dir`` keyed by the source file paths.
+
+    * an empty dictionary if there is no manifest or it has been written by another version of the
+      generator.
+    """
+
+    try:
+        with open(Path(output_dir, _MANIFEST_NAME), "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (OSError, ValueError):
+        return {}
+
+    if manifest.get("generator") != _generator_hash():
+        return {}
+    return manifest.get("files", {})
+
+
+def _save_manifest(output_dir: str, entries: dict[str, Any]) -> None:
+    manifest = {"generator": _generator_hash(), "files": entries}
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+    with open(Path(output_dir, _MANIFEST_NAME), "w", encoding="utf-8") as file:
+        json.dump(manifest, file, indent=1, sort_keys=True)
+
+
+class _InlineExecutor(Executor):
+    """Runs the submitted calls immediately in the current process."""
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future[Any]:
+        future: Future[Any] = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            future.set_exception(e)
+        return future
+
+
+class _Builder:
+    """Schedules the processing of source files, skipping the unchanged ones."""
+
+    def __init__(self, executor: Executor, output_dir: str, previous: dict[str, Any],
+        quiet: bool) -> None:
+        self.executor = executor
+        self.output_dir = output_dir
+        self.previous = previous
+        self.quiet = quiet
+        self.entries: dict[str, Any] = {}
+        self.report = DocsBuildReport()
+
+    def _is_unchanged(self, source: str, digest: str) -> bool:
+        entry = self.previous.get(source)
+        if entry is None or entry["hash"] != digest:
+            return False
+        output = entry["output"]
+        return output is None or Path(self.output_dir, output + ".rst").exists()
+
+    def run(self, tasks: Sequence[tuple[str, str, Callable[..., Optional[str]], tuple[Any, ...]]]
+           ) -> list[Optional[str]]:
+        """
+        Runs ``tasks`` given as tuples of the source path, the content hash, the processing
+        function and its arguments. Returns the stems of the generated files in the same order.
+        """
+
+        futures: list[Optional[Future[tuple[Optional[str], float]]]] = []
+        for source, digest, function, args in tasks:
+            if self._is_unchanged(source, digest):
+                futures.append(None)
+            else:
+                futures.append(self.executor.submit(_timed, function, *args))
+
+        results: list[Optional[str]] = []
+        for (source, digest, _, _), future in zip(tasks, futures):
+            if future is None:
+                output = self.previous[source]["output"]
+                self.report.skipped.append(source)
+            else:
+                output, elapsed = future.result()
+                self.report.generated[source] = elapsed
+                if not self.quiet:
+                    print(f"Generated rST for {source} in {elapsed:.2f} s.")
+            self.entries[source] = {"hash": digest, "output": output}
+            results.append(output)
+        return results
+
+
+def generate_laws_docs(source_dir: str,
+    output_dir: str,
+    exclude_dirs: Sequence[str],
+    quiet: bool,
+    *,
+    jobs: Optional[int] = None,
+    incremental: bool = True) -> DocsBuildReport:
     """
     Generates rST files for laws and packages, reading recursively starting from ``source_dir``,
     but avoiding ``exclude_dirs``.
 
     Writes the resulting files in ``output_dir``.
+
+    Modules are processed by ``jobs`` processes, which defaults to the number of CPUs. If ``jobs``
+    is ``1``, modules are processed in the current process. If ``incremental`` is `True`, modules
+    that have not changed since the previous run are skipped.
+
+    Suppresses generating messages if ``quiet`` is `True`.
     """
 
+    start = time.perf_counter()
     exclude_dirs_paths = [Path(source_dir, e) for e in exclude_dirs]
 
+    directories: list[tuple[Path, list[str], list[str]]] = []
     for path, dirs, files in os.walk(source_dir):
         path = Path(path)
 
@@ -168,16 +399,47 @@ def generate_laws_docs(source_dir: str, output_dir: str, exclude_dirs: Sequence[
         dirs.sort()
         files.sort()
 
-        laws: list[str] = []
-        for file in files:
-            law_name = _process_law(path, file, output_dir, quiet)
-            if law_name is None:
+        laws = [f for f in files if not f.startswith("__") and f.endswith(".py")]
+        directories.append((path, laws, list(dirs)))
+
+    hasher = _DependencyHasher([Path(source_dir).parent, _PACKAGE_ROOT])
+    previous = _load_manifest(output_dir) if incremental else {}
+    executor: Executor = _InlineExecutor() if jobs == 1 else ProcessPoolExecutor(jobs)
+    builder = _Builder(executor, output_dir, previous, quiet)
+    try:
+        law_tasks = []
+        for path, laws, _ in directories:
+            for law in laws:
+                source = path / law
+                law_tasks.append((str(source), hasher.hash(source), _process_law,
+                    (str(path), law, output_dir)))
+        law_names = iter(builder.run(law_tasks))
+
+        package_tasks = []
+        for path, laws, dirs in directories:
+            package_laws = [n for n in (next(law_names) for _ in laws) if n is not None]
+            source = path / "__init__.py"
+            # the package page also lists its laws and sub-packages
+            digest = hasher.hash(source, "\n".join(package_laws + dirs).encode())
+            package_tasks.append((str(source), digest, _process_law_package,
+                (str(path), package_laws, dirs, output_dir)))
+        builder.run(package_tasks)
+    finally:
+        executor.shutdown()
+        for source, entry in previous.items():
+            if source in builder.entries or Path(source).exists() or entry["output"] is None:
                 continue
-            laws.append(law_name)
+            Path(output_dir, entry["output"] + ".rst").unlink(missing_ok=True)
+            builder.report.removed.append(entry["output"])
+        _save_manifest(output_dir, builder.entries)
 
-        package_name = _process_law_package(path, laws, dirs, output_dir, quiet)
-        if package_name is None:
-            continue
+    report = builder.report
+    if not quiet:
+        print(f"Generated {len(report.generated)} rST files, skipped {len(report.skipped)} "
+            f"unchanged files in {time.perf_counter() - start:.2f} s.")
+        for source, elapsed in report.slowest(5):
+            print(f"  {elapsed:.2f} s  {source}")
+    return report
 
 
-__all__ = ["generate_laws_docs"]
+__all__ = ["DocsBuildReport", "generate_laws_docs"]
@@ -10,7 +10,8 @@ temperature. This law is known as the *Wien's displacement law*.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Wien%27s_displacement_law>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     quantities,
@@ -19,7 +19,8 @@ power of the black body's thermodynamic temperature.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Stefan%E2%80%93Boltzmann_law>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
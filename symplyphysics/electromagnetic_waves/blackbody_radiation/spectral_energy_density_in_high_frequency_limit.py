@@ -22,7 +22,8 @@ thermal emission, but fails to do that for long-wavelength (i.e. low-frequency)
 #. `Wikipedia <https://en.wikipedia.org/wiki/Wien_approximation>`__.
 """
 
-from sympy import Eq, exp, pi, Symbol as SymSymbol, solve, S
+from sympy import Eq, exp, pi, Symbol as SymSymbol, S
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.quantities import planck, speed_of_light, boltzmann_constant
 from symplyphysics.core.expr_comparisons import expr_equals
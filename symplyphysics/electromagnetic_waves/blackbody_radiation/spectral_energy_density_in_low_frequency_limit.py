@@ -23,7 +23,8 @@ known as the *ultraviolet catastrophe*.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Rayleigh%E2%80%93Jeans_law>`__.
 """
 
-from sympy import Eq, pi, Symbol as SymSymbol, solve
+from sympy import Eq, pi, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.quantities import planck, speed_of_light, boltzmann_constant
 from symplyphysics.core.expr_comparisons import expr_equals
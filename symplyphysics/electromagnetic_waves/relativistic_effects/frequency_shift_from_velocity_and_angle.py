@@ -19,7 +19,8 @@ See :ref:`Longitudinal frequency shift from speed`.
     TODO find link with angles
 """
 
-from sympy import Eq, cos, solve, sqrt
+from sympy import Eq, cos, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
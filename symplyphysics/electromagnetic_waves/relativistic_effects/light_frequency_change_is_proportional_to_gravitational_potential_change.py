@@ -25,7 +25,8 @@ between the change in light's frequency and the change in the gravitational pote
 #. Formula 72.4 on p. 378 of "General Course of Physics" (Obschiy kurs fiziki), vol. 1 by Sivukhin D.V. (1979).
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Symbol,
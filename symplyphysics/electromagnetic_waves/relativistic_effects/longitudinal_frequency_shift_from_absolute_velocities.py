@@ -28,7 +28,8 @@ This law is used to show the connection between classical and relativistic Doppl
     TODO add link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
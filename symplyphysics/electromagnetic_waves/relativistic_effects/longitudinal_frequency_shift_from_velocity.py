@@ -24,7 +24,8 @@ calculation of the Doppler effect.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Relativistic_Doppler_effect#Relativistic_longitudinal_Doppler_effect>`__.
 """
 
-from sympy import Eq, pi, solve, sqrt, simplify
+from sympy import Eq, pi, sqrt
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (
     Quantity,
     validate_input,
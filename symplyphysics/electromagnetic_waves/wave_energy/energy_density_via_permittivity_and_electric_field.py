@@ -10,7 +10,8 @@ on the strength of the electric field at that point.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_field#Energy_in_the_electric_field>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 energy_density = symbols.energy_density
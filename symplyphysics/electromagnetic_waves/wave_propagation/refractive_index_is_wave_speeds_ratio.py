@@ -17,7 +17,8 @@ slower the wave propagates in the refracting medium relative to the incident med
 #. `Wikipedia, first equation <https://en.wikipedia.org/wiki/Refractive_index#Definition>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ of the medium.
     TODO move to `electrodynamics` or `optics`?
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import validate_input, validate_output, convert_to_float, symbols
 
 refractive_index = symbols.relative_refractive_index
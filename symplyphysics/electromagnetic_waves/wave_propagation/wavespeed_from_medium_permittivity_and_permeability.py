@@ -14,7 +14,8 @@ permeability of the medium.
 #. `Wikipedia, derivable from here <https://en.wikipedia.org/wiki/Phase_velocity#Refractive_index>`__.
 """
 
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, quantities, symbols)
 
 wave_speed = symbols.phase_speed
@@ -13,7 +13,8 @@ Speed of electromagnetic wave propagation depends on the refractive index of the
 #. `Wikipedia <https://en.wikipedia.org/wiki/Phase_velocity#Refractive_index>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, quantities, symbols
 
 wave_speed = symbols.phase_speed
@@ -14,7 +14,8 @@ of the admittances of individual components.
 #. `Electronics Tutorials, "Admittance of a Parallel RLC Circuit" <https://www.electronics-tutorials.ws/accircuits/parallel-circuit.html>`__.
 """
 
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, validate_input, validate_output, global_index,
     IndexedSum, symbols)
 from symplyphysics.core.symbols.symbols import clone_as_indexed
@@ -15,7 +15,8 @@ Also see :ref:`Impedance definition <Impedance is resistance and reactance>`
 #. `Wikipedia – Admittance <https://en.wikipedia.org/wiki/Admittance>`__
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 admittance = symbols.admittance
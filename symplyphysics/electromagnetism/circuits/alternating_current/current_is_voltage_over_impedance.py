@@ -23,7 +23,8 @@ law <Current is voltage over resistance>`.
 #. `Univeristy of Maryland — Complex impedance method for AC circuits <https://physics.umd.edu/~jacobson/273c/impedance.pdf>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 current = symbols.current
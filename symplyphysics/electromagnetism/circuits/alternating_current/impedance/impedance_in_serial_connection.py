@@ -14,7 +14,8 @@ of the impedances of individual components.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electrical_impedance#Series_combination>`__.
 """
 
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, IndexedSum, global_index,
     symbols)
 from symplyphysics.core.symbols.symbols import clone_as_indexed
@@ -20,7 +20,8 @@ for steady-state AC analysis.
 #. `Wikipedia – Electrical impedance <https://en.wikipedia.org/wiki/Electrical_impedance#Complex_impedance>`__
 """
 
-from sympy import (I, Eq, solve)
+from sympy import (I, Eq)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 impedance = symbols.electrical_impedance
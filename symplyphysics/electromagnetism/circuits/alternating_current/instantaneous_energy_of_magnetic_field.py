@@ -15,7 +15,8 @@ of the current, the time and the initial phase.
        I(t) = I_\\text{max} \\cos(\\omega t + \\varphi)
 """
 
-from sympy import Eq, solve, cos
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 
 energy = symbols.energy
@@ -17,7 +17,8 @@ efficiency. It is the ratio of real power to apparent power of the circuit.
     TODO Move law to circuits folder?
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 
 apparent_power = clone_as_symbol(symbols.power, display_symbol="S", display_latex="S")
@@ -14,7 +14,8 @@ capacitances of individual capacitors.
 #. `Physics LibreTexts, formula 8.3.9 <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/University_Physics_II_-_Thermodynamics_Electricity_and_Magnetism_(OpenStax)/08%3A_Capacitance/8.03%3A_Capacitors_in_Series_and_in_Parallel>`__.
 """
 
-from sympy import Eq, Idx, solve, symbols as sympy_symbols
+from sympy import Eq, Idx, symbols as sympy_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
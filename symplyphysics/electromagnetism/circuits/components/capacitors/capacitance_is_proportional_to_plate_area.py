@@ -15,7 +15,8 @@ on the permittivity of the medium that fills the space between the plates.
 #. `Wikipedia, formula in box <https://en.wikipedia.org/wiki/Capacitor#Parallel-plate_capacitor>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
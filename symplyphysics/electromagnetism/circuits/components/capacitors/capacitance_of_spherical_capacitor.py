@@ -12,7 +12,8 @@ filled with a dielectric medium. See `Figure`_.
 #. `Physics Bootcamp, formula 34.3.1 <http://www.physicsbootcamp.org/Spherical-Capacitor.html>`__.
 """
 
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
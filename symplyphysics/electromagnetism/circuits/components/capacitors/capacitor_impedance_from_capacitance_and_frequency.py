@@ -11,7 +11,8 @@ capacitor is infinite, i.e. it is considered to be an opened connection.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Electrical_impedance#Inductor_and_capacitor_(in_the_steady_state)>`__.
 """
 
-from sympy import I, Eq, solve
+from sympy import I, Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
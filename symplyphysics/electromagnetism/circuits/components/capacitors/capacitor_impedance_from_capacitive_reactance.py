@@ -8,7 +8,8 @@ When the serial resistance of ideal capacitor is zero, its impedance depends on
     TODO: find link
 """
 
-from sympy import I, Eq, solve
+from sympy import I, Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 impedance = symbols.electrical_impedance
@@ -9,7 +9,8 @@ Capacitors store energy in the electric field when they are charged.
 #. `Wikipedia, third line of equations <https://en.wikipedia.org/wiki/Capacitor#Parallel-plate_capacitor>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
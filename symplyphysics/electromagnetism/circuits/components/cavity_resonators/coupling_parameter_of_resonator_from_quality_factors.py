@@ -10,7 +10,8 @@ external circuit.
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Symbol,
     validate_input,
@@ -9,7 +9,8 @@ equal to the ratio of the resonator's resistance to the load resistance.
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
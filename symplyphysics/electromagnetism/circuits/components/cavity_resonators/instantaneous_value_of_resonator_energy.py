@@ -10,7 +10,8 @@ its quality factor, initial energy value, time and angular frequency.
     TODO: find link
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
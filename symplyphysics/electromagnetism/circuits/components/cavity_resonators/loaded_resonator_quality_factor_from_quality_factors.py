@@ -9,7 +9,8 @@ resonator and the quality factor of the external circuit connected to the resona
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     validate_input,
     validate_output,
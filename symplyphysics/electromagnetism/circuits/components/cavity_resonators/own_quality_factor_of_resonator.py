@@ -9,7 +9,8 @@ resistance, inductance, and angular oscillation frequency.
     TODO: fix file name
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
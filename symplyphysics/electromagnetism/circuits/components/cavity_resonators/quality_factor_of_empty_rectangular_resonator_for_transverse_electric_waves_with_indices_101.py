@@ -14,7 +14,8 @@ walls of the resonator.
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
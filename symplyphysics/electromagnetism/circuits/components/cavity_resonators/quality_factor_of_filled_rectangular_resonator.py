@@ -11,7 +11,8 @@ the losses in the dielectric.
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (convert_to_float, validate_input, validate_output, symbols,
     clone_as_symbol)
 
@@ -13,7 +13,8 @@ A rectangular resonator consists of metal walls and a material filling it.
 #. `Mahatma Gandhi Central University, formula 17 on page 12 (PDF file) <https://mgcub.ac.in/pdf/material/20200427120209be39415ad1.pdf>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -17,7 +17,8 @@ these waves add up in phase; here :math:`N` is the interference order.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, quantities
 
 frequency = symbols.temporal_frequency
@@ -11,7 +11,8 @@ calculated from the ratio of resistances of the resistors.
     TODO: fix file name
 """
 
-from sympy import Eq, solve, exp, acosh
+from sympy import Eq, exp, acosh
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
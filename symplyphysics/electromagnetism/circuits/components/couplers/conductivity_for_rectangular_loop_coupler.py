@@ -11,7 +11,8 @@ coupler is connected and the power ratio at the outputs.
     TODO: rename file
 """
 
-from sympy import Eq, solve, Matrix, sqrt
+from sympy import Eq, Matrix, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
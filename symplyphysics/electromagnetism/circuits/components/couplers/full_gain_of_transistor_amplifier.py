@@ -9,7 +9,8 @@ matching circuits and the transistor gain.
     TODO: find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     validate_input,
     validate_output,
@@ -14,7 +14,8 @@ different widths. There are four such sections in total and each has its own imp
     TODO: find link
 """
 
-from sympy import Eq, solve, Matrix, sqrt
+from sympy import Eq, Matrix, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -10,7 +10,8 @@ connected and the load resistance.
     TODO: find link
 """
 
-from sympy import Eq, solve, pi, acos, sqrt
+from sympy import Eq, pi, acos, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
@@ -10,7 +10,8 @@ into the auxiliary channel of the coupler.
     TODO: find link
 """
 
-from sympy import Eq, solve, sin, asin, log
+from sympy import Eq, sin, asin, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     validate_input,
     validate_output,
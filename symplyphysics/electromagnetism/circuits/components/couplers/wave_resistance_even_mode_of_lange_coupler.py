@@ -16,7 +16,8 @@ of coupler segments, it is possible to calculate the wave impedance for an even
     TODO: rename file to mention wave *impedance*
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
@@ -17,7 +17,8 @@ calculate the wave impedance for an odd mode.
     TODO: rename file to mention wave *impedance*
 """
 
-from sympy import Eq, solve, sqrt, evaluate
+from sympy import Eq, sqrt, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
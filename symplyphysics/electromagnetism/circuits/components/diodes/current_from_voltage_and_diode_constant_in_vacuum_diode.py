@@ -18,7 +18,8 @@ electrodes of the vacuum diode.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Space_charge#In_vacuum_(Child's_law)>`__.
 """
 
-from sympy import Eq, solve, Rational
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -15,7 +15,8 @@ electrodes of the vacuum triode.
     TODO: find link in English
 """
 
-from sympy import Eq, Rational, solve
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
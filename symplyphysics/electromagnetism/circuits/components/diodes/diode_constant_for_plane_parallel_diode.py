@@ -20,7 +20,8 @@ electrodes.
 #. `Wikipedia, derivable from first formula <https://en.wikipedia.org/wiki/Space_charge#In_vacuum_(Child's_law)>`__.
 """
 
-from sympy import Eq, Rational, solve, sqrt
+from sympy import Eq, Rational, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.quantities import vacuum_permittivity, elementary_charge, electron_rest_mass
 
@@ -17,7 +17,8 @@ the anode.
     TODO: find link
 """
 
-from sympy import Eq, Rational, solve, sqrt
+from sympy import Eq, Rational, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ anode and cathode are known.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 internal_resistance = symbols.electrical_resistance
@@ -15,7 +15,8 @@ the anode.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.quantities import elementary_charge, electron_rest_mass
 
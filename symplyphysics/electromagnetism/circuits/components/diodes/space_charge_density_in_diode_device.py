@@ -13,7 +13,8 @@ contains a vacuum chamber, a thermionic cathode, a mesh electrode and an anode.
     TODO: find link
 """
 
-from sympy import Eq, solve, Rational
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ parameter and the voltage between the anode and cathode are known.
     TODO: find link
 """
 
-from sympy import Eq, Rational, solve, sqrt
+from sympy import Eq, Rational, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
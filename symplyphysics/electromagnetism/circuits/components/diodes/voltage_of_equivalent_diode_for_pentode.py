@@ -10,7 +10,8 @@ calculated.
     TODO: find link
 """
 
-from sympy import Eq, Rational, solve
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
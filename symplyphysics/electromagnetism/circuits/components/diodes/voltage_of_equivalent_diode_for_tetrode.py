@@ -10,7 +10,8 @@ equivalent diode can be calculated.
     TODO: find link
 """
 
-from sympy import Eq, Rational, solve
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 
 equivalent_diode_voltage = symbols.voltage
@@ -7,7 +7,8 @@ is given by approximating functions of the order of :math:`n`.
 
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Symbol,
     validate_input,
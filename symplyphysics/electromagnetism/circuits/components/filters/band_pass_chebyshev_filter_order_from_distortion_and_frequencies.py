@@ -17,7 +17,8 @@ only passes frequencies from a certain frequency range.
     TODO: fix file name
 """
 
-from sympy import Eq, solve, acosh, ceiling
+from sympy import Eq, acosh, ceiling
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
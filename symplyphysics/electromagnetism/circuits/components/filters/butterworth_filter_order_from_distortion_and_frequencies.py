@@ -8,7 +8,8 @@ The approximation of the power transmission coefficient of a normalized low-pass
     TODO: find link
 """
 
-from sympy import Eq, solve, log, ceiling
+from sympy import Eq, log, ceiling
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
@@ -9,7 +9,8 @@ is given by approximating functions of the order of :math:`n`.
     TODO: find link
 """
 
-from sympy import Expr, Eq, solve, ceiling
+from sympy import Expr, Eq, ceiling
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
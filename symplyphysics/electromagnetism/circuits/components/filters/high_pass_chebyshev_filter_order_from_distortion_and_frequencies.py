@@ -12,7 +12,8 @@ filter removes all frequencies from :math:`0` to the set frequency.
     TODO: find link
 """
 
-from sympy import Eq, solve, acosh, ceiling
+from sympy import Eq, acosh, ceiling
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
@@ -9,7 +9,8 @@ frequency :math:`f`. In this case, a low-pass filter is considered. The low-pass
 lets through all frequencies from :math:`0` to the set frequency.
 """
 
-from sympy import Eq, solve, acos, ceiling
+from sympy import Eq, acos, ceiling
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
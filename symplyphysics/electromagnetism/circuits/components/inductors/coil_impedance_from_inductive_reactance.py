@@ -9,7 +9,8 @@ the real part of coil impedance is zero.
     TODO: find link
 """
 
-from sympy import (I, Eq, solve)
+from sympy import (I, Eq)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 impedance = symbols.electrical_impedance
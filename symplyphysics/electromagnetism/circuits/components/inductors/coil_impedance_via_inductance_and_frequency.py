@@ -10,7 +10,8 @@ current. It is a purely imaginary quantity since the resistance of a coil is zer
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Electrical_impedance#Inductor_and_capacitor>`__.
 """
 
-from sympy import I, Eq, solve
+from sympy import I, Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ through it.
 #. `Wikipedia, formula in box <https://en.wikipedia.org/wiki/Inductor#Derivation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -15,7 +15,8 @@ of the inductances of individual components.
 #. `Electrical 4 U <https://www.electrical4u.com/series-and-parallel-inductors/>`__.
 """
 
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
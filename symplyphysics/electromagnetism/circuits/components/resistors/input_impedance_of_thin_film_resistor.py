@@ -10,7 +10,8 @@ on the angular frequency.
     TODO: find link
 """
 
-from sympy import Eq, solve, I
+from sympy import Eq, I
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 input_impedance = symbols.electrical_impedance
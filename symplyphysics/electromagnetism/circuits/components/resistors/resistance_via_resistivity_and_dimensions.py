@@ -23,7 +23,8 @@ property of the material and does not depend on its geometry.
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Electrical_resistance_and_conductance#Relation_to_resistivity_and_conductivity>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 resistance = symbols.electrical_resistance
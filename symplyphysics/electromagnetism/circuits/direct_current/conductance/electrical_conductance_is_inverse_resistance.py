@@ -13,7 +13,8 @@ Electrical conductance is inverse resistance
 #. `Wikipedia – Electrical resistance and conductance <https://en.wikipedia.org/wiki/Electrical_resistance_and_conductance>`__
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 conductance = symbols.electrical_conductance
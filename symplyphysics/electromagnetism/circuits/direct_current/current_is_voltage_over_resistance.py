@@ -18,7 +18,8 @@ inversely proportional to its resistance. This is also known as the **Ohm's law*
 #. `Wikipedia <https://en.wikipedia.org/wiki/Ohm%27s_law>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 current = symbols.current
@@ -11,7 +11,8 @@ instantaneous power in the circuit.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_power#Resistive_circuits>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
@@ -9,7 +9,8 @@ Electric power can be expressed using current flowing through a conductor and vo
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_power#Resistive_circuits>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 power = symbols.power
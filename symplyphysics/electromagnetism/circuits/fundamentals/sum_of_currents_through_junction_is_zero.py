@@ -18,7 +18,8 @@ known as the **first Kirchhoff's law**, or the **Kirchhoff's junction rule**.
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -12,7 +12,8 @@ This law is also known as **Kirchhoff's second law**, or **Kirchhoff's loop rule
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
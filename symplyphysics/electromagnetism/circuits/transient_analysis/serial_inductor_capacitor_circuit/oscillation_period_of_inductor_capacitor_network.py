@@ -15,15 +15,14 @@ resonant frequency.
 from sympy import (
     Eq,
     Idx,
-    solve,
     pi,
     sqrt,
     Derivative,
-    simplify,
     Symbol as SymSymbol,
     Function as SymFunction,
     symbols as sym_symbols,
 )
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -17,7 +17,8 @@ reaches the voltage of the source.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Capacitor#RC_circuits>`__.
 """
 
-from sympy import Derivative, Eq, Idx, solve, exp, simplify
+from sympy import Derivative, Eq, Idx, exp
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (
     Quantity,
     validate_input,
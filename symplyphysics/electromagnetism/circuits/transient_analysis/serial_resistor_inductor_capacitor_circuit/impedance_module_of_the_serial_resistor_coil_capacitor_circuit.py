@@ -10,7 +10,8 @@ in series. Then you can find the impedance module of such a circuit.
 #. `Wikipedia, derivable from first formula <https://en.wikipedia.org/wiki/Electrical_impedance#Resistance_vs_reactance>`__.
 """
 
-from sympy import (Eq, solve, sqrt, Idx, expand)
+from sympy import (Eq, sqrt, Idx, expand)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, Symbol, validate_input, validate_output, global_index,
     symbols, clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
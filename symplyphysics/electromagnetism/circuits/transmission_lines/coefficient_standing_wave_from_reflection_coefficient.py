@@ -13,7 +13,8 @@ wave.
     TODO: fix file name
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import validate_input, validate_output, convert_to_float, symbols
 
 standing_wave_ratio = symbols.standing_wave_ratio
@@ -13,7 +13,8 @@ value of voltage in the transmission line.
     TODO: fix file name
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
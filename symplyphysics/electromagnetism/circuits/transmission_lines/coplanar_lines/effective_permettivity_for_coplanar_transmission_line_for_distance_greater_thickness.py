@@ -19,7 +19,8 @@ See below for symbol descriptions.
     TODO: add link
 """
 
-from sympy import Eq, solve, root, pi, log, sinh, evaluate
+from sympy import Eq, root, pi, log, sinh, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -15,7 +15,8 @@ be calculated directly from the relative permittivity of the substrate.
     TODO: add link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     validate_input,
     validate_output,
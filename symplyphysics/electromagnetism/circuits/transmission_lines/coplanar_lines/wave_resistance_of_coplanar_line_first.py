@@ -18,7 +18,8 @@ See below for symbol descriptions.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt, root, log, evaluate
+from sympy import Eq, sqrt, root, log, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
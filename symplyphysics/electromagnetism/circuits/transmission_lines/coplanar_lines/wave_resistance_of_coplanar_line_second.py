@@ -19,7 +19,8 @@ the first and last electrodes.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt, pi, log, evaluate
+from sympy import Eq, sqrt, pi, log, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -11,7 +11,8 @@ relates the input voltage and output current to the input current and output vol
 #. `Wikipedia <https://en.wikipedia.org/wiki/Two-port_network#Hybrid_parameters_(h-parameters)>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
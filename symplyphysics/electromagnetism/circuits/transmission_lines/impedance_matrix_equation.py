@@ -11,7 +11,8 @@ relates the input and output voltages to the input and output currents.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Two-port_network#Impedance_parameters_(z-parameters)>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -11,7 +11,8 @@ circuit by knowing the transmission line parameters.
     TODO: find link
 """
 
-from sympy import Eq, solve, sinh, tanh, cosh, Symbol as SymSymbol, S
+from sympy import Eq, sinh, tanh, cosh, Symbol as SymSymbol, S
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -17,7 +17,8 @@ impedance of this device.
     TODO: fix file name
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -10,7 +10,8 @@ of the transmission line.
     TODO: find link
 """
 
-from sympy import Eq, solve, tan, I
+from sympy import Eq, tan, I
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ possible to determine the input impedance of the transmission line.
     TODO: find link
 """
 
-from sympy import Eq, solve, sinh, cosh, evaluate
+from sympy import Eq, sinh, cosh, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -16,7 +16,8 @@ the system.
     TODO: find link
 """
 
-from sympy import Eq, solve, pi, log, evaluate
+from sympy import Eq, pi, log, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -19,7 +19,8 @@ the microstrip.
     TODO: find link
 """
 
-from sympy import Eq, solve, pi, log, evaluate
+from sympy import Eq, pi, log, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
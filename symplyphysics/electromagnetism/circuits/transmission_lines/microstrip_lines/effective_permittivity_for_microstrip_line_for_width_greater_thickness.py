@@ -14,7 +14,8 @@ can be calculated from its relative permittivity and physical dimensions.
     TODO: find link.
 """
 
-from sympy import Eq, solve, sqrt, Rational, evaluate
+from sympy import Eq, sqrt, Rational, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
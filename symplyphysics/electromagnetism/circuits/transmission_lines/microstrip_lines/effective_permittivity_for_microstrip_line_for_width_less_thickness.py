@@ -14,7 +14,8 @@ can be calculated from its relative permittivity and physical dimensions.
     TODO: find link.
 """
 
-from sympy import Eq, Rational, solve, sqrt, evaluate
+from sympy import Eq, Rational, sqrt, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ from its frequency-indendent effective permittivity and physical dimensions.
     TODO: find link
 """
 
-from sympy import Eq, Rational, solve, sqrt, log, evaluate
+from sympy import Eq, Rational, sqrt, log, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ calculated from its physical dimension.
     TODO: find link
 """
 
-from sympy import Eq, solve, log, pi, evaluate
+from sympy import Eq, log, pi, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -15,7 +15,8 @@ calculated from its physical dimension.
     NOTE: get rid of `substrate_thickness` since we can multiply both sides of `law` by it?
 """
 
-from sympy import Eq, solve, log, pi, evaluate
+from sympy import Eq, log, pi, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -8,7 +8,8 @@ The inductance of the microstrip line can be calculated from its physical dimens
     TODO: find link
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -9,7 +9,8 @@ microstrip and the resistance of its surface.
     TODO: find link
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ the line. Such an opening will have a certain inductance, which can be calculate
     TODO: add link
 """
 
-from sympy import Eq, solve, sqrt, log, pi, evaluate
+from sympy import Eq, sqrt, log, pi, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, quantities, symbols
 
 inductance = symbols.inductance
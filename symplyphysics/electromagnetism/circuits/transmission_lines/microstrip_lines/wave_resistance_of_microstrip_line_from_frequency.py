@@ -10,7 +10,8 @@ frequency-independent surge impedance and effective permittivity.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt, evaluate
+from sympy import Eq, sqrt, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ to calculate the absolute value of the reflection coefficient.
 #. `Engineering LibreTexts, formula 3.20.4 <https://eng.libretexts.org/Bookshelves/Electrical_Engineering/Electro-Optics/Book%3A_Electromagnetics_I_(Ellingson)/03%3A_Transmission_Lines/3.20%3A_Power_Flow_on_Transmission_Lines>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ possible to calculate the reflection coefficient.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Reflection_coefficient#Relation_to_load_impedance>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
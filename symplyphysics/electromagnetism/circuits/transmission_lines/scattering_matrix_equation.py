@@ -17,7 +17,8 @@ and output.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Scattering_parameters#Two-port_S-parameters>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -19,7 +19,8 @@ parameters of the transmission matrix.
     TODO: make laws for the S-parameters, see second link above.
 """
 
-from sympy import Eq, solve, Matrix, evaluate
+from sympy import Eq, Matrix, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, validate_input, dimensionless, convert_to_float,
     symbols, Symbol)
 from symplyphysics.core.dimensions import assert_equivalent_dimension
@@ -14,7 +14,8 @@ output voltage and output current.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Two-port_network#ABCD-parameters>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
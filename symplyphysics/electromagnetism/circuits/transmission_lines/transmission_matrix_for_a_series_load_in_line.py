@@ -18,7 +18,8 @@ the load.
     TODO: find link
 """
 
-from sympy import Eq, solve, Matrix, S
+from sympy import Eq, Matrix, S
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
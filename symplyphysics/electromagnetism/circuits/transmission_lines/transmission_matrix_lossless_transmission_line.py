@@ -18,7 +18,8 @@ parameters :math:`A, B, C, D` of the transmission matrix of a lossless line.
     TODO: find link
 """
 
-from sympy import Eq, solve, Matrix, I, sin, cos, evaluate
+from sympy import Eq, Matrix, I, sin, cos, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
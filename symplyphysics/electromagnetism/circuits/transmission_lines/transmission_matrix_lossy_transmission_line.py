@@ -17,7 +17,8 @@ calculate the parameters :math:`A, B, C, D` of the transmission matrix of this l
     TODO: find link
 """
 
-from sympy import Eq, solve, Matrix, S, sinh, cosh
+from sympy import Eq, Matrix, S, sinh, cosh
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -20,7 +20,8 @@ transmission matrix of this line.
     TODO: find link
 """
 
-from sympy import Eq, solve, Matrix
+from sympy import Eq, Matrix
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, validate_input, dimensionless, convert_to_float,
     symbols, clone_as_symbol, Symbol)
 from symplyphysics.core.dimensions import assert_equivalent_dimension
@@ -20,7 +20,8 @@ transmission matrix of this line.
     TODO: find link
 """
 
-from sympy import Eq, solve, Matrix
+from sympy import Eq, Matrix
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -20,7 +20,8 @@ rectangular waveguides.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt, log, evaluate
+from sympy import Eq, sqrt, log, evaluate
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -12,7 +12,8 @@ the permeability and the dielectric loss angle of the insulator material.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 attenuation_coefficient = symbols.attenuation_coefficient
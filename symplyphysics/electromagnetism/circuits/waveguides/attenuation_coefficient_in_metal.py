@@ -14,7 +14,8 @@ resistance of the inner conductor.
     TODO: find link
 """
 
-from sympy import Eq, solve, pi, sqrt, ln
+from sympy import Eq, pi, sqrt, ln
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -15,7 +15,8 @@ the
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Wave_impedance#In_a_waveguide>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -12,7 +12,8 @@ than the critical one — dielectric breakdown intensity.
     TODO: find link
 """
 
-from sympy import Eq, solve, ln
+from sympy import Eq, ln
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ used to transmit radio frequency electrical signals.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt, ln
+from sympy import Eq, sqrt, ln
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -10,7 +10,8 @@ equal to :math:`1` and the second index equal to :math:`0`.
     TODO find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
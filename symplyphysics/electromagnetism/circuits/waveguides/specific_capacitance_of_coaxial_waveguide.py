@@ -12,7 +12,8 @@ inner conductor, as well as on the permittivity of the insulator material.
     TODO: find link
 """
 
-from sympy import Eq, solve, pi, ln
+from sympy import Eq, pi, ln
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
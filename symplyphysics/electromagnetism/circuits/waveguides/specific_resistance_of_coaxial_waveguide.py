@@ -13,7 +13,8 @@ signal and specific conductivity of conductor.
     TODO: find link
 """
 
-from sympy import Eq, solve, pi, sqrt
+from sympy import Eq, pi, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
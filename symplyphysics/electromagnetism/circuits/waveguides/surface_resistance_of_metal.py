@@ -12,7 +12,8 @@ frequency, magnetic permeability and specific conductivity of the metal.
     TODO: find link
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
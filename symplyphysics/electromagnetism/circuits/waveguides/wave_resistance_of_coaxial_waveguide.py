@@ -16,7 +16,8 @@ insulator material.
 
 """
 
-from sympy import Eq, solve, pi, sqrt, ln
+from sympy import Eq, pi, sqrt, ln
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -11,7 +11,8 @@ always longer than that in free space.
 #. `Microwaves101, section "Guide Wavelength" <https://www.microwaves101.com/encyclopedias/waveguide-mathematics>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
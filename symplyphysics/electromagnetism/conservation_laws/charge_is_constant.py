@@ -13,7 +13,8 @@ The total charge of any isolated system is conserved.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Charge_conservation>`__.
 """
 
-from sympy import Eq, solve, dsolve, Derivative
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -13,7 +13,8 @@ at all times.
     TODO: move to `../conservation`?
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 
 initial_charge = clone_as_symbol(symbols.charge, subscript="0")
@@ -15,7 +15,8 @@ corona discharge occurs at a certain potential difference between the electrodes
 #. `ResearchGate — "Generalization of the Townsend current-voltage characteristics of a corona discharge", p. 306, formula 1 <https://www.researchgate.net/publication/272031809_Generalization_of_the_Townsend_current-voltage_characteristics_of_a_corona_discharge>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -23,7 +23,8 @@ with a magnetic moment.
     TODO: rename file
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 magnetic_flux_density = symbols.magnetic_flux_density
@@ -20,7 +20,8 @@ of the magnetic flux density, the rotation frequency and the length of the rod.
 #. The angular velocity of the rod is constant.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -22,7 +22,8 @@ the area of the coil's contour.
 #. The angular speed of the coil's rotation constant.
 """
 
-from sympy import Eq, solve, sin
+from sympy import Eq, sin
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.electromagnetism.electrodynamics.electromotive_force import electromotive_force_induced_in_moving_contour as _emf_law
@@ -21,7 +21,8 @@ the charge accumulated in the object and inversely proportional to the voltage a
 #. `Wikipedia <https://en.wikipedia.org/wiki/Capacitance#Mutual_capacitance>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 capacitance = symbols.capacitance
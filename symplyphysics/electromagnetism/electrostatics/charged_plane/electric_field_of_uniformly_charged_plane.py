@@ -19,7 +19,8 @@ charge density.
 #. `Electric field of a uniformly charged plane <https://farside.ph.utexas.edu/teaching/316/lectures/node27.html>`__
 """
 
-from sympy import Eq, solve, symbols as sympy_symbols
+from sympy import Eq, symbols as sympy_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import quantities, Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.electromagnetism.electrostatics.electric_flux import electric_flux_of_uniform_electric_field as _flux_law
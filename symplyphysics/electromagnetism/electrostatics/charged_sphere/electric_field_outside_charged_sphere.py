@@ -21,7 +21,8 @@ of the sphere. However, due to the Gauss's law, on the inside the electric field
 #. `Wikipedia, "Spherical volume" <https://en.wikipedia.org/wiki/Electric_field#Common_formul%C3%A6>`__.
 """
 
-from sympy import (Eq, solve, pi, integrate)
+from sympy import (Eq, pi)
+from symplyphysics.core.disk_cache import integrate, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.mathematics.geometry import vector_area_is_unit_normal_times_scalar_area as _vector_area_def
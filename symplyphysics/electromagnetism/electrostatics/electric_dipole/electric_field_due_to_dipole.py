@@ -21,7 +21,8 @@ cube of the distance to the dipole and the value of the electric dipole moment.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_dipole_moment#Potential_and_field_of_an_electric_dipole>`__.
 """
 
-from sympy import Eq, solve, series, pi, Symbol as SymSymbol
+from sympy import Eq, series, pi, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
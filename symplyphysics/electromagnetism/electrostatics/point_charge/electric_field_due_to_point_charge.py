@@ -14,7 +14,8 @@ to the value of the charge and the square inverse of the distance to it.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_field#Electrostatics>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -24,7 +24,8 @@ square of the distance between them.
     TODO Flip sign of RHS, force should be positive for attraction.
 """
 
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (clone_as_symbol, symbols, Quantity, validate_input, validate_output,
     quantities)
 
@@ -10,7 +10,8 @@ to the distance to the point charge. Also see :ref:`Electrostatic potential is w
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_potential#Electric_potential_due_to_a_point_charge>`__.
 """
 
-from sympy import (Eq, solve, pi, oo)
+from sympy import (Eq, pi, oo)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -11,7 +11,8 @@ interaction belonging to the entire system.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Electric_potential_energy#Electrostatic_potential_energy_of_one_point_charge>`__.
 """
 
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
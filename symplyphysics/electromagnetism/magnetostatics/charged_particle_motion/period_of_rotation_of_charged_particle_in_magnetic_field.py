@@ -18,7 +18,8 @@ as well as by the magnetic field and it does not depend on the particle speed.
 #. `Physics LibreTexts, formula 11.4.2 <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/University_Physics_II_-_Thermodynamics_Electricity_and_Magnetism_(OpenStax)/11%3A_Magnetic_Forces_and_Fields/11.04%3A_Motion_of_a_Charged_Particle_in_a_Magnetic_Field>`__.
 """
 
-from sympy import Eq, solve, pi, symbols as sympy_symbols
+from sympy import Eq, pi, symbols as sympy_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.electromagnetism.electrodynamics.dynamics import lorentz_force_via_electromagnetic_field as _lorentz_law
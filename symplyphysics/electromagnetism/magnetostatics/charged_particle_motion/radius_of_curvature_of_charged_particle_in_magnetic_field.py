@@ -19,7 +19,8 @@ of the particle as well as by the magnetic flux density.
 #. `Physics LibreTexts, formula 11.4.1 <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/University_Physics_II_-_Thermodynamics_Electricity_and_Magnetism_(OpenStax)/11%3A_Magnetic_Forces_and_Fields/11.04%3A_Motion_of_a_Charged_Particle_in_a_Magnetic_Field>`__.
 """
 
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ the coil and volume of the core.
     TODO: use `energy_density` like in the electric field law
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, quantities, symbols
 
 energy = symbols.energy
@@ -14,7 +14,8 @@ permeability, the number of turns in the coil per unit length and its volume.
     FIXME remove either this law or `./inductance_is_proportional_to_turns_squared.py`, they are the same law
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
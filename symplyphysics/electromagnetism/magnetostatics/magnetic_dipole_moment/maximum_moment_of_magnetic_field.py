@@ -22,7 +22,8 @@ properties of a substance, that is, the ability to create and perceive a magneti
     TODO rename file
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 moment = symbols.magnetic_moment  # TODO: rename variable to magnetic_moment
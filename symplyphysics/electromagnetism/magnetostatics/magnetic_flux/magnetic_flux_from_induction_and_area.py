@@ -12,7 +12,8 @@ Magnetic flux is the flux of the vector of magnetic flux density through a certa
     TODO: make vector law
 """
 
-from sympy import (Eq, solve, cos)
+from sympy import (Eq, cos)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 magnetic_flux = symbols.magnetic_flux
@@ -17,7 +17,8 @@ the ends of the conductor to the point and the conductor.
 #. `Physics LibreTexts — infinite wire case <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/University_Physics_II_-_Thermodynamics_Electricity_and_Magnetism_(OpenStax)/12%3A_Sources_of_Magnetic_Fields/12.03%3A_Magnetic_Field_due_to_a_Thin_Straight_Wire>`__.
 """
 
-from sympy import Eq, solve, pi, cos, simplify, integrate, cot, refine, Q, sin
+from sympy import Eq, pi, cos, cot, refine, Q, sin
+from symplyphysics.core.disk_cache import integrate, simplify, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 from symplyphysics.electromagnetism.magnetostatics.straight_wire import magnetic_field_due_to_constant_filamentary_current as _biot_savart_law
 
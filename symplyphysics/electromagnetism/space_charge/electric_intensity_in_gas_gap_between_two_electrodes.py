@@ -18,7 +18,8 @@ particles is set to another electrode, then a current will flow through the gap.
    See "Mott—Gurney law".
 """
 
-from sympy import Eq, solve, sqrt, Rational
+from sympy import Eq, sqrt, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 electric_field_strength = symbols.electric_field_strength
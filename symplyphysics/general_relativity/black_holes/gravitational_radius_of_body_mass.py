@@ -23,7 +23,8 @@ and would lie entirely inside this sphere.
     TODO rename file
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -10,7 +10,8 @@ proportional to the lengths of the given vectors and the sine of the angle betwe
 #. `Wikipedia <https://en.wikipedia.org/wiki/Cross_product#Definition>`__.
 """
 
-from sympy import Eq, sin, solve
+from sympy import Eq, sin
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, Symbol, symbols
 from symplyphysics.core.dimensions import any_dimension
 from symplyphysics.core.symbols.quantities import scale_factor
@@ -11,7 +11,8 @@ the norms of the vectors and the cosine of the angle between them. Also see the
 #. `Wikipedia <https://en.wikipedia.org/wiki/Dot_product#Geometric_definition>`__.
 """
 
-from sympy import Eq, cos, solve
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, Symbol, symbols
 from symplyphysics.core.dimensions import any_dimension
 from symplyphysics.core.symbols.quantities import scale_factor
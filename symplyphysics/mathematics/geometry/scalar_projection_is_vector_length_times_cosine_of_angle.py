@@ -11,7 +11,8 @@ known.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Scalar_projection>`__.
 """
 
-from sympy import Eq, solve, cos
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, symbols, Symbol
 from symplyphysics.core.quantity_decorator import validate_output_same
 from symplyphysics.core.symbols.quantities import scale_factor
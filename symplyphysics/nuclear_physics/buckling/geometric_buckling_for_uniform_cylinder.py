@@ -14,7 +14,8 @@ Geometric buckling of a uniform cylindrical reactor is a function of its radius
 #. `Wikipedia, second row in first table <https://en.wikipedia.org/wiki/Geometric_and_material_buckling#Geometric_Buckling>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.nuclear_physics.buckling import neutron_flux_for_uniform_cylinder as cylinder_flux
 
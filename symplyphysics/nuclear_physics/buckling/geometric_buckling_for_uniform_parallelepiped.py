@@ -14,7 +14,8 @@ Geometric buckling of a uniform parallelepiped reactor is a function of its side
 #. `Wikipedia, third row in first table <https://en.wikipedia.org/wiki/Geometric_and_material_buckling#Geometric_Buckling>`__.
 """
 
-from sympy import (Eq, solve, pi)
+from sympy import (Eq, pi)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 from symplyphysics.nuclear_physics.buckling import neutron_flux_for_uniform_parallelepiped as parallelepiped_flux
 
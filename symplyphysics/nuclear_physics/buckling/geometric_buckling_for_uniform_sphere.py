@@ -9,7 +9,8 @@ Geometric buckling for a uniform spherical reactor is a function of its radius.
 #. `Wikipedia, first row in first table <https://en.wikipedia.org/wiki/Geometric_and_material_buckling#Geometric_Buckling>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.nuclear_physics.buckling import neutron_flux_for_uniform_sphere as sphere_flux
 
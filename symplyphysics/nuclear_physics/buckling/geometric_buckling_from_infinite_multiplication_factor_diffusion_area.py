@@ -10,7 +10,8 @@ and diffusion area of the neutrons.
 #. `Wikipedia, first part of second equation <https://en.wikipedia.org/wiki/Geometric_and_material_buckling#Material_Buckling>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.nuclear_physics.buckling import geometric_buckling_from_macroscopic_fission_cross_section_diffusion_coefficient as buckling_law
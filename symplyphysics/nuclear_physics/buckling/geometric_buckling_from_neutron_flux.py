@@ -11,8 +11,9 @@ is and the higher geometric buckling of the reactor is.
 #. `Wikipedia, see fourth equation <https://en.wikipedia.org/wiki/Geometric_and_material_buckling#Derivation>`__.
 """
 
-from sympy import (Eq, solve, Expr, simplify, Equality)
+from sympy import (Eq, Expr, Equality)
 from sympy.vector import Laplacian
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (SI, units, Quantity, validate_output, symbols, clone_as_function,
     Function)
 from symplyphysics.core.dimensions import collect_expression_and_dimension
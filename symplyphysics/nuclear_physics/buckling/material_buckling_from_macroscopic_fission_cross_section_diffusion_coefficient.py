@@ -10,7 +10,8 @@ as well as diffusion coefficient and average number of neutrons produced per fis
 #. `Wikipedia, last formula in paragraph <https://en.wikipedia.org/wiki/Geometric_and_material_buckling#Material_Buckling>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,8 +10,9 @@ neutron flux distribution in the multiplying system.
 #. `NuclearPower, possible similar formula <https://www.nuclear-power.com/nuclear-power/reactor-physics/neutron-diffusion-theory/diffusion-equation/>`__.
 """
 
-from sympy import Eq, Expr, solve, simplify
+from sympy import Eq, Expr
 from sympy.vector import Laplacian
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (
     SI,
     Function,
@@ -10,7 +10,8 @@ as well as fast and thermal non-leakage probabilities.
 #. `Wikipedia, formula above table <https://en.wikipedia.org/wiki/Six_factor_formula>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols
 from symplyphysics.core.symbols.probability import Probability
 
@@ -10,7 +10,8 @@ the geometric buckling associated with the given nuclear reactor.
 #. `Wikipedia, fifth row in table <https://en.wikipedia.org/wiki/Six_factor_formula>`__.
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     convert_to_float,
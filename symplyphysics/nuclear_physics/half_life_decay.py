@@ -12,7 +12,8 @@ factor of 2.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Exponential_decay#>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
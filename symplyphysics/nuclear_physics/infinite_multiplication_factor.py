@@ -12,7 +12,8 @@ factor, resonance escape probability, and thermal utilization factor.
 #. `NuclearPower <https://www.nuclear-power.com/nuclear-power/reactor-physics/nuclear-fission-chain-reaction/four-factor-formula-infinite-multiplication-factor/>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols
 from symplyphysics.core.symbols.probability import Probability
 
@@ -9,7 +9,8 @@ cross section and the average number of neutrons produced per fission.
     NOTE: possible link here, but it is about thermal fission factor <https://en.wikipedia.org/wiki/Six_factor_formula#>
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ path of neutrons is and the closer to the surface the neutron absorption will oc
     TODO: fix file name
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 mean_free_path = symbols.mean_free_path
@@ -12,7 +12,8 @@ atomic number density (concentration).
 #. `ScienceDirect <https://www.sciencedirect.com/topics/engineering/macroscopic-cross-section>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 microscopic_cross_section = symbols.cross_section
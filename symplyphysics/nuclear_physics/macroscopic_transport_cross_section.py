@@ -11,7 +11,8 @@ section and the averaged cosine of the scattering angle.
 #. `ScienceDirect, neutron transport <https://www.sciencedirect.com/topics/engineering/neutron-transport>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     Symbol,
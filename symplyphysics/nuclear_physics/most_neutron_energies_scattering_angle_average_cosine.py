@@ -10,7 +10,8 @@ target nucleus.
 #. `NuclearPower <https://www.nuclear-power.com/nuclear-power/reactor-physics/neutron-diffusion-theory/diffusion-coefficient/>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import symbols, Symbol, dimensionless
 
 mass_number = symbols.mass_number
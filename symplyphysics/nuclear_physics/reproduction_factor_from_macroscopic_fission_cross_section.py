@@ -10,7 +10,8 @@ sections in the fuel and the average number of neutrons produced per fission.
 #. `Wikipedia, first row in table <https://en.wikipedia.org/wiki/Four_factor_formula>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
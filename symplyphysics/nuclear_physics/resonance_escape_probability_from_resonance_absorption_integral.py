@@ -14,7 +14,8 @@ Resonance escape probability from resonance absorption integral
 #. `Wikipedia, third row in table <https://en.wikipedia.org/wiki/Six_factor_formula>`__.
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -11,7 +11,8 @@ and geometric buckling.
 #. `Wikipedia, last row in table <https://en.wikipedia.org/wiki/Six_factor_formula>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     convert_to_float,
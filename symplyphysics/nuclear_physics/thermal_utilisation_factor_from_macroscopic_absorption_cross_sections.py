@@ -12,7 +12,8 @@ in the fuel and the total macroscopic absorption cross section in the reactor.
 #. `Wikipedia, second row in table <https://en.wikipedia.org/wiki/Six_factor_formula>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     convert_to_float,
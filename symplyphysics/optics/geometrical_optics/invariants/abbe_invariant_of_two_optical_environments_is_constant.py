@@ -20,7 +20,8 @@ allowing one of them to be determined if the second one is known
 #. `OptoWiki <https://www.optowiki.info/glossary/abbe-invariant/>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
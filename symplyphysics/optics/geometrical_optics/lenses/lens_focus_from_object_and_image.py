@@ -14,7 +14,8 @@ This law is also called the **thin lens formula**.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Lens#Lens_equation>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 
 focus_distance = symbols.focal_length
@@ -15,7 +15,8 @@ Depending on the position of the object in relation to the lens, the linear dime
 #. `Wikipedia <https://en.wikipedia.org/wiki/Magnification#Single_lens>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
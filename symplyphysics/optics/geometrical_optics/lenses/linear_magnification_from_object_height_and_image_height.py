@@ -11,7 +11,8 @@ to object length measured in planes that are perpendicular to the optical axis.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Magnification#Single_lens>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ of axisymmetric lenses and centered optical systems made of such lenses.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Optical_power>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 
 focus_distance = symbols.focal_length
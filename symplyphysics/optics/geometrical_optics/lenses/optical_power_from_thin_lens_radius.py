@@ -14,7 +14,8 @@ surfaces and the refractive indices of the lens material and the medium.
     TODO add info about the sign convention for radii
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 
 optical_power = symbols.optical_power
@@ -13,7 +13,8 @@ the position of the image if the position of the object is known and vice versa.
     TODO find English link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -18,7 +18,8 @@ The focal length of a spherical mirror is equal to half the radius of curvature.
 #. `Spherical mirrors <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/University_Physics_III_-_Optics_and_Modern_Physics_(OpenStax)/02%3A_Geometric_Optics_and_Image_Formation/2.03%3A_Spherical_Mirrors>`__.
 """
 
-from sympy import Eq, simplify, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.optics.geometrical_optics.lenses import optical_power_of_spherical_lens_from_refractive_indices_and_distances as spherical_lens_law
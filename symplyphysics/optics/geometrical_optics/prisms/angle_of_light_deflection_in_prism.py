@@ -19,7 +19,8 @@ on the angle between the faces of the prism and the refractive index of the pris
     TODO find link in English
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -19,7 +19,8 @@ The law, also known as **Snell's law**, states that, for a given pair of media,
     TODO rename files
 """
 
-from sympy import (Eq, solve, diff, sin, pi, sqrt)
+from sympy import (Eq, diff, sin, pi, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, angle_type, validate_input, validate_output, symbols,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
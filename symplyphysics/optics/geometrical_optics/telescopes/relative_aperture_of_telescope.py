@@ -14,7 +14,8 @@ details need to be considered, that is, with planets.
 #. `Wikipedia <https://en.wikipedia.org/wiki/F-number#Notation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, convert_to_float, symbols
 
 relative_aperture = symbols.relative_aperture
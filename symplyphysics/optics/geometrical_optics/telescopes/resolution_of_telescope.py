@@ -10,7 +10,8 @@ distinguished separately in the telescope.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Angular_resolution#The_Rayleigh_criterion>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import units, Quantity, validate_input, validate_output, symbols
 
 resolution = symbols.angular_resolution
@@ -23,7 +23,8 @@ the distance to the picture.
     TODO rename file
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 
 travel_difference = symbols.optical_distance
@@ -16,7 +16,8 @@ of superposition of these waves.
 #. `Livelaptopspec <https://www.livelaptopspec.com/what-is-maximum-constructive-interference/>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 travel_difference = symbols.optical_distance
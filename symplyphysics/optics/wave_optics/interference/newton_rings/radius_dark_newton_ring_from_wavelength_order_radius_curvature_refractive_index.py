@@ -17,7 +17,8 @@ the same faces and demonstrate interference.
     TODO find English link
 """
 
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
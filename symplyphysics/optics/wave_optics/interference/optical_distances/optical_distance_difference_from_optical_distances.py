@@ -13,7 +13,8 @@ in the optical distances traversed by each of the rays
     TODO elaborate on optical distance
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
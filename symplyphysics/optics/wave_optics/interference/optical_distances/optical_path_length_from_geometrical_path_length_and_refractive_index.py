@@ -14,7 +14,8 @@ between any two points.
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Optical_path_length#>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols)
 
 optical_path = symbols.optical_distance
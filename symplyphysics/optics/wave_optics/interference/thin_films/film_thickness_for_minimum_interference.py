@@ -14,7 +14,8 @@ interfere. This law describes the result of their constructive interference.
     TODO rename file
 """
 
-from sympy import Eq, solve, cos
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -11,7 +11,8 @@ of the angle phi between the light's initial polarization direction and the axis
 #. `Wikipedia <https://en.wikipedia.org/wiki/Polarizer#Malus'_law_and_other_properties>`__.
 """
 
-from sympy import Eq, solve, cos
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
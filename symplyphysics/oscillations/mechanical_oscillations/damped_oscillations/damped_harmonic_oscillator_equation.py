@@ -14,7 +14,8 @@ Describes the motion of a single-degree-of-freedom mechanical oscillator that ex
 #. `Physics LibreTexts – Damped Oscillations (Eq. 15.6.2) <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/Book%3A_University_Physics_I_-_Mechanics_Sound_Oscillations_and_Waves_(OpenStax)/15%3A_Oscillations/15.06%3A_Damped_Oscillations>`__
 """
 
-from sympy import Derivative, Eq, dsolve
+from sympy import Derivative, Eq
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     Quantity,
     validate_input,
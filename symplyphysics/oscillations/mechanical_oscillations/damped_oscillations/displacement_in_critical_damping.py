@@ -12,7 +12,8 @@ initial velocity is nonzero. This behavior is also called *critical damping*.
 #. The system is critically damped, i.e. its damping ratio :math:`\\zeta = 1`.
 """
 
-from sympy import Eq, exp, dsolve, solve
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -12,7 +12,8 @@ to zero. This behavior is also known as *underdamping*.
 #. The system is underdamped, i.e. its damping ratio :math:`\\zeta < 1`.
 """
 
-from sympy import Eq, exp, cos, solve
+from sympy import Eq, exp, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -24,7 +24,8 @@ and (2) the angular frequency of the external force driving the oscillations.
 #. `Physics LibreTexts, derivable from (15.7.2) and (15.7.3) <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/Book%3A_University_Physics_I_-_Mechanics_Sound_Oscillations_and_Waves_(OpenStax)/15%3A_Oscillations/15.07%3A_Forced_Oscillations>`__.
 """
 
-from sympy import Eq, cos, dsolve
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     symbols,
     Quantity,
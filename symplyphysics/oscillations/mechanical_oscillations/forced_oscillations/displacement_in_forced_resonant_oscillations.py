@@ -21,7 +21,8 @@ resonance.
     TODO find link
 """
 
-from sympy import Eq, dsolve, sin
+from sympy import Eq, sin
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -19,7 +19,8 @@ natural angular frequency of the oscillator.
 #. `Physics LibreTexts, formula (15.7.1) <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/Book%3A_University_Physics_I_-_Mechanics_Sound_Oscillations_and_Waves_(OpenStax)/15%3A_Oscillations/15.07%3A_Forced_Oscillations>`__.
 """
 
-from sympy import Derivative, Eq, cos, dsolve
+from sympy import Derivative, Eq, cos
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     symbols,
     units,
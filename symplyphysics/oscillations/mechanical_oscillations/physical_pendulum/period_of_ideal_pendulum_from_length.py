@@ -17,7 +17,8 @@ Period of pendulum oscillation does not depend on its mass.
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Pendulum#Period_of_oscillation>`__.
 """
 
-from sympy import (Derivative, Eq, diff, sin, solve, pi, sqrt)
+from sympy import (Derivative, Eq, diff, sin, pi, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -11,7 +11,8 @@ mass and the distance between the pivot and the center of mass of the pendulum.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Pendulum#Compound_pendulum>`__.
 """
 
-from sympy import Eq, pi, solve, Derivative, sqrt
+from sympy import Eq, pi, Derivative, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
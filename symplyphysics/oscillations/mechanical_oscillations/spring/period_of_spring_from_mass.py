@@ -16,7 +16,8 @@ It starts oscillating after being pushed out of balance.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Spring_(device)#Frequency_&_period>`__.
 """
 
-from sympy import Derivative, Eq, diff, solve, pi, sqrt, simplify
+from sympy import Derivative, Eq, diff, pi, sqrt
+from symplyphysics.core.disk_cache import simplify, solve
 from symplyphysics import (
     Quantity,
     validate_input,
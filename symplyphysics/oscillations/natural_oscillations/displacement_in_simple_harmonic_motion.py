@@ -16,7 +16,8 @@ function of time.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Simple_harmonic_motion#Dynamics>`__.
 """
 
-from sympy import Eq, cos, dsolve
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -15,7 +15,8 @@ If :math:`F` is the only force acting on the system, the system is called a simp
 #. `Wikipedia – Simple harmonic oscillator <https://en.wikipedia.org/wiki/Harmonic_oscillator#Simple_harmonic_oscillator>`__
 """
 
-from sympy import Derivative, Eq, cos, solve, symbols as sympy_symbols
+from sympy import Derivative, Eq, cos, symbols as sympy_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_function,
     units,
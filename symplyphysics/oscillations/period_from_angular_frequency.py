@@ -11,7 +11,8 @@ The Period is inversely proportional to the angular frequency of oscillations. S
 #. `Wikipedia <https://en.wikipedia.org/wiki/Angular_frequency#Circular_motion>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.classical_mechanics.kinematics.rotational_motion import average_angular_speed_is_angular_distance_over_time as frequency_def
@@ -11,7 +11,8 @@ for additional information.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Frequency#Definitions_and_units>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
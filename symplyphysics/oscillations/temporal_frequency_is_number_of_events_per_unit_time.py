@@ -10,7 +10,8 @@ event per unit of time.
 #. `Wikipedia, see text <https://en.wikipedia.org/wiki/Frequency#>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
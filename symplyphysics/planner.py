@@ -0,0 +1,358 @@
+"""
+This module provides the law graph, which chains several laws to compute a quantity from known
+quantities. The graph is bipartite: laws are connected to the quantities their symbols represent.
+It is built from the static law catalog (see `symplyphysics.catalog`), so planning does not import
+any law module.
+
+The planner finds the cheapest chain of laws leading from the known quantities to the target. Each
+law in the chain is then compiled into a numeric kernel (see `symplyphysics.core.kernels`) and the
+chain is evaluated numerically step by step, instead of solving the whole system of laws
+symbolically.
+
+* `LawGraph` holds the graph and plans the chains.
+* `LawPlan` is a chain of `PlanStep` objects that can be evaluated over SI magnitudes or quantities.
+* `solve_chain` plans and evaluates a chain in one call.
+
+Example::
+
+    power = solve_chain("power", voltage=Quantity(3 * units.volt),
+        electrical_resistance=Quantity(2 * units.ohm))
+
+**Notes:**
+
+#. Quantities are named after the symbols of `symplyphysics.symbols` the law symbols are derived
+   from, e.g. ``"mass"`` or ``"electrical_resistance"``. Symbols that cannot be identified this way,
+   e.g. when a law has several symbols derived from the same one, are named after the law module and
+   the module member, e.g. ``"dynamics.law.initial_speed"``. Such quantities only connect to their
+   own law.
+
+#. Only laws with an explicit ``law`` equation between scalar symbols take part in the graph. Laws
+   are solved for their left-hand side symbol at a lower cost than for other symbols. If a law has
+   several solutions, the principal one is used, e.g. the positive square root, see
+   `symplyphysics.core.kernels.principal_solution`. Evaluating a step whose solution cannot be
+   chosen this way raises `ValueError`.
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Mapping, Optional
+
+import numpy as np
+from sympy.physics.units import Quantity as SymQuantity
+
+from .catalog import LawEntry, LawIndex, build_index, load_index
+from .core.dimensions import dimension_to_si_unit
+from .core.kernels import LawKernel, compile_law
+from .core.symbols.quantities import Quantity
+
+_PACKAGE_PREFIX = "symplyphysics."
+
+# symbols too generic to identify the same quantity across laws
+_GENERIC_SYMBOLS = frozenset({
+    "any_quantity",
+    "whole_number",
+    "positive_number",
+    "nonnegative_number",
+    "particle_count",
+    "probability",
+    "fractional_change",
+})
+
+_EXPLICIT_COST = 1.0
+_INVERSE_COST = 2.0
+
+
+@dataclass(frozen=True)
+class PlanStep:
+    """A law solved for one of its symbols."""
+
+    module: str
+    """Dotted path of the law module."""
+
+    target: str
+    """Name of the law symbol the law is solved for."""
+
+    output: str
+    """Name of the quantity computed by this step."""
+
+    inputs: dict[str, str]
+    """Quantities substituted into the law symbols, keyed by the symbol names."""
+
+    cost: float
+    """Cost of the step."""
+
+    def kernel(self) -> LawKernel:
+        """Compiles the principal solution of the law of this step, see `compile_law`."""
+
+        return compile_law(self.module, self.target, solution=None)
+
+
+@dataclass(frozen=True)
+class LawPlan:
+    """Chain of laws computing ``target`` from ``known`` quantities."""
+
+    target: str
+    """Name of the target quantity."""
+
+    known: frozenset[str]
+    """Names of the known quantities."""
+
+    steps: list[PlanStep] = field(default_factory=list)
+    """Steps in the order of evaluation. The last step computes the target."""
+
+    @property
+    def cost(self) -> float:
+        return sum(s.cost for s in self.steps)
+
+    @property
+    def modules(self) -> list[str]:
+        return [s.module for s in self.steps]
+
+    def kernels(self) -> list[LawKernel]:
+        return [s.kernel() for s in self.steps]
+
+    def values(self, values: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> dict[str, Any]:
+        """
+        Evaluates the chain over the known quantities given by their SI magnitudes, which can be
+        scalars or arrays that broadcast together, or by quantities. Returns the SI magnitudes of
+        the known and all computed quantities.
+
+        Raises:
+            TypeError: If some of the known quantities are missing.
+        """
+
+        known = dict(values or {}, **kwargs)
+        missing = sorted(self.known - set(known))
+        if missing:
+            raise TypeError(f"Plan for '{self.target}' is missing quantities: {', '.join(missing)}.")
+
+        result = {n: _si_magnitude(v) for n, v in known.items()}
+        for step in self.steps:
+            kernel = step.kernel()
+            result[step.output] = kernel(**{n: result[step.inputs[n]] for n in kernel.inputs})
+        return result
+
+    def __call__(self, values: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> np.ndarray:
+        """Returns the SI magnitude of the target, see `values`."""
+
+        return self.values(values, **kwargs)[self.target]
+
+    def evaluate(self, values: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Quantity:
+        """Returns the target as a quantity given scalar known quantities, see `values`."""
+
+        if not self.steps:
+            return Quantity(dict(values or {}, **kwargs)[self.target])
+
+        result = complex(self(values, **kwargs))
+        value = result.real if result.imag == 0 else result
+        dimension = self.steps[-1].kernel().output_dimension
+        return Quantity(value * dimension_to_si_unit(dimension))
+
+
+def _si_magnitude(value: Any) -> Any:
+    if not isinstance(value, SymQuantity):
+        return value
+
+    if not isinstance(value, Quantity):
+        value = Quantity(value)
+    magnitude = complex(Quantity(value / dimension_to_si_unit(value.dimension)).scale_factor)
+    return magnitude.real if magnitude.imag == 0 else magnitude
+
+
+@dataclass(frozen=True)
+class _LawNode:
+    module: str
+    output: str
+    symbols: dict[str, str]
+    """Quantity names keyed by the symbol names."""
+
+
+def _short_name(module: str) -> str:
+    return module[len(_PACKAGE_PREFIX):] if module.startswith(_PACKAGE_PREFIX) else module
+
+
+def _law_node(law: LawEntry) -> Optional[_LawNode]:
+    if law.output is None:
+        return None
+    if any(s.kind != "symbol" or s.base_dimensions is None for s in law.symbols):
+        return None
+
+    origins = [s.origin for s in law.symbols]
+    symbols: dict[str, str] = {}
+    for symbol in law.symbols:
+        if (symbol.origin is None or symbol.origin in _GENERIC_SYMBOLS or
+                origins.count(symbol.origin) > 1):
+            symbols[symbol.name] = f"{_short_name(law.module)}.{symbol.name}"
+        else:
+            symbols[symbol.name] = symbol.origin
+    return _LawNode(law.module, law.output, symbols)
+
+
+class LawGraph:
+    """Bipartite graph of laws and quantities built from the law ``index``."""
+
+    def __init__(self, index: LawIndex) -> None:
+        self._laws: list[_LawNode] = []
+        self._quantity_laws: dict[str, list[int]] = {}
+        for law in index.laws:
+            node = _law_node(law)
+            if node is None:
+                continue
+            for quantity in node.symbols.values():
+                self._quantity_laws.setdefault(quantity, []).append(len(self._laws))
+            self._laws.append(node)
+
+    @property
+    def quantities(self) -> list[str]:
+        return sorted(self._quantity_laws)
+
+    def laws_of(self, quantity: str) -> list[str]:
+        """Returns the law modules involving ``quantity``."""
+
+        return [self._laws[i].module for i in self._quantity_laws.get(quantity, [])]
+
+    def plan(
+        self,
+        target: str,
+        known: Iterable[str],
+        *,
+        exclude: Iterable[tuple[str, str]] = (),
+    ) -> LawPlan:
+        """
+        Finds the cheapest chain of laws computing ``target`` from the ``known`` quantities. Laws
+        solved for the given symbols are skipped if their pairs of the law module and the symbol
+        name are in ``exclude``.
+
+        Raises:
+            ValueError: If ``target`` cannot be computed from ``known``.
+        """
+
+        known = frozenset(known)
+        for name in [target, *known]:
+            if name not in self._quantity_laws:
+                raise ValueError(f"Quantity '{name}' does not appear in any law.")
+        excluded = set(exclude)
+
+        # generalized Dijkstra over the hypergraph of laws, a law can be solved for one of its
+        # quantities once all the other quantities of the law are computed
+        costs: dict[str, float] = {}
+        producers: dict[str, tuple[int, str]] = {}
+        pending = {i: len(set(law.symbols.values())) for i, law in enumerate(self._laws)}
+        queue: list[tuple[float, str, int, str]] = [(0.0, q, -1, "") for q in sorted(known)]
+
+        while queue:
+            cost, quantity, law_id, symbol = heapq.heappop(queue)
+            if quantity in costs:
+                continue
+            costs[quantity] = cost
+            if law_id >= 0:
+                producers[quantity] = (law_id, symbol)
+            if quantity == target:
+                break
+
+            for i in self._quantity_laws[quantity]:
+                pending[i] -= 1
+                if pending[i] != 1:
+                    continue
+                law = self._laws[i]
+                for name, missing in law.symbols.items():
+                    if missing in costs or (law.module, name) in excluded:
+                        continue
+                    step_cost = _EXPLICIT_COST if name == law.output else _INVERSE_COST
+                    total = step_cost + sum(costs[q] for q in set(law.symbols.values()) -
+                        {missing})
+                    heapq.heappush(queue, (total, missing, i, name))
+
+        if target not in costs:
+            raise ValueError(f"Quantity '{target}' cannot be computed from "
+                f"{', '.join(sorted(known)) or 'nothing'}.")
+
+        steps: list[PlanStep] = []
+        visited: set[str] = set()
+
+        def add_steps(quantity: str) -> None:
+            if quantity in visited or quantity not in producers:
+                return
+            visited.add(quantity)
+            law_id, symbol = producers[quantity]
+            law = self._laws[law_id]
+            inputs = {n: q for n, q in law.symbols.items() if n != symbol}
+            for q in inputs.values():
+                add_steps(q)
+            cost = _EXPLICIT_COST if symbol == law.output else _INVERSE_COST
+            steps.append(PlanStep(law.module, symbol, quantity, inputs, cost))
+
+        add_steps(target)
+        return LawPlan(target, known, steps)
+
+    def solve(self, target: str, values: Optional[Mapping[str, Any]] = None,
+        **kwargs: Any) -> LawPlan:
+        """
+        Plans the chain computing ``target`` from the quantities given in ``values`` and compiles
+        its kernels. Laws that cannot be solved for the planned symbols are excluded and the chain
+        is planned again.
+
+        Raises:
+            ValueError: If no chain can be compiled.
+        """
+
+        known = set(dict(values or {}, **kwargs))
+        excluded: set[tuple[str, str]] = set()
+        while True:
+            plan = self.plan(target, known, exclude=excluded)
+            failed: set[tuple[str, str]] = set()
+            for step in plan.steps:
+                try:
+                    step.kernel()
+                except ValueError:
+                    failed.add((step.module, step.target))
+            if not failed:
+                return plan
+            excluded |= failed
+
+
+def load_graph(index: Optional[LawIndex | str] = None) -> LawGraph:
+    """
+    Builds the law graph from ``index``, which is either an index or a path to an index file. By
+    default, the index is built from the package sources.
+    """
+
+    if index is None:
+        index = build_index()
+    elif not isinstance(index, LawIndex):
+        index = load_index(index)
+    return LawGraph(index)
+
+
+_default_graph: Optional[LawGraph] = None
+
+
+def solve_chain(target: str, values: Optional[Mapping[str, Any]] = None, **kwargs: Any) -> Any:
+    """
+    Computes the ``target`` quantity from the known quantities using the default law graph. Returns
+    a quantity if all known quantities are quantities, and the SI magnitude otherwise.
+    """
+
+    #pylint: disable-next=global-statement
+    global _default_graph
+    if _default_graph is None:
+        _default_graph = load_graph()
+
+    known = dict(values or {}, **kwargs)
+    plan = _default_graph.solve(target, known)
+    if known and all(isinstance(v, SymQuantity) for v in known.values()):
+        return plan.evaluate(known)
+    return plan(known)
+
+
+__all__ = [
+    "PlanStep",
+    "LawPlan",
+    "LawGraph",
+    "load_graph",
+    "solve_chain",
+]
@@ -0,0 +1,362 @@
+"""
+This module plots expressions by evaluating them on NumPy grids, instead of the adaptive sampling of
+`sympy.plotting.plot`, which evaluates expressions point by point. Expressions are compiled once
+into vectorized functions (see `symplyphysics.core.kernels`), and evaluated series are cached by
+the expression and the range, so that plotting the same curve again costs nothing. Families of
+curves that differ in the values of parameters are evaluated in one vectorized pass over a 2D grid.
+
+* `sample` evaluates an expression over a range of its variable.
+* `sample_family` evaluates an expression over a range of its variable for several values of its
+  parameters at once.
+* `sample_parametric` evaluates the components of a parametric curve.
+* `GridPlot` collects lines, families of lines and parametric curves, and renders them with
+  Matplotlib.
+
+Example::
+
+    plot = GridPlot(title="Interference of waves", xlabel="position, m", legend=True)
+    plot.family(wave, (position, -5, 5), {phase_shift: [0, pi / 2, pi]},
+        labels=["0", "pi/2", "pi"])
+    plot.show()
+
+**Notes:**
+
+#. Points at which an expression is not real or not finite are left out of the curve.
+
+#. Expressions should not depend on symbols other than the plotted variable and the parameters.
+   Quantities are replaced by their SI magnitudes.
+
+#. This module requires **NumPy** and **Matplotlib**, which can be installed via
+   ``pip install .[numeric,plots]``. Sampling does not require Matplotlib.
+"""
+
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Literal, Mapping, Optional, Sequence
+
+import numpy as np
+from sympy import Expr, Symbol as SymSymbol, sympify
+
+from .core.kernels import compile_expression, to_numeric_expression
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+
+Scale = Literal["linear", "log"]
+Bounds = tuple[SymSymbol, Any, Any]
+
+_DEFAULT_POINTS = 1000
+# relative size of imaginary parts that are considered rounding errors
+_IMAGINARY_TOLERANCE = 1e-9
+
+
+@functools.lru_cache(maxsize=None)
+def _compile(exprs: tuple[Expr, ...], variables: tuple[SymSymbol, ...]) -> Callable[..., Any]:
+    numeric = [to_numeric_expression(sympify(e)) for e in exprs]
+    unknown = set().union(*(e.free_symbols for e in numeric)) - set(variables)
+    if unknown:
+        names = sorted(str(s) for s in unknown)
+        raise ValueError(f"Expressions {list(exprs)} depend on {names}, which are not plotted.")
+    return compile_expression(numeric, variables)
+
+
+def _number(value: Any) -> float:
+    return float(to_numeric_expression(sympify(value)))
+
+
+def _real(values: Any, shape: tuple[int, ...]) -> np.ndarray:
+    values = np.broadcast_to(np.asarray(values), shape)
+    if np.iscomplexobj(values):
+        real = np.abs(values.imag) <= _IMAGINARY_TOLERANCE * np.abs(values.real)
+        values = np.where(real, values.real, np.nan)
+    values = np.array(values, dtype=float)
+    values[~np.isfinite(values)] = np.nan
+    values.setflags(write=False)
+    return values
+
+
+def _grid(start: float, stop: float, points: int, scale: Scale) -> np.ndarray:
+    if points < 2:
+        raise ValueError(f"Grid should have at least 2 points, got {points}.")
+    if scale == "log":
+        if start <= 0 or stop <= 0:
+            raise ValueError(f"Logarithmic grid should be positive, got [{start}, {stop}].")
+        grid = np.geomspace(start, stop, points)
+    else:
+        grid = np.linspace(start, stop, points)
+    grid.setflags(write=False)
+    return grid
+
+
+@functools.lru_cache(maxsize=256)
+def _sample(exprs: tuple[Expr, ...], variable: SymSymbol, start: float, stop: float, points: int,
+    scale: Scale) -> tuple[np.ndarray, ...]:
+    function = _compile(exprs, (variable,))
+    grid = _grid(start, stop, points, scale)
+    with np.errstate(all="ignore"):
+        values = function(grid)
+    return (grid, *(_real(v, grid.shape) for v in values))
+
+
+@functools.lru_cache(maxsize=256)
+def _sample_family(expr: Expr, variable: SymSymbol, start: float, stop: float,
+    parameters: tuple[tuple[SymSymbol, tuple[float, ...]], ...], points: int,
+    scale: Scale) -> tuple[np.ndarray, np.ndarray]:
+    function = _compile((expr,), (variable, *(p for p, _ in parameters)))
+    grid = _grid(start, stop, points, scale)
+    # parameters vary along the first axis of the grid, the variable along the second one
+    values = [np.array(v)[:, np.newaxis] for _, v in parameters]
+    with np.errstate(all="ignore"):
+        (result,) = function(grid, *values)
+    return grid, _real(result, (len(parameters[0][1]), points))
+
+
+def sample(expr: Expr,
+    bounds: Bounds,
+    *,
+    points: int = _DEFAULT_POINTS,
+    scale: Scale = "linear") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates ``expr`` over the range ``bounds = (variable, start, stop)``.
+
+    Args:
+        expr: Expression of ``variable``.
+        bounds: The variable and the bounds of its range, which can be SymPy numbers or
+            quantities.
+        points: Number of points of the grid.
+        scale: ``"log"`` spaces the grid evenly on the logarithmic scale.
+
+    Returns:
+        Read-only arrays of the grid and the values of ``expr``, NaN where ``expr`` is not real.
+
+    Raises:
+        ValueError: If ``expr`` depends on other symbols.
+    """
+
+    variable, start, stop = bounds
+    grid, values = _sample((sympify(expr),), variable, _number(start), _number(stop), points, scale)
+    return grid, values
+
+
+def sample_family(expr: Expr,
+    bounds: Bounds,
+    parameters: Mapping[SymSymbol, Sequence[Any]],
+    *,
+    points: int = _DEFAULT_POINTS,
+    scale: Scale = "linear") -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates ``expr`` over the range ``bounds`` for each set of values of its ``parameters``, see
+    `sample`. ``parameters`` maps the parameter symbols to the sequences of their values, the
+    ``i``-th curve of the family is evaluated at the ``i``-th values of all parameters.
+
+    Returns:
+        Read-only arrays of the grid and the values of ``expr`` of shape ``(curves, points)``.
+
+    Raises:
+        ValueError: If ``parameters`` are empty or their sequences differ in length, or ``expr``
+            depends on other symbols.
+    """
+
+    lengths = {len(v) for v in parameters.values()}
+    if len(lengths) != 1 or 0 in lengths:
+        raise ValueError(f"Parameters should have the same positive number of values, got "
+            f"{sorted(lengths)}.")
+    variable, start, stop = bounds
+    return _sample_family(sympify(expr), variable, _number(start), _number(stop),
+        tuple((p, tuple(_number(v) for v in values)) for p, values in parameters.items()), points,
+        scale)
+
+
+def sample_parametric(exprs: tuple[Expr, Expr],
+    bounds: Bounds,
+    *,
+    points: int = _DEFAULT_POINTS) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates the coordinates ``exprs`` of a parametric curve over the range ``bounds`` of its
+    parameter, see `sample`.
+
+    Returns:
+        Read-only arrays of the coordinates.
+    """
+
+    variable, start, stop = bounds
+    _, x, y = _sample(tuple(sympify(e) for e in exprs), variable, _number(start), _number(stop),
+        points, "linear")
+    return x, y
+
+
+def clear_plot_cache() -> None:
+    """Drops all compiled expressions and evaluated series."""
+
+    _compile.cache_clear()
+    _sample.cache_clear()
+    _sample_family.cache_clear()
+
+
+@dataclass(frozen=True)
+class _Series:
+    x: np.ndarray = field(repr=False)
+
+    y: np.ndarray = field(repr=False)
+
+    label: str
+
+    color: Optional[str]
+
+    style: str
+
+
+class GridPlot:
+    """
+    Plot of curves sampled on grids, see `sample`. The options are those of
+    `sympy.plotting.plot`: ``size`` is the size of the figure in inches, ``legend`` shows the
+    labels of the curves, and ``points`` is the default number of points of the curves.
+    """
+
+    def __init__(self,
+        *,
+        title: str = "",
+        xlabel: str = "",
+        ylabel: str = "",
+        xlim: Optional[tuple[Any, Any]] = None,
+        ylim: Optional[tuple[Any, Any]] = None,
+        xscale: Scale = "linear",
+        yscale: Scale = "linear",
+        size: Optional[tuple[float, float]] = None,
+        legend: bool = False,
+        grid: bool = False,
+        points: int = _DEFAULT_POINTS) -> None:
+        self.title = title
+        self.xlabel = xlabel
+        self.ylabel = ylabel
+        self.xlim = None if xlim is None else (_number(xlim[0]), _number(xlim[1]))
+        self.ylim = None if ylim is None else (_number(ylim[0]), _number(ylim[1]))
+        self.xscale = xscale
+        self.yscale = yscale
+        self.size = size
+        self.legend = legend
+        self.grid = grid
+        self.points = points
+        self._series: list[_Series] = []
+
+    def line(self,
+        expr: Expr,
+        bounds: Bounds,
+        *,
+        label: str = "",
+        color: Optional[str] = None,
+        style: str = "-",
+        points: Optional[int] = None) -> None:
+        """Adds the curve of ``expr`` over the range ``bounds = (variable, start, stop)``."""
+
+        x, y = sample(expr, bounds, points=points or self.points, scale=self.xscale)
+        self._series.append(_Series(x, y, label, color, style))
+
+    def family(self,
+        expr: Expr,
+        bounds: Bounds,
+        parameters: Mapping[SymSymbol, Sequence[Any]],
+        *,
+        labels: Optional[Sequence[str]] = None,
+        colors: Optional[Sequence[Optional[str]]] = None,
+        style: str = "-",
+        points: Optional[int] = None) -> None:
+        """
+        Adds the curves of ``expr`` for each set of values of its ``parameters``, evaluated at
+        once, see `sample_family`. ``labels`` and ``colors`` are given per curve.
+        """
+
+        x, ys = sample_family(expr,
+            bounds,
+            parameters,
+            points=points or self.points,
+            scale=self.xscale)
+        labels = [""] * len(ys) if labels is None else labels
+        colors = [None] * len(ys) if colors is None else colors
+        if not len(labels) == len(colors) == len(ys):
+            raise ValueError(f"Expected {len(ys)} labels and colors, got {len(labels)} and "
+                f"{len(colors)}.")
+        for y, label, color in zip(ys, labels, colors):
+            self._series.append(_Series(x, y, label, color, style))
+
+    def parametric(self,
+        exprs: tuple[Expr, Expr],
+        bounds: Bounds,
+        *,
+        label: str = "",
+        color: Optional[str] = None,
+        style: str = "-",
+        points: Optional[int] = None) -> None:
+        """Adds the curve with the coordinates ``exprs`` over the range ``bounds`` of its parameter."""
+
+        x, y = sample_parametric(exprs, bounds, points=points or self.points)
+        self._series.append(_Series(x, y, label, color, style))
+
+    def data(self,
+        x: Sequence[Any],
+        y: Sequence[Any],
+        *,
+        label: str = "",
+        color: Optional[str] = None,
+        style: str = "-") -> None:
+        """Adds the curve through the points with the coordinates ``x`` and ``y``."""
+
+        self._series.append(
+            _Series(np.asarray(x, dtype=float), np.asarray(y, dtype=float), label, color, style))
+
+    def figure(self) -> Figure:
+        """Renders the plot into a new Matplotlib figure."""
+
+        # pylint: disable-next=import-outside-toplevel
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=self.size)
+        for series in self._series:
+            # the color is passed only if given, so that it does not override the one of the style
+            options: dict[str, Any] = {} if series.color is None else {"color": series.color}
+            ax.plot(series.x, series.y, series.style, label=series.label, **options)
+        ax.set_title(self.title)
+        ax.set_xlabel(self.xlabel)
+        ax.set_ylabel(self.ylabel)
+        ax.set_xscale(self.xscale)
+        ax.set_yscale(self.yscale)
+        if self.xlim is not None:
+            ax.set_xlim(*self.xlim)
+        if self.ylim is not None:
+            ax.set_ylim(*self.ylim)
+        if self.grid:
+            ax.grid(which="both")
+        if self.legend and any(s.label for s in self._series):
+            ax.legend()
+        return fig
+
+    def save(self, path: str | Path) -> None:
+        """Renders the plot into the image file ``path``."""
+
+        # pylint: disable-next=import-outside-toplevel
+        import matplotlib.pyplot as plt
+
+        fig = self.figure()
+        fig.savefig(path)
+        plt.close(fig)
+
+    def show(self) -> None:
+        """Renders the plot and shows it."""
+
+        # pylint: disable-next=import-outside-toplevel
+        import matplotlib.pyplot as plt
+
+        self.figure()
+        plt.show()
+
+
+__all__ = [
+    "sample",
+    "sample_family",
+    "sample_parametric",
+    "clear_plot_cache",
+    "GridPlot",
+]
@@ -0,0 +1,396 @@
+"""
+This module provides a runner for the derivation proofs of laws. A proof is a module-level
+``assert`` statement, e.g. ``assert expr_equals(_derived_expr, law.rhs)``, along with the
+statements preceding it that derive the checked expressions.
+
+The runner discovers the modules containing proofs without importing them, executes the modules
+statement by statement across a pool of processes and times every proof. Each proof runs with a
+timeout, and the proofs of a module following a failed or timed out one are skipped. Modules that
+cannot be found or crash their process are reported as errors.
+
+* `discover_proofs` lists the modules that contain proofs.
+* `run_proofs` runs the proofs and returns a `ProofReport`.
+* `ProofReport` ranks the slowest proofs and can be saved as JSON.
+
+Run all proofs with ``python -m symplyphysics.proofs --jobs 4 --timeout 60``.
+
+**Notes:**
+
+#. Timeouts rely on ``SIGALRM`` and are ignored on platforms that do not support it, as well as
+   when the proofs run outside of the main thread. A timeout can interrupt SymPy in the middle of a
+   computation, so the process that ran a timed out proof is replaced and not reused for other
+   modules.
+
+#. Modules are executed from their source, so they are not registered in `sys.modules`. Law modules
+   imported by them are imported normally, and the time spent on that is attributed to the
+   ``import_time`` of the module rather than to its proofs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import importlib.util
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Literal, Optional, Sequence
+
+ProofStatus = Literal["passed", "failed", "error", "timeout", "skipped"]
+
+_PACKAGE_DIR = Path(__file__).parent
+_EXCLUDED_DIRS = ("core", "docs")
+
+
+class _ProofTimeout(BaseException):
+    """
+    Interrupts a proof. Derived from `BaseException` so that it is not swallowed by the
+    ``except Exception`` clauses within SymPy.
+    """
+
+
+@dataclass(frozen=True)
+class ProofResult:
+    """Outcome of a single proof."""
+
+    module: str
+    """Dotted path of the module."""
+
+    line: int
+    """Line of the ``assert`` statement."""
+
+    source: str
+    """Source code of the ``assert`` statement."""
+
+    status: ProofStatus
+    """Outcome of the proof."""
+
+    elapsed: float
+    """Time in seconds spent on the proof, including the derivation preceding it."""
+
+    message: str = ""
+    """Error message of failed proofs."""
+
+
+@dataclass(frozen=True)
+class ModuleProofs:
+    """Outcome of the proofs of a module."""
+
+    module: str
+    """Dotted path of the module."""
+
+    import_time: float
+    """Time in seconds spent on the import statements of the module."""
+
+    total_time: float
+    """Total time in seconds spent on the module."""
+
+    proofs: list[ProofResult]
+    """Outcomes of the proofs in the order of their definition."""
+
+
+@dataclass
+class ProofReport:
+    """Outcome of a `run_proofs` run."""
+
+    modules: list[ModuleProofs] = field(default_factory=list)
+
+    @property
+    def proofs(self) -> list[ProofResult]:
+        return [p for m in self.modules for p in m.proofs]
+
+    @property
+    def failures(self) -> list[ProofResult]:
+        """Proofs that have not passed, except the skipped ones."""
+
+        return [p for p in self.proofs if p.status not in ("passed", "skipped")]
+
+    @property
+    def passed(self) -> bool:
+        return all(p.status == "passed" for p in self.proofs)
+
+    def slowest(self, count: int = 10) -> list[ProofResult]:
+        return sorted(self.proofs, key=lambda p: p.elapsed, reverse=True)[:count]
+
+    def summary(self, count: int = 20) -> str:
+        """Returns the text report with the ``count`` slowest proofs and all failures."""
+
+        proofs = self.proofs
+        statuses = {s: sum(1 for p in proofs if p.status == s)
+            for s in ("passed", "failed", "error", "timeout", "skipped")}
+        total = sum(m.total_time for m in self.modules)
+        lines = [
+            f"{len(proofs)} proofs in {len(self.modules)} modules, {total:.2f} s in total: " +
+            ", ".join(f"{n} {s}" for s, n in statuses.items() if n),
+            "",
+            "Slowest proofs:",
+        ]
+        lines.extend(f"{p.elapsed:8.2f} s  {p.status:<8} {p.module}:{p.line}"
+            for p in self.slowest(count))
+        failures = self.failures
+        if failures:
+            lines.extend(["", "Failures:"])
+            lines.extend(f"{p.module}:{p.line} {p.status}: {p.message or p.source}"
+                for p in failures)
+        return "\n".join(lines)
+
+    def save(self, path: str | Path) -> None:
+        data = {"modules": [asdict(m) for m in self.modules]}
+        Path(path).write_text(json.dumps(data, indent=1), encoding="utf-8")
+
+
+def _is_proof(stmt: ast.stmt) -> bool:
+    if isinstance(stmt, ast.Assert):
+        return True
+    if isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+        return False
+    return any(isinstance(node, ast.Assert) for node in ast.walk(stmt))
+
+
+def _has_proofs(source: str) -> bool:
+    return any(_is_proof(stmt) for stmt in ast.parse(source).body)
+
+
+def discover_proofs(directory: Optional[str | Path] = None) -> list[str]:
+    """
+    Returns the dotted paths of the modules in ``directory`` containing proofs. ``directory``
+    defaults to the whole package. No module is imported.
+    """
+
+    root = Path(directory).resolve() if directory is not None else _PACKAGE_DIR.resolve()
+    base = _PACKAGE_DIR.resolve().parent
+
+    modules: list[str] = []
+    for path in sorted(root.rglob("*.py")):
+        parts = path.relative_to(base).with_suffix("").parts
+        if len(parts) > 1 and parts[1] in _EXCLUDED_DIRS:
+            continue
+        if parts[-1] == "__init__":
+            parts = parts[:-1]
+        if any(p.startswith(".") for p in parts):
+            continue
+        if _has_proofs(path.read_text(encoding="utf-8")):
+            modules.append(".".join(parts))
+    return modules
+
+
+def _on_timeout(*_: Any) -> None:
+    raise _ProofTimeout()
+
+
+class _Alarm:
+    """Raises `_ProofTimeout` after ``seconds`` in the main thread, if supported."""
+
+    def __init__(self, seconds: Optional[float]) -> None:
+        supported = (hasattr(signal, "setitimer") and
+            threading.current_thread() is threading.main_thread())
+        self._seconds = seconds if supported else None
+        self._previous_handler: Any = None
+
+    def __enter__(self) -> _Alarm:
+        if self._seconds:
+            self._previous_handler = signal.signal(signal.SIGALRM, _on_timeout)
+            signal.setitimer(signal.ITIMER_REAL, self._seconds)
+        return self
+
+    def __exit__(self, *_: Any) -> None:
+        if self._seconds:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self._previous_handler)
+
+
+def run_module_proofs(module: str, timeout: Optional[float] = None) -> ModuleProofs:
+    """
+    Executes the source of ``module`` statement by statement and times its proofs. Every proof,
+    including the derivation preceding it, is interrupted after ``timeout`` seconds. A module that
+    does not exist is reported with a single proof with the ``"error"`` status.
+    """
+
+    try:
+        spec = importlib.util.find_spec(module)
+    except ImportError:
+        spec = None
+    if spec is None or spec.origin is None:
+        return _error_proofs(module, f"Module '{module}' does not exist.")
+    path = Path(spec.origin)
+    source = path.read_text(encoding="utf-8")
+    tree = ast.parse(source)
+    lines = source.splitlines()
+
+    namespace: dict[str, Any] = {
+        "__name__": module,
+        "__file__": str(path),
+        "__package__": spec.parent,
+        "__builtins__": __builtins__,
+    }
+
+    start = time.perf_counter()
+    import_time = 0.0
+    proofs: list[ProofResult] = []
+    failed = False
+    segment_time = 0.0
+
+    for stmt in tree.body:
+        is_proof = _is_proof(stmt)
+        if failed:
+            if is_proof:
+                proofs.append(
+                    ProofResult(module, stmt.lineno, _statement_source(lines, stmt), "skipped",
+                    0.0))
+            continue
+
+        is_import = isinstance(stmt, (ast.Import, ast.ImportFrom))
+        code = compile(ast.Module([stmt], type_ignores=[]), str(path), "exec")
+        status: ProofStatus = "passed"
+        message = ""
+        # the timeout applies to the whole derivation of the proof, imports excluded
+        remaining = None if timeout is None or is_import else max(timeout - segment_time, 1e-3)
+        statement_start = time.perf_counter()
+        try:
+            with _Alarm(remaining):
+                exec(code, namespace)  # pylint: disable=exec-used
+        except _ProofTimeout:
+            status, message = "timeout", f"Proof has not finished within {timeout} s."
+        except AssertionError as e:
+            status, message = "failed", str(e)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            status, message = "error", f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - statement_start
+
+        if is_import:
+            import_time += elapsed
+        else:
+            segment_time += elapsed
+
+        if is_proof or status != "passed":
+            proofs.append(
+                ProofResult(module, stmt.lineno, _statement_source(lines, stmt), status,
+                segment_time, message))
+            segment_time = 0.0
+            failed = status != "passed"
+
+    return ModuleProofs(module, import_time, time.perf_counter() - start, proofs)
+
+
+def _statement_source(lines: Sequence[str], stmt: ast.stmt) -> str:
+    end = stmt.end_lineno or stmt.lineno
+    return "\n".join(lines[stmt.lineno - 1:end])
+
+
+def _error_proofs(module: str, message: str) -> ModuleProofs:
+    return ModuleProofs(module, 0.0, 0.0, [ProofResult(module, 0, "", "error", 0.0, message)])
+
+
+def _timed_out(proofs: ModuleProofs) -> bool:
+    return any(p.status == "timeout" for p in proofs.proofs)
+
+
+def _run_in_processes(modules: Sequence[str], jobs: int,
+    timeout: Optional[float]) -> list[ModuleProofs]:
+    # every process is an executor of its own, so that the process of a timed out module is replaced
+    idle = [ProcessPoolExecutor(1) for _ in range(min(jobs, len(modules)))]
+    pending = deque(enumerate(modules))
+    running: dict[Future[ModuleProofs], tuple[int, ProcessPoolExecutor]] = {}
+    results: dict[int, ModuleProofs] = {}
+    try:
+        while pending or running:
+            while pending and idle:
+                index, module = pending.popleft()
+                executor = idle.pop()
+                running[executor.submit(run_module_proofs, module, timeout)] = (index, executor)
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                index, executor = running.pop(future)
+                try:
+                    results[index] = future.result()
+                    replace = _timed_out(results[index])
+                except BrokenProcessPool as e:
+                    results[index] = _error_proofs(modules[index], f"Process crashed: {e}")
+                    replace = True
+                if replace:
+                    executor.shutdown()
+                    executor = ProcessPoolExecutor(1)
+                idle.append(executor)
+    finally:
+        for executor in [*idle, *(e for _, e in running.values())]:
+            executor.shutdown(cancel_futures=True)
+
+    return [results[i] for i in range(len(modules))]
+
+
+def run_proofs(modules: Optional[Iterable[str]] = None,
+    *,
+    jobs: Optional[int] = None,
+    timeout: Optional[float] = 60.0) -> ProofReport:
+    """
+    Runs the proofs of ``modules``, which default to all modules containing proofs, in ``jobs``
+    processes. If ``jobs`` is ``1``, the proofs run in the current process. Every proof is
+    interrupted after ``timeout`` seconds.
+    """
+
+    modules = list(modules) if modules is not None else discover_proofs()
+    report = ProofReport()
+
+    if jobs == 1:
+        report.modules = [run_module_proofs(m, timeout) for m in modules]
+        return report
+
+    report.modules = _run_in_processes(modules, jobs or os.cpu_count() or 1, timeout)
+    return report
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m symplyphysics.proofs",
+        description="Run and time the derivation proofs of Symplyphysics laws.")
+    parser.add_argument("modules",
+        nargs="*",
+        help="modules to run the proofs of, defaults to all modules with proofs")
+    parser.add_argument("-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of processes, defaults to the number of CPUs")
+    parser.add_argument("-t",
+        "--timeout",
+        type=float,
+        default=60.0,
+        help="time limit of a single proof in seconds")
+    parser.add_argument("-n",
+        "--count",
+        type=int,
+        default=20,
+        help="number of the slowest proofs to report")
+    parser.add_argument("-o", "--output", default=None, help="path of the JSON report")
+    return parser
+
+
+def main(argv: Sequence[str]) -> int:
+    args = get_parser().parse_args(argv)
+    report = run_proofs(args.modules or None, jobs=args.jobs, timeout=args.timeout)
+    print(report.summary(args.count))
+    if args.output:
+        report.save(args.output)
+    return 0 if not report.failures else 1
+
+
+__all__ = [
+    "ProofStatus",
+    "ProofResult",
+    "ModuleProofs",
+    "ProofReport",
+    "discover_proofs",
+    "run_module_proofs",
+    "run_proofs",
+]
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -21,7 +21,8 @@ orbit radius.
     TODO: find English link
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, quantities, symbols
 
 energy = symbols.energy
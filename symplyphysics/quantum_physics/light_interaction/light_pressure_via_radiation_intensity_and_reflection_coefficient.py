@@ -15,7 +15,8 @@ coefficient and the intensity of the radiation.
 #. `BYJU's, "Radiation pressure formula" <https://byjus.com/physics/radiation-pressure/>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities)
 
 pressure = symbols.pressure
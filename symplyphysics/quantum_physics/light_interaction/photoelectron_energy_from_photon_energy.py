@@ -20,7 +20,8 @@ of the material.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Photoelectric_effect#Theoretical_explanation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ in any reference frame. The energy of a photon depends only on its frequency.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Photon#Energy_and_momentum>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
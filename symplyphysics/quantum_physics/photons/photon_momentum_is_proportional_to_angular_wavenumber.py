@@ -13,7 +13,8 @@ The momentum of a photon is proportional to its wavenumber.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Photon#Energy_and_momentum>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
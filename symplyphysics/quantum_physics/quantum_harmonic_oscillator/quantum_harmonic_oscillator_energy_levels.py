@@ -20,8 +20,9 @@ are equidistant, i.e. the difference between successive energy levels is the sam
 #. `Wikipedia <https://en.wikipedia.org/wiki/Quantum_harmonic_oscillator#Hamiltonian_and_energy_eigenstates>`__.
 """
 
-from sympy import Eq, Rational, solve, symbols as sym_symbols, sqrt
+from sympy import Eq, Rational, symbols as sym_symbols, sqrt
 from sympy.functions.special.polynomials import hermite
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
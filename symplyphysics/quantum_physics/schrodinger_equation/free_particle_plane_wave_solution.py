@@ -25,7 +25,8 @@ a `plane wave <https://en.wikipedia.org/wiki/Plane_wave>`__.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Free_particle#Quantum_free_particle>`__.
 """
 
-from sympy import Eq, exp, I, S, dsolve
+from sympy import Eq, exp, I, S
+from symplyphysics.core.disk_cache import dsolve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -19,7 +19,8 @@ equation can be constructed using the solution of the time-independent equation.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Stationary_state>`__.
 """
 
-from sympy import Eq, exp, I, solve
+from sympy import Eq, exp, I
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
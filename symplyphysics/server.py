@@ -0,0 +1,612 @@
+"""
+This module provides an asyncio JSON-RPC server evaluating laws over HTTP on localhost.
+
+The server keeps compiled law kernels warm for the lifetime of the process. Concurrent ``evaluate``
+requests for the same law and target are collected into a batch and computed by a single
+vectorized kernel call. Calls to the ``calculate_*`` functions of laws and solving laws for kernels,
+which perform symbolic work, are offloaded to a process pool so that they do not block the event
+loop.
+
+JSON-RPC 2.0 requests are accepted with ``POST /``. Batch requests are supported. Methods:
+
+* ``evaluate`` with parameters ``law`` (dotted module path), ``target`` (name of the law symbol)
+  and ``inputs`` (mapping of symbol names to SI magnitudes, either numbers or lists of numbers).
+  Returns ``value`` and SI ``unit``. If the law has several solutions for ``target``, its principal
+  solution is evaluated, see `symplyphysics.core.kernels.principal_solution`.
+
+* ``calculate`` with parameters ``law``, ``function`` (name of the law function) and ``arguments``
+  (mapping of parameter names to ``{"value": ..., "unit": ...}`` objects). Returns ``value`` and SI
+  ``unit``.
+
+* ``preload`` with parameters ``law`` and ``target``. Compiles the kernel ahead of the first
+  ``evaluate`` call.
+
+* ``metrics`` returns the latency metrics of the server, which are also available with
+  ``GET /metrics``.
+
+Complex values are represented by ``{"real": ..., "imag": ...}`` objects. Infinite and NaN results,
+which JSON cannot represent, are returned as ``null``.
+
+Run the server with ``python -m symplyphysics.server --port 8000``.
+
+**Notes:**
+
+#. This module requires **NumPy**, which can be installed via ``pip install .[numeric]``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import math
+import sys
+import time
+from collections import deque
+from concurrent.futures import Executor
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import Any, Awaitable, Callable, Optional, Sequence
+
+import numpy as np
+from sympy import Expr
+
+from .core.convert import convert_to_si, parse_unit
+from .core.executor import AsyncLawExecutor
+from .core.dimensions import dimension_to_si_unit
+from .core.kernels import LawKernel, compile_law, compile_solved_law, load_law
+from .core.symbols.quantities import Quantity
+
+_PARSE_ERROR = -32700
+_INVALID_REQUEST = -32600
+_METHOD_NOT_FOUND = -32601
+_INVALID_PARAMS = -32602
+_SERVER_ERROR = -32000
+
+_MAX_BODY_SIZE = 16 * 1024 * 1024
+
+
+class RpcError(Exception):
+    """Raised by request handlers to produce a JSON-RPC error response."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class LatencyMetrics:
+    """
+    Collects latencies of handled requests per method. Percentiles are computed over the last
+    ``window`` requests of each method.
+    """
+
+    def __init__(self, window: int = 10000) -> None:
+        self._window = window
+        self._samples: dict[str, deque[float]] = {}
+        self._counts: dict[str, int] = {}
+        self._errors: dict[str, int] = {}
+        self._batches = 0
+        self._batched_requests = 0
+
+    def record(self, method: str, seconds: float, *, failed: bool = False) -> None:
+        self._samples.setdefault(method, deque(maxlen=self._window)).append(seconds)
+        self._counts[method] = self._counts.get(method, 0) + 1
+        if failed:
+            self._errors[method] = self._errors.get(method, 0) + 1
+
+    def record_batch(self, size: int) -> None:
+        self._batches += 1
+        self._batched_requests += size
+
+    def summary(self) -> dict[str, Any]:
+        """Returns the metrics in a JSON-compatible form, latencies are in milliseconds."""
+
+        methods: dict[str, Any] = {}
+        for method, samples in self._samples.items():
+            values = np.fromiter(samples, dtype=float) * 1000
+            p50, p90, p99 = np.percentile(values, [50, 90, 99])
+            methods[method] = {
+                "count": self._counts[method],
+                "errors": self._errors.get(method, 0),
+                "mean_ms": float(values.mean()),
+                "p50_ms": float(p50),
+                "p90_ms": float(p90),
+                "p99_ms": float(p99),
+                "max_ms": float(values.max()),
+            }
+
+        mean_batch_size = self._batched_requests / self._batches if self._batches else 0.0
+        return {
+            "methods": methods,
+            "batches": self._batches,
+            "mean_batch_size": mean_batch_size,
+        }
+
+
+def _finite(value: float) -> Optional[float]:
+    # JSON has no infinities and NaN
+    return value if math.isfinite(value) else None
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        return [_to_json(v) for v in value.tolist()] if value.ndim else _to_json(value.item())
+    if isinstance(value, (list, tuple)):
+        return [_to_json(v) for v in value]
+    value = complex(value)
+    if value.imag == 0:
+        return _finite(value.real)
+    return {"real": _finite(value.real), "imag": _finite(value.imag)}
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _from_json(value: Any) -> Any:
+    if isinstance(value, list):
+        return np.asarray([_from_json(v) for v in value])
+    if isinstance(value, dict):
+        if _is_number(value.get("real")) and _is_number(value.get("imag")):
+            return complex(value["real"], value["imag"])
+        raise RpcError(_INVALID_PARAMS,
+            f"Expected a complex number with 'real' and 'imag' parts, got '{value}'.")
+    if _is_number(value):
+        return value
+    raise RpcError(_INVALID_PARAMS, f"Expected a number, got '{value}'.")
+
+
+def _unit_string(kernel_or_dimension: Any) -> str:
+    dimension = getattr(kernel_or_dimension, "output_dimension", kernel_or_dimension)
+    return str(dimension_to_si_unit(dimension))
+
+
+def _calculate(law: str, function: str,
+    arguments: tuple[tuple[str, complex | float, str], ...]) -> tuple[Any, str]:
+    """Runs the law function in a worker process. Returns the SI magnitude and unit."""
+
+    module = load_law(law)
+    law_function = getattr(module, function, None)
+    if not function.startswith("calculate") or not callable(law_function):
+        raise ValueError(f"Law '{law}' does not have the function '{function}'.")
+
+    quantities = {name: Quantity(value * parse_unit(unit)) for name, value, unit in arguments}
+    result = law_function(**quantities)
+    if isinstance(result, Quantity):
+        return _to_json(convert_to_si(result)), _unit_string(result.dimension)
+    return _to_json(result), "1"
+
+
+def _solve(law: str, target: str) -> Expr:
+    """
+    Solves the law in a worker process for its principal solution, see
+    `symplyphysics.core.kernels.principal_solution`. Returns the solved form, which can be pickled,
+    unlike the kernel.
+    """
+
+    return compile_law(law, target, solution=None).portable_expr()
+
+
+@dataclass
+class _Batch:
+    kernel: LawKernel
+    inputs: list[dict[str, Any]] = field(default_factory=list)
+    futures: list[asyncio.Future[Any]] = field(default_factory=list)
+    handle: Optional[asyncio.TimerHandle] = None
+
+
+class LawServer:
+    """
+    Serves law evaluations over JSON-RPC. ``batch_window`` is the time in seconds during which
+    concurrent ``evaluate`` requests for the same kernel are collected into one call, up to
+    ``max_batch_size`` requests. ``executor`` runs the ``calculate`` requests, by default it is a
+    process pool with ``max_workers`` processes. Identical concurrent ``calculate`` requests share a
+    single computation.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        batch_window: float = 0.002,
+        max_batch_size: int = 4096,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.metrics = LatencyMetrics()
+        self._batch_window = batch_window
+        self._max_batch_size = max_batch_size
+        self._executor = AsyncLawExecutor("process", max_workers=max_workers, executor=executor)
+        self._server: Optional[asyncio.base_events.Server] = None
+        self._batches: dict[tuple[int, tuple[str, ...]], _Batch] = {}
+        self._compiling: dict[tuple[str, str], asyncio.Future[LawKernel]] = {}
+        self._methods: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]] = {
+            "evaluate": self._evaluate,
+            "calculate": self._calculate,
+            "preload": self._preload,
+            "metrics": self._metrics,
+        }
+
+    async def start(self) -> None:
+        """Starts listening. The actual port is available in `port` after the call."""
+
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        self._executor.shutdown(wait=False)
+
+    async def serve_forever(self) -> None:
+        if self._server is None:
+            await self.start()
+        assert self._server is not None
+        await self._server.serve_forever()
+
+    async def __aenter__(self) -> LawServer:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        await self.close()
+
+    async def kernel(self, law: str, target: str) -> LawKernel:
+        """
+        Returns the compiled kernel. The first request for a kernel solves the law in the process
+        pool and compiles the solved form in a thread, while concurrent requests for the same kernel
+        wait for that compilation. Failed compilations are retried by later requests.
+        """
+
+        key = (law, target)
+        future = self._compiling.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._compile(law, target))
+            self._compiling[key] = future
+            future.add_done_callback(functools.partial(self._forget_failed, key))
+        try:
+            return await asyncio.shield(future)
+        except ValueError as e:
+            raise RpcError(_INVALID_PARAMS, str(e)) from e
+
+    async def _compile(self, law: str, target: str) -> LawKernel:
+        expr = await self._executor.run(_solve, law, target)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, compile_solved_law, law, target, expr)
+
+    def _forget_failed(self, key: tuple[str, str], future: asyncio.Future[LawKernel]) -> None:
+        failed = future.cancelled() or future.exception() is not None
+        if failed and self._compiling.get(key) is future:
+            del self._compiling[key]
+
+    async def _preload(self, params: dict[str, Any]) -> Any:
+        kernel = await self.kernel(_param(params, "law", str), _param(params, "target", str))
+        return {"inputs": list(kernel.inputs), "unit": _unit_string(kernel)}
+
+    async def _metrics(self, _params: dict[str, Any]) -> Any:
+        return self.metrics.summary()
+
+    async def _evaluate(self, params: dict[str, Any]) -> Any:
+        kernel = await self.kernel(_param(params, "law", str), _param(params, "target", str))
+        raw_inputs = _param(params, "inputs", dict)
+        inputs = {name: _from_json(value) for name, value in raw_inputs.items()}
+
+        missing = set(kernel.inputs) - set(inputs)
+        unknown = set(inputs) - set(kernel.inputs)
+        if missing or unknown:
+            raise RpcError(_INVALID_PARAMS, f"Expected inputs {list(kernel.inputs)}, "
+                f"got {list(inputs)}.")
+
+        if any(isinstance(v, np.ndarray) for v in inputs.values()):
+            # already vectorized, non-finite elements are returned as null
+            with np.errstate(all="ignore"):
+                value = kernel(**inputs)
+        else:
+            value = await self._submit(kernel, inputs)
+        return {"value": _to_json(value), "unit": _unit_string(kernel)}
+
+    def _submit(self, kernel: LawKernel, inputs: dict[str, Any]) -> asyncio.Future[Any]:
+        loop = asyncio.get_running_loop()
+        key = (id(kernel), tuple(inputs))
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = _Batch(kernel)
+            self._batches[key] = batch
+            batch.handle = loop.call_later(self._batch_window, self._flush, key)
+
+        future: asyncio.Future[Any] = loop.create_future()
+        batch.inputs.append(inputs)
+        batch.futures.append(future)
+        if len(batch.inputs) >= self._max_batch_size:
+            self._flush(key)
+        return future
+
+    def _flush(self, key: tuple[int, tuple[str, ...]]) -> None:
+        batch = self._batches.pop(key, None)
+        if batch is None:
+            return
+        if batch.handle is not None:
+            batch.handle.cancel()
+
+        kernel, names = batch.kernel, key[1]
+        self.metrics.record_batch(len(batch.inputs))
+        try:
+            columns = {name: np.asarray([i[name] for i in batch.inputs]) for name in names}
+            with np.errstate(all="ignore"):
+                values = kernel(**columns) if names else np.repeat(kernel(), len(batch.inputs))
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(RpcError(_SERVER_ERROR, str(e)))
+            return
+
+        for future, value in zip(batch.futures, values):
+            if not future.done():
+                future.set_result(value)
+
+    async def _calculate(self, params: dict[str, Any]) -> Any:
+        law = _param(params, "law", str)
+        function = _param(params, "function", str)
+        arguments: list[tuple[str, complex | float, str]] = []
+        for name, argument in _param(params, "arguments", dict).items():
+            if not isinstance(argument, dict) or "value" not in argument:
+                raise RpcError(_INVALID_PARAMS, f"Argument '{name}' should have a value.")
+            value = _from_json(argument["value"])
+            if isinstance(value, np.ndarray):
+                raise RpcError(_INVALID_PARAMS, f"Argument '{name}' should be a single number.")
+            arguments.append((name, value, str(argument.get("unit", "1"))))
+
+        try:
+            # identical concurrent calculations are coalesced by the executor
+            value, unit = await self._executor.run(_calculate, law, function, tuple(arguments))
+        except (ValueError, TypeError) as e:
+            raise RpcError(_INVALID_PARAMS, str(e)) from e
+        return {"value": value, "unit": unit}
+
+    async def handle_request(self, request: Any) -> Optional[dict[str, Any]]:
+        """Handles a single JSON-RPC request object. Returns `None` for notifications."""
+
+        start = time.perf_counter()
+        request_id = request.get("id") if isinstance(request, dict) else None
+        method = "invalid"
+        failed = True
+        try:
+            if (not isinstance(request, dict) or request.get("jsonrpc") != "2.0" or
+                    not isinstance(request.get("method"), str)):
+                raise RpcError(_INVALID_REQUEST, "Invalid JSON-RPC request.")
+            handler = self._methods.get(request["method"])
+            if handler is None:
+                raise RpcError(_METHOD_NOT_FOUND, f"Method '{request['method']}' not found.")
+            method = request["method"]
+            params = request.get("params", {})
+            if not isinstance(params, dict):
+                raise RpcError(_INVALID_PARAMS, "Parameters should be an object.")
+            result = await handler(params)
+            failed = False
+            response: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except RpcError as e:
+            response = _error_response(request_id, e.code, e.message)
+        except Exception as e:  # pylint: disable=broad-exception-caught
+            response = _error_response(request_id, _SERVER_ERROR, f"{type(e).__name__}: {e}")
+        finally:
+            self.metrics.record(method, time.perf_counter() - start, failed=failed)
+
+        if isinstance(request, dict) and "id" not in request:
+            return None
+        return response
+
+    async def handle_payload(self, payload: bytes) -> Optional[Any]:
+        """Handles a JSON-RPC payload, which can contain a single request or a batch."""
+
+        try:
+            request = json.loads(payload)
+        except ValueError:
+            return _error_response(None, _PARSE_ERROR, "Parse error.")
+
+        if not isinstance(request, list):
+            return await self.handle_request(request)
+        if not request:
+            return _error_response(None, _INVALID_REQUEST, "Empty batch.")
+
+        responses = await asyncio.gather(*(self.handle_request(r) for r in request))
+        return [r for r in responses if r is not None] or None
+
+    async def _handle_connection(self, reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, headers = _parse_head(request_line, await _read_headers(reader))
+                length = int(headers.get("content-length", "0"))
+                if length > _MAX_BODY_SIZE:
+                    _write_response(writer, HTTPStatus.REQUEST_ENTITY_TOO_LARGE, None, False)
+                    break
+                body = await reader.readexactly(length) if length else b""
+                keep_alive = headers.get("connection", "keep-alive").lower() != "close"
+
+                if method == "POST" and path == "/":
+                    result = await self.handle_payload(body)
+                    status = HTTPStatus.OK if result is not None else HTTPStatus.NO_CONTENT
+                elif method == "GET" and path == "/metrics":
+                    result, status = self.metrics.summary(), HTTPStatus.OK
+                else:
+                    result, status = None, HTTPStatus.NOT_FOUND
+
+                _write_response(writer, status, result, keep_alive)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            writer.close()
+
+
+def _param(params: dict[str, Any], name: str, type_: type) -> Any:
+    value = params.get(name)
+    if not isinstance(value, type_):
+        raise RpcError(_INVALID_PARAMS, f"Parameter '{name}' should be {type_.__name__}.")
+    return value
+
+
+def _error_response(request_id: Any, code: int, message: str) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+async def _read_headers(reader: asyncio.StreamReader) -> list[bytes]:
+    lines: list[bytes] = []
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return lines
+        lines.append(line)
+
+
+def _parse_head(request_line: bytes, header_lines: list[bytes]) -> tuple[str, str, dict[str, str]]:
+    method, path, _ = request_line.decode("latin-1").split(" ", 2)
+    headers = {}
+    for line in header_lines:
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    return method, path, headers
+
+
+def _write_response(writer: asyncio.StreamWriter, status: HTTPStatus, result: Any,
+    keep_alive: bool) -> None:
+    body = b"" if result is None else json.dumps(result, allow_nan=False).encode("utf-8")
+    head = [
+        f"HTTP/1.1 {status.value} {status.phrase}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}",
+    ]
+    writer.write(("\r\n".join(head) + "\r\n\r\n").encode("latin-1") + body)
+
+
+class LawClient:
+    """A minimal asynchronous client of `LawServer` that uses a connection per request."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8000) -> None:
+        self.host = host
+        self.port = port
+        self._next_id = 0
+
+    async def _post(self, path: str, method: str, payload: Any) -> Any:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        try:
+            body = b""
+            if payload is not None:
+                body = json.dumps(payload, allow_nan=False).encode("utf-8")
+            head = (f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n")
+            writer.write(head.encode("latin-1") + body)
+            await writer.drain()
+
+            status_line = await reader.readline()
+            _, headers = status_line, await _read_headers(reader)
+            length = 0
+            for line in headers:
+                name, _, value = line.decode("latin-1").partition(":")
+                if name.strip().lower() == "content-length":
+                    length = int(value)
+            data = await reader.readexactly(length) if length else b""
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+        status = int(status_line.split()[1])
+        if status >= 400:
+            raise ConnectionError(f"Server responded with status {status}.")
+        return json.loads(data) if data else None
+
+    async def call(self, method: str, **params: Any) -> Any:
+        """
+        Calls the JSON-RPC ``method`` and returns its result.
+
+        Raises:
+            RpcError: If the server responded with an error.
+        """
+
+        self._next_id += 1
+        request = {"jsonrpc": "2.0", "id": self._next_id, "method": method, "params": params}
+        response = await self._post("/", "POST", request)
+        if "error" in response:
+            raise RpcError(response["error"]["code"], response["error"]["message"])
+        return response["result"]
+
+    async def call_batch(self, requests: Sequence[tuple[str, dict[str, Any]]]) -> list[Any]:
+        """Sends the ``requests`` in a single JSON-RPC batch and returns the responses in order."""
+
+        payload = []
+        for method, params in requests:
+            self._next_id += 1
+            payload.append({"jsonrpc": "2.0", "id": self._next_id, "method": method,
+                "params": params})
+        responses = {r["id"]: r for r in await self._post("/", "POST", payload)}
+        return [responses[p["id"]] for p in payload]
+
+    async def metrics(self) -> Any:
+        return await self._post("/metrics", "GET", None)
+
+
+def get_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m symplyphysics.server",
+        description="Serve Symplyphysics laws over JSON-RPC.")
+    parser.add_argument("--host", default="127.0.0.1", help="address to listen on")
+    parser.add_argument("--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--workers", type=int, default=None, help="size of the process pool")
+    parser.add_argument("--batch-window",
+        type=float,
+        default=0.002,
+        help="time in seconds to collect concurrent evaluations into one batch")
+    parser.add_argument("--preload",
+        nargs="*",
+        default=[],
+        metavar="LAW:TARGET",
+        help="kernels to compile before serving")
+    return parser
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    server = LawServer(args.host,
+        args.port,
+        batch_window=args.batch_window,
+        max_workers=args.workers)
+    await server.start()
+    for entry in args.preload:
+        law, _, target = entry.rpartition(":")
+        await server.kernel(law, target)
+    print(f"Serving on http://{server.host}:{server.port}")
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+def main(argv: Sequence[str]) -> None:
+    args = get_parser().parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+__all__ = [
+    "RpcError",
+    "LatencyMetrics",
+    "LawServer",
+    "LawClient",
+]
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -13,7 +13,8 @@ Fundamentally the energy of an object is synonimical to its mass.
 #. `Wikipedia, second formula in the last group of three equations <https://en.wikipedia.org/wiki/Mass_in_special_relativity#Relativistic_energy%E2%80%93momentum_equation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     quantities,
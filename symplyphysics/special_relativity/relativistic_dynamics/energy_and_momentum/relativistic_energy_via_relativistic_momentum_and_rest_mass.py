@@ -16,7 +16,8 @@ with non-zero momentum.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Energy%E2%80%93momentum_relation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     quantities,
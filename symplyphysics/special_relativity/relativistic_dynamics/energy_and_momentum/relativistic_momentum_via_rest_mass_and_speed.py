@@ -14,7 +14,8 @@ of a body. The relativistic momentum also takes into account speed limits equal
 #. `Wikipedia <https://en.wikipedia.org/wiki/Mass_in_special_relativity#Relativistic_energy%E2%80%93momentum_equation>`__.
 """
 
-from sympy import (Eq, solve, sqrt)
+from sympy import (Eq, sqrt)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -18,7 +18,8 @@ infinity as its speed approaches the speed of light.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Mass_in_special_relativity#Relativistic_mass>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities)
 
 relativistic_mass = symbols.relativistic_mass
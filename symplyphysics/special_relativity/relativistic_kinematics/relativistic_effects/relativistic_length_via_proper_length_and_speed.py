@@ -18,7 +18,8 @@ that this phenomenon is only observed in the direction parallel to the velocity
     TODO rename file
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
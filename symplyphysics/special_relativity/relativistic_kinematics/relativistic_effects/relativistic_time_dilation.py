@@ -16,7 +16,8 @@ covers the special relativistic time dilation due to acceleration.
 #. `Wikipedia, formula in box <https://en.wikipedia.org/wiki/Time_dilation#Simple_inference>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
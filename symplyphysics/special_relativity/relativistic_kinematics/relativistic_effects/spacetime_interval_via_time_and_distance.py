@@ -31,7 +31,8 @@ inertial reference frame.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Spacetime#Spacetime_interval>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
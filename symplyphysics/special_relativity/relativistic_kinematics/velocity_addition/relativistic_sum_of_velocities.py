@@ -20,7 +20,8 @@ its speed in the proper frame.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Velocity-addition_formula#Special_relativity>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, quantities,
     clone_as_symbol)
 
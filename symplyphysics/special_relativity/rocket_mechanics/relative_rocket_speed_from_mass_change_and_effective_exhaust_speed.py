@@ -15,7 +15,8 @@ Tsiolkovsky formula is valid for a rocket flying at a speed close to the speed o
 #. `Wikipedia <https://en.wikipedia.org/wiki/Tsiolkovsky_rocket_equation#Special_relativity>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
@@ -30,7 +30,8 @@ the total mass of the system does not change.
 #. Equation 9-87 on p. 242 of "Fundamentals of Physics" by David Halladay et al., 10th Ed.
 """
 
-from sympy import Eq, dsolve, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     Quantity,
     validate_input,
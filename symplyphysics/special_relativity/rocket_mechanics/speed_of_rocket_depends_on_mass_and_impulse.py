@@ -10,7 +10,8 @@ of a rocket engine, unchanged in direction, in the absence of all other forces.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Tsiolkovsky_rocket_equation>`__.
 """
 
-from sympy import (Eq, solve, log)
+from sympy import (Eq, log)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
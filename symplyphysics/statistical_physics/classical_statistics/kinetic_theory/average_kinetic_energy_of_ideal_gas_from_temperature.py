@@ -20,7 +20,8 @@ temperature of the gas and only depends on the temperature.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Kinetic_theory_of_gases#Temperature_and_kinetic_energy>`__.
 """
 
-from sympy import Eq, solve, Rational, stats, Interval, S
+from sympy import Eq, Rational, stats, Interval, S
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
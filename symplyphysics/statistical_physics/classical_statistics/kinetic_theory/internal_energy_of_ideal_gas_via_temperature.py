@@ -23,7 +23,8 @@ Internal energy of an ideal gas is the sum of the kinetic energy of all of its m
     TODO replace `mass/molar_mass` with `amount_of_substance`
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -14,7 +14,8 @@ of the gas and the average kinetic energy of gas particles.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Kinetic_theory_of_gases#Pressure_and_kinetic_energy>`__.
 """
 
-from sympy import Eq, solve, Rational
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, quantities, symbols,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
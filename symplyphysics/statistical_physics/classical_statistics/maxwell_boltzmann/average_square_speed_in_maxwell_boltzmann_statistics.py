@@ -22,7 +22,8 @@ and inversely proportional to the mass of the gas.
     TODO: move to `./maxwell_boltzmann_statistics.py`
 """
 
-from sympy import (Eq, solve, S, stats, Interval)
+from sympy import (Eq, S, stats, Interval)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol,
     quantities)
 from symplyphysics.core.expr_comparisons import expr_equals
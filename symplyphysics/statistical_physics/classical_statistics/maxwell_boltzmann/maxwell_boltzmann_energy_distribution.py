@@ -22,7 +22,8 @@ around energy value :math:`E`.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Maxwell%E2%80%93Boltzmann_distribution#Distribution_for_the_energy>`__.
 """
 
-from sympy import Eq, Rational, sqrt, pi, exp, solve
+from sympy import Eq, Rational, sqrt, pi, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
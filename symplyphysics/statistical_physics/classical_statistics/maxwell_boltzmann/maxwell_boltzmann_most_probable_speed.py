@@ -19,7 +19,8 @@ is maximum.
 #. `Wikipedia, first item within the list <https://en.wikipedia.org/wiki/Maxwell%E2%80%93Boltzmann_distribution#Typical_speeds>`__.
 """
 
-from sympy import Eq, sqrt, solve, sign, S
+from sympy import Eq, sqrt, sign, S
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -22,7 +22,8 @@ particles in thermodynamic equilibrium, the speed distribution function is a fun
 #. `Wikipedia <https://en.wikipedia.org/wiki/Maxwell%E2%80%93Boltzmann_distribution#Distribution_for_the_speed>`__.
 """
 
-from sympy import (Eq, Rational, sqrt, pi, exp, symbols as sym_symbols, solve)
+from sympy import (Eq, Rational, sqrt, pi, exp, symbols as sym_symbols)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (units, Quantity, Symbol, validate_input, validate_output,
     clone_as_symbol, symbols, quantities)
 from symplyphysics.core.expr_comparisons import expr_equals
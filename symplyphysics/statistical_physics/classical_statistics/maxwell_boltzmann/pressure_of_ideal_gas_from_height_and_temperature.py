@@ -19,7 +19,8 @@ The *barometric formula* determines the dependence of the pressure or density of
 #. `Wikipedia <https://en.wikipedia.org/wiki/Barometric_formula#Derivation>`__.
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
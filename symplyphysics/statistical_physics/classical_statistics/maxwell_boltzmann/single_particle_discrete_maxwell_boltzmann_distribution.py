@@ -20,7 +20,8 @@ found in a given single-particle microstate.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Maxwell%E2%80%93Boltzmann_statistics>`__.
 """
 
-from sympy import Eq, exp, solve
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     dimensionless,
     Quantity,
@@ -16,7 +16,8 @@ of all the possible energy states:
 """
 
 from typing import Sequence
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     convert_to_float,
     validate_input,
@@ -16,12 +16,11 @@ is the average number of microstates of a system that implement its macro-state.
 
 from sympy import (
     Eq,
-    solve,
     symbols as sym_symbols,
     Function as SymFunction,
-    dsolve,
     log,
 )
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     units,
     Quantity,
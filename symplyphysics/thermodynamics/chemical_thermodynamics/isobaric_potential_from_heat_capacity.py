@@ -23,7 +23,8 @@ pressure of :math:`1 \\, \\text{atm}`, as well as at a fixed composition of the
     TODO: find link
 """
 
-from sympy import (Eq, solve, log)
+from sympy import (Eq, log)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     quantities,
     symbols,
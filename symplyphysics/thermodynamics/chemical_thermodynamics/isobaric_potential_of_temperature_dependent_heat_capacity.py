@@ -25,7 +25,8 @@ dependence of heat capacity on temperature.
     TODO: find reference to the 'Temkin-Schwarzman formula'
 """
 
-from sympy import (Eq, solve, log)
+from sympy import (Eq, log)
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     quantities,
     symbols,
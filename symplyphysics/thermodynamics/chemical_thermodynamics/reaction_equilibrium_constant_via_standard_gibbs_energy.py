@@ -20,7 +20,8 @@ concentrations or fugitives) of reactants and products in a state of chemical eq
 #. `Wikipedia, derivable from the fifth equation <https://en.wikipedia.org/wiki/Equilibrium_constant#Basic_definitions_and_properties>`__.
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     units,
@@ -10,7 +10,8 @@ This is a direct consequence of the first law of thermodynamics.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Isolated_system>`__.
 """
 
-from sympy import Eq, Idx, solve
+from sympy import Eq, Idx
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -26,7 +26,8 @@ along with the more well-known van der Waals equation of state.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Real_gas#Dieterici_model>`__.
 """
 
-from sympy import Eq, solve, exp
+from sympy import Eq, exp
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -13,7 +13,8 @@ The change in pressure of ideal gas depends on temperature, standard pressure an
     TODO find link
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -14,7 +14,8 @@ describe a hypothetical ideal gas.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Ideal_gas_law>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -15,7 +15,8 @@ of the gas.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Ideal_gas_law#math_4>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
@@ -10,8 +10,9 @@ heat or mass between the thermodynamic system and its environment.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Isentropic_process#Derivation_of_the_isentropic_relations>`__.
 """
 
-from sympy import Eq, Rational, solve, dsolve
+from sympy import Eq, Rational
 from sympy.abc import t as _t
+from symplyphysics.core.disk_cache import dsolve, solve
 from symplyphysics import (
     clone_as_symbol,
     clone_as_function,
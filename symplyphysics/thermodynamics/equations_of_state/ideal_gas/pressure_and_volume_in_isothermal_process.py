@@ -11,7 +11,8 @@ process.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Ideal_gas_law#math_1>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
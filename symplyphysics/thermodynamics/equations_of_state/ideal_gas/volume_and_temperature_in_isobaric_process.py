@@ -11,7 +11,8 @@ by the same amount as the temperature during an isobaric process.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Ideal_gas_law#math_2>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
@@ -12,7 +12,8 @@ reduced pressure-volume curve at the same reduced temperature.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Van_der_Waals_equation#Critical_point_and_corresponding_states>`__.
 """
 
-from sympy import Eq, Rational, solve
+from sympy import Eq, Rational
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     dimensionless,
     Symbol,
@@ -19,7 +19,8 @@ into account the main characteristics of a gas with intermolecular interaction.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Van_der_Waals_equation#>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (symbols, Quantity, validate_input, validate_output, quantities)
 
 pressure = symbols.pressure
@@ -25,7 +25,8 @@ to inverse molar volume or equivalently, to molar density.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Van_der_Waals_equation#Virial_expansion>`__.
 """
 
-from sympy import Eq, solve, Symbol as SymSymbol
+from sympy import Eq, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     units,
     Quantity,
@@ -10,7 +10,8 @@ by the system.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Heat_engine#Efficiency>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
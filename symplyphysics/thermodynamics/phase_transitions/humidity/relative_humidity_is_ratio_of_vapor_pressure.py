@@ -13,7 +13,8 @@ molecules per unit time.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Humidity#Relative_humidity>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
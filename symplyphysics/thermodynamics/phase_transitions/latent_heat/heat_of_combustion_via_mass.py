@@ -9,7 +9,8 @@ Heat of combustion via mass
 #. `Wikipedia <https://en.wikipedia.org/wiki/Heat_of_combustion>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -10,7 +10,8 @@ in which it is converted from liquid into gaseous state.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Enthalpy_of_vaporization>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
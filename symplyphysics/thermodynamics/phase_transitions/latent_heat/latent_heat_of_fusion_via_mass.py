@@ -12,7 +12,8 @@ specific heat of solidification is equal by magnitude to that of fusion.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Enthalpy_of_fusion>`__.
 """
 
-from sympy import (Eq, solve)
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol)
 
 latent_heat = symbols.heat
@@ -19,7 +19,8 @@ to the heat capacity of the body times the change in the body's temperature.
 #. `Wikipedia, derivable from here <https://en.wikipedia.org/wiki/Heat_capacity#Basic_definition>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     clone_as_symbol,
     symbols,
@@ -11,7 +11,8 @@ not just ideal gases.
 #. `Wikipedia, second formula <https://en.wikipedia.org/wiki/Mayer%27s_relation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
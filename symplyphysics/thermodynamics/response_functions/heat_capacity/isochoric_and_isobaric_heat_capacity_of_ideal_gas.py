@@ -18,7 +18,8 @@ constant volume in the case of an ideal gas.
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Mayer%27s_relation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
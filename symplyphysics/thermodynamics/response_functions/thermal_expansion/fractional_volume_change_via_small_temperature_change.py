@@ -19,7 +19,8 @@ and the fractional change in the body's volume is proportional to the change in
     TODO move to `dynamics/deformations`?
 """
 
-from sympy import Eq, symbols as sym_symbols, solve
+from sympy import Eq, symbols as sym_symbols
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     convert_to_float,
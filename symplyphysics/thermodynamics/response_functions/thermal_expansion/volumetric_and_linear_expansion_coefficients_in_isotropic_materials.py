@@ -15,7 +15,8 @@ at a constant pressure. In isotropic materials, the volumetric coefficient is th
 #. `Wikipedia <https://en.wikipedia.org/wiki/Thermal_expansion#Isotropic_materials>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
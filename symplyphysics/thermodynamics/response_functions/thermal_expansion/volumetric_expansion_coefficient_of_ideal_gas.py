@@ -13,7 +13,8 @@ The isobaric volumetric expansion coefficient of an ideal gas is the inverse of
 #. `Wikipedia <https://en.wikipedia.org/wiki/Thermal_expansion#In_gases>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
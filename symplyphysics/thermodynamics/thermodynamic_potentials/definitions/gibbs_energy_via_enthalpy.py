@@ -12,7 +12,8 @@ conditions.
 #. `Wikipedia, first formula <https://en.wikipedia.org/wiki/Gibbs_free_energy>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
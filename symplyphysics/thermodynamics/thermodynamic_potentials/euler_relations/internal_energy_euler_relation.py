@@ -15,7 +15,8 @@ homogeneous functions to get the following expression.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Thermodynamic_potential#Euler_relations>`__.
 """
 
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.thermodynamics.thermodynamic_potentials.differentials import internal_energy_differential
@@ -25,7 +25,8 @@ as they always tend to arrive at a state of thermodynamic equilibrium, where the
     TODO find other link
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -9,7 +9,8 @@ Entropy of a system can be found if its free energy is known as a function of te
 #. `Wikipedia, follows from the corresponding fundamental relation <https://en.wikipedia.org/wiki/Fundamental_thermodynamic_relation>`__.
 """
 
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
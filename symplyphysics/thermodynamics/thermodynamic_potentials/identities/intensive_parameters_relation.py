@@ -15,7 +15,8 @@ parameters, or degrees of freedom.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Gibbs%E2%80%93Duhem_equation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
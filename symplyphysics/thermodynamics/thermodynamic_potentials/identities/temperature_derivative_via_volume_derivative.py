@@ -21,7 +21,8 @@ a gas without production of work or transfer of heat, which is in effect an isen
 #. `Chemistry LibreTexts <https://chem.libretexts.org/Courses/Millersville_University/CHEM_341-_Physical_Chemistry_I/04%3A_Putting_the_First_Law_to_Work/4.05%3A_The_Joule-Thomson_Effect>`__.
 """
 
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     symbols,
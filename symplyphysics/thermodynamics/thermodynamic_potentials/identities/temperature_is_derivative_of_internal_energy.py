@@ -9,7 +9,8 @@ Temperature of a thermodynamic system can be found when internal energy is known
 #. `Wikipedia <https://en.wikipedia.org/wiki/Internal_energy#Internal_energy_of_multi-component_systems>`__.
 """
 
-from sympy import Eq, Derivative, solve
+from sympy import Eq, Derivative
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
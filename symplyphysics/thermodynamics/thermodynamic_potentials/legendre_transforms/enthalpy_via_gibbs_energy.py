@@ -15,7 +15,8 @@ For example, enthalpy :math:`H` can be found using the Gibbs energy :math:`G` un
 #. `Wikipedia, equivalent concise form of this law <https://en.wikipedia.org/wiki/Gibbs%E2%80%93Helmholtz_equation>`__.
 """
 
-from sympy import Eq, Derivative, Point2D, solve
+from sympy import Eq, Derivative, Point2D
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
@@ -13,7 +13,8 @@ Internal energy via Helmholtz free energy
 #. `Wikipedia, see equivalent form of this law in table <https://en.wikipedia.org/wiki/Gibbs%E2%80%93Helmholtz_equation>`__.
 """
 
-from sympy import Eq, Derivative, Point2D, solve
+from sympy import Eq, Derivative, Point2D
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     Quantity,
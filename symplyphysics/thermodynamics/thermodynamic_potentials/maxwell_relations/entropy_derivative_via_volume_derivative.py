@@ -21,8 +21,8 @@ from sympy import (
     Derivative,
     symbols as sym_symbols,
     Function as SymFunction,
-    solve,
 )
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     symbols,
     units,
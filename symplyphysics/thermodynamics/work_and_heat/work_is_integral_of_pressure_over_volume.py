@@ -15,7 +15,8 @@ system changes.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Work_(thermodynamics)#Pressure%E2%80%93volume_work>`__.
 """
 
-from sympy import Eq, Integral, Point2D, solve
+from sympy import Eq, Integral, Point2D
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
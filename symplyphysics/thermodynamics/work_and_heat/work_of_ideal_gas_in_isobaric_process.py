@@ -15,7 +15,8 @@ by the gas is proportional to the pressure of the gas and its volume change.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Isobaric_process>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
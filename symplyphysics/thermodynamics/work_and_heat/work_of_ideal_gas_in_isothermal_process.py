@@ -21,7 +21,8 @@ To do this, the heat capacity of the external environment must be large enough,
 #. `Wikipedia <https://en.wikipedia.org/wiki/Isothermal_process#Calculation_of_work>`__.
 """
 
-from sympy import Eq, solve, log
+from sympy import Eq, log
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -17,7 +17,8 @@ in the medium.
 #. Equation 17-27 on p. 489 of "Fundamentals of Physics" by David Halladay et al., 10th Ed.
 """
 
-from sympy import Eq, solve, cos, Expr
+from sympy import Eq, cos, Expr
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol,
     clone_as_function)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -11,7 +11,8 @@ the angular frequency of the wave and the displacement of particles in the mediu
 #. Equation 17-14 on p. 484 of "Fundamentals of Physics" by David Halladay et al., 10th Ed.
 """
 
-from sympy import Eq, cos, sin, Wild, Q, solve
+from sympy import Eq, cos, sin, Wild, Q
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol,
     clone_as_function)
 from symplyphysics.core.expr_comparisons import expr_equals
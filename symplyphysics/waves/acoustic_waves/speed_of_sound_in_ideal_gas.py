@@ -15,7 +15,8 @@ for the speed of sound for ideal gases compared to the Newton's formula. See
 #. `Wikipedia <https://en.wikipedia.org/wiki/Speed_of_sound#Speed_of_sound_in_ideal_gases_and_air>`__.
 """
 
-from sympy import Eq, solve, sqrt
+from sympy import Eq, sqrt
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     symbols,
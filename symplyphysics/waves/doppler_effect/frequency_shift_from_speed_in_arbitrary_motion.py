@@ -17,7 +17,8 @@ Also see :ref:`Frequency shift from speed in collinear motion`.
     TODO find link to law with both angles
 """
 
-from sympy import Eq, cos, solve
+from sympy import Eq, cos
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -22,7 +22,8 @@ relation to an observer moving relative to the wave source.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Doppler_effect#General>`__.
 """
 
-from sympy import Eq, pi, solve
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -28,7 +28,8 @@ square of its angular frequency.
 #. `Physics LibreTexts, formula 16.5.1 <https://phys.libretexts.org/Bookshelves/University_Physics/University_Physics_(OpenStax)/Book%3A_University_Physics_I_-_Mechanics_Sound_Oscillations_and_Waves_(OpenStax)/16%3A_Waves/16.05%3A_Energy_and_Power_of_a_Wave>`__.
 """
 
-from sympy import Eq, cos, solve, sqrt, Symbol as SymSymbol
+from sympy import Eq, cos, sqrt, Symbol as SymSymbol
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, symbols, clone_as_symbol,
     clone_as_function)
 from symplyphysics.core.expr_comparisons import expr_equals
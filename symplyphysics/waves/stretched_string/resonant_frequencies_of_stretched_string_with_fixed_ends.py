@@ -12,7 +12,8 @@ the first harmonic, the mode corresponding to :math:`N = 2` is the second harmon
 #. `Wikipedia <https://en.wikipedia.org/wiki/String_vibration#Frequency_of_the_wave>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.oscillations import temporal_frequency_from_period as frequency_law
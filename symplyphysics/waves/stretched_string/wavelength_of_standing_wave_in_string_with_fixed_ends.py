@@ -16,7 +16,8 @@ string.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Standing_wave#Standing_wave_on_a_string_with_two_fixed_ends>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.waves import angular_wavenumber_is_inverse_wavelength as wavenumber_def
@@ -14,7 +14,8 @@ of the distance between the points and the wavelength of the wave.
 #. `BYJU's <https://byjus.com/physics/relation-between-phase-difference-and-path-difference/>`__.
 """
 
-from sympy import Eq, solve, pi
+from sympy import Eq, pi
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (Quantity, validate_input, validate_output, convert_to_float, symbols,
     clone_as_symbol)
 from symplyphysics.core.expr_comparisons import expr_equals
@@ -13,7 +13,8 @@ It is the speed at which the phase of one frequency component of the wave travel
     TODO: rename file
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.waves import angular_wavenumber_is_inverse_wavelength as wavenumber_def
@@ -20,7 +20,8 @@ collinear with the wavevector.
 #. `Wikipedia, derivable from here <https://en.wikipedia.org/wiki/Phase_velocity>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import Quantity, validate_input, validate_output, symbols, clone_as_symbol
 
 from symplyphysics.core.vectors import clone_as_vector_symbol, VectorNorm
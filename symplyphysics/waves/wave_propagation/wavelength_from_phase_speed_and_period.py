@@ -11,7 +11,8 @@ with the same wave phase.
 #. `Wikipedia <https://en.wikipedia.org/wiki/Wavelength#Mathematical_representation>`__.
 """
 
-from sympy import Eq, solve
+from sympy import Eq
+from symplyphysics.core.disk_cache import solve
 from symplyphysics import (
     Quantity,
     validate_input,
@@ -0,0 +1,98 @@
+import io
+import subprocess
+import sys
+from pathlib import Path
+import numpy as np
+from pytest import approx, raises
+from symplyphysics import units
+from symplyphysics.core.errors import UnitsError
+from symplyphysics.batch import evaluate_csv, main
+
+_OHM_LAW = "electromagnetism.circuits.direct_current.current_is_voltage_over_resistance"
+_ENERGY_LAW = "special_relativity.relativistic_dynamics.energy_and_momentum.relativistic_energy_via_relativistic_momentum_and_rest_mass"
+
+
+def _read(text: str) -> tuple[list[str], np.ndarray]:
+    header, *rows = text.splitlines()
+    return header.split(","), np.array([float(r.rsplit(",", 1)[1]) for r in rows])
+
+
+def test_evaluate_csv() -> None:
+    source = io.StringIO("id,voltage,resistance\n"
+        "a,1000,2\n"
+        "\n"
+        "b,3000,4\r\n"
+        "c,,4\n"
+        "d,5000,0.5\n"
+        "e,1000,0\n")
+    output = io.StringIO()
+    rows = evaluate_csv(_OHM_LAW,
+        "current",
+        source,
+        output,
+        units={
+        "voltage": units.milli * units.volt,
+        "current": "milli*ampere"
+        },
+        chunk_size=2)
+
+    assert rows == 5
+    header, values = _read(output.getvalue())
+    assert header == ["id", "voltage", "resistance", "current"]
+    assert output.getvalue().splitlines()[1].startswith("a,1000,2,")
+    assert values[[0, 1, 3]] == approx([500, 750, 10000])
+    # missing values and zero divisors
+    assert np.isnan(values[2]) and np.isnan(values[4])
+
+
+def test_law_with_several_solutions() -> None:
+    source = io.StringIO("relativistic_momentum,invariant_mass\n1e-16,1e-24\n")
+    output = io.StringIO()
+    evaluate_csv(_ENERGY_LAW, "relativistic_energy", source, output)
+    _, values = _read(output.getvalue())
+    assert values == approx([299792458 * np.hypot(1e-16, 1e-24 * 299792458)])
+
+
+def test_evaluate_in_workers(tmp_path: Path) -> None:
+    source = tmp_path / "data.csv"
+    voltages = np.linspace(1, 10, 1000)
+    source.write_text("voltage,resistance\n" + "".join(f"{v!r},2\n" for v in voltages.tolist()),
+        encoding="utf-8")
+    output = tmp_path / "result.csv"
+
+    assert main([_OHM_LAW, "-t", "current", "-i", str(source), "-o", str(output), "-j", "2",
+        "--chunk-size", "100"]) == 0
+    _, values = _read(output.read_text(encoding="utf-8"))
+    assert values == approx(voltages / 2)
+
+
+def test_bad_input() -> None:
+    with raises(ValueError):
+        evaluate_csv(_OHM_LAW, "current", io.StringIO("voltage,current\n1,2\n"), io.StringIO())
+    with raises(ValueError):
+        evaluate_csv(_OHM_LAW, "current", io.StringIO(""), io.StringIO())
+    with raises(ValueError):
+        evaluate_csv(_OHM_LAW,
+            "current",
+            io.StringIO("voltage,resistance\n1,2\n"),
+            io.StringIO(),
+            units={"power": "watt"})
+    with raises(UnitsError):
+        evaluate_csv(_OHM_LAW,
+            "current",
+            io.StringIO("voltage,resistance\n1,2\n"),
+            io.StringIO(),
+            units={"voltage": "meter"})
+    with raises(SystemExit):
+        main([_OHM_LAW, "-t", "current", "-u", "voltage"])
+
+
+def test_command_line(tmp_path: Path) -> None:
+    source = tmp_path / "data.csv"
+    source.write_text("voltage,current\n6,3\n", encoding="utf-8")
+    result = subprocess.run([sys.executable, "-m", "symplyphysics", "eval", _OHM_LAW, "--target",
+        "resistance", "--input", str(source), "--units", "resistance=kilo*ohm"],
+        capture_output=True,
+        text=True,
+        check=True)
+    assert result.stdout.splitlines() == ["voltage,current,resistance", "6,3,0.002"]
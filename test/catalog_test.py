@@ -0,0 +1,114 @@
+from pathlib import Path
+from pytest import fixture, raises
+from sympy.physics import units
+from symplyphysics.catalog import LawIndex, build_index, find_laws, load_index, main
+
+_FAKE_LAW = '''"""
+Fake law
+========
+
+Fake law with a member defined by other means.
+"""
+
+from sympy import Eq
+from symplyphysics import clone_as_symbol, symbols, units, Symbol
+
+force = clone_as_symbol(symbols.force, subscript="1")
+"""
+Force.
+"""
+
+mass = symbols.mass
+"""
+Mass.
+"""
+
+acceleration = Symbol("a", units.length / units.time**2)
+"""
+Acceleration.
+"""
+
+law = Eq(force, mass * acceleration)
+"""
+:laws:symbol::
+"""
+
+raise RuntimeError("This module should not be imported.")
+'''
+
+
+@fixture(name="index", scope="module")
+def index_fixture() -> LawIndex:
+    return build_index(Path("symplyphysics", "electromagnetism", "circuits", "direct_current"))
+
+
+def test_build_index(index: LawIndex) -> None:
+    law = index["electromagnetism.circuits.direct_current.current_is_voltage_over_resistance"]
+    assert law.title == "Current is voltage over resistance"
+    assert law.path == ("symplyphysics/electromagnetism/circuits/direct_current/"
+        "current_is_voltage_over_resistance.py")
+    assert [s.name for s in law.symbols] == ["current", "voltage", "resistance"]
+    assert law.output == "current"
+
+    resistance = law.symbol("resistance")
+    assert resistance.display == "R"
+    assert resistance.kind == "symbol"
+    assert resistance.origin == "electrical_resistance"
+    assert resistance.dimension == "impedance"
+
+    function = law.functions[0]
+    assert function.name == "calculate_current"
+    assert function.parameters == ["voltage_", "resistance_"]
+    assert function.inputs == {"voltage_": "voltage", "resistance_": "resistance"}
+    assert function.output == "current"
+
+
+def test_find_laws(index: LawIndex) -> None:
+    found = index.find_laws(outputs=units.current, inputs=[units.voltage, units.ohm])
+    assert [law.module.rsplit(".", 1)[1] for law in found] == [
+        "current_is_voltage_over_resistance"
+    ]
+
+    found = index.find_laws(outputs=units.power, inputs=["electrical_resistance"])
+    assert {law.module.rsplit(".", 1)[1] for law in found} == {
+        "power_via_current_and_resistance",
+        "power_via_voltage_and_resistance",
+    }
+
+    # inputs are matched to distinct symbols
+    assert not index.find_laws(outputs=units.current, inputs=[units.voltage, units.voltage])
+    assert not index.find_laws(outputs=units.mass)
+    assert len(index.find_laws()) == len(index)
+
+
+def test_static_parsing(tmp_path: Path) -> None:
+    (tmp_path / "fake_law.py").write_text(_FAKE_LAW, encoding="utf-8")
+    (tmp_path / "_private.py").write_text(_FAKE_LAW, encoding="utf-8")
+    index = build_index(tmp_path)
+    assert len(index) == 1
+
+    law = index[f"{tmp_path.name}.fake_law"]
+    assert law.symbol("force").display == "F_1"
+    assert law.symbol("acceleration").dimension == "length/time**2"
+    assert law.symbol("acceleration").base_dimensions == {"length": "1", "time": "-2"}
+    assert find_laws(units.force, [units.mass, units.acceleration], index=index) == [law]
+    assert find_laws("force", ["mass"], index=index) == [law]
+
+
+def test_save_and_load(index: LawIndex, tmp_path: Path) -> None:
+    path = tmp_path / "laws.json"
+    index.save(path)
+    loaded = load_index(path)
+    assert loaded.laws == index.laws
+    assert find_laws(units.power, [units.current], index=path) == index.find_laws(
+        units.power, [units.current])
+
+    path.write_text('{"version": 0, "laws": []}', encoding="utf-8")
+    with raises(ValueError):
+        load_index(path)
+
+
+def test_main(tmp_path: Path) -> None:
+    path = tmp_path / "laws.json"
+    main(["-o", str(path), "--source", "symplyphysics/electromagnetism/circuits/direct_current"])
+    assert len(load_index(path)) > 0
@@ -0,0 +1,76 @@
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+from types import ModuleType
+import numpy as np
+from pytest import approx, raises
+from symplyphysics.codegen import generate_law_module, generate_package, main
+
+_CIRCUITS = "electromagnetism.circuits.direct_current"
+_OHM_LAW = f"{_CIRCUITS}.current_is_voltage_over_resistance"
+
+
+def _load(path: Path) -> ModuleType:
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_generate_law(tmp_path: Path) -> None:
+    path = tmp_path / "ohm_law.py"
+    path.write_text(generate_law_module(_OHM_LAW), encoding="utf-8")
+    module = _load(path)
+
+    assert module.__all__ == ["calculate_current"]
+    assert module.calculate_current(np.array([1.0, 2.0]), 2.0) == approx([0.5, 1.0])
+    assert "ampere" in module.calculate_current.__doc__
+
+
+def test_generate_targets(tmp_path: Path) -> None:
+    path = tmp_path / "ohm_law.py"
+    assert main([_OHM_LAW, "-o", str(path), "-t", "voltage", "-t", "resistance",
+        "--check-dimensions"]) == 0
+    module = _load(path)
+
+    assert module.calculate_voltage(2.0, 3.0) == approx(6.0)
+    assert module.calculate_resistance(voltage=6.0, current=2.0) == approx(3.0)
+
+    ohm = {"mass": 1, "length": 2, "time": -3, "current": -2}
+    assert module.calculate_voltage(2.0, (3.0, ohm)) == approx(6.0)
+    with raises(ValueError):
+        module.calculate_voltage(2.0, (3.0, {"length": 1}))
+
+
+def test_generate_square_root(tmp_path: Path) -> None:
+    path = tmp_path / "power_law.py"
+    source = generate_law_module(f"{_CIRCUITS}.power_via_current_and_resistance", ["current"])
+    path.write_text(source, encoding="utf-8")
+    module = _load(path)
+
+    # the current is the positive root
+    assert module.calculate_current(power=4.0, resistance=1.0) == approx(2.0)
+    assert module.calculate_current(np.array([1.0, 9.0]), 1.0) == approx([1.0, 3.0])
+
+
+def test_bad_law() -> None:
+    with raises(ValueError):
+        generate_law_module(_OHM_LAW, ["unknown"])
+
+
+def test_generate_package(tmp_path: Path) -> None:
+    output = tmp_path / "laws"
+    report = generate_package(_CIRCUITS, output)
+    # sums over indexed symbols cannot be generated
+    assert list(report.failed) == [
+        f"symplyphysics.{_CIRCUITS}.resistance.resistance_in_serial_connection",
+    ]
+    assert str(output / "current_is_voltage_over_resistance.py") in report.generated
+    assert (output / "__init__.py").exists()
+
+    # generated modules do not depend on SymPy
+    code = ("import sys; import laws.current_is_voltage_over_resistance as law; "
+        "assert law.calculate_current(4.0, 2.0) == 2.0; assert 'sympy' not in sys.modules")
+    subprocess.run([sys.executable, "-c", code], cwd=tmp_path, check=True)
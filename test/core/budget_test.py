@@ -0,0 +1,152 @@
+import threading
+from typing import Any
+from pytest import MonkeyPatch, raises
+from sympy import Eq, exp, solve
+from sympy.core.parameters import global_parameters
+from symplyphysics import (units, Quantity, Symbol, validate_input, validate_output,
+    assert_equal)
+from symplyphysics.core import budget
+from symplyphysics.core.budget import LatencyReport, latency_budget, bounded_latency
+from symplyphysics.core.memo import ResultCache, memoize_results
+
+# The functions below emulate law functions whose symbolic work takes too long.
+
+length = Symbol("l", units.length)
+time = Symbol("t", units.time)
+speed = Symbol("v", units.speed)
+
+law = Eq(length, speed * time + speed * time**2 * exp(length / (length + units.meter)) / units.second)
+
+
+def _stall() -> None:
+    for _ in range(10**9):
+        pass
+
+
+@validate_input(speed_=speed, time_=time)
+@validate_output(length)
+def calculate_length(speed_: Quantity, time_: Quantity) -> Quantity:
+    _stall()
+    return Quantity(0)
+
+
+@validate_input(length_=length, time_=time)
+@validate_output(speed)
+def calculate_speed(length_: Quantity, time_: Quantity) -> Quantity:
+    result = solve(law, speed)[0]
+    return Quantity(result.subs({length: length_, time: time_}))
+
+
+@validate_input(speed_=speed, time_=time)
+@validate_output(length)
+def calculate_unevaluated(speed_: Quantity, time_: Quantity) -> Quantity:
+    # emulates an interruption that skips the exit of `evaluate(False)`
+    global_parameters.evaluate = False
+    _stall()
+    global_parameters.evaluate = True
+    return Quantity(0)
+
+
+@validate_input(speed_=speed, time_=time)
+@validate_output(length)
+def calculate_swallowing(speed_: Quantity, time_: Quantity) -> Quantity:
+    try:
+        _stall()
+    except BaseException:  # pylint: disable=broad-exception-caught
+        # the budget is not enforced again
+        for _ in range(10**6):
+            pass
+    return Quantity(0)
+
+
+@validate_input(speed_=units.speed, time_=units.time)
+@validate_output(units.length)
+def calculate_without_law_symbols(speed_: Quantity, time_: Quantity) -> Quantity:
+    _stall()
+    return Quantity(0)
+
+
+def test_symbolic_path() -> None:
+    with latency_budget(10) as report:
+        result = calculate_speed(Quantity(1 * units.meter), Quantity(1 * units.second))
+    assert report.paths == ["symbolic"]
+    assert_equal(result, 1 / (1 + exp(0.5)) * units.meter / units.second)
+
+
+def test_numeric_fallback_root_finding() -> None:
+    speed_ = Quantity(2 * units.meter / units.second)
+    time_ = Quantity(0.5 * units.second)
+    with latency_budget(0.05) as report:
+        result = calculate_length(speed_, time_)
+    assert report.path == "numeric"
+    assert report.fallbacks == 1
+    assert report.records[0].elapsed < 5
+
+    l = result.scale_factor
+    assert abs(l - (1 + 0.5 * exp(l / (l + 1)))) < 1e-9
+    assert_equal(law.rhs.subs({speed: speed_, time: time_, length: result}), result)
+
+
+def test_bounded_latency_decorator() -> None:
+    report = LatencyReport()
+    bounded = bounded_latency(0.05, report)(calculate_length)
+    bounded(Quantity(2 * units.meter / units.second), Quantity(0.5 * units.second))
+    bounded(speed_=Quantity(2 * units.meter / units.second), time_=Quantity(0.5 * units.second))
+    assert report.paths == ["numeric", "numeric"]
+
+
+def test_timeout_without_fallback() -> None:
+    args: Any = (Quantity(units.meter / units.second), Quantity(units.second))
+    with raises(TimeoutError):
+        with latency_budget(0.05):
+            calculate_without_law_symbols(*args)
+
+
+def test_bad_budget() -> None:
+    with raises(ValueError):
+        with latency_budget(0):
+            pass
+
+
+def test_single_watchdog_thread() -> None:
+    for _ in range(3):
+        with latency_budget(0.02) as report:
+            calculate_length(Quantity(2 * units.meter / units.second), Quantity(0.5 * units.second))
+        assert report.path == "numeric"
+    watchdogs = [t for t in threading.enumerate() if t.name == "symplyphysics-latency-budget"]
+    assert len(watchdogs) == 1
+
+
+def test_numeric_fallback_is_capped(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(budget, "_find_root", lambda *_: _stall())
+    with raises(TimeoutError):
+        with latency_budget(0.05):
+            calculate_length(Quantity(2 * units.meter / units.second), Quantity(0.5 * units.second))
+
+
+def test_numeric_results_are_not_cached() -> None:
+    args: Any = (Quantity(2 * units.meter / units.second), Quantity(0.5 * units.second))
+    with memoize_results(ResultCache()) as cache:
+        with latency_budget(0.05) as report:
+            calculate_length(*args)
+            calculate_length(*args)
+        assert report.paths == ["numeric", "numeric"]
+        assert len(cache) == 0
+
+        with latency_budget(10) as report:
+            calculate_speed(Quantity(units.meter), Quantity(units.second))
+            calculate_speed(Quantity(units.meter), Quantity(units.second))
+        assert cache.stats().hits == 1
+
+
+def test_sympy_parameters_are_restored() -> None:
+    with latency_budget(0.05) as report:
+        calculate_unevaluated(Quantity(2 * units.meter / units.second), Quantity(0.5 * units.second))
+    assert report.path == "numeric"
+    assert global_parameters.evaluate
+
+
+def test_interrupted_once() -> None:
+    with latency_budget(0.05) as report:
+        calculate_swallowing(Quantity(2 * units.meter / units.second), Quantity(0.5 * units.second))
+    assert report.path == "symbolic"
@@ -1,8 +1,9 @@
 from typing import Sequence, Optional
 from pytest import raises
-from sympy import ImmutableMatrix, sqrt, Expr, Rational
-from symplyphysics import Symbol, units
-from symplyphysics.core.coordinate_systems import BaseCoordinateSystem
+from sympy import ImmutableMatrix, sqrt, Expr, Rational, cos, sin
+from symplyphysics import Symbol, units, clone_as_function
+from symplyphysics.core.coordinate_systems import (BaseCoordinateSystem,
+    CartesianCoordinateSystem, CylindricalCoordinateSystem, SphericalCoordinateSystem)
 
 
 def test_no_generate_base_scalars() -> None:
@@ -61,3 +62,47 @@ def test_parabolic_system() -> None:
         [Rational(3, 5), Rational(4, 5), 0],
         [0, 0, 1],
     ])
+
+
+def test_metric_data_is_lazy() -> None:
+    calls: list[str] = []
+
+    class CountingCoordinateSystem(CylindricalCoordinateSystem):
+
+        def generate_base_vector_matrix(self) -> ImmutableMatrix:
+            calls.append("base_vector_matrix")
+            return super().generate_base_vector_matrix()
+
+    rho, phi, z = Symbol("rho", units.length), Symbol("phi"), Symbol("z", units.length)
+    sys = CountingCoordinateSystem([rho, phi, z])
+    assert not calls
+
+    matrix = ImmutableMatrix([[cos(phi), sin(phi), 0], [-sin(phi), cos(phi), 0], [0, 0, 1]])
+    assert sys.base_vector_matrix() == matrix
+    assert sys.base_vector_matrix() == matrix
+    assert calls == ["base_vector_matrix"]
+
+    # memoized per class and base scalars
+    other = CountingCoordinateSystem([rho, phi, z], [clone_as_function(s) for s in (rho, phi, z)])
+    assert other is not sys
+    assert other.base_vector_matrix() == matrix
+    assert calls == ["base_vector_matrix"]
+
+
+def test_precomputed_metric_data() -> None:
+    rho, phi, z = Symbol("rho", units.length), Symbol("phi"), Symbol("z", units.length)
+    r, theta = Symbol("r", units.length), Symbol("theta")
+
+    for sys in (
+            CartesianCoordinateSystem(),
+            CylindricalCoordinateSystem(),
+            CylindricalCoordinateSystem([rho, phi, z]),
+            SphericalCoordinateSystem(),
+            SphericalCoordinateSystem([r, theta, phi]),
+    ):
+        # pylint: disable=protected-access
+        assert sys._cartesian_derivative_matrix == (
+            BaseCoordinateSystem.generate_cartesian_derivative_matrix(sys))
+        assert sys._base_vector_matrix == BaseCoordinateSystem.generate_base_vector_matrix(sys)
+        assert sys._diff_base_vector_matrix == (
+            BaseCoordinateSystem.generate_diff_base_vector_matrix(sys))
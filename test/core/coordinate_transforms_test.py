@@ -0,0 +1,76 @@
+import numpy as np
+from pytest import approx, raises
+from symplyphysics import errors
+from symplyphysics.core.coordinate_systems import CARTESIAN, CYLINDRICAL, SPHERICAL
+from symplyphysics.core.coordinate_transforms import (transform_points, transform_vectors,
+    clear_transform_cache)
+
+_points = np.array([[1.0, 0.0, 1.0], [0.0, 2.0, 0.0], [1.0, 1.0, 1.0], [-1.0, -2.0, 0.5]])
+_vectors = np.array([[1.0, 2.0, 3.0], [0.0, -1.0, 0.5], [2.0, 0.0, 0.0], [1.0, 1.0, 1.0]])
+
+
+def test_transform_points() -> None:
+    spherical = transform_points(_points, CARTESIAN, SPHERICAL)
+    assert spherical.shape == (4, 3)
+    assert spherical[0] == approx([np.sqrt(2), np.pi / 4, 0])
+    assert spherical[1] == approx([2, np.pi / 2, np.pi / 2])
+
+    cylindrical = transform_points(_points, CARTESIAN, CYLINDRICAL)
+    assert cylindrical[2] == approx([np.sqrt(2), np.pi / 4, 1])
+
+    # the symbolic transform gives the same values
+    x, y, z = CYLINDRICAL.cartesian_transform(cylindrical[3].tolist())
+    assert [float(x), float(y), float(z)] == approx(_points[3].tolist())
+
+
+def test_round_trips() -> None:
+    systems = (CARTESIAN, CYLINDRICAL, SPHERICAL)
+    for source in systems:
+        points = transform_points(_points, CARTESIAN, source)
+        for target in systems:
+            transformed = transform_points(points, source, target)
+            assert transform_points(transformed, target, CARTESIAN) == approx(_points)
+
+            vectors = transform_vectors(_vectors, _points, CARTESIAN, source)
+            converted = transform_vectors(vectors, points, source, target)
+            assert transform_vectors(converted, transformed, target, CARTESIAN) == approx(_vectors)
+
+
+def test_transform_vectors() -> None:
+    spherical = transform_vectors(_vectors, _points, CARTESIAN, SPHERICAL)
+    # the first point lies in the xz plane at 45 degrees to the z axis
+    assert spherical[0] == approx([4 / np.sqrt(2), -2 / np.sqrt(2), 2])
+    # lengths of vectors do not change
+    assert np.linalg.norm(spherical, axis=-1) == approx(np.linalg.norm(_vectors, axis=-1))
+
+    # vectors applied at a single point
+    single = transform_vectors(_vectors, _points[0], CARTESIAN, CYLINDRICAL)
+    assert single[:, 2] == approx(_vectors[:, 2])
+
+
+def test_units() -> None:
+    cylindrical = transform_points((_points, "kilometer"), CARTESIAN, CYLINDRICAL)
+    assert cylindrical[1] == approx([2000, np.pi / 2, 0])
+
+    # angles are not scaled
+    cartesian = transform_points(([[1.0, np.pi / 2, 0.0]], "kilometer"), SPHERICAL, CARTESIAN)
+    assert cartesian[0] == approx([1000, 0, 0], abs=1e-9)
+
+    vectors = transform_vectors((_vectors, "kilometer/hour"), _points, CARTESIAN, CARTESIAN)
+    assert vectors == approx(_vectors / 3.6)
+
+    with raises(errors.UnitsError):
+        transform_points((_points, "second"), CARTESIAN, SPHERICAL)
+
+
+def test_bad_shape() -> None:
+    with raises(ValueError):
+        transform_points(np.zeros((4, 2)), CARTESIAN, SPHERICAL)
+    with raises(ValueError):
+        transform_vectors(1.0, _points, CARTESIAN, SPHERICAL)
+
+
+def test_clear_transform_cache() -> None:
+    first = transform_points(_points, CARTESIAN, SPHERICAL)
+    clear_transform_cache()
+    assert transform_points(_points, CARTESIAN, SPHERICAL) == approx(first)
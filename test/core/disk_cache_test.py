@@ -0,0 +1,144 @@
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from pytest import MonkeyPatch, fixture, raises
+import sympy
+from sympy import Derivative, Eq, Symbol as SymSymbol, Function as SymFunction, sin
+from symplyphysics import units, Quantity, symbols, clone_as_function
+from symplyphysics.core import disk_cache
+from symplyphysics.core.vectors import VectorNorm, VectorSymbol
+from symplyphysics.core.disk_cache import (DiskCache, active_disk_cache, enable_disk_cache,
+    disable_disk_cache, disk_cacheit, dsolve, solve)
+
+_calls: list[int] = []
+
+
+@disk_cacheit
+def _counted_solve(expr: Eq, symbol: SymSymbol) -> list[dict[SymSymbol, SymSymbol]]:
+    _calls.append(1)
+    return sympy.solve(expr, symbol, dict=True)
+
+
+def _store(directory: str, index: int) -> int:
+    cache = DiskCache(directory)
+    for i in range(20):
+        cache.put(f"{index}-{i}", bytes(100))
+    return len(cache)
+
+
+@fixture(name="cache")
+def cache_fixture(tmp_path: Path, monkeypatch: MonkeyPatch) -> DiskCache:
+    monkeypatch.setattr(disk_cache, "_disk_cache", None)
+    _calls.clear()
+    return enable_disk_cache(tmp_path)
+
+
+def test_disabled_cache(monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.setattr(disk_cache, "_disk_cache", None)
+    assert active_disk_cache() is None
+    x = SymSymbol("x")
+    assert solve(Eq(2 * x, 4), x) == [2]
+
+
+def test_cached_calls(cache: DiskCache) -> None:
+    x = symbols.position
+    y = SymSymbol("y", positive=True)
+    first = _counted_solve(Eq(x * y, 4), x)
+    second = _counted_solve(Eq(x * y, 4), x)
+    assert first == second == [{x: 4 / y}]
+    # the stored symbols are replaced with the symbols of the call
+    assert next(iter(second[0])) is x
+    assert len(_calls) == 1
+    assert len(cache) == 1
+
+    # assumptions are a part of the key
+    _counted_solve(Eq(x * SymSymbol("y"), 4), x)
+    assert len(_calls) == 2
+
+    disable_disk_cache()
+    _counted_solve(Eq(x * y, 4), x)
+    assert len(_calls) == 3
+
+
+def test_cached_functions(cache: DiskCache) -> None:
+    time = symbols.time
+    speed = clone_as_function(symbols.speed, [time])
+    eqn = Eq(Derivative(speed(time), time), sin(time))
+
+    first = dsolve(eqn, speed(time))
+    second = dsolve(eqn, speed(time))
+    assert first == second
+    assert second.lhs.func is speed
+    assert len(cache) == 1
+
+    # a plain function with the same name is not confused with the law function
+    other = SymFunction(str(speed), real=True)
+    assert dsolve(eqn.subs(speed(time), other(time)), other(time)).lhs.func is other
+    assert len(cache) == 2
+
+
+def test_cached_quantities(cache: DiskCache) -> None:
+    x = SymSymbol("x")
+    first = _counted_solve(Eq(x * Quantity(2 * units.second), Quantity(3 * units.meter)), x)
+    duration, distance = Quantity(2 * units.second), Quantity(3 * units.meter)
+    second = _counted_solve(Eq(x * duration, distance), x)
+    assert len(_calls) == 1
+    assert len(cache) == 1
+    # the stored quantities are replaced with the quantities of the call
+    assert second == [{x: distance / duration}]
+    assert first != second
+
+    # scale factors, dimensions and signs are a part of the key
+    _counted_solve(Eq(x * duration, Quantity(4 * units.meter)), x)
+    _counted_solve(Eq(x * duration, Quantity(3 * units.kilogram)), x)
+    _counted_solve(Eq(x * duration, Quantity(-3 * units.meter)), x)
+    assert len(_calls) == 4
+
+
+def test_uncacheable_calls(cache: DiskCache) -> None:
+    x = SymSymbol("x")
+    assert solve(Eq(x, VectorNorm(VectorSymbol("F"))), x)
+    assert len(cache) == 0
+
+
+def test_eviction(tmp_path: Path) -> None:
+    cache = DiskCache(tmp_path, max_bytes=1000)
+    for i in range(15):
+        cache.put(str(i), bytes(100))
+    assert cache.size() <= 1000
+    assert cache.get("0") is None
+    assert cache.get("14") == bytes(100)
+
+    with raises(ValueError):
+        DiskCache(tmp_path, max_bytes=0)
+
+
+def test_signed_entries(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.delenv("SYMPLYPHYSICS_CACHE_KEY", raising=False)
+    cache = DiskCache(tmp_path)
+    cache.put("key", b"value")
+    assert DiskCache(tmp_path).get("key") == b"value"
+    assert (tmp_path / "cache.key").stat().st_mode & 0o777 == 0o600
+
+    # entries written with another key are ignored
+    DiskCache(tmp_path, key=b"other").put("key", b"forged")
+    assert cache.get("key") is None
+    # entries moved to another key are ignored
+    cache.put("key", b"value")
+    with sqlite3.connect(cache.path) as connection:
+        connection.execute("UPDATE entries SET key = 'moved'")
+    assert cache.get("moved") is None
+
+    # the key file should be private
+    (tmp_path / "cache.key").chmod(0o644)
+    with raises(ValueError):
+        DiskCache(tmp_path)
+    monkeypatch.setenv("SYMPLYPHYSICS_CACHE_KEY", "shared")
+    DiskCache(tmp_path).put("key", b"value")
+    assert DiskCache(tmp_path).get("key") == b"value"
+
+
+def test_concurrent_processes(tmp_path: Path) -> None:
+    with ProcessPoolExecutor(2) as executor:
+        list(executor.map(_store, [str(tmp_path)] * 4, range(4)))
+    assert len(DiskCache(tmp_path)) == 80
@@ -0,0 +1,86 @@
+import asyncio
+import threading
+from typing import Any
+from pytest import raises
+from symplyphysics import errors, units, Quantity, assert_equal
+from symplyphysics.core.executor import AsyncLawExecutor, acalculate
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+
+_calls: list[Any] = []
+_release = threading.Event()
+
+
+def _blocking_law(value: Quantity) -> Quantity:
+    _calls.append(value)
+    _release.wait(5)
+    return value
+
+
+def test_acalculate() -> None:
+    voltage = Quantity(3 * units.volt)
+    resistance = Quantity(2 * units.ohm)
+    result = asyncio.run(acalculate(ohm_law.calculate_current, voltage, resistance))
+    assert_equal(result, 1.5 * units.ampere)
+
+
+def test_errors_are_propagated() -> None:
+    with raises(errors.UnitsError):
+        asyncio.run(acalculate(ohm_law.calculate_current, Quantity(units.meter), Quantity(units.ohm)))
+
+
+def test_identical_calls_are_coalesced() -> None:
+    _calls.clear()
+    _release.clear()
+
+    async def scenario() -> list[Any]:
+        with AsyncLawExecutor("thread", max_workers=4) as executor:
+            tasks = [
+                asyncio.create_task(executor.run(_blocking_law, Quantity(2 * units.meter)))
+                for _ in range(5)
+            ]
+            other = asyncio.create_task(executor.run(_blocking_law, Quantity(3 * units.meter)))
+            await asyncio.sleep(0.05)
+            assert executor.in_flight == 2
+            _release.set()
+            results = await asyncio.gather(*tasks, other)
+            assert executor.in_flight == 0
+            return results
+
+    results = asyncio.run(scenario())
+    assert len(_calls) == 2
+    for result in results[:5]:
+        assert_equal(result, 2 * units.meter)
+    assert_equal(results[5], 3 * units.meter)
+
+
+def test_cancelled_call_is_dropped() -> None:
+    _calls.clear()
+    _release.clear()
+
+    async def scenario() -> None:
+        with AsyncLawExecutor("thread", max_workers=1) as executor:
+            running = asyncio.create_task(executor.run(_blocking_law, Quantity(1)))
+            queued = asyncio.create_task(executor.run(_blocking_law, Quantity(2)))
+            await asyncio.sleep(0.05)
+            queued.cancel()
+            with raises(asyncio.CancelledError):
+                await queued
+            _release.set()
+            await running
+
+    asyncio.run(scenario())
+    assert len(_calls) == 1
+
+
+def test_process_executor() -> None:
+    voltage = Quantity(3 * units.volt)
+    resistance = Quantity(2 * units.kilo * units.ohm)
+
+    async def scenario() -> Any:
+        async with AsyncLawExecutor("process", max_workers=1) as executor:
+            return await acalculate(ohm_law.calculate_current,
+                voltage_=voltage,
+                resistance_=resistance,
+                executor=executor)
+
+    assert_equal(asyncio.run(scenario()), 1.5e-3 * units.ampere)
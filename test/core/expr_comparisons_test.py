@@ -1,5 +1,7 @@
-from sympy import symbols, sin, cos, pi
-from symplyphysics.core.expr_comparisons import expr_equals, expr_equals_abs
+from sympy import (symbols, sin, cos, pi, sqrt, floor, Abs, Derivative, Float, Function, Piecewise,
+    S)
+from symplyphysics.core.expr_comparisons import (Comparison, compare_expressions, expr_equals,
+    expr_equals_abs, numeric_equals)
 
 
 def test_basic_comparison() -> None:
@@ -33,3 +35,65 @@ def test_basic_abs_comparison() -> None:
     assert expr_equals_abs(x1, -x1)
     assert expr_equals_abs(-x1, -x1)
     assert not expr_equals_abs(x1, x2)
+
+
+def test_comparison_tiers() -> None:
+    x1, x2 = symbols("x1 x2")
+    assert compare_expressions(x1 + x2, x2 + x1) == Comparison(True, "structural")
+    assert compare_expressions((x1 + x2)**2, x1**2 + 2 * x1 * x2 + x2**2).tier == "numeric"
+    assert compare_expressions(sin(x1), cos(x1)) == Comparison(False, "symbolic")
+
+
+def test_numeric_assumptions() -> None:
+    x1 = symbols("x1")
+    x2 = symbols("x2", positive=True)
+    assert numeric_equals(sqrt(x2**2), x2)
+    assert not numeric_equals(sqrt(x1**2), x1)
+    assert not expr_equals(sqrt(x1**2), x1)
+
+
+def test_numeric_undefined_functions() -> None:
+    x1 = symbols("x1")
+    f = Function("f")
+    lhs = Derivative(f(x1), x1) * (x1 + 1)**2
+    rhs = Derivative(f(x1), x1) * x1**2 + 2 * x1 * Derivative(f(x1), x1) + Derivative(f(x1), x1)
+    assert compare_expressions(lhs, rhs).tier == "numeric"
+    assert expr_equals(lhs, rhs)
+
+
+def test_numeric_singularity() -> None:
+    x1 = symbols("x1", integer=True)
+    assert numeric_equals(x1 / x1, 1)
+    assert numeric_equals(x1, x1 + S.ComplexInfinity) is None
+
+
+def test_numeric_tier_never_confirms_unequal() -> None:
+    a, b = symbols("a b")
+    n = symbols("n", integer=True, nonnegative=True)
+    x = symbols("x", positive=True)
+    assert not expr_equals(a, a + Float("1e-14") * b)
+    assert not expr_equals(a, a + Float("1e-20"))
+    assert not expr_equals(floor(n / 10), 0)
+    assert not expr_equals(floor(x / 100), 0)
+    assert not expr_equals(Piecewise((1, x < 100), (2, True)), 1)
+    assert not expr_equals(sqrt(a**2) * sqrt(b**2), a * b)
+
+    # equal expressions with opaque or piecewise subexpressions are still confirmed
+    assert expr_equals(Float("0.5") * (a + b)**2, Float("0.5") * (a**2 + 2 * a * b + b**2))
+    assert compare_expressions(floor(x) * (x + 1)**2,
+        floor(x) * (x**2 + 2 * x + 1)) == Comparison(True, "symbolic")
+
+
+def test_numeric_tier_never_confirms_piecewise() -> None:
+    a, b = symbols("a b", real=True)
+    assert compare_expressions(Abs(a * b), -a * b) == Comparison(False, "symbolic")
+    assert compare_expressions(sqrt(a**2 * b**2), -a * b) == Comparison(False, "symbolic")
+    assert compare_expressions(Abs(a) + Abs(b), Abs(a - b)) == Comparison(False, "symbolic")
+
+    for seed in range(20):
+        assert numeric_equals(Abs(a * b), -a * b, seed=seed) is None
+        assert numeric_equals(sqrt(a**2 * b**2), -a * b, seed=seed) is None
+
+    # powers of positive expressions are still compared numerically
+    x = symbols("x", positive=True)
+    assert compare_expressions(sqrt(x**3 + x**2), x * sqrt(x + 1)).tier == "numeric"
@@ -0,0 +1,91 @@
+import numpy as np
+from pytest import approx, raises
+from sympy import Eq, exp
+from symplyphysics import units, Quantity, Symbol, convert_to_float
+from symplyphysics.core.errors import UnitsError
+from symplyphysics.core.fitting import fit
+from symplyphysics.condensed_matter.electrical_properties import resistance_from_temperature as resistance_law
+from symplyphysics.electromagnetism.circuits.direct_current import power_via_current_and_resistance as power_law
+
+_ZERO_CELSIUS = 273.15
+
+
+def test_fit_linear_law() -> None:
+    rng = np.random.default_rng(0)
+    temperatures = np.linspace(250, 400, 100_000)
+    resistances = 2e3 * (1 + 4e-3 * (temperatures - _ZERO_CELSIUS))
+    noisy = resistances + rng.normal(0, 1, temperatures.shape)
+
+    result = fit(resistance_law, {
+        "resistance": (noisy / 1e3, "kilo*ohm"),
+        "temperature": (temperatures, "kelvin"),
+    },
+        free=["resistance_initial", "temperature_coefficient"])
+    assert result.converged
+    initial = convert_to_float(result.parameters["resistance_initial"] / units.ohm)
+    coefficient = convert_to_float(result.parameters["temperature_coefficient"] * units.kelvin)
+    assert initial == approx(2e3, rel=1e-4)
+    assert coefficient == approx(4e-3, rel=1e-4)
+
+    error = convert_to_float(result.standard_errors["resistance_initial"] / units.ohm)
+    assert 0 < error < 0.1
+    assert result.covariance.shape == (2, 2)
+    assert np.diagonal(result.correlation) == approx([1, 1])
+    assert np.std(result.residuals) == approx(1, rel=1e-2)
+
+
+def test_fit_nonlinear_law() -> None:
+    time = Symbol("t", units.time)
+    charge = Symbol("q", units.charge)
+    initial_charge = Symbol("q_0", units.charge)
+    time_constant = Symbol("tau", units.time)
+    law = Eq(charge, initial_charge * exp(-time / time_constant))
+
+    times = np.linspace(0, 5, 1000)
+    result = fit(law, {
+        "t": times,
+        "q": 3 * np.exp(-times / 2),
+    },
+        free=["q_0", "tau"],
+        guess={"tau": Quantity(1 * units.second)})
+    assert convert_to_float(result.parameters["q_0"] / units.coulomb) == approx(3)
+    assert convert_to_float(result.parameters["tau"] / units.second) == approx(2)
+
+
+def test_fit_principal_solution() -> None:
+    # the current is the positive square root of the power over the resistance
+    powers = np.linspace(1, 10, 20)
+    currents = np.sqrt(powers / 4)
+    result = fit(power_law, {
+        "power": powers,
+        "current": currents,
+    },
+        free=["resistance"],
+        target="current")
+    assert result.converged
+    assert convert_to_float(result.parameters["resistance"] / units.ohm) == approx(4)
+
+
+def test_bad_fit() -> None:
+    temperatures = np.linspace(250, 400, 10)
+    with raises(UnitsError):
+        fit(resistance_law, {
+            "resistance": (temperatures, "ohm"),
+            "temperature": (temperatures, "meter"),
+        },
+            free=["resistance_initial", "temperature_coefficient"])
+    with raises(ValueError):
+        fit(resistance_law, {"resistance": temperatures},
+            free=["resistance_initial", "temperature_coefficient"])
+    with raises(ValueError):
+        fit(resistance_law, {
+            "resistance": temperatures,
+            "temperature": temperatures
+        },
+            free=["mass"])
+    with raises(ValueError):
+        fit(resistance_law, {
+            "resistance": [1.0],
+            "temperature": [1.0],
+        },
+            free=["resistance_initial", "temperature_coefficient"])
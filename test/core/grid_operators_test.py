@@ -0,0 +1,129 @@
+import numpy as np
+from pytest import approx, raises
+from sympy import Symbol as SymSymbol, cos, exp, sin
+from symplyphysics import units, Quantity
+from symplyphysics.core.coordinate_systems import (CARTESIAN, CYLINDRICAL, SPHERICAL, AppliedPoint,
+    CoordinateScalar, CoordinateVector)
+from symplyphysics.core.grid_operators import (Grid, evaluate_field, gradient, divergence, curl,
+    laplacian)
+
+x, y, z = CARTESIAN.base_scalars
+r, theta, phi = SPHERICAL.base_scalars
+_spherical_point = AppliedPoint([r, theta, phi], SPHERICAL)
+
+_cartesian_grid = Grid(CARTESIAN, [np.linspace(-1, 1, 21), np.linspace(0, 2, 31), [0.0, 0.5, 1.0]])
+_spherical_grid = Grid(SPHERICAL,
+    [np.linspace(1, 2, 31),
+    np.linspace(0.3, 2.8, 41),
+    np.linspace(0, 6, 51)])
+
+
+def _interior(values: np.ndarray, margin: int = 1) -> np.ndarray:
+    return values[margin:-margin, margin:-margin, margin:-margin]
+
+
+def test_grid() -> None:
+    assert _cartesian_grid.shape == (21, 31, 3)
+    a, b, c = _cartesian_grid.mesh()
+    assert a.shape == b.shape == c.shape == (21, 31, 3)
+    assert [(s.start, s.stop) for s in _cartesian_grid.chunks(8)] == [(0, 8), (8, 16), (16, 21)]
+
+    with raises(ValueError):
+        Grid(CARTESIAN, [[0, 1], [0, 1]])
+    with raises(ValueError):
+        Grid(CARTESIAN, [[0, 1], [1, 0], [0, 1]])
+    with raises(ValueError):
+        list(_cartesian_grid.chunks(0))
+
+
+def test_evaluate_field() -> None:
+    scalar = CoordinateScalar(x * y + Quantity(2 * units.meter**2), CARTESIAN)
+    values = evaluate_field(scalar, _cartesian_grid)
+    a, b, _ = _cartesian_grid.mesh()
+    assert values == approx(a * b + 2)
+    assert np.array_equal(evaluate_field(scalar, _cartesian_grid, chunk_size=4), values)
+
+    vector = CoordinateVector([1, x, z**2], CARTESIAN)
+    values = evaluate_field(vector, _cartesian_grid)
+    assert values.shape == (21, 31, 3, 3)
+    assert values[..., 0] == approx(np.ones((21, 31, 3)))
+
+    with raises(ValueError):
+        evaluate_field(CoordinateScalar(x * SymSymbol("k"), CARTESIAN), _cartesian_grid)
+    with raises(ValueError):
+        evaluate_field(x, _cartesian_grid)
+    with raises(ValueError):
+        evaluate_field(CoordinateScalar(r, SPHERICAL, _spherical_point), _cartesian_grid)
+
+
+def test_symbolic_operators() -> None:
+    a, b, c = _cartesian_grid.mesh()
+
+    scalar = CoordinateScalar(x**2 * y + z, CARTESIAN)
+    assert gradient(scalar, _cartesian_grid) == approx(np.stack([2 * a * b, a**2, c * 0 + 1], -1))
+    assert laplacian(scalar, _cartesian_grid) == approx(2 * b)
+
+    vector = CoordinateVector([-y, x, 0], CARTESIAN)
+    assert divergence(vector, _cartesian_grid) == approx(np.zeros(_cartesian_grid.shape))
+    assert curl(vector, _cartesian_grid)[..., 2] == approx(np.full(_cartesian_grid.shape, 2))
+
+    # vanishing results
+    constant = CoordinateScalar(1, CARTESIAN)
+    assert gradient(constant, _cartesian_grid) == approx(np.zeros(_cartesian_grid.shape + (3,)))
+
+
+def test_spherical_operators() -> None:
+    scalar = CoordinateScalar(r**2 * sin(theta) * cos(phi), SPHERICAL, _spherical_point)
+    samples = evaluate_field(scalar, _spherical_grid)
+
+    exact = gradient(scalar, _spherical_grid)
+    assert _interior(gradient(samples, _spherical_grid)) == approx(_interior(exact), abs=1e-2)
+
+    exact = laplacian(scalar, _spherical_grid)
+    numeric = laplacian(samples, _spherical_grid)
+    assert _interior(numeric, 2) == approx(_interior(exact, 2), abs=2e-2)
+
+    vector = CoordinateVector([r * cos(theta), r**2 * sin(phi), r * sin(theta)], SPHERICAL,
+        _spherical_point)
+    samples = evaluate_field(vector, _spherical_grid)
+    for operator in (divergence, curl):
+        exact = operator(vector, _spherical_grid)
+        assert _interior(operator(samples, _spherical_grid)) == approx(_interior(exact), abs=5e-2)
+
+
+def test_cylindrical_operators() -> None:
+    rho, _, height = CYLINDRICAL.base_scalars
+    point = AppliedPoint(CYLINDRICAL.base_scalars, CYLINDRICAL)
+    grid = Grid(CYLINDRICAL,
+        [np.linspace(0.5, 1.5, 21),
+        np.linspace(0, 3, 21),
+        np.linspace(0, 1, 21)])
+
+    scalar = CoordinateScalar(rho**2 * exp(-height), CYLINDRICAL, point)
+    samples = evaluate_field(scalar, grid)
+    exact = laplacian(scalar, grid)
+    assert _interior(laplacian(samples, grid), 2) == approx(_interior(exact, 2), rel=1e-2)
+
+
+def test_chunking() -> None:
+    scalar = CoordinateScalar(r**2 * sin(theta) * cos(phi), SPHERICAL, _spherical_point)
+    samples = evaluate_field(scalar, _spherical_grid)
+    vector = np.stack([samples, samples**2, np.cos(samples)], axis=-1)
+
+    # the results differ from the unchunked ones only by rounding
+    for chunk_size in (1, 4, 30):
+        assert gradient(samples, _spherical_grid, chunk_size=chunk_size) == approx(
+            gradient(samples, _spherical_grid), rel=1e-9)
+        assert laplacian(samples, _spherical_grid, chunk_size=chunk_size) == approx(
+            laplacian(samples, _spherical_grid), rel=1e-9)
+        assert divergence(vector, _spherical_grid, chunk_size=chunk_size) == approx(
+            divergence(vector, _spherical_grid), rel=1e-9)
+        assert curl(vector, _spherical_grid, chunk_size=chunk_size) == approx(
+            curl(vector, _spherical_grid), rel=1e-9)
+
+
+def test_bad_samples() -> None:
+    with raises(ValueError):
+        gradient(np.zeros((2, 2, 2)), _cartesian_grid)
+    with raises(ValueError):
+        divergence(np.zeros(_cartesian_grid.shape), _cartesian_grid)
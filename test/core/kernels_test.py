@@ -0,0 +1,155 @@
+import pickle
+import numpy as np
+from pytest import approx, raises
+from sympy import Eq
+from sympy.physics import units as sympy_units
+from symplyphysics import units, Quantity, Symbol, assert_equal
+from symplyphysics.core.convert import parse_unit
+from symplyphysics.core.kernels import compile_law, compile_law_outputs, compile_solved_law, load_law
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+from symplyphysics.classical_mechanics.kinematics.translational_motion import position_via_constant_acceleration_and_time as movement_law
+from symplyphysics.electromagnetism.circuits.transmission_lines import transmission_matrix_of_t_type_circuit as t_circuit_law
+from symplyphysics.electromagnetism.circuits.transmission_lines import hybrid_parameters_matrix as hybrid_law
+
+
+def test_compile_explicit_law() -> None:
+    kernel = compile_law(ohm_law, "current")
+    assert kernel.inputs == ("voltage", "resistance")
+    assert kernel.output_dimension == units.current
+    assert list(kernel(voltage=[1.0, 2.0, 3.0], resistance=2.0)) == [0.5, 1.0, 1.5]
+    assert kernel(4.0, 2.0) == 2.0
+
+
+def test_compile_solved_law() -> None:
+    kernel = compile_law(ohm_law, ohm_law.resistance)
+    assert kernel.inputs == ("current", "voltage")
+    assert kernel(current=2.0, voltage=1.0) == 0.5
+
+
+def test_compile_principal_solution() -> None:
+    x = Symbol("x", units.length)
+    t = Symbol("t", units.time)
+    law = Eq(x**2, t**2 * units.meter**2 / units.second**2)
+    assert compile_law(law, x, solution=None)(t=2.0) == 2.0
+    assert {float(compile_law(law, x, solution=i)(t=2.0)) for i in range(2)} == {2.0, -2.0}
+
+    positive = Symbol("y", units.length, negative=True)
+    law = Eq(positive**2, t**2 * units.meter**2 / units.second**2)
+    assert compile_law(law, positive, solution=None)(t=2.0) == -2.0
+
+    with raises(ValueError):
+        compile_law(Eq(x**2 - x * units.meter, t**2 * units.meter**2 / units.second**2), x,
+            solution=None)
+
+
+def test_compile_portable_expr() -> None:
+    kernel = compile_law(movement_law, "acceleration")
+    expr = pickle.loads(pickle.dumps(kernel.portable_expr()))
+    solved = compile_solved_law(movement_law, "acceleration", expr)
+    assert solved.inputs == kernel.inputs
+    arguments = dict(zip(kernel.inputs, (1.0, 2.0, 3.0, 4.0)))
+    assert solved(**arguments) == approx(kernel(**arguments))
+
+
+def test_kernel_is_cached() -> None:
+    kernel = compile_law(movement_law, "acceleration")
+    assert compile_law(movement_law, "acceleration") is kernel
+    path = "classical_mechanics.kinematics.translational_motion.position_via_constant_acceleration_and_time"
+    assert compile_law(path, "acceleration") is kernel
+
+
+def test_kernel_evaluate_quantities() -> None:
+    kernel = compile_law(ohm_law, "current")
+    result = kernel.evaluate(voltage=Quantity(3 * units.volt),
+        resistance=Quantity(2 * units.kilo * units.ohm))
+    assert_equal(result, 1.5e-3 * units.ampere)
+
+
+def test_compile_equation() -> None:
+    x = Symbol("x", units.length)
+    t = Symbol("t", units.time)
+    kernel = compile_law(Eq(x, 3 * t * units.meter / units.second), x)
+    assert kernel.inputs == ("t",)
+    assert kernel(t=2.0) == 6.0
+
+
+def test_bad_kernel() -> None:
+    with raises(ValueError):
+        compile_law(ohm_law, "mass")
+    with raises(ValueError):
+        load_law("electromagnetism.circuits.direct_current.no_such_law")
+    with raises(ValueError):
+        load_law("electromagnetism.circuits.direct_current")
+    kernel = compile_law(ohm_law, "current")
+    with raises(TypeError):
+        kernel(voltage=1.0)
+    with raises(TypeError):
+        kernel(voltage=1.0, resistance=1.0, mass=1.0)
+
+
+def test_parse_unit() -> None:
+    assert parse_unit("kilometer/hour") == sympy_units.kilometer / sympy_units.hour
+    assert parse_unit("kilo*ohm") == sympy_units.kilo * sympy_units.ohm
+    assert parse_unit("kg*m/s**2") == sympy_units.kg * sympy_units.m / sympy_units.s**2
+    assert parse_unit("2*m*s**-1") == 2 * sympy_units.m / sympy_units.s
+    with raises(ValueError):
+        parse_unit("no_such_unit")
+
+    # the string is never evaluated
+    for unit in [
+            "__import__('os')",
+            "m.__class__",
+            "m.__class__.__new__.__globals__.clear()",
+            "meter.scale_factor",
+            "__builtins__",
+            "meter()",
+            "m[0]",
+            "(lambda: m)()",
+            "'m'",
+            "m + s",
+            "True * m",
+            "1/0",
+            "10**10**10",
+            "m**s",
+    ]:
+        with raises(ValueError):
+            parse_unit(unit)
+
+
+def test_compile_matrix_law() -> None:
+    kernel = compile_law_outputs(t_circuit_law)
+    assert kernel.targets == ("voltage_voltage_parameter", "voltage_current_parameter",
+        "current_voltage_parameter", "current_current_parameter")
+    assert kernel.inputs == ("first_impedance", "second_impedance", "third_impedance")
+    assert compile_law_outputs(t_circuit_law) is kernel
+
+    impedances = (np.array([1.0, 2.0]), 2.0, 4.0)
+    outputs = kernel(*impedances)
+    assert [o.shape for o in outputs] == [(2,)] * 4
+    values = dict(zip(kernel.inputs, impedances))
+    for output, target in zip(outputs, kernel.targets):
+        single = compile_law(t_circuit_law, target)
+        expected = single(**{n: values[n] for n in single.inputs})
+        assert output == approx(np.broadcast_to(expected, (2,)))
+
+    a, b, c, d = kernel.evaluate(Quantity(1 * units.ohm), Quantity(2 * units.ohm),
+        Quantity(4 * units.ohm))
+    assert_equal(a, 1.25)
+    assert_equal(b, 3.5 * units.ohm)
+    assert_equal(c, 0.25 / units.ohm)
+    assert_equal(d, 1.5)
+
+
+def test_compile_solved_outputs() -> None:
+    kernel = compile_law_outputs(hybrid_law, ["input_current", "output_voltage"])
+    input_current, output_voltage = kernel(input_voltage=1.0,
+        output_current=2.0,
+        input_input_parameter=3.0,
+        input_output_parameter=4.0,
+        output_input_parameter=5.0,
+        output_output_parameter=6.0)
+    assert input_current == approx(1.0)
+    assert output_voltage == approx(-0.5)
+
+    with raises(ValueError):
+        compile_law_outputs(ohm_law)
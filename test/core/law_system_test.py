@@ -0,0 +1,60 @@
+import numpy as np
+from pytest import approx, raises
+from sympy import Eq, sqrt
+from symplyphysics import units, quantities, Quantity, Symbol, assert_equal, clone_as_symbol
+from symplyphysics.core.errors import UnitsError
+from symplyphysics.core.law_system import LawSystem
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+from symplyphysics.electromagnetism.circuits.direct_current import power_via_voltage_and_current as power_law
+from symplyphysics.condensed_matter.semiconductors import concentration_of_intrinsic_charge_carriers as carriers_law
+
+
+def test_solve_quantities() -> None:
+    system = LawSystem([ohm_law, power_law])
+    assert list(system.variables) == ["current", "voltage", "resistance", "power"]
+    solution = system.solve(power=Quantity(4 * units.watt), resistance=Quantity(1 * units.ohm))
+    assert_equal(solution["current"], 2 * units.ampere)
+    assert_equal(solution["voltage"], 2 * units.volt)
+
+
+def test_identified_symbols() -> None:
+    resistance = clone_as_symbol(ohm_law.resistance, subscript="1")
+    voltage = Symbol("U", units.voltage)
+    second_law = Eq(ohm_law.current, voltage / resistance)
+    system = LawSystem([ohm_law, second_law], identify=[(ohm_law.resistance, resistance)])
+    assert set(system.variables) == {"current", "voltage", "resistance", "U"}
+
+    solution = system.solve(["voltage", "resistance"], current=[1.0, 2.0], U=4.0)
+    assert solution["voltage"] == approx([4.0, 4.0])
+    assert solution["resistance"] == approx([4.0, 2.0])
+
+    with raises(UnitsError):
+        LawSystem([ohm_law, second_law], identify=[(ohm_law.resistance, voltage)])
+
+
+def test_warm_start_sweep() -> None:
+    reduced_concentration = Symbol("n^*")
+    reduced_temperature = Symbol("T^*")
+    system = LawSystem([
+        carriers_law,
+        Eq(reduced_concentration, carriers_law.charge_carriers_concentration /
+        sqrt(carriers_law.density_of_states_in_conduction_band *
+        carriers_law.density_of_states_in_valence_band)),
+        Eq(reduced_temperature,
+        quantities.boltzmann_constant * carriers_law.temperature / carriers_law.band_gap),
+    ])
+
+    temperatures = np.linspace(0.5, 5, 10)
+    solution = system.solve(["charge_carriers_concentration", "n^*", "temperature"],
+        guess={"temperature": 1e4, "charge_carriers_concentration": 1e24},
+        warm_start=True,
+        density_of_states_in_conduction_band=2e24,
+        density_of_states_in_valence_band=3e24,
+        band_gap=1.8e-19,
+        **{"T^*": temperatures})
+    assert solution["n^*"] == approx(np.exp(-1 / (2 * temperatures)))
+
+    with raises(ValueError):
+        system.solve(["temperature"], band_gap=1.0)
+    with raises(ValueError):
+        system.solve(mass=1.0)
@@ -0,0 +1,73 @@
+import time
+from pytest import raises
+from symplyphysics import errors, units, Quantity, assert_equal
+from symplyphysics.core.memo import (ResultCache, active_result_cache, memoize_results,
+    enable_result_cache, disable_result_cache)
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+
+
+def test_memoization_is_opt_in() -> None:
+    assert active_result_cache() is None
+    with memoize_results() as cache:
+        assert active_result_cache() is cache
+    assert active_result_cache() is None
+
+    cache = enable_result_cache()
+    try:
+        assert active_result_cache() is cache
+    finally:
+        disable_result_cache()
+    assert active_result_cache() is None
+
+
+def test_repeated_calls_are_cached() -> None:
+    with memoize_results(ResultCache(maxsize=16)) as cache:
+        first = ohm_law.calculate_current(Quantity(3 * units.volt), Quantity(2 * units.ohm))
+        second = ohm_law.calculate_current(Quantity(3 * units.volt), Quantity(2 * units.ohm))
+        other = ohm_law.calculate_current(Quantity(3 * units.volt), Quantity(3 * units.ohm))
+
+    assert second is first
+    assert_equal(first, 1.5 * units.ampere)
+    assert_equal(other, 1 * units.ampere)
+    stats = cache.stats()
+    assert stats.hits == 1
+    assert stats.misses == 2
+    assert stats.size == 2
+    assert abs(stats.hit_rate - 1 / 3) < 1e-9
+
+
+def test_invalid_calls_are_not_cached() -> None:
+    with memoize_results() as cache:
+        for _ in range(2):
+            with raises(errors.UnitsError):
+                ohm_law.calculate_current(Quantity(3 * units.meter), Quantity(2 * units.ohm))
+    assert cache.stats().size == 0
+
+
+def test_lru_eviction() -> None:
+    with memoize_results(ResultCache(maxsize=2)) as cache:
+        for volts in (1, 2, 3, 1):
+            ohm_law.calculate_current(Quantity(volts * units.volt), Quantity(units.ohm))
+
+    stats = cache.stats()
+    assert stats.size == 2
+    assert stats.evictions == 2
+    assert stats.hits == 0
+
+
+def test_ttl_expiration() -> None:
+    with memoize_results(ResultCache(ttl=0.01)) as cache:
+        ohm_law.calculate_current(Quantity(units.volt), Quantity(units.ohm))
+        time.sleep(0.02)
+        ohm_law.calculate_current(Quantity(units.volt), Quantity(units.ohm))
+
+    stats = cache.stats()
+    assert stats.expirations == 1
+    assert stats.misses == 2
+
+
+def test_bad_cache() -> None:
+    with raises(ValueError):
+        ResultCache(maxsize=0)
+    with raises(ValueError):
+        ResultCache(ttl=-1)
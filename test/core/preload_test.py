@@ -0,0 +1,72 @@
+from pytest import raises
+from symplyphysics import preload
+from symplyphysics.core import kernels
+from symplyphysics.core.preload import PreloadHandle
+
+_PACKAGE = "electromagnetism.circuits.direct_current"
+
+
+def test_background_preload() -> None:
+    handle = preload([_PACKAGE])
+    assert handle.wait(timeout=120)
+    assert handle.done
+    assert handle.progress == 1
+    assert not handle.errors
+
+    assert handle.modules[0] == f"symplyphysics.{_PACKAGE}"
+    assert handle.completed == handle.total == len(handle.timings)
+    assert handle.is_ready(_PACKAGE)
+    assert handle.is_ready(f"symplyphysics.{_PACKAGE}.current_is_voltage_over_resistance")
+    assert all(not t.compiled for t in handle.timings.values())
+
+    slowest = handle.slowest(2)
+    assert len(slowest) == 2
+    assert slowest[0][1].total_time >= slowest[1][1].total_time
+
+
+def test_compile_preload() -> None:
+    module = f"{_PACKAGE}.current_is_voltage_over_resistance"
+    handle = preload([module], compile=True, background=False)
+    assert handle.done
+    assert handle.modules == [f"symplyphysics.{module}"]
+
+    timing = handle.timings[f"symplyphysics.{module}"]
+    assert timing.compiled == ["current"]
+    assert timing.total_time >= timing.compile_time > 0
+
+    handle = preload([module], compile=True, all_targets=True, background=False)
+    assert sorted(handle.timings[f"symplyphysics.{module}"].compiled) == [
+        "current", "resistance", "voltage"
+    ]
+
+
+def test_compile_principal_solutions() -> None:
+    module = f"{_PACKAGE}.power_via_current_and_resistance"
+    kernels.clear_kernel_cache()
+    preload([module], compile=True, all_targets=True, background=False)
+
+    # the kernels used by the planner and the server are already compiled
+    hits = kernels._compile_law.cache_info().hits  # pylint: disable=protected-access
+    kernel = kernels.compile_law(f"symplyphysics.{module}", "current", solution=None)
+    assert kernels._compile_law.cache_info().hits == hits + 1  # pylint: disable=protected-access
+    assert kernel(power=4, resistance=1) == 2
+
+
+def test_cancel_preload() -> None:
+    handle = PreloadHandle([f"symplyphysics.{_PACKAGE}"])
+    handle.cancel()
+    handle.run()
+    assert handle.done
+    assert handle.completed == 0
+    assert handle.progress == 0
+
+
+def test_bad_preload() -> None:
+    with raises(ValueError):
+        preload(["no_such_package"])
+
+    handle = PreloadHandle(["symplyphysics.no_such_module"])
+    handle.run()
+    assert handle.progress == 1
+    assert isinstance(handle.errors["symplyphysics.no_such_module"], ImportError)
+    assert not handle.is_ready("no_such_module")
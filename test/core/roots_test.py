@@ -0,0 +1,72 @@
+import numpy as np
+from pytest import approx, raises
+from sympy import Eq, exp
+from symplyphysics import units, Quantity, Symbol, Function, assert_equal, convert_to_float
+from symplyphysics.core.roots import compile_residual, solve_numeric
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+from symplyphysics.optics.geometrical_optics.refraction import refraction_angle_from_environments as refraction_law
+from symplyphysics.electromagnetism.circuits.transmission_lines.microstrip_lines import effective_permittivity_for_microstrip_line_for_width_greater_thickness as microstrip_law
+
+
+def test_solve_quantities() -> None:
+    result = solve_numeric(ohm_law, "resistance",
+        current=Quantity(2 * units.ampere),
+        voltage=Quantity(3 * units.volt))
+    assert_equal(result, 1.5 * units.ohm)
+
+
+def test_solve_transcendental_law() -> None:
+    angle = solve_numeric(refraction_law, "incidence_angle",
+        incidence_refractive_index=1.0,
+        resulting_refractive_index=1.5,
+        refraction_angle=Quantity(0.3 * units.radian))
+    assert convert_to_float(angle) == approx(np.arcsin(1.5 * np.sin(0.3)))
+
+    # the bracket selects another root
+    angle = solve_numeric(refraction_law, "incidence_angle",
+        bracket=(2.0, 3.0),
+        incidence_refractive_index=1.0,
+        resulting_refractive_index=1.5,
+        refraction_angle=Quantity(0.3 * units.radian))
+    assert convert_to_float(angle) == approx(np.pi - np.arcsin(1.5 * np.sin(0.3)))
+
+
+def test_solve_batch() -> None:
+    widths = np.array([2e-3, 3e-3, 5e-2])
+    permittivities = microstrip_law.law.rhs.subs({
+        microstrip_law.relative_permittivity: 4,
+        microstrip_law.thickness: 1e-6,
+        microstrip_law.substrate_thickness: 1e-3,
+    })
+    effective = [float(permittivities.subs(microstrip_law.width, w)) for w in widths]
+    result = solve_numeric(microstrip_law, "width",
+        relative_permittivity=4.0,
+        effective_permittivity=np.array(effective),
+        thickness=1e-6,
+        substrate_thickness=1e-3)
+    assert result == approx(widths)
+
+
+def test_residual_is_cached() -> None:
+    kernel = compile_residual(ohm_law, "voltage")
+    assert compile_residual(ohm_law, "voltage") is kernel
+    assert kernel.inputs == ("current", "resistance")
+
+
+def test_no_root() -> None:
+    x = Symbol("x", units.length)
+    y = Symbol("y", units.length)
+    law = Eq(y, exp(x / units.meter) * units.meter)
+    assert np.isnan(solve_numeric(law, x, y=[-1.0])).all()
+    with raises(ValueError):
+        solve_numeric(law, x, y=Quantity(-1 * units.meter))
+    with raises(TypeError):
+        solve_numeric(law, x)
+
+
+def test_solve_function() -> None:
+    time = Symbol("t", units.time)
+    position = Function("x", [time], units.length)
+    law = Eq(position(time)**2, 3 * units.meter * position(time) + 10 * units.meter**2)
+    # the function is not assumed to be positive, so negative magnitudes are scanned as well
+    assert solve_numeric(law, position, t=[0.0]) == approx([-2.0])
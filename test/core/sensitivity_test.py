@@ -0,0 +1,80 @@
+import numpy as np
+from pytest import approx, raises
+from symplyphysics import units, Quantity, assert_equal
+from symplyphysics.core.sensitivity import law_sensitivity
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+from symplyphysics.classical_mechanics.kinematics.translational_motion import position_via_constant_acceleration_and_time as movement_law
+from symplyphysics.electromagnetism.circuits.transmission_lines import transmission_matrix_of_t_type_circuit as t_circuit_law
+from symplyphysics.electromagnetism.circuits.direct_current import power_via_current_and_resistance as power_law
+
+
+def test_gradient() -> None:
+    sensitivity = law_sensitivity(ohm_law, "current")
+    assert sensitivity.inputs == ("voltage", "resistance")
+    assert law_sensitivity(ohm_law, "current") is sensitivity
+
+    gradient = sensitivity.gradient(voltage=[1.0, 2.0], resistance=2.0)
+    assert gradient["voltage"] == approx([0.5, 0.5])
+    assert gradient["resistance"] == approx([-0.25, -0.5])
+    assert sensitivity.partial_dimensions[("current", "resistance")] == (units.current /
+        units.impedance)
+
+
+def test_relative_gradient() -> None:
+    sensitivity = law_sensitivity(movement_law, "final_position")
+    gradient = sensitivity.relative_gradient(initial_position=0.0,
+        initial_speed=0.0,
+        acceleration=np.array([1.0, 3.0]),
+        time=2.0)
+    # the position is proportional to the acceleration and to the squared time
+    assert gradient["acceleration"] == approx([1.0, 1.0])
+    assert gradient["time"] == approx([2.0, 2.0])
+    assert gradient["initial_speed"] == approx([0.0, 0.0])
+
+
+def test_evaluate_quantities() -> None:
+    sensitivity = law_sensitivity(ohm_law, "current")
+    gradient = sensitivity.evaluate(voltage=Quantity(3 * units.volt),
+        resistance=Quantity(2 * units.ohm))
+    assert_equal(gradient["voltage"], 0.5 / units.ohm)
+    assert_equal(gradient["resistance"], -0.75 * units.ampere / units.ohm)
+
+
+def test_jacobian() -> None:
+    sensitivity = law_sensitivity(t_circuit_law)
+    impedances = np.array([[1.0, 2.0, 4.0], [2.0, 2.0, 4.0]])
+    jacobian = sensitivity.jacobian(*impedances.T)
+    assert jacobian.shape == (2, 4, 3)
+
+    # central differences of the law kernel
+    step = 1e-6
+    for j in range(3):
+        shift = np.zeros(3)
+        shift[j] = step
+        forward = np.stack(sensitivity.function(*(impedances + shift).T)[:4], axis=-1)
+        backward = np.stack(sensitivity.function(*(impedances - shift).T)[:4], axis=-1)
+        assert jacobian[..., j] == approx((forward - backward) / (2 * step), rel=1e-6)
+
+    with raises(ValueError):
+        sensitivity.gradient(*impedances.T)
+
+
+def test_default_target() -> None:
+    sensitivity = law_sensitivity(power_law)
+    assert sensitivity.targets == ("power",)
+    assert sensitivity.inputs == ("current", "resistance")
+
+    gradient = sensitivity.gradient(current=2.0, resistance=3.0)
+    assert gradient["current"] == approx(12.0)
+    assert gradient["resistance"] == approx(4.0)
+
+
+def test_principal_solution() -> None:
+    # the current is the principal square root of the ratio of the power to the resistance
+    sensitivity = law_sensitivity(power_law, "current")
+    gradient = sensitivity.gradient(power=4.0, resistance=1.0)
+    assert gradient["power"] == approx(0.25)
+    assert gradient["resistance"] == approx(-1.0)
+
+    negative = law_sensitivity(power_law, "current", solution=0)
+    assert negative.gradient(power=4.0, resistance=1.0)["power"] == approx(-0.25)
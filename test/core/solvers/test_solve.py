@@ -3,7 +3,7 @@ from sympy import Eq, evaluate
 from symplyphysics import Symbol
 from symplyphysics.core.expr_comparisons import expr_equals
 from symplyphysics.core.vectors import VectorSymbol, VectorNorm as norm
-from symplyphysics.core.solvers import apply, solve_for_vector, vector_equals
+from symplyphysics.core.solvers import apply, compare_vectors, solve_for_vector, vector_equals
 
 
 def test_apply() -> None:
@@ -52,6 +52,20 @@ def test_vector_equals() -> None:
     assert vector_equals(lhs, 0)
 
 
+def test_compare_vectors() -> None:
+    x = Symbol("x", real=True)
+    a = VectorSymbol("a")
+    b = VectorSymbol("b")
+
+    assert compare_vectors(a + b, b + a).tier == "structural"
+    comparison = compare_vectors(a * (x + 1)**2 + b, a * (x**2 + 2 * x + 1) + b)
+    assert comparison.equal
+    assert comparison.tier == "numeric"
+    comparison = compare_vectors(a * x, b * x)
+    assert not comparison.equal
+    assert comparison.tier == "symbolic"
+
+
 def test_express_atomic() -> None:
     a = VectorSymbol("a")
     b = VectorSymbol("b")
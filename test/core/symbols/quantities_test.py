@@ -1,7 +1,8 @@
+import pickle
 from pytest import raises
 from sympy import Derivative, cos, pi, Symbol as SymSymbol
 from symplyphysics import (units, Quantity, SI, dimensionless)
-from symplyphysics.core.symbols.quantities import scale_factor
+from symplyphysics.core.symbols.quantities import scale_factor, quantity_key
 
 # Test Quantity constructor
 
@@ -139,3 +140,22 @@ def test_invalid_free_symbol_quantity() -> None:
     expr = b * a
     with raises(ValueError):
         Quantity(expr)
+
+
+def test_pickle_quantity() -> None:
+    q = Quantity(10 * units.kilometer, display_symbol="d")
+    restored = pickle.loads(pickle.dumps(q))
+    assert restored.scale_factor == 10000
+    assert restored.dimension == units.length
+    assert restored.display_name == "d"
+
+
+def test_quantity_key() -> None:
+    a = Quantity(10 * units.meter)
+    b = Quantity(10 * units.meter)
+    assert a != b
+    assert quantity_key(a) == quantity_key(b)
+    assert quantity_key(a) != quantity_key(Quantity(10 * units.second))
+    assert quantity_key([a, 1]) == quantity_key([b, 1])
+    with raises(TypeError):
+        quantity_key({})
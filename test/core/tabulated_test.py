@@ -0,0 +1,97 @@
+from pathlib import Path
+import numpy as np
+from pytest import approx, fixture, raises
+from symplyphysics import units, Quantity, convert_to_float
+from symplyphysics.core.errors import UnitsError
+from symplyphysics.core.tabulated import TabulatedLaw
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+from symplyphysics.condensed_matter.ionization import ionization_cross_section_of_atom_by_electron_per_lotz_drevin as cross_section_law
+from symplyphysics.special_relativity.relativistic_dynamics.energy_and_momentum import relativistic_energy_via_relativistic_momentum_and_rest_mass as energy_law
+
+_FIXED = {
+    "ionization_energy_": Quantity(15.76 * units.electronvolt),
+    "first_calculation_coefficient_": 0.6,
+    "second_calculation_coefficient_": 0.9,
+    "number_of_equivalent_electrons_on_outer_orbit_": 6,
+}
+
+
+@fixture(name="table")
+def table_fixture() -> TabulatedLaw:
+    return TabulatedLaw.build(cross_section_law.calculate_cross_sectional_area_of_ionization, {
+        "energy_of_electron_": (Quantity(20 * units.electronvolt),
+        Quantity(1000 * units.electronvolt)),
+    },
+        fixed=_FIXED,
+        tolerance=1e-5)
+
+
+def test_tabulated_law(table: TabulatedLaw) -> None:
+    assert table.parameters == ("energy_of_electron_",)
+    for energy in (20, 37.5, 100, 999):
+        arguments = dict(_FIXED, energy_of_electron_=Quantity(energy * units.electronvolt))
+        exact = cross_section_law.calculate_cross_sectional_area_of_ionization(**arguments)
+        assert convert_to_float(table(**arguments) / exact) == approx(1, abs=1e-4)
+
+
+def test_contract(table: TabulatedLaw) -> None:
+    arguments = dict(_FIXED, energy_of_electron_=Quantity(100 * units.electronvolt))
+    with raises(UnitsError):
+        table(**dict(arguments, energy_of_electron_=Quantity(100 * units.meter)))
+    with raises(ValueError):
+        table(**dict(arguments, energy_of_electron_=Quantity(2000 * units.electronvolt)))
+    with raises(ValueError):
+        table(**dict(arguments, first_calculation_coefficient_=0.7))
+    with raises(ValueError):
+        table.magnitudes(energy_of_electron_=[0.0])
+
+
+def test_multilinear_table() -> None:
+    table = TabulatedLaw.build(ohm_law.calculate_current, {
+        "voltage_": (Quantity(0 * units.volt), Quantity(10 * units.volt)),
+        "resistance_": (Quantity(1 * units.ohm), Quantity(1 * units.kilo * units.ohm)),
+    },
+        tolerance=1e-4)
+    assert table.log_scale == (False, True)
+
+    voltages = np.linspace(0, 10, 50)
+    resistances = np.geomspace(1, 1000, 40)[:, np.newaxis]
+    values = table.magnitudes(voltages, resistances)
+    assert values.shape == (40, 50)
+    assert np.max(np.abs(values - voltages / resistances)) <= 1e-4 * 10
+
+    with raises(ValueError):
+        TabulatedLaw.build(ohm_law.calculate_current,
+            {"voltage_": (Quantity(0 * units.volt), Quantity(10 * units.volt))})
+    with raises(ValueError):
+        TabulatedLaw.build(ohm_law.calculate_current, {
+            "voltage_": (Quantity(0 * units.volt), Quantity(10 * units.volt)),
+            "resistance_": (Quantity(1e-9 * units.ohm), Quantity(1 * units.ohm)),
+        },
+            tolerance=1e-12,
+            max_points=1000)
+
+
+def test_law_with_several_solutions() -> None:
+    mass = Quantity(1e-24 * units.kilogram)
+    table = TabulatedLaw.build(energy_law.calculate_relativistic_energy, {
+        "relativistic_momentum_": (Quantity(1e-17 * units.kilogram * units.meter / units.second),
+        Quantity(1e-15 * units.kilogram * units.meter / units.second)),
+    },
+        fixed={"invariant_mass_": mass})
+
+    momentum = Quantity(1e-16 * units.kilogram * units.meter / units.second)
+    expected = convert_to_float(energy_law.calculate_relativistic_energy(momentum, mass) /
+        units.joule)
+    assert expected > 0
+    assert convert_to_float(table(momentum, mass) / units.joule) == approx(expected, rel=1e-3)
+
+
+def test_save_and_load(table: TabulatedLaw, tmp_path: Path) -> None:
+    table.save(tmp_path)
+    loaded = TabulatedLaw.load(tmp_path)
+    assert isinstance(loaded.values, np.memmap)
+    assert loaded.function is cross_section_law.calculate_cross_sectional_area_of_ionization
+    energies = np.linspace(3.3e-18, 1.6e-16, 100)
+    assert loaded.magnitudes(energies) == approx(table.magnitudes(energies))
+    assert not isinstance(TabulatedLaw.load(tmp_path, mmap=False).values, np.memmap)
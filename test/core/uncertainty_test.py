@@ -0,0 +1,97 @@
+import numpy as np
+from pytest import approx, raises
+from symplyphysics import units, Quantity, convert_to_float
+from symplyphysics.core.errors import UnitsError
+from symplyphysics.core.uncertainty import Normal, Triangular, Uniform, propagate
+from symplyphysics.electromagnetism.circuits.direct_current import current_is_voltage_over_resistance as ohm_law
+from symplyphysics.classical_mechanics.kinematics.translational_motion import position_via_constant_acceleration_and_time as movement_law
+from symplyphysics.special_relativity.relativistic_dynamics.energy_and_momentum import relativistic_energy_via_relativistic_momentum_and_rest_mass as energy_law
+
+
+def _value(quantity: Quantity, unit: Quantity) -> float:
+    return convert_to_float(quantity / unit)
+
+
+def test_propagate_normal() -> None:
+    result = propagate(ohm_law.calculate_current, {
+        "voltage_": Normal(Quantity(3 * units.volt), Quantity(0.3 * units.volt)),
+        "resistance_": Quantity(2 * units.ohm),
+    }, samples=200_000)
+    assert result.samples.shape == (200_000,)
+    assert _value(result.mean, units.ampere) == approx(1.5, rel=1e-2)
+    assert _value(result.std, units.ampere) == approx(0.15, rel=1e-2)
+    low, high = result.interval(0.95)
+    assert _value(low, units.ampere) == approx(1.5 - 1.96 * 0.15, rel=1e-2)
+    assert _value(high, units.ampere) == approx(1.5 + 1.96 * 0.15, rel=1e-2)
+
+    # the generator is seeded
+    again = propagate(ohm_law.calculate_current, {
+        "voltage_": Normal(Quantity(3 * units.volt), Quantity(0.3 * units.volt)),
+        "resistance_": Quantity(2 * units.ohm),
+    }, samples=200_000)
+    assert np.array_equal(result.samples, again.samples)
+
+
+def test_latin_hypercube() -> None:
+    inputs = {
+        "initial_position_": Quantity(0 * units.meter),
+        "initial_velocity_": Quantity(0 * units.meter / units.second),
+        "acceleration_": Uniform(Quantity(1 * units.meter / units.second**2),
+        Quantity(3 * units.meter / units.second**2)),
+        "time_": Triangular(Quantity(1 * units.second), Quantity(2 * units.second),
+        Quantity(3 * units.second)),
+    }
+    result = propagate(movement_law.calculate_distance, inputs, samples=10_000,
+        method="latin_hypercube")
+    # E[a t^2 / 2] = E[a] (Var[t] + E[t]^2) / 2
+    expected = 2 * (1 / 6 + 4) / 2
+    assert _value(result.mean, units.meter) == approx(expected, rel=1e-3)
+    assert _value(result.median, units.meter) < _value(result.percentile(90), units.meter)
+
+
+def test_law_with_several_solutions() -> None:
+    # the law function computes the positive root of E**2
+    mass = Quantity(1e-24 * units.kilogram)
+    momentum = Quantity(1e-16 * units.kilogram * units.meter / units.second)
+    expected = _value(energy_law.calculate_relativistic_energy(momentum, mass), units.joule)
+    assert expected > 0
+
+    result = propagate(energy_law.calculate_relativistic_energy, {
+        "relativistic_momentum_": momentum,
+        "invariant_mass_": Uniform(Quantity(0.99e-24 * units.kilogram),
+        Quantity(1.01e-24 * units.kilogram)),
+    }, samples=1000)
+    assert _value(result.mean, units.joule) == approx(expected, rel=1e-2)
+
+
+def test_degenerate_triangular() -> None:
+    time = Quantity(2 * units.second)
+    result = propagate(movement_law.calculate_distance, {
+        "initial_position_": Quantity(0 * units.meter),
+        "initial_velocity_": Quantity(0 * units.meter / units.second),
+        "acceleration_": Quantity(1 * units.meter / units.second**2),
+        "time_": Triangular(time, time, time),
+    }, samples=100, method="latin_hypercube")
+    assert result.samples == approx(np.full(100, 2.0))
+
+
+def test_bad_propagation() -> None:
+    with raises(UnitsError):
+        propagate(ohm_law.calculate_current, {
+            "voltage_": Normal(Quantity(3 * units.volt), Quantity(0.3 * units.ampere)),
+            "resistance_": Quantity(2 * units.ohm),
+        })
+    with raises(ValueError):
+        propagate(ohm_law.calculate_current, {"voltage_": Quantity(3 * units.volt)})
+    with raises(ValueError):
+        propagate(ohm_law.calculate_current, {
+            "voltage_": Quantity(3 * units.volt),
+            "resistance_": Quantity(2 * units.ohm),
+            "mass_": Quantity(2 * units.kilogram),
+        })
+    with raises(ValueError):
+        propagate(ohm_law.calculate_current, {
+            "voltage_": Triangular(Quantity(3 * units.volt), Quantity(4 * units.volt),
+            Quantity(2 * units.volt)),
+            "resistance_": Quantity(2 * units.ohm),
+        })
@@ -0,0 +1,122 @@
+import json
+from pathlib import Path
+from pytest import MonkeyPatch, fixture
+from symplyphysics.docs.build import generate_laws_docs
+
+_PACKAGE = '''"""
+Laws
+====
+
+Package of laws.
+"""
+'''
+
+_LAW = '''"""
+Force is mass times acceleration
+================================
+
+Newton's second law.
+"""
+
+from sympy import Eq
+from symplyphysics import symbols
+
+force = symbols.force
+"""
+:symbols:`force`.
+"""
+
+mass = symbols.mass
+"""
+:symbols:`mass`.
+"""
+
+acceleration = symbols.acceleration
+"""
+:symbols:`acceleration`.
+"""
+
+law = Eq(force, mass * acceleration)
+"""
+:laws:symbol::
+
+:laws:latex::
+"""
+'''
+
+
+@fixture(name="source")
+def source_fixture(tmp_path: Path, monkeypatch: MonkeyPatch) -> Path:
+    monkeypatch.chdir(tmp_path)
+    source = Path("src")
+    (source / "laws").mkdir(parents=True)
+    (source / "__init__.py").write_text("", encoding="utf-8")
+    (source / "laws" / "__init__.py").write_text(_PACKAGE, encoding="utf-8")
+    (source / "laws" / "force_law.py").write_text(_LAW, encoding="utf-8")
+    (source / "laws" / "helper.py").write_text("VALUE = 1\n", encoding="utf-8")
+    return source
+
+
+def test_generate_docs(source: Path) -> None:
+    report = generate_laws_docs(str(source), "out", [], True, jobs=1)
+    laws = source / "laws"
+    assert set(report.generated) == {
+        str(laws / "force_law.py"),
+        str(laws / "helper.py"),
+        str(laws / "__init__.py"),
+        str(source / "__init__.py"),
+    }
+    assert not report.skipped
+
+    law_doc = Path("out", "laws.force_law.rst").read_text(encoding="utf-8")
+    assert "Force is mass times acceleration" in law_doc
+    assert "laws.force_law" in Path("out", "laws.rst").read_text(encoding="utf-8")
+
+    manifest = json.loads(Path("out", ".manifest.json").read_text(encoding="utf-8"))
+    assert manifest["files"][str(laws / "force_law.py")]["output"] == "laws.force_law"
+    assert manifest["files"][str(laws / "helper.py")]["output"] is None
+
+
+def test_incremental_docs(source: Path) -> None:
+    generate_laws_docs(str(source), "out", [], True, jobs=1)
+
+    report = generate_laws_docs(str(source), "out", [], True, jobs=1)
+    assert not report.generated
+    assert len(report.skipped) == 4
+
+    # only the changed law is regenerated
+    law_path = source / "laws" / "force_law.py"
+    law_path.write_text(_LAW.replace("Newton's second law.", "Second law."), encoding="utf-8")
+    report = generate_laws_docs(str(source), "out", [], True, jobs=1)
+    assert set(report.generated) == {str(law_path)}
+    assert "Second law." in Path("out", "laws.force_law.rst").read_text(encoding="utf-8")
+
+    # removing a law removes its file and updates the package
+    law_path.unlink()
+    report = generate_laws_docs(str(source), "out", [], True, jobs=1)
+    assert report.removed == ["laws.force_law"]
+    assert set(report.generated) == {str(source / "laws" / "__init__.py")}
+    assert not Path("out", "laws.force_law.rst").exists()
+
+    report = generate_laws_docs(str(source), "out", [], True, jobs=1, incremental=False)
+    assert len(report.generated) == 3
+
+
+def test_parallel_docs(source: Path) -> None:
+    report = generate_laws_docs(str(source), "out", [], True, jobs=2)
+    assert len(report.generated) == 4
+    assert Path("out", "laws.force_law.rst").exists()
+
+
+def test_imported_modules_invalidate_docs(source: Path, monkeypatch: MonkeyPatch) -> None:
+    monkeypatch.syspath_prepend(str(Path.cwd()))
+    law_path = source / "laws" / "force_law.py"
+    law_path.write_text(_LAW.replace("from symplyphysics import symbols\n",
+        "from symplyphysics import symbols\nfrom src.laws import helper\n"),
+        encoding="utf-8")
+    generate_laws_docs(str(source), "out", [], True, jobs=1)
+
+    # the law is regenerated when the module it imports changes
+    (source / "laws" / "helper.py").write_text("VALUE = 2\n", encoding="utf-8")
+    report = generate_laws_docs(str(source), "out", [], True, jobs=1)
+    assert set(report.generated) == {str(law_path), str(source / "laws" / "helper.py")}
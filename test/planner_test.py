@@ -0,0 +1,68 @@
+from pathlib import Path
+import numpy as np
+from pytest import approx, fixture, raises
+import symplyphysics
+from symplyphysics import units, Quantity
+from symplyphysics.catalog import build_index
+from symplyphysics.core.approx import assert_equal
+from symplyphysics.planner import LawGraph
+
+_CIRCUITS = "symplyphysics.electromagnetism.circuits.direct_current"
+_CIRCUITS_DIR = Path(symplyphysics.__file__).parent.joinpath(*_CIRCUITS.split(".")[1:])
+
+
+@fixture(name="graph", scope="module")
+def graph_fixture() -> LawGraph:
+    return LawGraph(build_index(_CIRCUITS_DIR))
+
+
+def test_graph(graph: LawGraph) -> None:
+    assert "voltage" in graph.quantities
+    assert f"{_CIRCUITS}.current_is_voltage_over_resistance" in graph.laws_of("current")
+
+
+def test_plan(graph: LawGraph) -> None:
+    plan = graph.plan("current", ["voltage", "electrical_resistance"])
+    assert plan.modules == [f"{_CIRCUITS}.current_is_voltage_over_resistance"]
+    assert plan.cost == 1
+
+    plan = graph.plan("current", ["voltage", "electrical_conductance"])
+    assert [(s.module.rsplit(".", 1)[1], s.target) for s in plan.steps] == [
+        ("electrical_conductance_is_inverse_resistance", "resistance"),
+        ("current_is_voltage_over_resistance", "current"),
+    ]
+    assert plan.steps[-1].inputs == {"voltage": "voltage", "resistance": "electrical_resistance"}
+    assert plan.cost == 3
+
+
+def test_evaluate_plan(graph: LawGraph) -> None:
+    plan = graph.solve("current", voltage=1, electrical_conductance=1)
+
+    result = plan(voltage=np.array([1.0, 2.0, 3.0]), electrical_conductance=0.5)
+    assert result == approx([0.5, 1.0, 1.5])
+
+    values = plan.values({"voltage": 4.0, "electrical_conductance": 0.5})
+    assert values["electrical_resistance"] == approx(2.0)
+
+    current = plan.evaluate(voltage=Quantity(3 * units.volt),
+        electrical_conductance=Quantity(2 * units.siemens))
+    assert_equal(current, 6 * units.ampere)
+
+    with raises(TypeError):
+        plan(voltage=1.0)
+
+
+def test_bad_plan(graph: LawGraph) -> None:
+    with raises(ValueError):
+        graph.plan("current", ["voltage"])
+    with raises(ValueError):
+        graph.plan("mass", ["voltage", "electrical_resistance"])
+
+
+def test_exclude_plan(graph: LawGraph) -> None:
+    excluded = (f"{_CIRCUITS}.current_is_voltage_over_resistance", "current")
+    plan = graph.plan("current", ["voltage", "electrical_resistance"], exclude=[excluded])
+    assert excluded not in [(s.module, s.target) for s in plan.steps]
+    assert plan.cost > 1
+    # the current is found from the power as the principal square root
+    assert plan(voltage=3.0, electrical_resistance=2.0) == approx(1.5)
@@ -0,0 +1,103 @@
+from pathlib import Path
+import numpy as np
+from pytest import approx, raises, importorskip
+from sympy import Symbol, exp, pi, sin, sqrt
+from symplyphysics import units, Quantity
+from symplyphysics.plotting import (sample, sample_family, sample_parametric, clear_plot_cache,
+    GridPlot)
+
+x = Symbol("x")
+a = Symbol("a")
+b = Symbol("b")
+
+
+def test_sample() -> None:
+    grid, values = sample(x**2 + 1, (x, 0, 2), points=5)
+    assert grid.tolist() == approx([0, 0.5, 1, 1.5, 2])
+    assert values.tolist() == approx([1, 1.25, 2, 3.25, 5])
+    assert not values.flags.writeable
+
+    # series are cached
+    assert sample(x**2 + 1, (x, 0, 2), points=5)[1] is values
+    clear_plot_cache()
+    assert sample(x**2 + 1, (x, 0, 2), points=5)[1] is not values
+
+
+def test_sample_log_scale() -> None:
+    grid, values = sample(1 / x, (x, 1, 100), points=3, scale="log")
+    assert grid.tolist() == approx([1, 10, 100])
+    assert values.tolist() == approx([1, 0.1, 0.01])
+
+    with raises(ValueError):
+        sample(1 / x, (x, 0, 100), scale="log")
+
+
+def test_sample_constant_and_quantities() -> None:
+    _, values = sample(pi + 0 * x, (x, 0, 1), points=3)
+    assert values.tolist() == approx([float(pi)] * 3)
+
+    grid, values = sample(x * Quantity(2 * units.kilometer), (x, 0, Quantity(units.kilometer)),
+        points=2)
+    assert grid.tolist() == approx([0, 1000])
+    assert values.tolist() == approx([0, 2e6])
+
+
+def test_sample_not_real() -> None:
+    _, values = sample(sqrt(x) + 1 / (x - 1), (x, -1, 1), points=3)
+    assert np.isnan(values).tolist() == [True, False, True]
+    assert values[1] == approx(-1)
+
+
+def test_sample_unknown_symbols() -> None:
+    with raises(ValueError):
+        sample(a * x, (x, 0, 1))
+
+
+def test_sample_family() -> None:
+    grid, values = sample_family(a * exp(-b * x), (x, 0, 1), {
+        a: [1, 2, 3],
+        b: [0, 1, 2]
+    },
+        points=11)
+    assert values.shape == (3, 11)
+    assert not values.flags.writeable
+    for i in range(3):
+        assert values[i] == approx((i + 1) * np.exp(-i * grid))
+
+    with raises(ValueError):
+        sample_family(a * x, (x, 0, 1), {a: [1, 2], b: [1]})
+    with raises(ValueError):
+        sample_family(a * x, (x, 0, 1), {})
+
+
+def test_sample_parametric() -> None:
+    x_values, y_values = sample_parametric((1, sin(x)), (x, 0, pi / 2), points=3)
+    assert x_values.tolist() == approx([1, 1, 1])
+    assert y_values.tolist() == approx([0, np.sin(np.pi / 4), 1])
+
+
+def test_grid_plot(tmp_path: Path) -> None:
+    importorskip("matplotlib")
+
+    plot = GridPlot(title="Plot", xlim=(0, 1), ylim=(-1, 2), legend=True, points=50)
+    plot.line(x**2, (x, 0, 1), label="square", color="red")
+    plot.family(a * x, (x, 0, 1), {a: [1, 2]}, labels=["one", "two"])
+    plot.parametric((sin(x), x), (x, 0, 1), style="--")
+    plot.data([0, 0.5, 1], [0, 1, 0], style="b.-")
+
+    figure = plot.figure()
+    (axes,) = figure.axes
+    assert len(axes.lines) == 5
+    assert axes.get_xlim() == approx((0, 1))
+    legend = axes.get_legend()
+    assert legend is not None
+    assert [t.get_text() for t in legend.get_texts()] == ["square", "one", "two"]
+    assert axes.lines[0].get_color() == "red"
+    assert axes.lines[4].get_color() == "b"
+
+    path = tmp_path / "plot.png"
+    plot.save(path)
+    assert path.stat().st_size > 0
+
+    with raises(ValueError):
+        plot.family(a * x, (x, 0, 1), {a: [1, 2]}, labels=["one"])
@@ -0,0 +1,142 @@
+import signal
+from pathlib import Path
+from typing import Any
+from pytest import MonkeyPatch, fixture
+from symplyphysics.proofs import ProofReport, discover_proofs, main, run_module_proofs, run_proofs
+
+_LAW = "symplyphysics.electromagnetism.fundamentals.speed_of_light_from_fundamentals"
+_PACKAGE_DIR = Path(__file__).parent.parent / "symplyphysics"
+
+_FAKE_PROOFS = '''import time
+from sympy import Symbol, expand
+
+_x = Symbol("x")
+_expr = expand((_x + 1)**2)
+assert _expr == _x**2 + 2 * _x + 1
+
+_y = 1
+assert _y == 2, "y is not 2"
+
+assert _y == 1
+'''
+
+_SLOW_PROOFS = '''import time
+
+_x = 1
+for _ in range(1000):
+    time.sleep(0.01)
+assert _x == 1
+'''
+
+# records the processes running the proofs
+_PROCESS_PROOFS = '''import os
+import time
+from pathlib import Path
+
+with Path(__file__).with_name("processes.txt").open("a", encoding="utf-8") as _file:
+    _file.write(f"{__name__} {os.getpid()}\\n")
+time.sleep(0.1 if __name__ == "recorded_proofs" else 10)
+assert True
+'''
+
+
+@fixture(name="fake_modules")
+def fake_modules_fixture(tmp_path: Path, monkeypatch: MonkeyPatch) -> None:
+    (tmp_path / "fake_proofs.py").write_text(_FAKE_PROOFS, encoding="utf-8")
+    (tmp_path / "slow_proofs.py").write_text(_SLOW_PROOFS, encoding="utf-8")
+    (tmp_path / "recorded_proofs.py").write_text(_PROCESS_PROOFS, encoding="utf-8")
+    (tmp_path / "stalled_proofs.py").write_text(_PROCESS_PROOFS, encoding="utf-8")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+
+def test_discover_proofs() -> None:
+    modules = discover_proofs(_PACKAGE_DIR / "electromagnetism" / "fundamentals")
+    assert _LAW in modules
+    assert all(m.startswith("symplyphysics.electromagnetism.fundamentals.") for m in modules)
+
+
+def test_law_proofs() -> None:
+    report = run_proofs([_LAW], jobs=1)
+    assert report.passed
+    assert len(report.proofs) == 1
+    source = _PACKAGE_DIR.joinpath(*_LAW.split(".")[1:]).with_suffix(".py")
+    lines = source.read_text(encoding="utf-8").splitlines()
+    line = next(i for i, l in enumerate(lines, 1) if l.startswith("assert convert_to(law.lhs"))
+    assert report.proofs[0].line == line
+    assert report.proofs[0].source.startswith("assert convert_to(law.lhs")
+    assert report.modules[0].total_time >= report.modules[0].import_time
+
+
+def test_failed_proofs(fake_modules: None) -> None:
+    del fake_modules
+    result = run_module_proofs("fake_proofs")
+    assert [(p.line, p.status) for p in result.proofs] == [
+        (6, "passed"),
+        (9, "failed"),
+        (11, "skipped"),
+    ]
+    assert result.proofs[1].message == "y is not 2"
+    assert result.import_time > 0
+
+
+def test_timeout_proofs(fake_modules: None) -> None:
+    del fake_modules
+    report = run_proofs(["slow_proofs", "fake_proofs"], jobs=1, timeout=0.1)
+    assert not report.passed
+    slow = report.modules[0].proofs
+    assert [(p.line, p.status) for p in slow] == [(4, "timeout"), (6, "skipped")]
+    assert 0.1 <= slow[0].elapsed < 5
+    assert report.slowest(1) == [slow[0]]
+    assert {p.status for p in report.failures} == {"timeout", "failed"}
+    assert "Failures:" in report.summary()
+
+
+def test_timeout_restores_signal_handler(fake_modules: None) -> None:
+    del fake_modules
+
+    def handler(*_: Any) -> None:
+        pass
+
+    previous = signal.signal(signal.SIGALRM, handler)
+    try:
+        run_module_proofs("fake_proofs", timeout=1)
+        assert signal.getsignal(signal.SIGALRM) is handler
+    finally:
+        signal.signal(signal.SIGALRM, previous)
+
+
+def test_save_report(tmp_path: Path) -> None:
+    path = tmp_path / "report.json"
+    assert main(["-j", "1", "-o", str(path), _LAW]) == 0
+    assert path.exists()
+    assert ProofReport().passed
+
+
+def test_parallel_proofs() -> None:
+    report = run_proofs([_LAW], jobs=2)
+    assert report.passed
+    assert report.modules[0].module == _LAW
+
+
+def test_missing_module(fake_modules: None) -> None:
+    del fake_modules
+    report = run_proofs(["no_such_module", "fake_proofs", "no_such_package.module"], jobs=2)
+    assert [m.module for m in report.modules] == [
+        "no_such_module", "fake_proofs", "no_such_package.module"
+    ]
+    assert [p.status for p in report.modules[0].proofs] == ["error"]
+    assert [p.status for p in report.modules[2].proofs] == ["error"]
+    assert len(report.modules[1].proofs) == 3
+
+
+def test_timed_out_process_is_replaced(tmp_path: Path, fake_modules: None) -> None:
+    del fake_modules
+    report = run_proofs(["stalled_proofs", *["recorded_proofs"] * 8], jobs=2, timeout=0.5)
+    assert [p.status for p in report.modules[0].proofs] == ["timeout", "skipped"]
+    assert all(m.proofs[-1].status == "passed" for m in report.modules[1:])
+
+    lines = (tmp_path / "processes.txt").read_text(encoding="utf-8").splitlines()
+    processes = [line.split() for line in lines]
+    stalled = {pid for name, pid in processes if name == "stalled_proofs"}
+    recorded = {pid for name, pid in processes if name == "recorded_proofs"}
+    assert stalled and not stalled & recorded
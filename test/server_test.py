@@ -0,0 +1,192 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Coroutine
+from pytest import raises
+from symplyphysics.server import LawServer, LawClient, RpcError
+
+_LAW = "electromagnetism.circuits.direct_current.current_is_voltage_over_resistance"
+_POWER_LAW = "electromagnetism.circuits.direct_current.power_via_current_and_resistance"
+
+
+def _run(coroutine: Coroutine[Any, Any, Any]) -> Any:
+    return asyncio.run(coroutine)
+
+
+class _FailingOnceExecutor(ThreadPoolExecutor):
+
+    def __init__(self) -> None:
+        super().__init__(1)
+        self.failed = False
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        if not self.failed:
+            self.failed = True
+            raise RuntimeError("Worker is gone.")
+        return super().submit(fn, *args, **kwargs)
+
+
+def test_evaluate_batches_concurrent_requests() -> None:
+
+    async def scenario() -> tuple[list[Any], Any]:
+        async with LawServer(batch_window=0.05, executor=ThreadPoolExecutor(1)) as server:
+            client = LawClient(port=server.port)
+            await client.call("preload", law=_LAW, target="current")
+            results = await asyncio.gather(*(client.call("evaluate",
+                law=_LAW,
+                target="current",
+                inputs={
+                "voltage": float(i),
+                "resistance": 2.0,
+                }) for i in range(20)))
+            return results, server.metrics.summary()
+
+    results, metrics = _run(scenario())
+    assert [r["value"] for r in results] == [i / 2 for i in range(20)]
+    assert results[0]["unit"] == "ampere"
+    assert metrics["methods"]["evaluate"]["count"] == 20
+    assert metrics["mean_batch_size"] > 1
+
+
+def test_evaluate_vectorized_and_batch_request() -> None:
+
+    async def scenario() -> list[Any]:
+        async with LawServer(executor=ThreadPoolExecutor(1)) as server:
+            client = LawClient(port=server.port)
+            return await client.call_batch([
+                ("evaluate", {
+                "law": _LAW,
+                "target": "current",
+                "inputs": {
+                "voltage": [1, 2, 3],
+                "resistance": 2
+                }
+                }),
+                ("evaluate", {
+                "law": _LAW,
+                "target": "resistance",
+                "inputs": {
+                "voltage": 1,
+                "current": 2
+                }
+                }),
+            ])
+
+    first, second = _run(scenario())
+    assert first["result"]["value"] == [0.5, 1.0, 1.5]
+    assert second["result"]["value"] == 0.5
+
+
+def test_evaluate_non_finite() -> None:
+
+    async def scenario() -> Any:
+        async with LawServer(executor=ThreadPoolExecutor(1)) as server:
+            client = LawClient(port=server.port)
+            return await client.call("evaluate",
+                law=_LAW,
+                target="current",
+                inputs={
+                "voltage": [1, 0, 2],
+                "resistance": [0, 0, 4],
+                })
+
+    # infinities and NaN are not valid JSON
+    assert _run(scenario())["value"] == [None, None, 0.5]
+
+
+def test_kernel_in_process_pool() -> None:
+
+    async def scenario() -> Any:
+        async with LawServer(max_workers=1) as server:
+            client = LawClient(port=server.port)
+            return await client.call("evaluate",
+                law=_LAW,
+                target="resistance",
+                inputs={
+                "voltage": 3,
+                "current": 2,
+                })
+
+    assert _run(scenario())["value"] == 1.5
+
+
+def test_evaluate_principal_solution() -> None:
+
+    async def scenario() -> Any:
+        async with LawServer(executor=ThreadPoolExecutor(1)) as server:
+            client = LawClient(port=server.port)
+            return await client.call("evaluate",
+                law=_POWER_LAW,
+                target="current",
+                inputs={
+                "power": 4,
+                "resistance": 1,
+                })
+
+    assert _run(scenario())["value"] == 2.0
+
+
+def test_failed_kernel_is_retried() -> None:
+
+    async def scenario() -> Any:
+        async with LawServer(executor=_FailingOnceExecutor()) as server:
+            with raises(RuntimeError):
+                await server.kernel(_LAW, "current")
+            return await server.kernel(_LAW, "current")
+
+    assert _run(scenario())(voltage=3, resistance=2) == 1.5
+
+
+def test_calculate_in_process_pool() -> None:
+
+    async def scenario() -> Any:
+        async with LawServer(max_workers=1) as server:
+            client = LawClient(port=server.port)
+            return await client.call("calculate",
+                law=_LAW,
+                function="calculate_current",
+                arguments={
+                "voltage_": {
+                "value": 3,
+                "unit": "volt"
+                },
+                "resistance_": {
+                "value": 2,
+                "unit": "kilo*ohm"
+                },
+                })
+
+    result = _run(scenario())
+    assert abs(result["value"] - 0.0015) < 1e-12
+    assert result["unit"] == "ampere"
+
+
+def test_bad_requests() -> None:
+
+    async def scenario() -> Any:
+        async with LawServer(executor=ThreadPoolExecutor(1)) as server:
+            client = LawClient(port=server.port)
+            with raises(RpcError) as error:
+                await client.call("evaluate", law=_LAW, target="current", inputs={"voltage": 1})
+            assert error.value.code == -32602
+            with raises(RpcError) as error:
+                await client.call("evaluate", law=_LAW, target="mass", inputs={})
+            assert error.value.code == -32602
+            with raises(RpcError) as error:
+                await client.call("evaluate",
+                    law=_LAW,
+                    target="current",
+                    inputs={
+                    "voltage": {
+                    "real": 1
+                    },
+                    "resistance": 2,
+                    })
+            assert error.value.code == -32602
+            with raises(RpcError) as error:
+                await client.call("no_such_method")
+            assert error.value.code == -32601
+            return await client.metrics()
+
+    metrics = _run(scenario())
+    assert metrics["methods"]["evaluate"]["errors"] == 3
+    assert "no_such_method" not in metrics["methods"]